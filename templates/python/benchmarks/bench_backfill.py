@@ -0,0 +1,179 @@
+"""Benchmark: chunked online backfill vs. one big UPDATE on a SQLite users table.
+
+Fills `--rows` users into a SQLite file, adds an `email_canonical` column
+and fills it twice:
+
+- chunked: `BackfillRunner` (keyset chunks through `User.from_persistence`,
+  adaptive size around `--target-ms`, checkpoint per chunk).
+- single:  `UPDATE users SET email_canonical = canonical(email)` with the
+  same canonicalization registered as a SQL function.
+
+Meanwhile a second connection updates one random user every
+`--writer-interval-ms`, like the application would; its worst wait is how
+long the backfill kept the table locked. Reports throughput, the chunk
+transaction times and the concurrent writer's latency for both modes.
+
+Usage:
+    python -m benchmarks.bench_backfill --rows 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.domain.services.email_canonicalization import EmailCanonicalizer
+from src.infrastructure.persistence.backfill import Backfill, BackfillRunner
+from src.infrastructure.persistence.sql_user_repository import (
+    USER_COLUMNS,
+    USERS_TABLE_DDL,
+)
+
+DOMAINS = ('gmail.com', 'example.com', 'outlook.com', 'acme.io')
+CREATED = datetime(2020, 1, 1)
+
+
+def _user_id(index: int) -> str:
+    return f'00000000-0000-4000-8000-{index:012d}'
+
+
+def build_table(path: Path, rows: int) -> None:
+    """Create the users table with `rows` rows and an empty email_canonical column."""
+    connection = sqlite3.connect(path)
+    connection.execute(USERS_TABLE_DDL.format(table='users'))
+    markers = ', '.join('?' * len(USER_COLUMNS))
+    statement = f'INSERT INTO users ({", ".join(USER_COLUMNS)}) VALUES ({markers})'
+    start = time.perf_counter()
+    for first in range(0, rows, 100_000):
+        connection.executemany(
+            statement,
+            (
+                (
+                    _user_id(index),
+                    f'first.last+{index}@{DOMAINS[index % len(DOMAINS)]}',
+                    f'User {index}',
+                    'pbkdf2_sha256$1000$salt$hash',
+                    'user',
+                    False,
+                    CREATED.isoformat(' '),
+                    CREATED.isoformat(' '),
+                    1,
+                )
+                for index in range(first, min(rows, first + 100_000))
+            ),
+        )
+    connection.execute('ALTER TABLE users ADD COLUMN email_canonical TEXT')
+    connection.commit()
+    connection.close()
+    print(f'built {rows:,} rows in {time.perf_counter() - start:,.1f}s')
+
+
+class Writer(threading.Thread):
+    """Updates one random user at a fixed interval and records each statement's latency."""
+
+    def __init__(self, path: Path, rows: int, interval: float) -> None:
+        super().__init__(daemon=True)
+        self._connection = sqlite3.connect(path, timeout=3600, check_same_thread=False)
+        self._rows = rows
+        self._interval = interval
+        self._stopping = threading.Event()
+        self.latencies: list[float] = []
+
+    def run(self) -> None:
+        rng = random.Random(5)
+        while not self._stopping.wait(self._interval):
+            start = time.perf_counter()
+            self._connection.execute(
+                'UPDATE users SET name = ?, version = version + 1 WHERE id = ?',
+                ('Renamed', _user_id(rng.randrange(self._rows))),
+            )
+            self._connection.commit()
+            self.latencies.append(time.perf_counter() - start)
+
+    def stop(self) -> list[float]:
+        self._stopping.set()
+        self.join()
+        self._connection.close()
+        return sorted(self.latencies)
+
+
+def _describe_writer(latencies: list[float]) -> str:
+    if not latencies:
+        return 'writer: no statement completed'
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return (
+        f'writer: {len(latencies):,} updates  median {statistics.median(latencies) * 1000:.1f} ms  '
+        f'p99 {p99 * 1000:.1f} ms  max {latencies[-1] * 1000:,.1f} ms'
+    )
+
+
+def bench_chunked(path: Path, rows: int, target: float, interval: float) -> None:
+    """Backfill with BackfillRunner while the writer runs."""
+    canonicalizer = EmailCanonicalizer()
+    backfill = Backfill(
+        'email_canonical', ('email_canonical',), lambda u: (canonicalizer.canonical_key(u.email),)
+    )
+    connection = sqlite3.connect(path, timeout=3600)
+    runner = BackfillRunner(connection, target_chunk_seconds=target)
+    runner.create_schema()
+    writer = Writer(path, rows, interval)
+    writer.start()
+    start = time.perf_counter()
+    progress = runner.run(backfill)
+    elapsed = time.perf_counter() - start
+    latencies = writer.stop()
+    chunks = sorted(runner.chunk_seconds)
+    print(
+        f'chunked: {elapsed:7.1f}s  {progress.rows / elapsed:9,.0f} rows/s  '
+        f'{len(chunks):,} chunks (final size {progress.chunk_size:,})  '
+        f'chunk txn median {statistics.median(chunks) * 1000:.0f} ms  '
+        f'max {chunks[-1] * 1000:.0f} ms  skipped {progress.skipped:,}'
+    )
+    print(f'         {_describe_writer(latencies)}')
+    connection.execute('UPDATE users SET email_canonical = NULL')
+    connection.commit()
+    connection.close()
+
+
+def bench_single(path: Path, rows: int, interval: float) -> None:
+    """Backfill with one UPDATE statement while the writer runs."""
+    canonicalizer = EmailCanonicalizer()
+    connection = sqlite3.connect(path, timeout=3600)
+    connection.create_function('canonical', 1, canonicalizer.canonicalize, deterministic=True)
+    writer = Writer(path, rows, interval)
+    writer.start()
+    start = time.perf_counter()
+    connection.execute('UPDATE users SET email_canonical = canonical(email)')
+    connection.commit()
+    elapsed = time.perf_counter() - start
+    latencies = writer.stop()
+    print(f'single : {elapsed:7.1f}s  {rows / elapsed:9,.0f} rows/s  one transaction')
+    print(f'         {_describe_writer(latencies)}')
+    connection.close()
+
+
+def main() -> None:
+    """Build the table, then run both backfills against the same data."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--target-ms', type=float, default=200.0)
+    parser.add_argument('--writer-interval-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'users.db'
+        build_table(path, args.rows)
+        interval = args.writer_interval_ms / 1000
+        bench_chunked(path, args.rows, args.target_ms / 1000, interval)
+        bench_single(path, args.rows, interval)
+
+
+if __name__ == '__main__':
+    main()
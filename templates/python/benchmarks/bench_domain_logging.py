@@ -0,0 +1,146 @@
+"""Benchmark: registration latency with domain logging off, synchronous and queued.
+
+Drives `POST /users` in-process (httpx ASGI transport, in-memory storage,
+low PBKDF2 work factor) with every domain operation logged:
+
+- off:    no logging wrappers installed.
+- sync:   structlog renders JSON and writes + flushes one line per record on
+          the request thread (the usual `PrintLogger` setup).
+- queued: `BatchingLogWriter` - records are queued and written in batches
+          by a background thread.
+
+Records go to a temporary file; `--sink-latency-ms` adds a sleep to every
+write to stand in for a slow stdout consumer (a pipe to a log shipper, a
+terminal). Reports p50/p99 request latency and how many records were
+written or dropped.
+
+Usage:
+    python -m benchmarks.bench_domain_logging --requests 5000 --sink-latency-ms 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any
+
+import httpx
+import structlog
+
+from src.application.use_cases.register_user_account import RegisterUserAccountHandler
+from src.infrastructure.http.app import create_app
+from src.infrastructure.observability.domain_logging import BatchingLogWriter, DomainLogger
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+MODES = ('off', 'sync', 'queued')
+
+
+class SlowFile:
+    """Text file whose every write also sleeps, like a backed-up pipe."""
+
+    def __init__(self, file: Any, latency: float) -> None:
+        self._file = file
+        self._latency = latency
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        self.lines += text.count('\n')
+        return int(self._file.write(text))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+
+async def _run(requests: int, concurrency: int, prefix: str) -> list[float]:
+    handler = RegisterUserAccountHandler(InMemoryUserRepository(), Pbkdf2PasswordHasher(1_000))
+    transport = httpx.ASGITransport(app=create_app(handler))
+    latencies: list[float] = []
+    queue = iter(range(requests))
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+
+        async def worker() -> None:
+            for index in queue:
+                body = {
+                    'email': f'{prefix}{index}@example.com',
+                    'name': f'User {index}',
+                    'password': 'correct-horse-battery',
+                }
+                start = time.perf_counter()
+                response = await client.post('/users', json=body)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 201:
+                    raise RuntimeError(f'/users returned {response.status_code}')
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def bench(
+    mode: str, requests: int, concurrency: int, sink_latency: float, *, report: bool = True
+) -> None:
+    """Run one mode and print its latency percentiles."""
+    with tempfile.TemporaryFile('w+') as file:
+        sink = SlowFile(file, sink_latency)
+        domain_logger = DomainLogger()
+        writer = None
+        if mode == 'sync':
+            logger = structlog.wrap_logger(
+                structlog.PrintLogger(sink),
+                processors=[
+                    structlog.processors.add_log_level,
+                    structlog.processors.TimeStamper(fmt='iso'),
+                    structlog.processors.JSONRenderer(),
+                ],
+                wrapper_class=structlog.make_filtering_bound_logger(20),
+            )
+            domain_logger.install(logger)
+        elif mode == 'queued':
+            writer = BatchingLogWriter(sink)
+            writer.start()
+            domain_logger.install(writer.get_logger())
+        try:
+            start = time.perf_counter()
+            latencies = sorted(asyncio.run(_run(requests, concurrency, mode)))
+            wall = time.perf_counter() - start
+        finally:
+            domain_logger.uninstall()
+            if writer is not None:
+                writer.close()
+        if not report:
+            return
+        dropped = writer.dropped if writer is not None else 0
+
+        def percentile(q: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * q))] * 1000
+
+        print(
+            f'{mode:<7}: {requests / wall:7,.0f} req/s  p50 {percentile(0.50):6.2f} ms  '
+            f'p99 {percentile(0.99):6.2f} ms  p99.9 {percentile(0.999):6.2f} ms  '
+            f'lines {sink.lines:,}  dropped {dropped:,}'
+        )
+
+
+def main() -> None:
+    """Run every mode against the same workload."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--sink-latency-ms', type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(
+        f'requests={args.requests:,} concurrency={args.concurrency} '
+        f'sink_latency={args.sink_latency_ms} ms'
+    )
+    bench('off', min(args.requests, 500), args.concurrency, 0.0, report=False)  # warm-up
+    for mode in MODES:
+        bench(mode, args.requests, args.concurrency, args.sink_latency_ms / 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark: request-to-domain and domain-to-response conversion rates.
+
+Request to domain, per JSON body of `--users` seeded users:
+
+- status quo: `RegisterUserRequest.model_validate_json`, then
+  `RegisterUserAccountCommand.create`, `Email.create` and `User.create`
+- `UserDraft.model_validate_json(...).to_user(...)`: the domain rules run
+  once inside pydantic-core and the objects are built trusted
+
+Domain to response, per `User`:
+
+- status quo: `to_dict`, the camelCase `data` mapping and `json.dumps`
+- `UserSerializer(RESPONSE_FIELDS).to_json`, and the `to_dict`-shaped
+  snapshot through `UserSerializer().to_python`
+
+Password hashing is left out on both sides (a constant hash is used); the
+request rows are timed with and without `User.create` (uuid4, clock and
+event), which dominates the conversion.
+
+Usage:
+    python -m benchmarks.bench_domain_models --users 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.datasets import raw_emails
+from src.application.use_cases.register_user_account import RegisterUserAccountCommand
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.http.domain_models import RESPONSE_FIELDS, UserDraft, UserSerializer
+from src.infrastructure.http.schemas import RegisterUserRequest
+
+PASSWORD_HASH = 'pbkdf2_sha256$1$salt$hash'  # noqa: S105 - fixed test hash
+
+
+def status_quo_request(body: bytes) -> User:
+    """The HTTP adapter and use case path, minus hashing and storage."""
+    request = RegisterUserRequest.model_validate_json(body)
+    command = RegisterUserAccountCommand.create(request.email, request.name, request.password)
+    return User.create(Email.create(command.email), command.name, PASSWORD_HASH, command.role)
+
+
+def status_quo_fields(body: bytes) -> Email:
+    """Validation only: request model, command and `Email.create`."""
+    request = RegisterUserRequest.model_validate_json(body)
+    command = RegisterUserAccountCommand.create(request.email, request.name, request.password)
+    return Email.create(command.email)
+
+
+def draft_request(body: bytes) -> User:
+    """The same conversion through `UserDraft`."""
+    return UserDraft.model_validate_json(body).to_user(PASSWORD_HASH)
+
+
+def status_quo_response(user: User) -> bytes:
+    """`to_dict`, then the API's camelCase mapping, then `json.dumps`."""
+    snapshot = user.to_dict()
+    data = {
+        'userId': snapshot['id'],
+        'email': snapshot['email'],
+        'name': snapshot['name'],
+        'role': snapshot['role'],
+        'createdAt': snapshot['created_at'],
+    }
+    return json.dumps(data).encode()
+
+
+def _rate(convert: Callable[[Any], Any], items: list[Any], repeat: int) -> float:
+    def run() -> None:
+        for item in items:
+            convert(item)
+
+    return len(items) / min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Time both directions, status quo first."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = [
+        json.dumps(
+            {'email': f' {email.upper()} ', 'name': f'Person {i}', 'password': 'x' * 16}
+        ).encode()
+        for i, email in enumerate(raw_emails(args.users, args.seed))
+    ]
+    users = [draft_request(body) for body in bodies]
+    response = UserSerializer(RESPONSE_FIELDS)
+    snapshot = UserSerializer()
+    assert [json.loads(response.to_json(user)) for user in users[:100]] == [  # noqa: S101
+        json.loads(status_quo_response(user)) for user in users[:100]
+    ]
+
+    print(f'users={args.users:,} (conversions per second)')
+    rows: list[tuple[str, Callable[[Any], Any], list[Any]]] = [
+        ('request -> checked fields, status quo', status_quo_fields, bodies),
+        ('request -> checked fields, UserDraft', UserDraft.model_validate_json, bodies),
+        ('request -> User, status quo', status_quo_request, bodies),
+        ('request -> User, UserDraft', draft_request, bodies),
+        ('User -> response JSON, to_dict + json.dumps', status_quo_response, users),
+        ('User -> response JSON, UserSerializer', response.to_json, users),
+        ('User -> snapshot dict, to_dict', User.to_dict, users),
+        ('User -> snapshot dict, UserSerializer', snapshot.to_python, users),
+    ]
+    for label, convert, items in rows:
+        print(f'  {label:<45}: {_rate(convert, items, args.repeat):>10,.0f} /s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: partitioned event replay from a SQLite event log.
+
+Writes `--events` synthetic user events (creation, then verification and
+renames for some users, interleaved across users as in a real history) to
+a SQLite `SqlEventLog`, then rebuilds `UserStatistics` with `replay` on
+each `--workers` count, one partition per worker, with checkpoints every
+`--checkpoint-every` events. Reports events/s per run and checks every run
+produced the same statistics.
+
+The log file is kept and reused when it already holds `--events` events,
+so several process counts can be compared without regenerating it.
+
+Usage:
+    python -m benchmarks.bench_event_replay --events 100000000 --workers 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.application.analytics.event_replay import replay
+from src.application.analytics.user_statistics import UserStatistics
+from src.domain.entities.user import (
+    DomainEvent,
+    EmailVerifiedEvent,
+    UserCreatedEvent,
+    UserNameChangedEvent,
+)
+from src.infrastructure.persistence.file_replay_checkpoint_store import (
+    FileReplayCheckpointStore,
+)
+from src.infrastructure.persistence.sql_event_log import SqlEventLog, event_to_row
+
+START = datetime(2020, 1, 1)
+DOMAINS = ('gmail.com', 'example.com', 'outlook.com', 'acme.io')
+
+
+def synthetic_events(count: int, seed: int) -> Iterator[tuple[str, DomainEvent]]:
+    """Yield `count` (user id, event) pairs: ~40% creations, the rest follow-ups."""
+    rng = random.Random(seed)
+    created = 0
+    for _ in range(count):
+        if created == 0 or rng.random() < 0.4:
+            user_id = f'00000000-0000-4000-8000-{created:012d}'
+            yield user_id, UserCreatedEvent(
+                user_id=user_id,
+                email=f'user{created}@{DOMAINS[created % len(DOMAINS)]}',
+                name=f'User {created}',
+                event_id=f'e-{created}',
+                occurred_at=START + timedelta(seconds=created * 10),
+            )
+            created += 1
+            continue
+        user_id = f'00000000-0000-4000-8000-{rng.randrange(created):012d}'
+        if rng.random() < 0.5:
+            yield user_id, EmailVerifiedEvent(user_id=user_id, event_id='v', occurred_at=START)
+        else:
+            yield user_id, UserNameChangedEvent(
+                user_id=user_id, name='Renamed', event_id='n', occurred_at=START
+            )
+
+
+def build_log(path: Path, events: int, seed: int) -> SqlEventLog:
+    """Open the log at `path`, (re)generating it unless it already holds `events`."""
+    log = SqlEventLog(functools.partial(sqlite3.connect, str(path)))
+    log.create_schema()
+    if log.head() == events:
+        return log
+    connection = log.connection
+    connection.cursor().execute('DELETE FROM domain_events')
+    start = time.perf_counter()
+    rows = []
+    cursor = connection.cursor()
+    for position, (user_id, event) in enumerate(synthetic_events(events, seed), start=1):
+        rows.append(event_to_row(position, user_id, event))
+        if len(rows) == 100_000:
+            cursor.executemany('INSERT INTO domain_events VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            rows.clear()
+    cursor.executemany('INSERT INTO domain_events VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+    connection.commit()
+    elapsed = time.perf_counter() - start
+    print(
+        f'generated {events:,} events in {elapsed:,.1f}s '
+        f'({os.path.getsize(path) / 2**20:,.0f} MB on disk)'
+    )
+    return SqlEventLog(functools.partial(sqlite3.connect, str(path)))
+
+
+def main() -> None:
+    """Generate the log if needed and replay it with each worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=2_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--checkpoint-every', type=int, default=1_000_000)
+    parser.add_argument('--db', type=Path, default=Path(tempfile.gettempdir()) / 'events.db')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    log = build_log(args.db, args.events, args.seed)
+    print(f'events={args.events:,} cpus={os.cpu_count()}')
+    reference = None
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        store = FileReplayCheckpointStore(checkpoint_dir)
+        for workers in args.workers:
+            start = time.perf_counter()
+            result = replay(
+                log,
+                UserStatistics,
+                workers=workers,
+                checkpoints=store,
+                checkpoint_every=args.checkpoint_every,
+            )
+            elapsed = time.perf_counter() - start
+            stats = result.projection.to_dict()
+            reference = reference or stats
+            print(
+                f'workers={workers:3d}: {elapsed:8.1f}s  '
+                f'{result.events / elapsed:10,.0f} events/s  '
+                f'users {stats["total"]:,}  same result: {stats == reference}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark: duplicate-storm registration with and without idempotency keys.
+
+Simulates clients retrying during a latency spike: every registration is
+sent `--duplicates` times concurrently with the same `Idempotency-Key`.
+Without the idempotency layer each duplicate checks the email and, while
+the first copy is still hashing, hashes the password again; with it, one
+copy runs and the rest wait for and replay its response.
+
+The app runs in-process (httpx ASGI transport) with in-memory storage and a
+realistic PBKDF2 work factor (`--hash-iterations`).
+
+Usage:
+    python -m benchmarks.bench_idempotency --registrations 200 --duplicates 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+
+from src.application.use_cases.idempotency import IdempotentExecutor
+from src.application.use_cases.register_user_account import RegisterUserAccountHandler
+from src.infrastructure.http.app import create_app
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+PASSWORD = 'correct-horse-battery'
+
+
+class CountingHasher(Pbkdf2PasswordHasher):
+    """Counts password hashes: one per registration attempt that got past the checks."""
+
+    calls = 0
+
+    def hash(self, plain_password: str) -> str:
+        """Hash and count."""
+        self.calls += 1
+        return super().hash(plain_password)
+
+
+async def _storm(
+    registrations: int, duplicates: int, concurrency: int, hash_iterations: int, idempotent: bool
+) -> dict[str, float]:
+    hasher = CountingHasher(iterations=hash_iterations)
+    handler = RegisterUserAccountHandler(InMemoryUserRepository(), hasher)
+    executor = IdempotentExecutor(InMemoryIdempotencyStore()) if idempotent else None
+    transport = httpx.ASGITransport(app=create_app(handler, executor))
+
+    # Retries of one registration arrive together, as they do after a timeout.
+    requests = [i for i in range(registrations) for _ in range(duplicates)]
+    statuses: Counter[int] = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+
+        async def send(index: int) -> None:
+            body = {
+                'email': f'user{index}@example.com',
+                'name': f'User {index}',
+                'password': PASSWORD,
+            }
+            async with semaphore:
+                response = await client.post(
+                    '/users', json=body, headers={'Idempotency-Key': f'register-{index}'}
+                )
+            statuses[response.status_code] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send(index) for index in requests))
+        elapsed = time.perf_counter() - start
+
+    return {
+        'requests': len(requests),
+        'seconds': elapsed,
+        'hashes': hasher.calls,
+        'created': statuses[201],
+        'conflicts': statuses[409],
+    }
+
+
+def main() -> None:
+    """Run the storm both ways and print throughput and wasted work."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--registrations', type=int, default=200)
+    parser.add_argument('--duplicates', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=40)
+    parser.add_argument('--hash-iterations', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(
+        f'registrations={args.registrations} duplicates={args.duplicates} '
+        f'concurrency={args.concurrency} hash_iterations={args.hash_iterations}'
+    )
+    results = {}
+    for label, idempotent in (('without', False), ('with', True)):
+        result = asyncio.run(
+            _storm(
+                args.registrations, args.duplicates, args.concurrency, args.hash_iterations,
+                idempotent,
+            )
+        )
+        results[label] = result
+        print(
+            f'{label:<7}: {result["requests"] / result["seconds"]:8.0f} req/s  '
+            f'{result["seconds"]:6.2f}s  hashes {result["hashes"]:6.0f}  '
+            f'201 {result["created"]:6.0f}  409 {result["conflicts"]:6.0f}'
+        )
+    print(f'speedup: {results["without"]["seconds"] / results["with"]["seconds"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
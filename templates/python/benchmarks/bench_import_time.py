@@ -0,0 +1,186 @@
+"""Benchmark: cold-start import time against benchmarks/import_budget.json.
+
+Each module is imported in a fresh interpreter with `-X importtime`; the
+stderr trace is parsed into per-module self/cumulative times. A module fails
+when its best cumulative time over `runs` exceeds `max_ms`, or when its
+import pulls in any module listed in `forbid` (e.g. the domain touching
+infrastructure, or an integration loading its SDK eagerly).
+
+Usage:
+    python -m benchmarks.bench_import_time                 # report, exit 1 on failure
+    python -m benchmarks.bench_import_time --json out.json # machine-readable report
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BUDGET = Path(__file__).with_name('import_budget.json')
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of `-X importtime` output."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ModuleReport:
+    """Budget check result for one module."""
+
+    module: str
+    cumulative_ms: float
+    max_ms: float
+    forbidden: list[str] = field(default_factory=list)
+    slowest: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the module is within budget and imports nothing forbidden."""
+        return self.cumulative_ms <= self.max_ms and not self.forbidden
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """
+    Parse `-X importtime` lines (`import time: self | cumulative | name`).
+
+    Args:
+        stderr: Captured standard error of the interpreter.
+
+    Returns:
+        Records in output order (dependencies before dependants).
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def trace_import(module: str) -> list[ImportRecord]:
+    """
+    Import `module` in a fresh interpreter and return its import trace.
+
+    Args:
+        module: Dotted module name.
+
+    Returns:
+        Parsed trace.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    completed = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{completed.stderr[-2000:]}')
+    return parse_importtime(completed.stderr)
+
+
+def _is_forbidden(name: str, forbid: list[str]) -> bool:
+    return any(name == prefix or name.startswith(prefix + '.') for prefix in forbid)
+
+
+def check_module(module: str, max_ms: float, forbid: list[str], runs: int) -> ModuleReport:
+    """
+    Measure one module against its budget.
+
+    Args:
+        module: Dotted module name.
+        max_ms: Allowed cumulative import time, in milliseconds.
+        forbid: Module prefixes that must not be imported.
+        runs: Fresh interpreters to try; the fastest run counts.
+
+    Returns:
+        The module report.
+    """
+    best: list[ImportRecord] | None = None
+    best_us = None
+    for _ in range(runs):
+        records = trace_import(module)
+        target = next(record for record in records if record.name == module)
+        if best_us is None or target.cumulative_us < best_us:
+            best, best_us = records, target.cumulative_us
+    assert best is not None and best_us is not None  # noqa: S101 - runs >= 1
+
+    # Only what the target itself pulled in, not interpreter start-up (site, ...).
+    start = next(i for i, record in enumerate(best) if record.name == module)
+    first = start
+    while first > 0 and best[first - 1].depth > best[start].depth:
+        first -= 1
+    own = best[first : start + 1]
+    slowest = sorted(own, key=lambda record: record.self_us, reverse=True)[:5]
+    return ModuleReport(
+        module=module,
+        cumulative_ms=best_us / 1000,
+        max_ms=max_ms,
+        forbidden=sorted({record.name for record in own if _is_forbidden(record.name, forbid)}),
+        slowest=[{'module': record.name, 'self_ms': record.self_us / 1000} for record in slowest],
+    )
+
+
+def check_budget(budget_path: Path = DEFAULT_BUDGET, runs: int | None = None) -> list[ModuleReport]:
+    """
+    Check every module listed in a budget file.
+
+    Args:
+        budget_path: JSON file with `runs` and `modules`.
+        runs: Override the number of runs per module.
+
+    Returns:
+        One report per module.
+    """
+    budget = json.loads(budget_path.read_text())
+    runs = runs or budget.get('runs', 5)
+    return [
+        check_module(module, spec['max_ms'], spec.get('forbid', []), runs)
+        for module, spec in budget['modules'].items()
+    ]
+
+
+def main() -> None:
+    """Print the report and exit with status 1 if any module is over budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument('--runs', type=int, default=None)
+    parser.add_argument('--json', type=Path, default=None, help='write the report as JSON')
+    args = parser.parse_args()
+
+    reports = check_budget(args.budget, args.runs)
+    for report in reports:
+        status = 'ok' if report.ok else 'FAIL'
+        print(f'{status:<4} {report.module:<55} {report.cumulative_ms:7.1f} ms '
+              f'(budget {report.max_ms:.0f} ms)')
+        for item in report.slowest:
+            print(f'       {item["self_ms"]:7.2f} ms self  {item["module"]}')
+        if report.forbidden:
+            print(f'       forbidden imports: {", ".join(report.forbidden)}')
+
+    if args.json:
+        payload = [dict(asdict(report), ok=report.ok) for report in reports]
+        args.json.write_text(json.dumps(payload, indent=2) + '\n')
+    if not all(report.ok for report in reports):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
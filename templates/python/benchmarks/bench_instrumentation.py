@@ -0,0 +1,86 @@
+"""Benchmark: overhead of the domain OpenTelemetry instrumentation.
+
+Measures `Email.create` + `User.create` + `User.to_dict` per registration in
+three states, interleaving rounds so machine drift affects all equally:
+
+- baseline: never instrumented
+- disabled: after `instrument()` + `uninstrument()` (must stay within 2%)
+- enabled: instrumented with the given latency sample rate
+
+Exits with status 1 when the disabled overhead exceeds the budget.
+
+Usage:
+    python -m benchmarks.bench_instrumentation --sample-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.domain_instrumentor import DomainInstrumentor
+
+from . import datasets
+from .harness import measure
+
+DISABLED_BUDGET = 0.02
+
+
+def _registrations(emails: list[str]) -> None:
+    for value in emails:
+        User.create(email=Email.create(value), name='Bench', password_hash='hash').to_dict()
+
+
+def main() -> None:
+    """Run the benchmark and print per-registration medians."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1_000)
+    parser.add_argument('--rounds', type=int, default=7)
+    parser.add_argument('--repeats', type=int, default=11)
+    parser.add_argument('--sample-rate', type=float, default=0.01)
+    args = parser.parse_args()
+
+    emails = datasets.raw_emails(args.size)
+    instrumentor = DomainInstrumentor()
+    provider = MeterProvider(metric_readers=[InMemoryMetricReader()])
+    medians: dict[str, list[float]] = {'baseline': [], 'disabled': [], 'enabled': []}
+
+    def run() -> None:
+        _registrations(emails)
+
+    for _ in range(args.repeats):
+        for state in ('baseline', 'disabled', 'enabled'):
+            if state == 'enabled':
+                instrumentor.instrument(meter_provider=provider, sample_rate=args.sample_rate)
+            medians[state].append(
+                measure(state, run, operations=args.size, rounds=args.rounds).median
+            )
+            instrumentor.uninstrument()
+
+    # Each repeat measures the three states back to back, so comparing
+    # within a repeat cancels slow machine drift; the median over repeats
+    # discards the repeats hit by a noisy neighbour.
+    overheads = {
+        state: statistics.median(
+            value / base - 1 for value, base in zip(values, medians['baseline'], strict=True)
+        )
+        for state, values in medians.items()
+    }
+    for state, values in medians.items():
+        print(f'{state:<9}: {statistics.median(values) * 1e6:8.2f} us/registration  '
+              f'overhead {overheads[state]:+6.1%}')
+
+    if overheads['disabled'] > DISABLED_BUDGET:
+        print(f'FAIL: disabled overhead {overheads["disabled"]:.1%} exceeds {DISABLED_BUDGET:.0%}')
+        sys.exit(1)
+    print(f'OK: disabled overhead within {DISABLED_BUDGET:.0%}')
+
+
+if __name__ == '__main__':
+    main()
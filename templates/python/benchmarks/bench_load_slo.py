@@ -0,0 +1,209 @@
+"""Load test: open-loop registration traffic checked against slos.yaml.
+
+Starts the real composition root (`uvicorn src.main:app`, in-memory
+adapters since REDIS_URL is removed, rate limits raised out of the way)
+on a free local port, or targets `--url`, and sends `POST /users` with a
+fresh email and Idempotency-Key at `--rate` requests per second for
+`--duration` seconds with `run_open_loop`. Latencies are measured from each
+request's scheduled send time, so server stalls are not hidden by the
+client slowing down with them.
+
+The SLO file (`config/observability/slos.yaml`, found from the working
+directory upwards, or `--slo-file`) is evaluated on the measured requests.
+A JSON report (configuration, status counts, response- and service-time
+percentiles, every SLO/SLI) is written to `--report`; the exit status is 1
+when an SLO is missed, so the run can gate CI or feed regression tracking.
+
+Password hashing uses the server's default work factor unless
+`--hash-iterations` is given; the hash dominates each request, so the
+sustainable rate is roughly CPUs / hash time.
+
+Usage:
+    python -m benchmarks.bench_load_slo --rate 2 --duration 60 --report load-report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.infrastructure.observability.open_loop_load import LoadResult, run_open_loop
+from src.infrastructure.observability.slo_evaluation import (
+    SloReport,
+    evaluate,
+    find_slo_file,
+    load_slo_file,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PASSWORD = 'correct-horse-battery'
+REPORT_FORMAT = 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@contextlib.contextmanager
+def local_server(hash_iterations: int | None, timeout: float = 30.0) -> Iterator[str]:
+    """Run `uvicorn src.main:app` with in-memory adapters; yield its base URL."""
+    env = dict(os.environ)
+    env.pop('REDIS_URL', None)
+    env['RATE_LIMIT_DOMAIN_PER_MINUTE'] = env['RATE_LIMIT_CLIENT_PER_MINUTE'] = '1e12'
+    if hash_iterations is not None:
+        env['PASSWORD_HASH_ITERATIONS'] = str(hash_iterations)
+    port = _free_port()
+    command = [sys.executable, '-m', 'uvicorn', 'src.main:app', '--host', '127.0.0.1']
+    command += ['--port', str(port), '--log-level', 'warning', '--no-access-log']
+    server = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env)
+    url = f'http://127.0.0.1:{port}'
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError(f'server exited with status {server.returncode}')
+            with contextlib.suppress(httpx.TransportError):
+                if httpx.get(f'{url}/openapi.json', timeout=1.0).status_code == 200:
+                    break
+            if time.monotonic() > deadline:
+                raise RuntimeError(f'server not ready after {timeout:.0f}s')
+            time.sleep(0.1)
+        yield url
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def drive(url: str, args: argparse.Namespace) -> LoadResult:
+    """Register users at the configured rate against `url`."""
+    run = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=100)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=args.timeout) as client:
+
+        async def send(index: int) -> int:
+            response = await client.post(
+                '/users',
+                json={
+                    'email': f'load-{run}-{index}@example.com',
+                    'name': f'Load {index}',
+                    'password': PASSWORD,
+                },
+                headers={'Idempotency-Key': f'{run}-{index}'},
+            )
+            return response.status_code
+
+        return await run_open_loop(
+            send,
+            rate=args.rate,
+            duration=args.duration,
+            warmup=args.warmup,
+            arrivals=args.arrivals,
+            seed=args.seed,
+            max_in_flight=args.max_in_flight,
+        )
+
+
+def build_report(
+    args: argparse.Namespace, url: str, result: LoadResult, slos: SloReport, slo_file: Path
+) -> dict[str, Any]:
+    """Assemble the JSON report."""
+    return {
+        'format': REPORT_FORMAT,
+        'finished_at': datetime.now(UTC).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'config': {
+            'url': url,
+            'rate': args.rate,
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'arrivals': args.arrivals,
+            'max_in_flight': args.max_in_flight,
+            'timeout': args.timeout,
+            'hash_iterations': args.hash_iterations,
+            'slo_file': str(slo_file),
+        },
+        'results': {
+            'requests': result.requests,
+            'achieved_rate': round(result.achieved_rate, 3),
+            'statuses': {str(status): count for status, count in sorted(result.statuses.items())},
+            'max_send_lag_ms': round(result.max_send_lag * 1000, 3),
+            'response_time_ms': result.response_time.summary(),
+            'service_time_ms': result.service_time.summary(),
+        },
+        'slo': slos.to_dict(),
+    }
+
+
+def _describe(report: dict[str, Any]) -> str:
+    results = report['results']
+    response, service = results['response_time_ms'], results['service_time_ms']
+    lines = [
+        f'{results["requests"]:,} requests at {results["achieved_rate"]:.1f}/s '
+        f'(target {report["config"]["rate"]}/s), statuses {results["statuses"]}',
+        f'response time  p50 {response["p50"]:8.1f} ms  p95 {response["p95"]:8.1f} ms  '
+        f'p99 {response["p99"]:8.1f} ms  max {response["max"]:8.1f} ms',
+        f'service time   p50 {service["p50"]:8.1f} ms  p95 {service["p95"]:8.1f} ms  '
+        f'p99 {service["p99"]:8.1f} ms  max {service["max"]:8.1f} ms',
+    ]
+    for objective in report['slo']['objectives']:
+        verdict = 'PASS' if objective['passed'] else 'FAIL'
+        lines.append(
+            f'{verdict} {objective["name"]}: {objective["ratio"]:.4%} good '
+            f'(target {objective["target"]:.2%})'
+        )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    """Run the load test, write the report and return 1 if an SLO was missed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=2.0, help='requests per second')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds, with warm-up')
+    parser.add_argument('--warmup', type=float, default=5.0)
+    parser.add_argument('--arrivals', choices=('constant', 'poisson'), default='constant')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--max-in-flight', type=int, default=1_000)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--hash-iterations', type=int, default=None)
+    parser.add_argument('--url', default=None, help='target a running server instead')
+    parser.add_argument('--slo-file', type=Path, default=None)
+    parser.add_argument('--report', type=Path, default=Path('load-report.json'))
+    args = parser.parse_args()
+
+    slo_file = args.slo_file or find_slo_file(Path.cwd())
+    document = load_slo_file(slo_file)
+    with contextlib.ExitStack() as stack:
+        url = args.url or stack.enter_context(local_server(args.hash_iterations))
+        result = asyncio.run(drive(url, args))
+    slos = evaluate(document, result)
+    report = build_report(args, url, result, slos, slo_file)
+    args.report.write_text(json.dumps(report, indent=2) + '\n')
+    print(_describe(report))
+    print(f'report written to {args.report}')
+    return 0 if slos.passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
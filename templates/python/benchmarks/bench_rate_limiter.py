@@ -0,0 +1,130 @@
+"""Benchmark: token-bucket decisions per second with many active keys.
+
+Fills the limiter with `--keys` buckets (domain and client keys alike),
+then times random `acquire` calls over them. The compact array-backed
+limiter is compared with the straightforward design of one bucket object
+per key in a dict (equally thread-safe, but never evicting), both for
+throughput and for memory per key (traced with tracemalloc while the
+buckets are created).
+
+With `--redis-url` the Redis script backend is measured too (one round
+trip per decision, so expect network-bound numbers).
+
+Usage:
+    python -m benchmarks.bench_rate_limiter --keys 1000000 --decisions 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from src.application.ports.rate_limiter import RateLimitDecision, TokenBucketPolicy
+from src.infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+
+POLICY = TokenBucketPolicy(capacity=100, refill_per_second=100 / 60)
+
+
+class _Bucket:
+    __slots__ = ('tokens', 'updated')
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+
+class ObjectPerKeyLimiter:
+    """Baseline: a dict of bucket objects behind a lock, no eviction."""
+
+    def __init__(self, policy: TokenBucketPolicy) -> None:
+        """Create an empty limiter."""
+        self.policy = policy
+        self._buckets: dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        """Take tokens from the key's bucket."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(self.policy.capacity, now)
+            tokens = min(
+                self.policy.capacity,
+                bucket.tokens + (now - bucket.updated) * self.policy.refill_per_second,
+            )
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            bucket.tokens, bucket.updated = tokens, now
+        return RateLimitDecision(allowed, tokens)
+
+
+def _keys(count: int) -> list[str]:
+    half = count // 2
+    return [f'domain:d{i}.example' for i in range(half)] + [
+        f'client:{i:012x}' for i in range(count - half)
+    ]
+
+
+def _fill(acquire: Callable[[str], RateLimitDecision], keys: list[str]) -> tuple[float, int]:
+    """Create one bucket per key; return seconds and bytes allocated."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    for key in keys:
+        acquire(key)
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, allocated
+
+
+def _decide(acquire: Callable[[str], RateLimitDecision], probes: list[str]) -> float:
+    start = time.perf_counter()
+    for key in probes:
+        acquire(key)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Fill both limiters, then print decisions/sec and bytes per key."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=1_000_000)
+    parser.add_argument('--decisions', type=int, default=1_000_000)
+    parser.add_argument('--redis-url', default=None)
+    args = parser.parse_args()
+
+    keys = _keys(args.keys)
+    # Key strings are shared by both limiters; only bucket storage is traced.
+    probes = random.Random(42).choices(keys, k=args.decisions)
+    limiters: dict[str, Callable[[str], RateLimitDecision]] = {
+        'compact arrays': InMemoryRateLimiter(POLICY).acquire,
+        'object per key': ObjectPerKeyLimiter(POLICY).acquire,
+    }
+
+    print(f'keys={args.keys} decisions={args.decisions}')
+    for label, acquire in limiters.items():
+        fill_seconds, allocated = _fill(acquire, keys)
+        seconds = _decide(acquire, probes)
+        print(
+            f'{label:<15}: {args.decisions / seconds:12,.0f} decisions/s  '
+            f'{allocated / args.keys:6.1f} B/key  (fill {fill_seconds:.2f}s)'
+        )
+
+    if args.redis_url:
+        import redis
+
+        from src.infrastructure.rate_limiting.redis_rate_limiter import RedisRateLimiter
+
+        limiter = RedisRateLimiter(redis.Redis.from_url(args.redis_url), POLICY)
+        sample = probes[: min(len(probes), 100_000)]
+        seconds = _decide(limiter.acquire, sample)
+        print(f'{"redis script":<15}: {len(sample) / seconds:12,.0f} decisions/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark: single vs. batch registration through the HTTP API.
+
+Drives the FastAPI app in-process (httpx ASGI transport, no sockets) with
+in-memory storage and compares registering the same number of users as
+individual `POST /users` calls against `POST /users:batch` requests.
+
+Password hashing uses a low PBKDF2 work factor by default so the numbers
+show request and persistence overhead; pass `--hash-iterations 600000` to
+see the production cost (it dominates both modes equally).
+
+Usage:
+    python -m benchmarks.bench_registration_http --users 1000 --batch-size 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from src.application.use_cases.register_user_account import RegisterUserAccountHandler
+from src.infrastructure.http.app import create_app
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+PASSWORD = 'correct-horse-battery'
+
+
+def _client(hash_iterations: int) -> httpx.AsyncClient:
+    handler = RegisterUserAccountHandler(
+        InMemoryUserRepository(), Pbkdf2PasswordHasher(iterations=hash_iterations)
+    )
+    transport = httpx.ASGITransport(app=create_app(handler))
+    return httpx.AsyncClient(transport=transport, base_url='http://bench')
+
+
+def _item(prefix: str, index: int) -> dict[str, str]:
+    return {'email': f'{prefix}{index}@example.com', 'name': f'User {index}', 'password': PASSWORD}
+
+
+async def _run(
+    requests: list[tuple[str, dict[str, object]]], hash_iterations: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """Send the requests with bounded concurrency; return wall time and latencies."""
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with _client(hash_iterations) as client:
+
+        async def send(path: str, body: dict[str, object]) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(path, json=body)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 201:
+                    raise RuntimeError(f'{path} returned {response.status_code}')
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send(path, body) for path, body in requests))
+        return time.perf_counter() - start, latencies
+
+
+def bench_single(users: int, hash_iterations: int, concurrency: int) -> tuple[float, list[float]]:
+    """Register every user with its own request."""
+    requests = [('/users', _item('single', i)) for i in range(users)]
+    return asyncio.run(_run(requests, hash_iterations, concurrency))
+
+
+def bench_batch(
+    users: int, batch_size: int, hash_iterations: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """Register the users in batches of `batch_size`."""
+    requests: list[tuple[str, dict[str, object]]] = [
+        ('/users:batch', {'items': [_item('batch', i) for i in range(start, start + batch_size)]})
+        for start in range(0, users, batch_size)
+    ]
+    return asyncio.run(_run(requests, hash_iterations, concurrency))
+
+
+def _describe(label: str, users: int, wall: float, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f'{label:<7}: {len(latencies):5d} requests  {wall:7.3f}s  {users / wall:9.0f} users/s  '
+        f'p50 {statistics.median(ordered) * 1000:7.2f} ms  p95 {p95 * 1000:7.2f} ms'
+    )
+
+
+def main() -> None:
+    """Run both modes and print throughput and request latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--hash-iterations', type=int, default=1_000)
+    args = parser.parse_args()
+
+    single_wall, single_latencies = bench_single(
+        args.users, args.hash_iterations, args.concurrency
+    )
+    batch_wall, batch_latencies = bench_batch(
+        args.users, args.batch_size, args.hash_iterations, args.concurrency
+    )
+
+    print(
+        f'users={args.users} batch_size={args.batch_size} concurrency={args.concurrency} '
+        f'hash_iterations={args.hash_iterations}'
+    )
+    _describe('single', args.users, single_wall, single_latencies)
+    _describe('batch', args.users, batch_wall, batch_latencies)
+    print(f'speedup: {single_wall / batch_wall:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
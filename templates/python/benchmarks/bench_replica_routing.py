@@ -0,0 +1,137 @@
+"""Benchmark: primary load with and without read-replica routing.
+
+A primary and `--replicas` replicas are SQLite files replicated by
+`SimulatedReplication` with a real `--delay-ms` lag. After seeding
+`--users` users (and waiting out the lag), `--threads` client threads run
+`--operations` operations, each in its own session:
+
+- `--write-ratio` of them register a user and read it straight back by id
+  and by email (the read-your-writes case: these reads must see the write)
+- the rest read a random existing user by id or by email
+
+The workload runs twice: every statement on the primary (no replicas), then
+routed. Reported: statements the primary executed, the read split between
+replicas and primary, lag fallbacks, and read-your-writes violations (a
+caller not finding the user it just created), which must be zero.
+
+Usage:
+    python -m benchmarks.bench_replica_routing --operations 20000 --delay-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+
+from benchmarks.datasets import iter_users
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.connection_pool import ConnectionPool
+from src.infrastructure.persistence.replica_routing import DatabaseNode, ReplicaRouter
+from src.infrastructure.persistence.simulated_replication import (
+    PRIMARY,
+    SimulatedReplication,
+    simulated_position,
+)
+
+
+def _node(replication: SimulatedReplication, name: str, size: int) -> DatabaseNode:
+    pool = ConnectionPool(replication.connector(name), size=size)
+    return DatabaseNode(name, pool, simulated_position)
+
+
+def _run(replicas: int, args: argparse.Namespace, seed: list[User]) -> dict[str, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        replication = SimulatedReplication(directory, delay=args.delay_ms / 1000)
+        names = [f'replica{index}' for index in range(replicas)]
+        for name in names:
+            replication.add_replica(name)
+        router = ReplicaRouter(
+            _node(replication, PRIMARY, args.threads),
+            [_node(replication, name, args.threads) for name in names],
+            position_ttl=args.position_ttl_ms / 1000,
+        )
+        router.write(lambda users: users.create_schema())
+        router.write(lambda users: users.insert_many(seed))
+        time.sleep(replication.delay)
+        replication.statements.clear()
+
+        rng = random.Random(replicas)
+        plan = [rng.random() < args.write_ratio for _ in range(args.operations)]
+        lock = threading.Lock()
+        pending = iter(enumerate(plan))
+        violations = 0
+
+        def worker() -> None:
+            nonlocal violations
+            local = random.Random()
+            while True:
+                with lock:
+                    job = next(pending, None)
+                if job is None:
+                    return
+                index, writes = job
+                session = router.session()
+                if writes:
+                    email = Email.create(f'new{index}@bench.example.com')
+                    user = User.create(email, f'New {index}', 'hash')
+                    session.save(user)
+                    found = session.find_by_id(user.id), session.find_by_email(email)
+                    if any(item is None for item in found):
+                        with lock:
+                            violations += 1
+                else:
+                    existing = local.choice(seed)
+                    if index % 2:
+                        session.find_by_email(existing.email)
+                    else:
+                        session.find_by_id(existing.id)
+
+        threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - start
+        replication.close()
+
+    primary = replication.statements[PRIMARY]
+    on_replicas = sum(replication.statements[name] for name in names)
+    reads = router.reads
+    print(
+        f'{replicas} replica(s): {args.operations / seconds:8,.0f} ops/s  '
+        f'primary statements {primary:8,}  replica statements {on_replicas:8,}  '
+        f'reads replica/primary {reads["replica"]:,}/{reads["primary"]:,}  '
+        f'lag fallbacks {reads["lag_fallback"]:,}  read-your-writes violations {violations}'
+    )
+    return {'primary': primary, 'violations': violations}
+
+
+def main() -> None:
+    """Run the same workload against the primary alone and with replicas."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--operations', type=int, default=20_000)
+    parser.add_argument('--write-ratio', type=float, default=0.05)
+    parser.add_argument('--replicas', type=int, default=2)
+    parser.add_argument('--delay-ms', type=float, default=50.0)
+    parser.add_argument('--position-ttl-ms', type=float, default=5.0)
+    parser.add_argument('--threads', type=int, default=4)
+    args = parser.parse_args()
+
+    seed = list(iter_users(args.users))
+    print(
+        f'users={args.users:,} operations={args.operations:,} write_ratio={args.write_ratio} '
+        f'delay={args.delay_ms}ms threads={args.threads}'
+    )
+    baseline = _run(0, args, seed)
+    routed = _run(args.replicas, args, seed)
+    print(f'primary load: {1 - routed["primary"] / baseline["primary"]:.1%} fewer statements')
+
+
+if __name__ == '__main__':
+    main()
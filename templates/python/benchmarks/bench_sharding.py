@@ -0,0 +1,211 @@
+"""Benchmark: sharded user repository throughput at 1, 4 and 8 shards.
+
+Every shard is its own SQLite database file (WAL, synchronous=NORMAL). An
+in-process SQLite call costs CPU, not a network round trip, so each
+statement and commit also sleeps `--latency-ms` to stand in for the round
+trip to a database node (0 measures the router's own overhead). For each
+shard count, `--threads` client threads:
+
+1. register `--users` users, `--registration-batch` per `save_all`
+   (claim emails, insert users; one commit per shard touched)
+2. run `--reads` point reads, alternating `find_by_id` and `find_by_email`
+3. run `--reads / --batch-size` fan-out `find_by_emails` of `--batch-size`
+   emails each
+
+Each shard has one connection, so a shard serves one call at a time and
+throughput grows with the number of shards a workload can use in parallel.
+
+With `--postgres-dsn` (a libpq DSN with `{shard}` in the database name,
+each database already created) the shards are PostgreSQL databases and no
+latency is added.
+
+Usage:
+    python -m benchmarks.bench_sharding --users 5000 --threads 8 --latency-ms 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from benchmarks.datasets import iter_users
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.sharded_user_repository import ShardedUserRepository
+
+
+class RemoteCursor:
+    """sqlite3 cursor whose statements pay a simulated round trip."""
+
+    # No reference cycles: the cursor must be released by the thread using it,
+    # under its shard's lock, not later by the cyclic collector in another thread.
+
+    def __init__(self, cursor: sqlite3.Cursor, latency: float) -> None:
+        """Wrap a cursor."""
+        self._cursor = cursor
+        self._latency = latency
+
+    @property
+    def rowcount(self) -> int:
+        """Rows affected by the last statement."""
+        return self._cursor.rowcount
+
+    def execute(self, *args: Any) -> Any:
+        """Execute after a round trip."""
+        time.sleep(self._latency)
+        return self._cursor.execute(*args)
+
+    def executemany(self, *args: Any) -> Any:
+        """Execute many after a round trip."""
+        time.sleep(self._latency)
+        return self._cursor.executemany(*args)
+
+    def fetchone(self) -> Any:
+        """Fetch the next row."""
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> list[Any]:
+        """Fetch the remaining rows."""
+        return self._cursor.fetchall()
+
+
+class RemoteConnection:
+    """sqlite3 connection that sleeps one simulated round trip per statement and commit."""
+
+    def __init__(self, connection: sqlite3.Connection, latency: float) -> None:
+        """Wrap a connection."""
+        self._connection = connection
+        self._latency = latency
+
+    def cursor(self) -> RemoteCursor:
+        """Return a cursor whose statements pay the round trip."""
+        return RemoteCursor(self._connection.cursor(), self._latency)
+
+    def commit(self) -> None:
+        """Commit after a round trip."""
+        time.sleep(self._latency)
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        """Roll back."""
+        self._connection.rollback()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
+
+
+def _sqlite(directory: str, shard: str, latency: float) -> Any:
+    connection = sqlite3.connect(f'{directory}/{shard}.sqlite3', check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    return RemoteConnection(connection, latency)
+
+
+def _in_threads(threads: int, jobs: list[Any], work: Callable[[Any], None]) -> float:
+    """Run `work` over `jobs` from `threads` threads; return elapsed seconds."""
+    lock = threading.Lock()
+    pending = iter(jobs)
+
+    def worker() -> None:
+        while True:
+            with lock:
+                job = next(pending, None)
+            if job is None:
+                return
+            work(job)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def _run(shards: int, args: argparse.Namespace, users: list[User], connect: Any) -> None:
+    names = [f'shard{index}' for index in range(shards)]
+    connections = {name: connect(name) for name in names}
+    placeholder = '%s' if args.postgres_dsn else '?'
+    repository = ShardedUserRepository(connections, placeholder=placeholder)
+    repository.create_schema()
+    fresh = [User.create(user.email, user.name, user.password_hash) for user in users]
+    size = args.registration_batch
+    batches = [fresh[start : start + size] for start in range(0, len(fresh), size)]
+    write_seconds = _in_threads(args.threads, batches, repository.save_all)
+
+    rng = random.Random(shards)
+    sample = rng.choices(fresh, k=args.reads)
+
+    def read(pair: tuple[int, User]) -> None:
+        index, user = pair
+        if index % 2:
+            repository.find_by_email(Email.create(user.email.value))
+        else:
+            repository.find_by_id(user.id)
+
+    read_seconds = _in_threads(args.threads, list(enumerate(sample)), read)
+    groups = [
+        [user.email for user in rng.choices(fresh, k=args.batch_size)]
+        for _ in range(max(1, args.reads // args.batch_size))
+    ]
+    fan_out_seconds = _in_threads(args.threads, groups, repository.find_by_emails)
+
+    counts = []
+    for connection in connections.values():
+        cursor = connection.cursor()
+        cursor.execute('SELECT count(*) FROM users')
+        counts.append(cursor.fetchone()[0])
+    print(
+        f'{shards} shard(s): {len(fresh) / write_seconds:9,.0f} registrations/s  '
+        f'{args.reads / read_seconds:9,.0f} point reads/s  '
+        f'{len(groups) * args.batch_size / fan_out_seconds:9,.0f} emails/s via find_by_emails  '
+        f'(rows per shard {min(counts):,}-{max(counts):,})'
+    )
+    repository.close()
+    for connection in connections.values():
+        connection.close()
+
+
+def main() -> None:
+    """Register and read the same users at each shard count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=5_000)
+    parser.add_argument('--reads', type=int, default=5_000)
+    parser.add_argument('--registration-batch', type=int, default=1)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=1.0)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--postgres-dsn', default=None)
+    args = parser.parse_args()
+
+    users = list(iter_users(args.users))
+    print(
+        f'users={args.users:,} reads={args.reads:,} registration_batch={args.registration_batch} '
+        f'batch={args.batch_size} threads={args.threads} latency={args.latency_ms}ms'
+    )
+    latency = args.latency_ms / 1000
+    for shards in args.shards:
+        if args.postgres_dsn:
+            import psycopg
+
+            def connect(name: str) -> Any:
+                return psycopg.connect(args.postgres_dsn.format(shard=name))
+
+            _run(shards, args, users, connect)
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                _run(shards, args, users, partial(_sqlite, directory, latency=latency))
+
+
+if __name__ == '__main__':
+    main()
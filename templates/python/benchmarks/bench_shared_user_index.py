@@ -0,0 +1,159 @@
+"""Benchmark: shared-memory user index vs. per-process dicts in pre-fork workers.
+
+The parent builds `--users` users once. Then `--workers` forked workers warm
+up in one of two ways and serve random lookups:
+
+- per-process dicts: load the `User.to_dict` records (as they would come from
+  the database) and build `email -> id` and `id -> record` dicts
+- shared index: attach to the segment published by the parent
+
+Each worker reports its warm-up time, lookup latency and memory growth:
+PSS (resident pages, shared ones split between the processes mapping them,
+so it sums to the real total) and RssShmem (shared-memory pages it maps;
+one physical copy serves every worker).
+
+Usage:
+    python -m benchmarks.bench_shared_user_index --users 1000000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import os
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.datasets import users as make_users
+from src.infrastructure.cache.shared_user_index import SharedUserIndex, SharedUserIndexPublisher
+
+
+def _memory_kb() -> dict[str, int]:
+    """RssShmem and PSS of this process, in kB."""
+    values: dict[str, int] = {}
+    for path in ('/proc/self/status', '/proc/self/smaps_rollup'):
+        for line in Path(path).read_text().splitlines():
+            name, _, amount = line.partition(':')
+            if name in ('RssShmem', 'Pss'):
+                values[name.lower()] = int(amount.split()[0])
+    return values
+
+
+def _time_lookups(
+    by_email: Any, by_id: Any, emails: list[str], ids: list[str]
+) -> tuple[float, float]:
+    start = time.perf_counter()
+    for email in emails:
+        by_email(email)
+    email_ns = (time.perf_counter() - start) / len(emails) * 1e9
+    start = time.perf_counter()
+    for user_id in ids:
+        by_id(user_id)
+    id_ns = (time.perf_counter() - start) / len(ids) * 1e9
+    return email_ns, id_ns
+
+
+def _dict_worker(
+    records_path: str, emails: list[str], ids: list[str], queue: multiprocessing.Queue
+) -> None:
+    before = _memory_kb()
+    start = time.perf_counter()
+    records = pickle.loads(Path(records_path).read_bytes())
+    by_id = {record['id']: record for record in records}
+    id_by_email = {record['email'].lower(): record['id'] for record in records}
+    del records
+    warm_up = time.perf_counter() - start
+    email_ns, id_ns = _time_lookups(
+        lambda email: id_by_email.get(email.lower()), by_id.get, emails, ids
+    )
+    queue.put(('per-process dicts', warm_up, email_ns, id_ns, before, _memory_kb()))
+
+
+def _shared_worker(
+    prefix: str, emails: list[str], ids: list[str], queue: multiprocessing.Queue
+) -> None:
+    before = _memory_kb()
+    start = time.perf_counter()
+    index = SharedUserIndex(prefix)
+    warm_up = time.perf_counter() - start
+    email_ns, id_ns = _time_lookups(index.id_for_email, index.get_by_id, emails, ids)
+    queue.put(('shared index', warm_up, email_ns, id_ns, before, _memory_kb()))
+    index.close()
+
+
+def _run(target: Any, arg: str, workers: int, emails: list[str], ids: list[str]) -> list[Any]:
+    # Keep the children's collector off the parent's objects (copy-on-write friendly).
+    gc.collect()
+    gc.freeze()
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    processes = [
+        context.Process(target=target, args=(arg, emails, ids, queue)) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return reports
+
+
+def _print(reports: list[Any]) -> None:
+    label = reports[0][0]
+    n = len(reports)
+    warm_up = sum(report[1] for report in reports) / n
+    email_ns = sum(report[2] for report in reports) / n
+    id_ns = sum(report[3] for report in reports) / n
+    growth = {
+        name: sum(report[5][name] - report[4][name] for report in reports) / n / 1024
+        for name in ('rssshmem', 'pss')
+    }
+    print(
+        f'{label:<18}: warm-up {warm_up:6.2f}s  email->id {email_ns:6.0f} ns  '
+        f'id->record {id_ns:6.0f} ns  per worker: +PSS {growth["pss"]:6.1f} MB  '
+        f'(+shmem mapped {growth["rssshmem"]:6.1f} MB)'
+    )
+
+
+def main() -> None:
+    """Publish the index, run both kinds of workers and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--lookups', type=int, default=200_000)
+    args = parser.parse_args()
+
+    population = make_users(args.users)
+    rng = random.Random(1)
+    sample = rng.choices(population, k=args.lookups)
+    emails = [user.email.value for user in sample]
+    ids = [user.id for user in sample]
+
+    with tempfile.TemporaryDirectory() as directory:
+        records_path = os.path.join(directory, 'records.pickle')
+        Path(records_path).write_bytes(pickle.dumps([user.to_dict() for user in population]))
+
+        prefix = f'bench-user-index-{os.getpid()}'
+        publisher = SharedUserIndexPublisher(prefix)
+        start = time.perf_counter()
+        publisher.publish(population)
+        publish_seconds = time.perf_counter() - start
+        segment_mb = publisher.size / 2**20
+        del population, sample
+
+        print(f'users={args.users} workers={args.workers} lookups={args.lookups}')
+        print(f'publish (parent, once): {publish_seconds:.2f}s, segment {segment_mb:.1f} MB')
+        try:
+            _print(_run(_dict_worker, records_path, args.workers, emails, ids))
+            _print(_run(_shared_worker, prefix, args.workers, emails, ids))
+        finally:
+            publisher.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""Soak test: memory of long-running domain workloads.
+
+Runs each scenario with `run_soak` for `--budget-seconds` (or until
+`--cycles` cycles), sampling RSS every `--sample-interval` seconds and,
+over the last `--trace-share` of the run, tracemalloc. Reports whether
+memory kept growing and which call sites retained it:
+
+- lifecycle: `Email.create` + `User.create`, verify and rename, hand the
+  events to a publisher, `clear_domain_events`, drop the user.
+- pooled:    a worker's long-lived users (`--pool` of them) renamed round
+  robin, events published and cleared every time.
+- uncleared: the same pool, events never cleared; the leak this soak is
+  meant to catch, run as a control so a silent detector is noticed.
+
+Runs offline (no database, network or password hashing). A JSON report is
+written to `--report`; the exit status is 1 when a scenario's verdict is
+not the expected one (a leak in lifecycle/pooled, or none in uncleared).
+
+Usage:
+    python -m benchmarks.bench_soak --budget-seconds 300 --cycles 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+from src.domain.entities.user import DomainEvent, User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.memory_soak import SoakReport, run_soak
+
+PASSWORD_HASH = 'pbkdf2_sha256$600000$salt$hash'
+EXPECTED_LEAKS = {'lifecycle': False, 'pooled': False, 'uncleared': True}
+PUBLISHED: Counter[str] = Counter()
+
+
+def _publish(events: list[DomainEvent]) -> None:
+    """Stand-in for the event bus: count the events by type and let them go."""
+    for event in events:
+        PUBLISHED[type(event).__name__] += 1
+
+
+def lifecycle(index: int) -> None:
+    """Create, mutate and publish a user, then let it go."""
+    user = User.create(
+        email=Email.create(f'soak.user+{index}@example.com'),
+        name=f'Soak {index}',
+        password_hash=PASSWORD_HASH,
+    )
+    user.verify_email()
+    user.change_name(f'Renamed {index}')
+    _publish(user.get_domain_events())
+    user.clear_domain_events()
+
+
+def pooled(size: int, clear: bool) -> Callable[[int], None]:
+    """Rename long-lived users round robin, clearing their events or not."""
+    pool = [
+        User.create(
+            email=Email.create(f'pooled{slot}@example.com'),
+            name=f'Pooled {slot}',
+            password_hash=PASSWORD_HASH,
+        )
+        for slot in range(size)
+    ]
+    for user in pool:
+        user.clear_domain_events()
+
+    def cycle(index: int) -> None:
+        user = pool[index % size]
+        user.change_name(f'Renamed {index % 1000}')
+        if clear:
+            _publish(user.get_domain_events())
+            user.clear_domain_events()
+
+    return cycle
+
+
+def _describe(name: str, report: SoakReport) -> str:
+    verdict = 'LEAK SUSPECTED' if report.leak_suspected else 'stable'
+    lines = [
+        f'{name:9}: {report.cycles:,} cycles in {report.elapsed:.1f}s  '
+        f'{report.cycles / report.elapsed:,.0f} cycles/s  {len(report.samples)} samples',
+        f'           rss {report.rss_growth / 2**20:+8.2f} MiB  '
+        f'traced {report.traced_growth / 2**20:+8.2f} MiB  '
+        f'{report.bytes_per_cycle:+.2f} B/cycle  -> {verdict}',
+    ]
+    if report.leak_suspected:
+        for site in report.top_sites[:5]:
+            lines.append(
+                f'           {site.size_diff / 2**20:+8.2f} MiB {site.count_diff:+,} blocks  '
+                f'{" <- ".join(site.traceback[:3])}'
+            )
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    """Run the scenarios and return 1 when a verdict is not the expected one."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', choices=(*EXPECTED_LEAKS, 'all'), nargs='+', default=['all'])
+    parser.add_argument('--budget-seconds', type=float, default=60.0, help='per scenario')
+    parser.add_argument('--cycles', type=int, default=None, help='cap per scenario')
+    parser.add_argument('--sample-interval', type=float, default=2.0)
+    parser.add_argument('--trace-share', type=float, default=0.2, help='0 samples RSS only')
+    parser.add_argument('--trace-frames', type=int, default=5)
+    parser.add_argument('--pool', type=int, default=10_000)
+    parser.add_argument('--min-growth-mb', type=float, default=1.0)
+    parser.add_argument('--report', type=Path, default=Path('soak-report.json'))
+    args = parser.parse_args()
+
+    names = list(EXPECTED_LEAKS) if 'all' in args.scenario else args.scenario
+    workloads: dict[str, Callable[[], Callable[[int], None]]] = {
+        'lifecycle': lambda: lifecycle,
+        'pooled': lambda: pooled(args.pool, clear=True),
+        'uncleared': lambda: pooled(args.pool, clear=False),
+    }
+    results = {}
+    unexpected = []
+    for name in names:
+        report = run_soak(
+            workloads[name](),
+            budget_seconds=args.budget_seconds,
+            max_cycles=args.cycles,
+            sample_interval=args.sample_interval,
+            trace_share=args.trace_share,
+            trace_frames=args.trace_frames,
+            min_growth_bytes=int(args.min_growth_mb * 2**20),
+        )
+        print(_describe(name, report))
+        results[name] = {**report.to_dict(), 'expected_leak': EXPECTED_LEAKS[name]}
+        if report.leak_suspected != EXPECTED_LEAKS[name]:
+            unexpected.append(name)
+    args.report.write_text(json.dumps(results, indent=2) + '\n')
+    print(f'report written to {args.report}')
+    if unexpected:
+        print(f'unexpected verdict: {", ".join(unexpected)}')
+    return 1 if unexpected else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
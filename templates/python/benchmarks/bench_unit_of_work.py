@@ -0,0 +1,100 @@
+"""Benchmark: dirty-field unit of work flush vs. full-row rewrites.
+
+Seeds an in-memory SQLite database, loads every user, changes one field on
+each and measures how long it takes to persist the changes with:
+
+- full-row rewrite: one `UPDATE ... SET <every column> WHERE id = ?` per user
+- unit of work: dirty columns only, multi-row statements, version check
+
+Usage:
+    python -m benchmarks.bench_unit_of_work --users 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import time
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.sql_user_repository import (
+    USER_COLUMNS,
+    SqlUserRepository,
+    row_to_user,
+    user_to_row,
+)
+from src.infrastructure.persistence.unit_of_work import SqlUserUnitOfWork
+
+
+def _seed(connection: sqlite3.Connection, count: int) -> None:
+    repository = SqlUserRepository(connection)
+    repository.create_schema()
+    repository.insert_many(
+        [
+            User.create(
+                email=Email.create(f'user{i}@example.com'),
+                name=f'User {i}',
+                password_hash=f'hash{i}',
+            )
+            for i in range(count)
+        ]
+    )
+    connection.commit()
+
+
+def _load_all(connection: sqlite3.Connection) -> list[User]:
+    rows = connection.execute(f'SELECT {", ".join(USER_COLUMNS)} FROM users').fetchall()
+    return [row_to_user(row) for row in rows]
+
+
+def _mutate(users: list[User], round_: int) -> None:
+    for user in users:
+        user.change_name(f'{user.name.split(" #")[0]} #{round_}')
+
+
+def bench_full_row_rewrite(connection: sqlite3.Connection, round_: int) -> float:
+    """Persist every loaded user by rewriting all of its columns."""
+    users = _load_all(connection)
+    _mutate(users, round_)
+    assignments = ', '.join(f'{column} = ?' for column in USER_COLUMNS[1:])
+    statement = f'UPDATE users SET {assignments} WHERE id = ?'
+    start = time.perf_counter()
+    connection.executemany(statement, [user_to_row(user)[1:] + (user.id,) for user in users])
+    connection.commit()
+    return time.perf_counter() - start
+
+
+def bench_unit_of_work(connection: sqlite3.Connection, round_: int, batch_size: int) -> float:
+    """Persist every loaded user through the dirty-tracking unit of work."""
+    uow = SqlUserUnitOfWork(connection, batch_size=batch_size)
+    for user in _load_all(connection):
+        uow.track(user)
+    _mutate(list(uow.identity_map.values()), round_)
+    start = time.perf_counter()
+    uow.commit()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run both strategies and print the flush times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(':memory:')
+    _seed(connection, args.users)
+
+    full = [bench_full_row_rewrite(connection, r) for r in range(args.rounds)]
+    uow = [bench_unit_of_work(connection, r, args.batch_size) for r in range(args.rounds)]
+
+    print(f'users={args.users} batch_size={args.batch_size} rounds={args.rounds}')
+    print(f'full-row rewrite : best {min(full):.3f}s')
+    print(f'unit of work     : best {min(uow):.3f}s')
+    print(f'speedup          : {min(full) / min(uow):.2f}x')
+
+
+if __name__ == '__main__':
+    main()
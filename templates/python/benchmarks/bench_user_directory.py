@@ -0,0 +1,140 @@
+"""Benchmark: user directory projection vs. re-sorting on every page load.
+
+Builds a synthetic population as directory rows (materializing 10M `User`
+objects would measure object allocation, not the projection), then times:
+
+- a full rebuild, serial and with `--workers` processes
+- page fetches (50 rows) at the first, middle and last page of the
+  unfiltered, per-role and verified listings
+- incremental `apply` of `UserCreatedEvent` and `EmailVerifiedEvent`
+- the status quo: sorting the population for one page, on
+  `--baseline-users` rows and extrapolated to `--users` (n log n)
+
+Usage:
+    python -m benchmarks.bench_user_directory --users 10000000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.application.analytics.user_directory import DirectoryRow, UserDirectory
+from src.domain.entities.user import EmailVerifiedEvent, UserCreatedEvent, UserRole
+
+START = datetime(2020, 1, 1)
+ROLE_WEIGHTS = [1, 95, 4]  # admin, user, guest
+PAGE = 50
+
+
+def synthetic_rows(count: int, seed: int) -> Iterator[DirectoryRow]:
+    """Yield a reproducible population."""
+    rng = random.Random(seed)
+    roles = list(UserRole)
+    for i in range(count):
+        yield (
+            f'00000000-0000-4000-8000-{i:012d}',
+            rng.choices(roles, ROLE_WEIGHTS)[0],
+            rng.random() < 0.5,
+            START + timedelta(seconds=rng.randrange(150_000_000)),
+        )
+
+
+def _micros(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f'median {statistics.median(ordered) * 1e6:8.1f} us  p99 {p99 * 1e6:8.1f} us'
+
+
+def _time_pages(directory: UserDirectory, repeat: int) -> None:
+    listings: list[tuple[str, dict[str, Any]]] = [
+        ('all, newest first', {}),
+        ('role=user', {'role': UserRole.USER}),
+        ('role=admin', {'role': UserRole.ADMIN}),
+        ('verified=true', {'verified': True}),
+    ]
+    for label, filters in listings:
+        total = directory.page(limit=0, **filters).total
+        for where, offset in (('first', 0), ('middle', total // 2), ('last', max(0, total - PAGE))):
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                directory.page(offset=offset, limit=PAGE, **filters)
+                samples.append(time.perf_counter() - start)
+            print(f'  page {label:<18} {where:<6} (of {total:>11,}): {_micros(samples)}')
+
+
+def _time_events(directory: UserDirectory, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = START + timedelta(seconds=150_000_000)
+    created = [
+        UserCreatedEvent(
+            user_id=f'new-{i}',
+            email=f'new{i}@example.com',
+            role=rng.choices(list(UserRole), ROLE_WEIGHTS)[0].value,
+            occurred_at=now + timedelta(milliseconds=i),
+        )
+        for i in range(count)
+    ]
+    verified = [EmailVerifiedEvent(user_id=f'new-{i}') for i in range(count)]
+    for label, events in (('UserCreatedEvent', created), ('EmailVerifiedEvent', verified)):
+        samples = []
+        for event in events:
+            start = time.perf_counter()
+            directory.apply(event)
+            samples.append(time.perf_counter() - start)
+        print(f'  apply {label:<19}: {_micros(samples)}')
+
+
+def _time_resort(count: int, target: int, seed: int) -> None:
+    order = {role: code for code, role in enumerate(UserRole)}
+    rows = list(synthetic_rows(count, seed))
+    start = time.perf_counter()
+    ranked = sorted(rows, key=lambda row: row[3], reverse=True)
+    ranked.sort(key=lambda row: (order[UserRole(row[1])], not row[2]))
+    page = ranked[:PAGE]
+    seconds = time.perf_counter() - start
+    scale = target * math.log2(target) / (count * math.log2(count))
+    print(
+        f'  re-sort {count:,} rows for one page: {seconds * 1e3:,.0f} ms '
+        f'(~{seconds * scale:,.1f} s per page at {target:,}; {len(page)} rows)'
+    )
+
+
+def main() -> None:
+    """Rebuild, page and update the directory at the requested size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--events', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=1_000)
+    parser.add_argument('--baseline-users', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    print(f'users={args.users:,} workers={args.workers} events={args.events:,}')
+
+    rows = synthetic_rows(args.users, args.seed)
+    start = time.perf_counter()
+    directory = UserDirectory.rebuild(rows, workers=1)
+    print(f'  rebuild with 1 worker: {time.perf_counter() - start:,.1f} s')
+    if args.workers > 1:
+        del directory
+        start = time.perf_counter()
+        rows = synthetic_rows(args.users, args.seed)
+        directory = UserDirectory.rebuild(rows, workers=args.workers)
+        print(f'  rebuild with {args.workers} workers: {time.perf_counter() - start:,.1f} s')
+
+    _time_pages(directory, args.repeat)
+    _time_events(directory, args.events, args.seed)
+    del directory
+    _time_resort(min(args.baseline_users, args.users), args.users, args.seed)
+
+
+if __name__ == '__main__':
+    main()
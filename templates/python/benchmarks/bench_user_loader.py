@@ -0,0 +1,184 @@
+"""Benchmark: queries and latency of a fan-out-heavy request, with and without UserLoader.
+
+Seeds `--users` users in SQLite behind `SqlUserRepository`, with a
+`--rtt-ms` round trip added to every statement (a network database; the
+call blocks, as the DB-API driver would). Each request renders a feed of
+`--items` items, resolving concurrently (`asyncio.gather`) per level:
+
+- the author of every item
+- `--comments` commenters per item, and the author again (profile card)
+- the users mentioned by email in each comment (`--mentions` per comment)
+
+Authors and commenters are drawn from a small `--active` set, so the same
+users come back many times per request, as on real feeds. The request is
+run with direct `find_by_id` / `find_by_email` calls (one query each) and
+with one `UserLoader` per request.
+
+Usage:
+    python -m benchmarks.bench_user_loader --requests 50 --rtt-ms 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.application.loaders import UserLoader
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.sql_user_repository import SqlUserRepository
+
+Resolver = Callable[[str], Awaitable[User | None]]
+EmailResolver = Callable[[Email], Awaitable[User | None]]
+
+
+class SlowConnection:
+    """DB-API connection wrapper adding a round trip and counting statements."""
+
+    def __init__(self, connection: sqlite3.Connection, rtt: float) -> None:
+        self._connection = connection
+        self._rtt = rtt
+        self.statements = 0
+
+    def cursor(self) -> Any:
+        owner = self
+        cursor = self._connection.cursor()
+
+        class _Cursor:
+            def execute(self, sql: str, params: Any = ()) -> Any:
+                owner.statements += 1
+                time.sleep(owner._rtt)
+                return cursor.execute(sql, params)
+
+            def executemany(self, sql: str, rows: Any) -> Any:
+                return cursor.executemany(sql, rows)
+
+            def fetchone(self) -> Any:
+                return cursor.fetchone()
+
+            def fetchall(self) -> Any:
+                return cursor.fetchall()
+
+        return _Cursor()
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+
+def _feed(users: list[User], args: argparse.Namespace, rng: random.Random) -> list[dict[str, Any]]:
+    active = users[: args.active]
+    mentions = [user.email.value.upper() for user in users]
+    return [
+        {
+            'author': rng.choice(active).id,
+            'comments': [
+                {
+                    'by': rng.choice(active).id,
+                    'mentions': [rng.choice(mentions) for _ in range(args.mentions)],
+                }
+                for _ in range(args.comments)
+            ],
+        }
+        for _ in range(args.items)
+    ]
+
+
+async def _render(feed: list[dict[str, Any]], by_id: Resolver, by_email: EmailResolver) -> int:
+    """Resolve every user of the feed level by level; return the users resolved."""
+
+    async def comment(data: dict[str, Any]) -> int:
+        author = await by_id(data['by'])
+        mentioned = await asyncio.gather(
+            *(by_email(Email.create(value)) for value in data['mentions'])
+        )
+        return (author is not None) + sum(user is not None for user in mentioned)
+
+    async def item(data: dict[str, Any]) -> int:
+        author = await by_id(data['author'])
+        card = await by_id(author.id) if author is not None else None
+        counts = await asyncio.gather(*(comment(entry) for entry in data['comments']))
+        return 1 + (card is not None) + sum(counts)
+
+    return sum(await asyncio.gather(*(item(entry) for entry in feed)))
+
+
+async def _run(
+    repository: SqlUserRepository,
+    connection: SlowConnection,
+    feeds: list[list[dict[str, Any]]],
+    batched: bool,
+) -> tuple[list[float], list[int]]:
+    latencies, queries = [], []
+    for feed in feeds:
+        before = connection.statements
+        start = time.perf_counter()
+        if batched:
+            loader = UserLoader(repository)
+            await _render(feed, loader.load, loader.load_by_email)
+        else:
+
+            async def by_id(user_id: str) -> User | None:
+                return repository.find_by_id(user_id)
+
+            async def by_email(email: Email) -> User | None:
+                return repository.find_by_email(email)
+
+            await _render(feed, by_id, by_email)
+        latencies.append(time.perf_counter() - start)
+        queries.append(connection.statements - before)
+    return latencies, queries
+
+
+def main() -> None:
+    """Seed the database, then run the same requests both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--items', type=int, default=50)
+    parser.add_argument('--comments', type=int, default=4)
+    parser.add_argument('--mentions', type=int, default=2)
+    parser.add_argument('--active', type=int, default=40)
+    parser.add_argument('--rtt-ms', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=3)
+    args = parser.parse_args()
+
+    raw = sqlite3.connect(':memory:')
+    SqlUserRepository(raw).create_schema()
+    users = [
+        User.create(Email.create(f'user{i}@example.com'), f'User {i}', 'hash')
+        for i in range(args.users)
+    ]
+    SqlUserRepository(raw).save_all(users)
+    raw.execute('CREATE INDEX users_email_lower ON users (lower(email))')
+    raw.commit()
+
+    connection = SlowConnection(raw, args.rtt_ms / 1000)
+    repository = SqlUserRepository(connection)
+    rng = random.Random(args.seed)
+    feeds = [_feed(users, args, rng) for _ in range(args.requests)]
+    lookups = args.items * (2 + args.comments * (1 + args.mentions))
+    print(
+        f'users={args.users:,} requests={args.requests} lookups/request={lookups:,} '
+        f'rtt={args.rtt_ms}ms'
+    )
+    for label, batched in (('direct find_by_*', False), ('UserLoader', True)):
+        latencies, queries = asyncio.run(_run(repository, connection, feeds, batched))
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f'  {label:<16}: {statistics.mean(queries):7.1f} queries/request  '
+            f'median {statistics.median(latencies) * 1e3:7.1f} ms  p99 {p99 * 1e3:7.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
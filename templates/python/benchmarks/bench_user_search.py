@@ -0,0 +1,117 @@
+"""Benchmark: user search index build time, query latency and memory.
+
+Indexes `--users` synthetic users (emails from `benchmarks.datasets`, names
+drawn from first/last name lists), then times `--queries` queries of each
+kind, top 10:
+
+- email prefix ("jane.12"), surname prefix ("garc"), full-name prefix
+- substring inside an email local part ("e.4817") or a name ("rnánd")
+- a miss, and a query made only of stop-grams ("example.c")
+
+For comparison it times the status quo, a Python filter over every folded
+email and name, on `--baseline-users` users. Peak RSS is reported after
+the build.
+
+Usage:
+    python -m benchmarks.bench_user_search --users 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import statistics
+import time
+from collections.abc import Callable, Iterator
+
+from benchmarks.datasets import iter_raw_emails
+from src.application.search.user_search_index import UserSearchIndex, fold
+
+FIRST = ('Ana', 'Juan', 'María', 'José', 'Lucía', 'Carlos', 'Sofía', 'Pedro', 'Jane', 'John')
+LAST = ('García', 'Fernández', 'López', 'Martínez', 'Sánchez', 'Pérez', 'Gómez', 'Ruiz', 'Díaz')
+
+
+def synthetic_rows(count: int, seed: int) -> Iterator[tuple[str, str, str]]:
+    """Yield reproducible (id, email, name) rows."""
+    rng = random.Random(seed)
+    for i, email in enumerate(iter_raw_emails(count, seed)):
+        name = f'{rng.choice(FIRST)} {rng.choice(LAST)} {rng.choice(LAST)}'
+        yield f'00000000-0000-4000-8000-{i:012d}', email, name
+
+
+def _queries(count: int, users: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    picks = sorted(rng.sample(range(users), min(count, users)))
+    sample = []
+    rows = synthetic_rows(users, seed)
+    for position, row in enumerate(rows):
+        if picks and position == picks[0]:
+            sample.append(row)
+            picks.pop(0)
+            if not picks:
+                break
+    emails = [email.lower() for _, email, _ in sample]
+    names = [fold(name) for _, _, name in sample]
+    return {
+        'email prefix': [email[: email.index('@') - 1] for email in emails],
+        'surname prefix': [name.split(' ')[1][:4] for name in names],
+        'full-name prefix': [name[: len(name) - 3] for name in names],
+        'email substring': [email[2 : email.index('@')] for email in emails],
+        'name substring': [name.split(' ')[2][1:5] for name in names],
+        'miss': [f'zq{index}x' for index in range(len(sample))],
+        'stop-grams only': ['example.c'] * len(sample),
+    }
+
+
+def _latency(run: Callable[[str], object], queries: list[str]) -> tuple[float, float]:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main() -> None:
+    """Build the index, then time queries against it and against a scan."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--baseline-users', type=int, default=1_000_000)
+    parser.add_argument('--max-postings', type=int, default=50_000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    queries = _queries(args.queries, args.users, args.seed)
+    start = time.perf_counter()
+    index = UserSearchIndex.build(
+        synthetic_rows(args.users, args.seed), max_postings=args.max_postings
+    )
+    seconds = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f'users={args.users:,}: build {seconds:,.1f} s, peak RSS {peak_mb:,.0f} MB, '
+        f'{index.stop_grams:,} stop-grams (max_postings={args.max_postings:,})'
+    )
+    for kind, batch in queries.items():
+        median, p99 = _latency(index.search, batch)
+        print(f'  index {kind:<17}: median {median * 1e3:8.3f} ms  p99 {p99 * 1e3:8.3f} ms')
+    del index
+
+    folded = [
+        (fold(email), fold(name))
+        for _, email, name in synthetic_rows(min(args.baseline_users, args.users), args.seed)
+    ]
+
+    def scan(query: str) -> list[int]:
+        text = fold(query)
+        return [seq for seq, (email, name) in enumerate(folded) if text in email or text in name]
+
+    median, _ = _latency(scan, queries['email substring'][:5])
+    print(f'  scan of {len(folded):,} users (status quo): median {median * 1e3:,.0f} ms per query')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""Benchmark: worker warm-up from an mmap user snapshot vs. re-querying the database.
+
+Writes a snapshot of `--users` users (streamed, never all in memory), then
+starts a fresh interpreter (spawn) that opens it and reports:
+
+- time to first lookup: open + one `find_by_email` materializing a `User`
+- RSS after the first lookup and after `--lookups` random lookups, split
+  into file-backed pages (the shared page cache) and private memory
+
+The baseline is what a restarted worker does today: stream every user out
+of SQLite (`SqlUserRepository.iter_all`) into `id` and `email` dicts. It
+runs on `--baseline-users` rows and is extrapolated linearly to `--users`,
+since the full population does not fit in memory as objects.
+
+The page cache is not dropped between steps (that needs root), so the
+snapshot numbers are for a warm cache, as for a worker restarting on a live
+host; a cold first lookup adds about two dozen page faults.
+
+Usage:
+    python -m benchmarks.bench_user_snapshot --users 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.datasets import iter_users
+from src.domain.value_objects.email import Email
+from src.infrastructure.cache.user_snapshot import UserSnapshot, write_user_snapshot
+from src.infrastructure.persistence.sql_user_repository import SqlUserRepository
+
+
+def _memory_mb() -> dict[str, float]:
+    """RssAnon and RssFile of this process, in MB."""
+    values = {}
+    for line in Path('/proc/self/status').read_text().splitlines():
+        name, _, amount = line.partition(':')
+        if name in ('RssAnon', 'RssFile'):
+            values[name] = int(amount.split()[0]) / 1024
+    return values
+
+
+def _snapshot_worker(path: str, emails: list[str], queue: Any) -> None:
+    before = _memory_mb()
+    start = time.perf_counter()
+    snapshot = UserSnapshot(path)
+    user = snapshot.find_by_email(Email.create(emails[0]))
+    first = time.perf_counter() - start
+    assert user is not None
+    after_first = _memory_mb()
+    start = time.perf_counter()
+    for email in emails:
+        snapshot.find_by_email(Email.create(email))
+    per_lookup = (time.perf_counter() - start) / len(emails)
+    queue.put((first, per_lookup, before, after_first, _memory_mb()))
+    snapshot.close()
+
+
+def _database_worker(path: str, emails: list[str], queue: Any) -> None:
+    before = _memory_mb()
+    start = time.perf_counter()
+    connection = sqlite3.connect(path)
+    by_id = {}
+    id_by_email = {}
+    for user in SqlUserRepository(connection, batch_size=5000).iter_all():
+        by_id[user.id] = user
+        id_by_email[user.email.value.lower()] = user.id
+    user = by_id[id_by_email[emails[0].lower()]]
+    first = time.perf_counter() - start
+    after_first = _memory_mb()
+    start = time.perf_counter()
+    for email in emails:
+        by_id.get(id_by_email.get(email.lower(), ''))
+    per_lookup = (time.perf_counter() - start) / len(emails)
+    queue.put((first, per_lookup, before, after_first, _memory_mb()))
+    connection.close()
+
+
+def _spawn(target: Any, path: str, emails: list[str]) -> tuple[Any, ...]:
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=target, args=(path, emails, queue))
+    process.start()
+    report = queue.get()
+    process.join()
+    return report  # type: ignore[no-any-return]
+
+
+def _sample(count: int, lookups: int) -> tuple[list[str], Any]:
+    """Pick `lookups` random users and capture their emails while streaming."""
+    wanted = set(random.Random(3).sample(range(count), min(lookups, count)))
+    emails: list[str] = []
+
+    def users() -> Any:
+        for index, user in enumerate(iter_users(count)):
+            if index in wanted:
+                emails.append(user.email.value)
+            yield user
+
+    return emails, users()
+
+
+def _print(label: str, report: tuple[Any, ...], scale: float = 1.0) -> None:
+    first, per_lookup, before, after_first, after = report
+    growth_first = {name: after_first[name] - before[name] for name in before}
+    growth = {name: after[name] - before[name] for name in before}
+    print(
+        f'{label:<22}: first lookup {first * scale:9.3f}s  '
+        f'RSS after it +{growth_first["RssAnon"] * scale:8.1f} MB private '
+        f'+{growth_first["RssFile"]:7.1f} MB file  |  after lookups '
+        f'+{growth["RssAnon"] * scale:8.1f} MB private +{growth["RssFile"]:7.1f} MB file  '
+        f'{per_lookup * 1e6:6.2f} µs/lookup'
+    )
+
+
+def main() -> None:
+    """Write the snapshot and the baseline database, then time both warm-ups."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000_000)
+    parser.add_argument('--baseline-users', type=int, default=500_000)
+    parser.add_argument('--lookups', type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, 'users.snapshot')
+        emails, users = _sample(args.users, args.lookups)
+        start = time.perf_counter()
+        written = write_user_snapshot(snapshot_path, users)
+        write_seconds = time.perf_counter() - start
+        size_mb = os.path.getsize(snapshot_path) / 2**20
+        random.Random(4).shuffle(emails)
+
+        database_path = os.path.join(directory, 'users.sqlite3')
+        connection = sqlite3.connect(database_path)
+        repository = SqlUserRepository(connection, batch_size=5000)
+        repository.create_schema()
+        baseline_users = list(iter_users(args.baseline_users))
+        repository.insert_many(baseline_users)
+        connection.commit()
+        connection.close()
+        baseline_emails = [
+            user.email.value for user in random.Random(5).choices(baseline_users, k=args.lookups)
+        ]
+        del baseline_users
+
+        print(f'users={written:,} lookups={args.lookups:,} baseline_users={args.baseline_users:,}')
+        print(f'snapshot: written in {write_seconds:.1f}s, {size_mb:,.0f} MB on disk')
+        _print('mmap snapshot', _spawn(_snapshot_worker, snapshot_path, emails))
+        scale = args.users / args.baseline_users
+        report = _spawn(_database_worker, database_path, baseline_emails)
+        _print(f're-query ({args.baseline_users:,})', report)
+        _print(f're-query (x{scale:g}, est.)', report, scale)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark: user statistics full recompute vs. incremental updates.
+
+Builds a synthetic population directly as columns (materializing 10M `User`
+objects would measure object allocation, not aggregation), then times:
+
+- full recompute with the pure `array`/`Counter` path
+- full recompute with NumPy (when installed)
+- incremental `apply` of `UserCreatedEvent`/`EmailVerifiedEvent` on top of it
+
+Usage:
+    python -m benchmarks.bench_user_statistics --users 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from array import array
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from typing import Any, TypeVar
+
+from src.application.analytics.user_statistics import ROLES, UserColumns, UserStatistics
+from src.domain.entities.user import DomainEvent, EmailVerifiedEvent, UserCreatedEvent
+
+DOMAINS = [f'domain{i}.com' for i in range(1_000)]
+FIRST_DAY = date(2020, 1, 1).toordinal()
+
+T = TypeVar('T')
+
+
+def synthetic_columns(count: int, seed: int) -> UserColumns:
+    """Fill columns with a reproducible population."""
+    rng = random.Random(seed)
+    columns = UserColumns()
+    for domain in DOMAINS:
+        columns.domain_code(domain)
+    columns.role = array('B', rng.choices(range(len(ROLES)), weights=[1, 95, 4], k=count))
+    columns.verified = array('B', rng.choices((0, 1), k=count))
+    columns.domain = array('I', (int(rng.paretovariate(1.2)) % len(DOMAINS) for _ in range(count)))
+    columns.signup_day = array('i', (FIRST_DAY + rng.randrange(1_500) for _ in range(count)))
+    return columns
+
+
+def synthetic_events(count: int, seed: int) -> list[DomainEvent]:
+    """Build a reproducible mix of creations and verifications."""
+    rng = random.Random(seed)
+    now = datetime(2024, 6, 1)
+    events: list[DomainEvent] = []
+    for i in range(count):
+        if i % 3 == 2:
+            events.append(EmailVerifiedEvent(user_id=f'user-{i - 1}'))
+        else:
+            events.append(
+                UserCreatedEvent(
+                    user_id=f'user-{i}',
+                    email=f'user{i}@{rng.choice(DOMAINS)}',
+                    occurred_at=now + timedelta(seconds=i),
+                )
+            )
+    return events
+
+
+def _timed(label: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f'{label:<28}: {time.perf_counter() - start:.3f}s')
+    return result
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000_000)
+    parser.add_argument('--events', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    columns = _timed('build columns', synthetic_columns, args.users, args.seed)
+    stats = _timed('full recompute (array)', UserStatistics.from_columns, columns, use_numpy=False)
+    try:
+        _timed('full recompute (numpy)', UserStatistics.from_columns, columns, use_numpy=True)
+    except RuntimeError:
+        print('full recompute (numpy)      : skipped (NumPy not installed)')
+
+    events = synthetic_events(args.events, args.seed)
+    start = time.perf_counter()
+    stats.apply_all(events)
+    elapsed = time.perf_counter() - start
+    print(f'{"incremental apply":<28}: {elapsed:.3f}s for {args.events} events '
+          f'({elapsed / args.events * 1e9:.0f} ns/event)')
+    print(f'users={stats.total} admins={stats.admins} verified={stats.verified}')
+
+
+if __name__ == '__main__':
+    main()
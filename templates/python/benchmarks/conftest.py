@@ -0,0 +1,100 @@
+"""Pytest wiring for the benchmark suite.
+
+Run with:
+    pytest benchmarks -m benchmark --no-cov
+    pytest benchmarks -m benchmark --no-cov --bench-save   # record a new baseline
+
+The session fails when any hot path regresses against `baseline.json`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from .harness import (
+    BenchmarkResult,
+    Comparison,
+    compare,
+    format_report,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+_RESULTS = pytest.StashKey[list[BenchmarkResult]]()
+_COMPARISONS = pytest.StashKey[list[Comparison]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the benchmark command-line options."""
+    group = parser.getgroup('bench', 'domain hot-path benchmarks')
+    group.addoption('--bench-baseline', type=Path, default=DEFAULT_BASELINE,
+                    help='baseline JSON to compare against (default: benchmarks/baseline.json)')
+    group.addoption('--bench-threshold', type=float, default=0.25,
+                    help='allowed relative slowdown of the median (default: 0.25)')
+    group.addoption('--bench-rounds', type=int, default=15,
+                    help='samples per benchmark (default: 15)')
+    group.addoption('--bench-save', action='store_true',
+                    help='write the results as the new baseline instead of comparing')
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Prepare per-session result storage."""
+    config.stash[_RESULTS] = []
+    config.stash[_COMPARISONS] = []
+
+
+@pytest.fixture()
+def hot_path(request: pytest.FixtureRequest) -> Callable[..., BenchmarkResult]:
+    """Measure a callable and record the result for the end-of-session comparison."""
+    config = request.config
+
+    def run(name: str, func: Callable[[], object], operations: int = 1) -> BenchmarkResult:
+        result = measure(
+            name, func, operations=operations, rounds=config.getoption('--bench-rounds')
+        )
+        config.stash[_RESULTS].append(result)
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Save the baseline or compare against it, failing the session on regressions."""
+    config = session.config
+    results = config.stash[_RESULTS]
+    if not results:
+        return
+
+    path: Path = config.getoption('--bench-baseline')
+    if config.getoption('--bench-save'):
+        save_baseline(path, results)
+        return
+
+    baseline = load_baseline(path)
+    threshold: float = config.getoption('--bench-threshold')
+    comparisons = [compare(result, baseline.get(result.name), threshold) for result in results]
+    config.stash[_COMPARISONS] = comparisons
+    if exitstatus == pytest.ExitCode.OK and any(item.regressed for item in comparisons):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Print the comparison table."""
+    comparisons = config.stash[_COMPARISONS]
+    if config.getoption('--bench-save') and config.stash[_RESULTS]:
+        terminalreporter.write_sep('-', f'baseline saved to {config.getoption("--bench-baseline")}')
+    if not comparisons:
+        return
+    terminalreporter.write_sep('-', 'benchmark comparison')
+    for line in format_report(comparisons, config.getoption('--bench-threshold')):
+        terminalreporter.write_line(line)
+    regressed = [item.current.name for item in comparisons if item.regressed]
+    if regressed:
+        terminalreporter.write_sep('!', f'hot path regression: {", ".join(regressed)}', red=True)
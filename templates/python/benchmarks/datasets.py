@@ -0,0 +1,67 @@
+"""Reproducible datasets for benchmarks.
+
+Every generator takes an explicit seed so two runs (or two machines) time
+exactly the same inputs.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.domain.entities.user import User, UserRole
+from src.domain.value_objects.email import Email
+
+DEFAULT_SEED = 20240101
+_DOMAINS = ('example.com', 'gmail.com', 'corp.io', 'mail.example.org', 'university.edu')
+_EPOCH = datetime(2024, 1, 1)
+
+
+def iter_raw_emails(count: int, seed: int = DEFAULT_SEED) -> Iterator[str]:
+    """Yield valid email strings with a realistic mix of lengths and domains."""
+    rng = random.Random(seed)
+    for i in range(count):
+        local = f'{rng.choice(("john", "jane", "ops", "x"))}.{i}'
+        if rng.random() < 0.2:
+            local += f'+tag{rng.randrange(100)}'
+        yield f'{local}@{rng.choice(_DOMAINS)}'
+
+
+def raw_emails(count: int, seed: int = DEFAULT_SEED) -> list[str]:
+    """Return `iter_raw_emails` as a list."""
+    return list(iter_raw_emails(count, seed))
+
+
+def iter_persistence_rows(count: int, seed: int = DEFAULT_SEED) -> Iterator[dict[str, Any]]:
+    """Yield keyword arguments for `User.from_persistence`, as a repository would."""
+    rng = random.Random(seed)
+    for i, email in enumerate(iter_raw_emails(count, seed)):
+        created = _EPOCH + timedelta(seconds=rng.randrange(10_000_000))
+        yield {
+            'id': f'00000000-0000-4000-8000-{i:012d}',
+            'email': Email.create(email),
+            'name': f'User {i}',
+            'password_hash': f'$2b$12${i:053d}',
+            'role': rng.choice(tuple(UserRole)),
+            'email_verified': rng.random() < 0.5,
+            'created_at': created,
+            'updated_at': created,
+        }
+
+
+def persistence_rows(count: int, seed: int = DEFAULT_SEED) -> list[dict[str, Any]]:
+    """Return `iter_persistence_rows` as a list."""
+    return list(iter_persistence_rows(count, seed))
+
+
+def iter_users(count: int, seed: int = DEFAULT_SEED) -> Iterator[User]:
+    """Yield hydrated users one at a time, for datasets too large to hold."""
+    for row in iter_persistence_rows(count, seed):
+        yield User.from_persistence(**row)
+
+
+def users(count: int, seed: int = DEFAULT_SEED) -> list[User]:
+    """Return hydrated users built from `persistence_rows`."""
+    return list(iter_users(count, seed))
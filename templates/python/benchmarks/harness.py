@@ -0,0 +1,201 @@
+"""Micro-benchmark harness with baseline comparison.
+
+A benchmark is timed in `rounds` independent samples, each running the
+callable enough times to last at least `min_time` seconds. Results are
+summarized by quartiles, which are robust to the occasional scheduler hiccup.
+
+A hot path is reported as regressed only when both hold:
+- its median is more than `threshold` slower than the baseline median
+- its first quartile is above the baseline third quartile (the spreads do
+  not overlap, so the slowdown is not just noise)
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+BASELINE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Quartiles of the per-operation time of one benchmark, in seconds."""
+
+    name: str
+    q1: float
+    median: float
+    q3: float
+    rounds: int
+    number: int
+
+    @classmethod
+    def from_samples(cls, name: str, samples: list[float], number: int) -> BenchmarkResult:
+        """Summarize per-operation samples."""
+        if len(samples) < 2:
+            value = samples[0]
+            return cls(name, value, value, value, len(samples), number)
+        q1, median, q3 = statistics.quantiles(samples, n=4)
+        return cls(name, q1, median, q3, len(samples), number)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A benchmark result set against its baseline."""
+
+    current: BenchmarkResult
+    baseline: BenchmarkResult | None
+    regressed: bool
+
+    @property
+    def ratio(self) -> float | None:
+        """Current median divided by baseline median."""
+        if self.baseline is None:
+            return None
+        return self.current.median / self.baseline.median
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    operations: int = 1,
+    rounds: int = 15,
+    min_time: float = 0.02,
+) -> BenchmarkResult:
+    """
+    Time a callable.
+
+    Args:
+        name: Benchmark identifier used in the baseline file.
+        func: Zero-argument callable to time.
+        operations: Number of hot-path operations one call of `func` performs.
+        rounds: Number of independent samples.
+        min_time: Minimum duration of one sample, in seconds.
+
+    Returns:
+        The per-operation result.
+    """
+    number = 1
+    while True:
+        elapsed = _run(func, number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = [_run(func, number) / (number * operations) for _ in range(rounds)]
+    return BenchmarkResult.from_samples(name, samples, number)
+
+
+def _run(func: Callable[[], object], number: int) -> float:
+    """Run `func` `number` times with the garbage collector paused."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def compare(
+    current: BenchmarkResult, baseline: BenchmarkResult | None, threshold: float
+) -> Comparison:
+    """
+    Decide whether a result regressed against its baseline.
+
+    Args:
+        current: Freshly measured result.
+        baseline: Stored result, or None for a benchmark without baseline.
+        threshold: Allowed relative slowdown of the median (0.2 = 20%).
+
+    Returns:
+        The comparison.
+    """
+    if baseline is None:
+        return Comparison(current, None, regressed=False)
+    regressed = (
+        current.median > baseline.median * (1 + threshold) and current.q1 > baseline.q3
+    )
+    return Comparison(current, baseline, regressed)
+
+
+def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+    """
+    Read a baseline file.
+
+    Args:
+        path: JSON file written by `save_baseline`.
+
+    Returns:
+        Results by benchmark name; empty if the file does not exist.
+
+    Raises:
+        ValueError: If the file uses an unknown format.
+    """
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    if data.get('format') != BASELINE_FORMAT:
+        raise ValueError(f'Unsupported baseline format in {path}')
+    return {
+        name: BenchmarkResult(name=name, **values)
+        for name, values in data['benchmarks'].items()
+    }
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]) -> None:
+    """
+    Write results as the new baseline, together with the machine they ran on.
+
+    Args:
+        path: Destination JSON file.
+        results: Results to store.
+    """
+    benchmarks: dict[str, Any] = {}
+    for result in sorted(results, key=lambda item: item.name):
+        values = asdict(result)
+        del values['name']
+        benchmarks[result.name] = values
+    data = {
+        'format': BASELINE_FORMAT,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': benchmarks,
+    }
+    path.write_text(json.dumps(data, indent=2) + '\n')
+
+
+def format_report(comparisons: list[Comparison], threshold: float) -> list[str]:
+    """
+    Render comparisons as aligned text lines.
+
+    Args:
+        comparisons: Results to report.
+        threshold: Threshold used, shown in the header.
+
+    Returns:
+        Report lines.
+    """
+    lines = [
+        f'{"benchmark":<28} {"median":>12} {"baseline":>12} {"ratio":>7}  '
+        f'(threshold +{threshold:.0%})'
+    ]
+    for item in comparisons:
+        baseline = f'{item.baseline.median * 1e9:>10.0f}ns' if item.baseline else f'{"-":>12}'
+        ratio = f'{item.ratio:>6.2f}x' if item.ratio is not None else f'{"new":>7}'
+        flag = '  REGRESSION' if item.regressed else ''
+        lines.append(
+            f'{item.current.name:<28} {item.current.median * 1e9:>10.0f}ns {baseline} {ratio}{flag}'
+        )
+    return lines
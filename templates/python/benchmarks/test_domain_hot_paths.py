@@ -0,0 +1,73 @@
+"""Benchmarks for the domain hot paths.
+
+Each benchmark loops over a fixed, seeded dataset so results are comparable
+across runs; timings are reported per operation.
+"""
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+
+from . import datasets
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+SIZE = 1_000
+
+
+@pytest.fixture(scope='module')
+def raw_emails():
+    return datasets.raw_emails(SIZE)
+
+
+@pytest.fixture(scope='module')
+def rows():
+    return datasets.persistence_rows(SIZE)
+
+
+@pytest.fixture(scope='module')
+def users():
+    return datasets.users(SIZE)
+
+
+def test_email_create(hot_path, raw_emails):
+    def run():
+        for value in raw_emails:
+            Email.create(value)
+
+    hot_path('email.create', run, operations=SIZE)
+
+
+def test_email_hash(hot_path, raw_emails):
+    emails = [Email.create(value) for value in raw_emails]
+
+    def run():
+        for email in emails:
+            hash(email)
+
+    hot_path('email.hash', run, operations=SIZE)
+
+
+def test_user_create(hot_path, rows):
+    def run():
+        for row in rows:
+            User.create(email=row['email'], name=row['name'], password_hash=row['password_hash'])
+
+    hot_path('user.create', run, operations=SIZE)
+
+
+def test_user_from_persistence(hot_path, rows):
+    def run():
+        for row in rows:
+            User.from_persistence(**row)
+
+    hot_path('user.from_persistence', run, operations=SIZE)
+
+
+def test_user_to_dict(hot_path, users):
+    def run():
+        for user in users:
+            user.to_dict()
+
+    hot_path('user.to_dict', run, operations=SIZE)
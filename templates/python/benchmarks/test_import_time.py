@@ -0,0 +1,39 @@
+"""Cold-start budget: fails when an import exceeds benchmarks/import_budget.json."""
+
+import json
+
+import pytest
+
+from .bench_import_time import DEFAULT_BUDGET, check_module, parse_importtime
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+BUDGET = json.loads(DEFAULT_BUDGET.read_text())
+
+
+def test_parse_importtime():
+    stderr = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |   re._parser\n'
+        'import time:       300 |        420 | re\n'
+    )
+
+    records = parse_importtime(stderr)
+
+    assert [(r.name, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ('re._parser', 120, 120, 1),
+        ('re', 300, 420, 0),
+    ]
+
+
+@pytest.mark.parametrize('module', sorted(BUDGET['modules']))
+def test_import_within_budget(module):
+    spec = BUDGET['modules'][module]
+
+    report = check_module(module, spec['max_ms'], spec.get('forbid', []), BUDGET['runs'])
+
+    assert not report.forbidden, f'{module} imports {report.forbidden}'
+    assert report.cumulative_ms <= report.max_ms, (
+        f'{module} took {report.cumulative_ms:.1f} ms (budget {report.max_ms} ms); '
+        f'slowest: {report.slowest}'
+    )
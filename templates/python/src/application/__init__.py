@@ -0,0 +1 @@
+"""Application layer - Use cases and ports."""
@@ -0,0 +1,17 @@
+"""Read-side analytics over domain aggregates."""
+
+from .event_replay import Projection, ReplayResult, replay
+from .user_directory import DirectoryEntry, DirectoryPage, OrderedIndex, UserDirectory
+from .user_statistics import UserColumns, UserStatistics
+
+__all__ = [
+    'DirectoryEntry',
+    'DirectoryPage',
+    'OrderedIndex',
+    'Projection',
+    'ReplayResult',
+    'UserColumns',
+    'UserDirectory',
+    'UserStatistics',
+    'replay',
+]
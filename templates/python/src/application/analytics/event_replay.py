@@ -0,0 +1,183 @@
+"""Parallel projection rebuild by replaying the event log.
+
+Replay is partitioned by aggregate: partition `p` of `P` owns the log
+buckets `p, p + P, p + 2P, ...` (see `ports.event_log`), and a bucket holds
+every event of its aggregates. Each partition folds its buckets, in
+position order, into its own fresh projection, so the events of one user
+are applied in the order they were raised without any coordination between
+partitions. Partitions run in a process pool and the partial projections
+are merged at the end (`Projection.merge`), which is why a projection must
+combine disjoint sets of aggregates correctly.
+
+The replay covers the log up to its head when it starts. Partitions save a
+checkpoint (their projection and how far they got) every
+`checkpoint_every` events; a replay that finds checkpoints for the same
+partitioning and projection factory resumes from them, and checkpoints are
+cleared once the merged projection is built.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, NamedTuple, Protocol
+
+from ...domain.entities.user import DomainEvent
+from ..ports.event_log import BUCKETS, EventLog
+from ..ports.replay_checkpoint_store import ReplayCheckpoint, ReplayCheckpointStore
+
+
+class Projection(Protocol):
+    """A read model rebuilt from events."""
+
+    def apply(self, event: DomainEvent) -> None:
+        """Fold one event in."""
+        ...
+
+    def merge(self, other: Any) -> None:
+        """Absorb a projection built from a disjoint set of aggregates."""
+        ...
+
+
+def _factory_name(factory: Callable[[], Projection]) -> str:
+    """Qualified name of a projection factory, as recorded in checkpoints."""
+    qualname = getattr(factory, '__qualname__', None)
+    if qualname is None:  # e.g. functools.partial
+        return repr(factory)
+    return f'{factory.__module__}.{qualname}'
+
+
+class ReplayResult(NamedTuple):
+    """Outcome of a replay."""
+
+    projection: Any
+    head: int  # last log position covered
+    events: int  # events folded into the projection
+    replayed: int  # of which applied by this run (the rest came from checkpoints)
+
+
+def _replay_partition(
+    log: EventLog,
+    factory: Callable[[], Projection],
+    partition: int,
+    partitions: int,
+    head: int,
+    checkpoints: ReplayCheckpointStore | None,
+    checkpoint_every: int,
+    resume: ReplayCheckpoint | None,
+) -> tuple[Projection, int, int]:
+    """Fold the buckets of one partition; return (projection, total events, replayed)."""
+    if resume is None:
+        projection, first, after, total = factory(), partition, 0, 0
+    else:
+        projection, first, after, total = (
+            resume.projection,
+            resume.bucket,
+            resume.position,
+            resume.events,
+        )
+    name = _factory_name(factory)
+    replayed = since_checkpoint = 0
+    for bucket in range(first, BUCKETS, partitions):
+        for position, event in log.read_bucket(bucket, after, head):
+            projection.apply(event)
+            replayed += 1
+            since_checkpoint += 1
+            if checkpoints is not None and since_checkpoint >= checkpoint_every:
+                checkpoints.save(
+                    ReplayCheckpoint(
+                        partition,
+                        partitions,
+                        head,
+                        bucket,
+                        position,
+                        total + replayed,
+                        projection,
+                        name,
+                    )
+                )
+                since_checkpoint = 0
+        after = 0
+    if checkpoints is not None:
+        checkpoints.save(
+            ReplayCheckpoint(
+                partition, partitions, head, BUCKETS, 0, total + replayed, projection, name
+            )
+        )
+    return projection, total + replayed, replayed
+
+
+def replay(
+    log: EventLog,
+    factory: Callable[[], Projection],
+    *,
+    workers: int = 1,
+    partitions: int | None = None,
+    checkpoints: ReplayCheckpointStore | None = None,
+    checkpoint_every: int = 1_000_000,
+) -> ReplayResult:
+    """
+    Rebuild a projection from the whole event log.
+
+    Args:
+        log: The event log; pickled to the worker processes when workers > 1.
+        factory: Builds an empty projection; must be picklable (e.g. the class).
+        workers: Processes replaying in parallel; 1 replays in this process.
+        partitions: Partitions to split the buckets into; defaults to workers.
+        checkpoints: Where partitions save their progress; None disables checkpoints.
+        checkpoint_every: Events a partition applies between checkpoints.
+
+    Returns:
+        The merged projection and replay counts.
+
+    Raises:
+        ValueError: If workers, partitions or checkpoint_every is not positive,
+            or partitions exceeds the number of buckets.
+    """
+    partitions = partitions or workers
+    if workers < 1 or partitions < 1 or checkpoint_every < 1:
+        raise ValueError('workers, partitions and checkpoint_every must be positive')
+    if partitions > BUCKETS:
+        raise ValueError(f'partitions cannot exceed {BUCKETS}')
+
+    resume = _resume_points(checkpoints, partitions, _factory_name(factory))
+    head = next(iter(resume.values())).head if resume else log.head()
+    jobs = [
+        (log, factory, p, partitions, head, checkpoints, checkpoint_every, resume.get(p))
+        for p in range(partitions)
+    ]
+    if workers > 1:
+        # Imported here: multiprocessing would weigh on every import of analytics.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_replay_partition, *zip(*jobs, strict=True)))
+    else:
+        results = [_replay_partition(*job) for job in jobs]
+
+    merged = results[0][0]
+    for projection, _, _ in results[1:]:
+        merged.merge(projection)
+    if checkpoints is not None:
+        checkpoints.clear()
+    return ReplayResult(
+        merged,
+        head,
+        sum(total for _, total, _ in results),
+        sum(replayed for _, _, replayed in results),
+    )
+
+
+def _resume_points(
+    checkpoints: ReplayCheckpointStore | None, partitions: int, factory: str
+) -> dict[int, ReplayCheckpoint]:
+    """Return the usable checkpoints by partition, clearing ones of another replay."""
+    if checkpoints is None:
+        return {}
+    stored = checkpoints.load_all()
+    heads = {checkpoint.head for checkpoint in stored}
+    if stored and (
+        len(heads) > 1 or any(c.partitions != partitions or c.factory != factory for c in stored)
+    ):
+        checkpoints.clear()
+        return {}
+    return {checkpoint.partition: checkpoint for checkpoint in stored}
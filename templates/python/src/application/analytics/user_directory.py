@@ -0,0 +1,462 @@
+"""User directory projection for admin listings.
+
+Admin pages list users by role, then verified before unverified, newest
+first, optionally filtered by role and/or verified status; unfiltered pages
+list everyone newest first. Instead of re-sorting the population on every
+page load, `UserDirectory` keeps both orderings sorted as `UserCreatedEvent`
+and `EmailVerifiedEvent` arrive, so an event costs O(log n) and a page costs
+O(log n + page size) at any offset.
+
+Each ordering is an `OrderedIndex` of integer sort keys. A user gets a dense
+sequence number on arrival; its key packs, from most to least significant
+bits, the (role, verified) group (role ordering only), the inverted creation
+time in microseconds and the sequence number, so keys are unique, compare in
+listing order, and decode back to the user without a lookup.
+
+A directory can also be rebuilt from scratch, e.g. from
+`SqlUserRepository.iter_all`: worker processes sort chunks of keys in
+parallel and the parent merges the sorted runs with one `list.sort`, which
+detects runs and merges them in C.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from ...domain.entities.user import (
+    DomainEvent,
+    EmailVerifiedEvent,
+    User,
+    UserCreatedEvent,
+    UserRole,
+)
+
+DirectoryRow = tuple[str, UserRole | str, bool, datetime]  # user id, role, verified, created at
+
+ROLES: tuple[UserRole, ...] = tuple(UserRole)
+_ROLE_CODES: dict[str, int] = {role.value: code for code, role in enumerate(ROLES)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_SEQ_BITS = 32
+_SEQ_MASK = (1 << _SEQ_BITS) - 1
+_NEWEST = (1 << 60) - 1  # creation times are stored inverted so newer sorts first
+_GROUP_SHIFT = 96
+
+
+class OrderedIndex:
+    """
+    Sorted multiset of ints with O(log n) insert, remove, rank and select.
+
+    Keys live in sorted blocks of `load` to `2 * load` keys; a Fenwick tree
+    over the block lengths turns a rank into a block and an offset. Inserting
+    into a block moves at most `2 * load` pointers (a C memmove), and the tree
+    is only rebuilt when a block splits or empties.
+    """
+
+    def __init__(self, sorted_keys: Iterable[int] = (), *, load: int = 1000) -> None:
+        """
+        Create an index.
+
+        Args:
+            sorted_keys: Initial keys, already in ascending order.
+            load: Target block size.
+        """
+        keys = list(sorted_keys)
+        self._load = load
+        self._blocks = [keys[start : start + load] for start in range(0, len(keys), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(keys)
+        self._tree: list[int] = []
+        self._build_tree()
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate the keys in ascending order."""
+        for block in self._blocks:
+            yield from block
+
+    def add(self, key: int) -> None:
+        """Insert a key."""
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            self._build_tree()
+            return
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            index -= 1
+            self._blocks[index].append(key)
+            self._maxes[index] = key
+        else:
+            insort(self._blocks[index], key)
+        block = self._blocks[index]
+        if len(block) > 2 * self._load:
+            half = len(block) // 2
+            self._blocks[index : index + 1] = [block[:half], block[half:]]
+            self._maxes[index : index + 1] = [block[half - 1], block[-1]]
+            self._build_tree()
+        else:
+            self._update(index, 1)
+
+    def remove(self, key: int) -> None:
+        """
+        Remove one occurrence of a key.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            raise KeyError(key)
+        block = self._blocks[index]
+        position = bisect_left(block, key)
+        if block[position] != key:
+            raise KeyError(key)
+        del block[position]
+        self._len -= 1
+        if not block:
+            del self._blocks[index]
+            del self._maxes[index]
+            self._build_tree()
+        else:
+            self._maxes[index] = block[-1]
+            self._update(index, -1)
+
+    def rank(self, key: int) -> int:
+        """Return the number of keys lower than `key`."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._blocks):
+            return self._len
+        return self._prefix(index) + bisect_left(self._blocks[index], key)
+
+    def slice(self, start: int, stop: int) -> list[int]:
+        """Return the keys ranked `start` (inclusive) to `stop` (exclusive)."""
+        start, stop = max(start, 0), min(stop, self._len)
+        if start >= stop:
+            return []
+        index, offset = self._locate(start)
+        keys: list[int] = []
+        wanted = stop - start
+        while len(keys) < wanted:
+            block = self._blocks[index]
+            keys.extend(block[offset : offset + wanted - len(keys)])
+            index, offset = index + 1, 0
+        return keys
+
+    def _build_tree(self) -> None:
+        size = len(self._blocks)
+        tree = [0] * (size + 1)
+        for node in range(1, size + 1):
+            tree[node] += len(self._blocks[node - 1])
+            parent = node + (node & -node)
+            if parent <= size:
+                tree[parent] += tree[node]
+        self._tree = tree
+
+    def _update(self, index: int, delta: int) -> None:
+        node, size = index + 1, len(self._blocks)
+        while node <= size:
+            self._tree[node] += delta
+            node += node & -node
+
+    def _prefix(self, index: int) -> int:
+        """Number of keys in the blocks before `index`."""
+        total = 0
+        while index:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def _locate(self, rank: int) -> tuple[int, int]:
+        """Block and offset of the key ranked `rank` (which must exist)."""
+        node, size = 0, len(self._blocks)
+        step = 1 << size.bit_length()
+        while step:
+            candidate = node + step
+            if candidate <= size and self._tree[candidate] <= rank:
+                node = candidate
+                rank -= self._tree[candidate]
+            step >>= 1
+        return node, rank
+
+
+@dataclass(frozen=True)
+class DirectoryEntry:
+    """One row of an admin listing."""
+
+    user_id: str
+    role: UserRole
+    email_verified: bool
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class DirectoryPage:
+    """A page of an admin listing."""
+
+    entries: list[DirectoryEntry]
+    total: int
+    offset: int
+
+    @property
+    def next_offset(self) -> int | None:
+        """Offset of the following page, or None on the last page."""
+        following = self.offset + len(self.entries)
+        return following if self.entries and following < self.total else None
+
+
+def _micros(moment: datetime) -> int:
+    """Microseconds since the epoch of a naive-UTC (or aware) datetime."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _group(role: UserRole | str, email_verified: bool) -> int:
+    return _ROLE_CODES[UserRole(role).value] * 2 + (0 if email_verified else 1)
+
+
+def _sorted_keys(
+    by_role: bool, created: array[int], groups: array[int], first_seq: int
+) -> list[int]:
+    """Sort keys of a chunk of users (runs in a worker process during rebuilds)."""
+    if by_role:
+        keys = [
+            (group << _GROUP_SHIFT) | ((_NEWEST - micros) << _SEQ_BITS) | seq
+            for seq, micros, group in zip(
+                range(first_seq, first_seq + len(created)), created, groups, strict=True
+            )
+        ]
+    else:
+        keys = [
+            ((_NEWEST - micros) << _SEQ_BITS) | seq
+            for seq, micros in enumerate(created, first_seq)
+        ]
+    keys.sort()
+    return keys
+
+
+class UserDirectory:
+    """Sorted, paginated views of the user population, maintained from domain events."""
+
+    def __init__(self, *, load: int = 1000) -> None:
+        """
+        Create an empty directory.
+
+        Args:
+            load: Block size of the underlying `OrderedIndex`es.
+        """
+        self._load = load
+        self._ids: list[str] = []
+        self._seqs: dict[str, int] = {}
+        self._created = array('q')
+        self._groups = array('B')
+        self._newest = OrderedIndex(load=load)
+        self._by_role = OrderedIndex(load=load)
+
+    @classmethod
+    def rebuild(
+        cls, rows: Iterable[DirectoryRow], *, workers: int = 1, load: int = 1000
+    ) -> UserDirectory:
+        """
+        Build a directory from scratch.
+
+        Args:
+            rows: (user id, role, email verified, created at) of every user.
+            workers: Processes sorting in parallel; 1 sorts in this process.
+            load: Block size of the underlying `OrderedIndex`es.
+
+        Returns:
+            The populated directory.
+        """
+        directory = cls(load=load)
+        for user_id, role, email_verified, created_at in rows:
+            if user_id not in directory._seqs:
+                directory._append(user_id, role, email_verified, created_at)
+
+        created, groups = directory._created, directory._groups
+        chunk = -(-len(created) // workers) or 1
+        jobs = [
+            (by_role, created[start : start + chunk], groups[start : start + chunk], start)
+            for by_role in (False, True)
+            for start in range(0, len(created), chunk)
+        ]
+        if workers > 1:
+            # Imported here: multiprocessing would weigh on every import of analytics.
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                runs = list(pool.map(_sorted_keys, *zip(*jobs, strict=True)))
+        else:
+            runs = [_sorted_keys(*job) for job in jobs]
+
+        for by_role in (False, True):
+            keys: list[int] = []
+            for (job_by_role, *_), run in zip(jobs, runs, strict=True):
+                if job_by_role is by_role:
+                    keys.extend(run)
+            keys.sort()  # merges the sorted runs
+            index = OrderedIndex(keys, load=load)
+            if by_role:
+                directory._by_role = index
+            else:
+                directory._newest = index
+        return directory
+
+    @classmethod
+    def from_users(
+        cls, users: Iterable[User], *, workers: int = 1, load: int = 1000
+    ) -> UserDirectory:
+        """Build a directory from scratch from user aggregates (see `rebuild`)."""
+        rows = ((user.id, user.role, user.email_verified, user.created_at) for user in users)
+        return cls.rebuild(rows, workers=workers, load=load)
+
+    def __len__(self) -> int:
+        """Return the number of users listed."""
+        return len(self._ids)
+
+    def __contains__(self, user_id: object) -> bool:
+        """Return whether a user is listed."""
+        return user_id in self._seqs
+
+    def apply(self, event: DomainEvent) -> None:
+        """
+        Fold one domain event into the views; unrelated events are ignored.
+
+        Replays are harmless: a user already listed is not added again, and
+        verifying an unknown or already verified user changes nothing.
+
+        Args:
+            event: A domain event raised by a User aggregate.
+        """
+        if isinstance(event, UserCreatedEvent):
+            self.add(event.user_id, event.role, False, event.occurred_at)
+        elif isinstance(event, EmailVerifiedEvent):
+            self.mark_verified(event.user_id)
+
+    def apply_all(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Fold a batch of domain events into the views.
+
+        Args:
+            events: Domain events in the order they were raised.
+        """
+        for event in events:
+            self.apply(event)
+
+    def add(
+        self, user_id: str, role: UserRole | str, email_verified: bool, created_at: datetime
+    ) -> None:
+        """List a user (no-op if already listed)."""
+        if user_id in self._seqs:
+            return
+        seq = self._append(user_id, role, email_verified, created_at)
+        newest = self._newest_key(seq)
+        self._newest.add(newest)
+        self._by_role.add((self._groups[seq] << _GROUP_SHIFT) | newest)
+
+    def mark_verified(self, user_id: str) -> None:
+        """Move a user to the verified part of its role (no-op if unknown or verified)."""
+        seq = self._seqs.get(user_id)
+        if seq is None or not self._groups[seq] & 1:
+            return
+        newest = self._newest_key(seq)
+        group = self._groups[seq]
+        self._by_role.remove((group << _GROUP_SHIFT) | newest)
+        self._groups[seq] = group - 1
+        self._by_role.add(((group - 1) << _GROUP_SHIFT) | newest)
+
+    def count(self, *, role: UserRole | str | None = None, verified: bool | None = None) -> int:
+        """Return the number of users matching the filters."""
+        return sum(stop - start for start, stop in self._ranges(role, verified)[1])
+
+    def page(
+        self,
+        *,
+        role: UserRole | str | None = None,
+        verified: bool | None = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> DirectoryPage:
+        """
+        Return one page of a listing.
+
+        Without filters users are listed newest first; with a role and/or
+        verified filter they are listed by role, verified first, newest first.
+
+        Args:
+            role: Only list users with this role.
+            verified: Only list users whose email is (True) or is not (False) verified.
+            offset: Number of matching users to skip.
+            limit: Maximum entries in the page.
+
+        Returns:
+            The page and the total number of matching users.
+        """
+        index, ranges = self._ranges(role, verified)
+        total = sum(stop - start for start, stop in ranges)
+        keys: list[int] = []
+        skip = max(offset, 0)
+        for start, stop in ranges:
+            if len(keys) >= limit:
+                break
+            if skip >= stop - start:
+                skip -= stop - start
+                continue
+            first = start + skip
+            keys.extend(index.slice(first, min(stop, first + limit - len(keys))))
+            skip = 0
+        return DirectoryPage([self._entry(key & _SEQ_MASK) for key in keys], total, offset)
+
+    def _ranges(
+        self, role: UserRole | str | None, verified: bool | None
+    ) -> tuple[OrderedIndex, list[tuple[int, int]]]:
+        """The index to read and the rank ranges of the matching users, in listing order."""
+        if role is None and verified is None:
+            return self._newest, [(0, len(self._newest))]
+        codes = range(len(ROLES)) if role is None else [_ROLE_CODES[UserRole(role).value]]
+        flags = (0, 1) if verified is None else (0 if verified else 1,)
+        ranges = []
+        for code in codes:
+            for flag in flags:
+                group = code * 2 + flag
+                ranges.append(
+                    (
+                        self._by_role.rank(group << _GROUP_SHIFT),
+                        self._by_role.rank((group + 1) << _GROUP_SHIFT),
+                    )
+                )
+        return self._by_role, ranges
+
+    def _append(
+        self, user_id: str, role: UserRole | str, email_verified: bool, created_at: datetime
+    ) -> int:
+        seq = len(self._ids)
+        if seq > _SEQ_MASK:
+            raise OverflowError('The directory holds at most 2**32 users')
+        self._ids.append(user_id)
+        self._seqs[user_id] = seq
+        self._created.append(_micros(created_at))
+        self._groups.append(_group(role, email_verified))
+        return seq
+
+    def _newest_key(self, seq: int) -> int:
+        return ((_NEWEST - self._created[seq]) << _SEQ_BITS) | seq
+
+    def _entry(self, seq: int) -> DirectoryEntry:
+        group = self._groups[seq]
+        return DirectoryEntry(
+            user_id=self._ids[seq],
+            role=ROLES[group >> 1],
+            email_verified=not group & 1,
+            created_at=_EPOCH + timedelta(microseconds=self._created[seq]),
+        )
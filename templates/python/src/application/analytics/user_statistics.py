@@ -0,0 +1,294 @@
+"""User population statistics for dashboards.
+
+Two ways to keep the numbers:
+- Full recompute: users are packed into array-backed columns (`UserColumns`)
+  and aggregated in C loops (`array.count`, `Counter`) or with NumPy
+  `bincount` when NumPy is installed.
+- Incremental: `UserStatistics.apply` folds `UserCreatedEvent` and
+  `EmailVerifiedEvent` into the running counters in O(1) per event, and
+  `merge` adds up statistics built over disjoint users (parallel replay).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date
+from types import ModuleType
+from typing import Any
+
+from ...domain.entities.user import (
+    DomainEvent,
+    EmailVerifiedEvent,
+    User,
+    UserCreatedEvent,
+    UserRole,
+)
+
+# NumPy is optional and costly to import: detect it now, import it on first use.
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+ROLES: tuple[UserRole, ...] = tuple(UserRole)
+_ROLE_CODES: dict[str, int] = {role.value: code for code, role in enumerate(ROLES)}
+
+
+def _numpy() -> ModuleType:
+    """Import NumPy on demand."""
+    import numpy
+
+    return numpy
+
+
+class UserColumns:
+    """Column-oriented snapshot of the fields the statistics need."""
+
+    def __init__(self) -> None:
+        """Create empty columns."""
+        self.role = array('B')
+        self.verified = array('B')
+        self.domain = array('I')
+        self.signup_day = array('i')
+        self.domains: list[str] = []
+        self._domain_codes: dict[str, int] = {}
+
+    @classmethod
+    def from_users(cls, users: Iterable[User]) -> UserColumns:
+        """
+        Pack a user collection into columns.
+
+        Args:
+            users: Users to pack.
+
+        Returns:
+            The populated columns.
+        """
+        columns = cls()
+        for user in users:
+            columns.append(
+                user.role, user.email_verified, user.email.domain, user.created_at.date()
+            )
+        return columns
+
+    def append(
+        self, role: UserRole | str, email_verified: bool, domain: str, signup_day: date
+    ) -> None:
+        """
+        Append one user's row.
+
+        Args:
+            role: User role (enum or its value).
+            email_verified: Whether the email is verified.
+            domain: Lower-cased email domain.
+            signup_day: Day the user signed up.
+        """
+        self.role.append(_ROLE_CODES[UserRole(role).value])
+        self.verified.append(1 if email_verified else 0)
+        self.domain.append(self.domain_code(domain))
+        self.signup_day.append(signup_day.toordinal())
+
+    def domain_code(self, domain: str) -> int:
+        """
+        Return the dictionary code of a domain, assigning one on first sight.
+
+        Args:
+            domain: Lower-cased email domain.
+
+        Returns:
+            Integer code indexing `domains`.
+        """
+        code = self._domain_codes.get(domain)
+        if code is None:
+            code = len(self.domains)
+            self._domain_codes[domain] = code
+            self.domains.append(domain)
+        return code
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.role)
+
+
+class UserStatistics:
+    """Running aggregates over a user population."""
+
+    def __init__(self) -> None:
+        """Create empty statistics."""
+        self.total = 0
+        self.verified = 0
+        self.role_counts: Counter[str] = Counter()
+        self.domain_counts: Counter[str] = Counter()
+        self.signups_per_day: Counter[date] = Counter()
+
+    @classmethod
+    def compute(cls, users: Iterable[User], *, use_numpy: bool | None = None) -> UserStatistics:
+        """
+        Recompute statistics from scratch over a user collection.
+
+        Args:
+            users: The whole population.
+            use_numpy: Force (True) or disable (False) NumPy; None uses it when installed.
+
+        Returns:
+            Fresh statistics.
+        """
+        return cls.from_columns(UserColumns.from_users(users), use_numpy=use_numpy)
+
+    @classmethod
+    def from_columns(
+        cls, columns: UserColumns, *, use_numpy: bool | None = None
+    ) -> UserStatistics:
+        """
+        Aggregate pre-packed columns.
+
+        Args:
+            columns: Column snapshot of the population.
+            use_numpy: Force (True) or disable (False) NumPy; None uses it when installed.
+
+        Returns:
+            Fresh statistics.
+
+        Raises:
+            RuntimeError: If NumPy is requested but not installed.
+        """
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise RuntimeError('NumPy is not installed')
+
+        stats = cls()
+        stats.total = len(columns)
+        if use_numpy:
+            stats._aggregate_numpy(columns)
+        else:
+            stats._aggregate_arrays(columns)
+        return stats
+
+    def _aggregate_arrays(self, columns: UserColumns) -> None:
+        """Aggregate with the C-level loops of `array.count` and `Counter`."""
+        self.verified = columns.verified.count(1)
+        for code, role in enumerate(ROLES):
+            count = columns.role.count(code)
+            if count:
+                self.role_counts[role.value] = count
+        for code, count in Counter(columns.domain).items():
+            self.domain_counts[columns.domains[code]] = count
+        for ordinal, count in Counter(columns.signup_day).items():
+            self.signups_per_day[date.fromordinal(ordinal)] = count
+
+    def _aggregate_numpy(self, columns: UserColumns) -> None:
+        """Aggregate with NumPy over zero-copy views of the columns."""
+        numpy = _numpy()
+        roles = numpy.frombuffer(columns.role, dtype=numpy.uint8)
+        verified = numpy.frombuffer(columns.verified, dtype=numpy.uint8)
+        domains = numpy.frombuffer(columns.domain, dtype=numpy.uint32)
+        days = numpy.frombuffer(columns.signup_day, dtype=numpy.int32)
+
+        self.verified = int(numpy.count_nonzero(verified))
+        for code, count in enumerate(numpy.bincount(roles, minlength=len(ROLES)).tolist()):
+            if count:
+                self.role_counts[ROLES[code].value] = count
+        for code, count in enumerate(numpy.bincount(domains).tolist()):
+            if count:
+                self.domain_counts[columns.domains[code]] = count
+        if len(days):
+            first = int(days.min())
+            for offset, count in enumerate(numpy.bincount(days - first).tolist()):
+                if count:
+                    self.signups_per_day[date.fromordinal(first + offset)] = count
+
+    def apply(self, event: DomainEvent) -> None:
+        """
+        Fold one domain event into the counters; unrelated events are ignored.
+
+        Args:
+            event: A domain event raised by a User aggregate.
+        """
+        if isinstance(event, UserCreatedEvent):
+            self.total += 1
+            self.role_counts[event.role] += 1
+            self.domain_counts[event.email.split('@')[1].lower()] += 1
+            self.signups_per_day[event.occurred_at.date()] += 1
+        elif isinstance(event, EmailVerifiedEvent):
+            self.verified += 1
+
+    def apply_all(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Fold a batch of domain events into the counters.
+
+        Args:
+            events: Domain events in the order they were raised.
+        """
+        for event in events:
+            self.apply(event)
+
+    def merge(self, other: UserStatistics) -> None:
+        """
+        Add the counters of statistics built over a disjoint set of users.
+
+        Args:
+            other: Statistics of other users, e.g. another replay partition.
+        """
+        self.total += other.total
+        self.verified += other.verified
+        self.role_counts.update(other.role_counts)
+        self.domain_counts.update(other.domain_counts)
+        self.signups_per_day.update(other.signups_per_day)
+
+    @property
+    def admins(self) -> int:
+        """Number of users with the ADMIN role."""
+        return self.role_counts[UserRole.ADMIN.value]
+
+    @property
+    def unverified(self) -> int:
+        """Number of users whose email is not verified."""
+        return self.total - self.verified
+
+    def top_domains(self, limit: int = 10) -> list[tuple[str, int]]:
+        """
+        Return the most common email domains.
+
+        Args:
+            limit: Maximum number of domains.
+
+        Returns:
+            (domain, count) pairs, most common first.
+        """
+        return self.domain_counts.most_common(limit)
+
+    def signup_histogram(self) -> list[tuple[date, int]]:
+        """
+        Return signups per day in chronological order.
+
+        Returns:
+            (day, count) pairs sorted by day.
+        """
+        return sorted(self.signups_per_day.items())
+
+    def to_dict(self, top_domains: int = 10) -> dict[str, Any]:
+        """
+        Serialize the statistics for a dashboard response.
+
+        Args:
+            top_domains: Number of domains to include.
+
+        Returns:
+            JSON-friendly mapping of every aggregate.
+        """
+        return {
+            'total': self.total,
+            'admins': self.admins,
+            'verified': self.verified,
+            'unverified': self.unverified,
+            'roles': dict(self.role_counts),
+            'top_domains': [
+                {'domain': domain, 'count': count}
+                for domain, count in self.top_domains(top_domains)
+            ],
+            'signups_per_day': [
+                {'day': day.isoformat(), 'count': count}
+                for day, count in self.signup_histogram()
+            ],
+        }
@@ -0,0 +1,5 @@
+"""Duplicate-account detection."""
+
+from .alias_index import AliasCluster, AliasIndex
+
+__all__ = ['AliasCluster', 'AliasIndex']
@@ -0,0 +1,106 @@
+"""Alias clusters through a hash index over canonical email keys.
+
+Replaces pairwise fuzzy comparison (O(n²)) with one linear pass: each
+address is canonicalized and looked up in a dict; the first owner of a key
+is stored as a bare id and only keys seen twice grow a member list, so
+memory is dominated by one dict entry per distinct mailbox.
+
+With `exact=False` the dict is keyed by the 64-bit hash of the canonical
+key instead of the string, which keeps tens of millions of addresses in
+memory at the price of a ~n²/2⁶⁵ chance of merging two unrelated
+mailboxes (about 1e-5 for 20M addresses); clusters then carry the key of
+their second member as label.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass
+
+from ...domain.services.email_canonicalization import EmailCanonicalizer
+from ...domain.value_objects.email import Email
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class AliasCluster:
+    """Accounts whose emails deliver to the same mailbox."""
+
+    canonical_key: str
+    members: tuple[Hashable, ...]
+
+
+class AliasIndex:
+    """Single-pass index from canonical email keys to account ids."""
+
+    def __init__(
+        self, canonicalizer: EmailCanonicalizer | None = None, *, exact: bool = True
+    ) -> None:
+        """
+        Create an empty index.
+
+        Args:
+            canonicalizer: Provider rules; the default rules when omitted.
+            exact: Key by canonical string (True) or by its 64-bit hash (False).
+        """
+        self._canonicalizer = canonicalizer or EmailCanonicalizer()
+        self._exact = exact
+        self._first: dict[Hashable, Hashable] = {}
+        self._clusters: dict[Hashable, tuple[str, list[Hashable]]] = {}
+        self.size = 0
+
+    def add(self, member: Hashable, email: Email | str) -> str:
+        """
+        Index one account.
+
+        Args:
+            member: Account identifier (user id, row number...).
+            email: Its Email, or a raw address already validated elsewhere.
+
+        Returns:
+            The canonical key of the email.
+        """
+        canonicalize = self._canonicalizer.canonicalize
+        key = canonicalize(email.value if isinstance(email, Email) else email)
+        self._insert(member, key)
+        return key
+
+    def add_all(self, entries: Iterable[tuple[Hashable, Email | str]]) -> None:
+        """
+        Index many accounts in one pass.
+
+        Args:
+            entries: (member, email) pairs.
+        """
+        canonicalize = self._canonicalizer.canonicalize
+        insert = self._insert
+        for member, email in entries:
+            insert(member, canonicalize(email.value if isinstance(email, Email) else email))
+
+    def _insert(self, member: Hashable, key: str) -> None:
+        slot = key if self._exact else hash(key)
+        self.size += 1
+        first = self._first.get(slot, _MISSING)
+        if first is _MISSING:
+            self._first[slot] = member
+            return
+        cluster = self._clusters.get(slot)
+        if cluster is None:
+            self._clusters[slot] = (key, [first, member])
+        else:
+            cluster[1].append(member)
+
+    def clusters(self) -> Iterator[AliasCluster]:
+        """
+        Yield the mailboxes shared by two or more accounts, in discovery order.
+
+        Yields:
+            One cluster per shared mailbox; members in insertion order.
+        """
+        for key, members in self._clusters.values():
+            yield AliasCluster(key, tuple(members))
+
+    def __len__(self) -> int:
+        """Return the number of distinct mailboxes indexed."""
+        return len(self._first)
@@ -0,0 +1,5 @@
+"""Request-scoped loaders batching repository lookups."""
+
+from .user_loader import UserLoader
+
+__all__ = ['UserLoader']
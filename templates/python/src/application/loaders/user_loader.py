@@ -0,0 +1,190 @@
+"""Per-request batching and caching of user lookups (DataLoader pattern).
+
+Composite and GraphQL-style handlers resolve users from many places: the
+author of each item, the owner of each comment, the same admin again and
+again. Calling `find_by_id` from each place costs one query per call.
+`UserLoader` turns those calls into awaitables and coalesces them:
+
+- Batching: keys requested while the event loop runs one round of ready
+  callbacks (typically the tasks of an `asyncio.gather`) are collected and
+  sent as one `find_by_ids` / `find_by_emails` call, i.e. one
+  `WHERE id IN (...)` query, after that round (`max_batch` keys per call).
+- Deduplication: each key has one pending future. Emails are keyed by the
+  `Email` value object, whose hash and equality ignore case, so
+  'Ana@X.io' and 'ana@x.io' share a lookup.
+- Caching: resolved futures stay in the loader, so a key is fetched at most
+  once per loader. A user found by id also answers its email, and the other
+  way round. Create one loader per request: the cache is not invalidated by
+  writes from elsewhere (`clear` drops entries after a local write).
+
+Failures of a batch are raised to every caller waiting on it and are not
+cached. The repository is called on the loop thread, like the synchronous
+routes call it today; pass an `executor` to run batches off the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+    from ..ports.user_repository import UserRepository
+
+K = TypeVar('K', bound=Hashable)
+
+
+class _Batcher(Generic[K]):
+    """Pending and cached lookups of one key kind."""
+
+    def __init__(
+        self,
+        fetch: Callable[[list[K]], list[User]],
+        key_of: Callable[[User], K],
+    ) -> None:
+        self.fetch = fetch
+        self.key_of = key_of
+        self.cache: dict[K, asyncio.Future[User | None]] = {}
+        self.queue: dict[K, asyncio.Future[User | None]] = {}
+
+
+class UserLoader:
+    """Coalesces `find_by_id` / `find_by_email` calls of one request into batched queries."""
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        *,
+        max_batch: int = 500,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Create a loader; use one per request.
+
+        Args:
+            repository: Port answering `find_by_ids` and `find_by_emails`.
+            max_batch: Maximum keys per repository call.
+            executor: Runs the repository calls when given; otherwise they run
+                inline on the event loop.
+
+        Raises:
+            ValueError: If max_batch is not positive.
+        """
+        if max_batch < 1:
+            raise ValueError('max_batch must be positive')
+        self._max_batch = max_batch
+        self._executor = executor
+        self._ids: _Batcher[str] = _Batcher(repository.find_by_ids, lambda user: user.id)
+        self._emails: _Batcher[Email] = _Batcher(
+            repository.find_by_emails, lambda user: user.email
+        )
+        self._scheduled = False
+        self.batches = 0  # repository calls made, for tests and metrics
+
+    async def load(self, user_id: str) -> User | None:
+        """Return the user with the id, or None; batched with the other loads of this tick."""
+        return await asyncio.shield(self._future(self._ids, user_id))
+
+    async def load_by_email(self, email: Email) -> User | None:
+        """Return the user owning the email (case-insensitive), or None; batched likewise."""
+        return await asyncio.shield(self._future(self._emails, email))
+
+    async def load_many(self, user_ids: Iterable[str]) -> list[User | None]:
+        """Return the users with the ids, in order (None where missing), in one batch."""
+        futures = [self._future(self._ids, user_id) for user_id in user_ids]
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def prime(self, user: User) -> None:
+        """Cache a user the request already holds (e.g. just saved) under its id and email."""
+        self._resolve(self._ids, user.id, user)
+        self._resolve(self._emails, user.email, user)
+
+    def clear(self, user: User) -> None:
+        """Forget the cached lookups of a user, e.g. after changing it."""
+        self._ids.cache.pop(user.id, None)
+        self._emails.cache.pop(user.email, None)
+
+    def clear_all(self) -> None:
+        """Forget every cached lookup."""
+        self._ids.cache.clear()
+        self._emails.cache.clear()
+
+    def _future(self, batcher: _Batcher[K], key: K) -> asyncio.Future[User | None]:
+        future = batcher.cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = batcher.cache[key] = batcher.queue[key] = loop.create_future()
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        return future
+
+    def _resolve(self, batcher: _Batcher[K], key: K, user: User) -> None:
+        future = batcher.cache.get(key)
+        if future is None:
+            future = batcher.cache[key] = asyncio.get_running_loop().create_future()
+        if not future.done():
+            future.set_result(user)
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        self._flush(self._ids)
+        self._flush(self._emails)
+
+    def _flush(self, batcher: _Batcher[K]) -> None:
+        queued, batcher.queue = batcher.queue, {}
+        # A key may already be answered by a user loaded through the other index.
+        keys = [key for key, future in queued.items() if not future.done()]
+        for start in range(0, len(keys), self._max_batch):
+            chunk = keys[start : start + self._max_batch]
+            self._run(batcher, {key: queued[key] for key in chunk})
+
+    def _run(self, batcher: _Batcher[K], pending: dict[K, asyncio.Future[User | None]]) -> None:
+        self.batches += 1
+        keys = list(pending)
+        if self._executor is None:
+            try:
+                users = batcher.fetch(keys)
+            except Exception as error:  # noqa: BLE001 - handed to every waiting caller
+                self._fail(batcher, pending, error)
+            else:
+                self._fulfil(batcher, pending, users)
+            return
+
+        call = asyncio.get_running_loop().run_in_executor(self._executor, batcher.fetch, keys)
+
+        def done(call: asyncio.Future[list[User]]) -> None:
+            error = call.exception()
+            if error is not None:
+                self._fail(batcher, pending, error)
+            else:
+                self._fulfil(batcher, pending, call.result())
+
+        call.add_done_callback(done)
+
+    def _fulfil(
+        self,
+        batcher: _Batcher[K],
+        pending: dict[K, asyncio.Future[User | None]],
+        users: list[User],
+    ) -> None:
+        found: dict[K, User] = {batcher.key_of(user): user for user in users}
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(key))
+        for user in users:
+            self._resolve(self._ids, user.id, user)
+            self._resolve(self._emails, user.email, user)
+
+    @staticmethod
+    def _fail(
+        batcher: _Batcher[K], pending: dict[K, asyncio.Future[User | None]], error: BaseException
+    ) -> None:
+        for key, future in pending.items():
+            if batcher.cache.get(key) is future:
+                del batcher.cache[key]
+            if not future.done():
+                future.set_exception(error)
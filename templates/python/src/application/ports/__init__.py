@@ -0,0 +1 @@
+"""Application ports (interfaces implemented by infrastructure)."""
@@ -0,0 +1,54 @@
+"""Event Log Port.
+
+The log keeps every domain event with a global, increasing position. For
+parallel replay each aggregate is assigned to one of `BUCKETS` fixed
+buckets by a stable hash of its id, and the log can be read one bucket at a
+time: a reader that owns a set of buckets sees every event of its
+aggregates, in order, and nothing else.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, Protocol
+
+from ...domain.entities.user import DomainEvent
+
+BUCKETS = 1024
+
+
+def bucket_of(aggregate_id: str) -> int:
+    """
+    Return the bucket of an aggregate (stable across processes and runs).
+
+    Args:
+        aggregate_id: Id of the aggregate, e.g. the user id.
+
+    Returns:
+        Bucket number in [0, BUCKETS).
+    """
+    return zlib.crc32(aggregate_id.encode()) % BUCKETS
+
+
+class StoredEvent(NamedTuple):
+    """A domain event and its position in the log."""
+
+    position: int
+    event: DomainEvent
+
+
+class EventLog(Protocol):
+    """Append-only log of domain events, readable per bucket."""
+
+    def append(self, aggregate_id: str, events: Sequence[DomainEvent]) -> int:
+        """Append the events of one aggregate and return the position of the last one."""
+        ...
+
+    def head(self) -> int:
+        """Return the position of the last event, 0 for an empty log."""
+        ...
+
+    def read_bucket(self, bucket: int, after: int, until: int) -> Iterable[StoredEvent]:
+        """Yield the events of a bucket with `after < position <= until`, by position."""
+        ...
@@ -0,0 +1,41 @@
+"""Idempotency Store Port.
+
+Keeps the response of an operation under a client-supplied idempotency
+key, plus a short-lived lock that marks the key as in flight. The lock
+holder gets an owner token, so a caller whose lock expired cannot release
+the lock another caller took since.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """Response recorded for an idempotency key."""
+
+    fingerprint: str
+    status_code: int
+    body: bytes
+
+
+class IdempotencyStore(Protocol):
+    """Storage for idempotent responses and in-flight locks."""
+
+    def get(self, key: str) -> StoredResponse | None:
+        """Return the response stored for the key, or None if absent or expired."""
+        ...
+
+    def put(self, key: str, response: StoredResponse, ttl_seconds: float) -> None:
+        """Store the response for `ttl_seconds`."""
+        ...
+
+    def acquire(self, key: str, ttl_seconds: float) -> str | None:
+        """Mark the key as in flight; return the owner token, or None if another caller holds it."""
+        ...
+
+    def release(self, key: str, token: str) -> None:
+        """Clear the in-flight mark if `token` still owns it."""
+        ...
@@ -0,0 +1,17 @@
+"""Password Hasher Port."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class PasswordHasher(Protocol):
+    """Turns plain passwords into storable hashes and checks them."""
+
+    def hash(self, plain_password: str) -> str:
+        """Return a salted, self-describing hash of the password."""
+        ...
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        """Return True if the password matches the stored hash."""
+        ...
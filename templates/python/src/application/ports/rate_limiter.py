@@ -0,0 +1,46 @@
+"""Rate Limiter Port."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import NamedTuple, Protocol
+
+
+@dataclass(frozen=True)
+class TokenBucketPolicy:
+    """Bucket size and refill speed shared by every key of a limiter."""
+
+    capacity: float
+    refill_per_second: float
+
+    def __post_init__(self) -> None:
+        """Reject policies that could never allow or never refill."""
+        if self.capacity <= 0 or self.refill_per_second <= 0:
+            raise ValueError('capacity and refill_per_second must be positive')
+
+    @property
+    def seconds_to_full(self) -> float:
+        """Time an empty bucket takes to refill completely."""
+        return self.capacity / self.refill_per_second
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of taking tokens from a bucket."""
+
+    allowed: bool
+    remaining: float
+    retry_after: float = 0.0
+
+
+class RateLimiter(Protocol):
+    """Token buckets keyed by an arbitrary string."""
+
+    policy: TokenBucketPolicy
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        """Take `cost` tokens from the key's bucket if it holds enough."""
+        ...
+
+    def refund(self, key: str, cost: float = 1.0) -> None:
+        """Give back tokens taken by `acquire`, up to the bucket's capacity."""
+        ...
@@ -0,0 +1,40 @@
+"""Replay Checkpoint Store Port."""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Protocol
+
+
+class ReplayCheckpoint(NamedTuple):
+    """
+    Progress of one replay partition.
+
+    Buckets of the partition before `bucket` are done, and `bucket` is done
+    up to `position`; `bucket >= BUCKETS` means the partition is finished.
+    `factory` names the projection factory the replay was started with.
+    """
+
+    partition: int
+    partitions: int
+    head: int  # last log position the replay covers
+    bucket: int
+    position: int
+    events: int  # events folded into `projection` so far
+    projection: Any
+    factory: str = ''  # qualified name; '' in checkpoints saved before it was recorded
+
+
+class ReplayCheckpointStore(Protocol):
+    """Persists the checkpoints of a running replay, one per partition."""
+
+    def load_all(self) -> list[ReplayCheckpoint]:
+        """Return every stored checkpoint."""
+        ...
+
+    def save(self, checkpoint: ReplayCheckpoint) -> None:
+        """Replace the checkpoint of the partition atomically."""
+        ...
+
+    def clear(self) -> None:
+        """Forget every checkpoint."""
+        ...
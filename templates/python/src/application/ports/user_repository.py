@@ -0,0 +1,73 @@
+"""User Repository Port.
+
+RULES:
+- Defined by the application layer, implemented by infrastructure
+- Speaks in domain objects (User, Email), never in rows or DTOs
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+
+class UserRepository(Protocol):
+    """Persistence port for the User aggregate."""
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """Return the user with the given id, or None if it does not exist."""
+        ...
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """Return the users with any of the ids, in one round trip."""
+        ...
+
+    def find_by_email(self, email: Email) -> User | None:
+        """Return the user owning the email (case-insensitive), or None."""
+        ...
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """Return the users owning any of the emails (case-insensitive), in one round trip."""
+        ...
+
+    def save(self, user: User) -> None:
+        """Insert a new user or store the pending changes of an existing one."""
+        ...
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """Store several users in one batch."""
+        ...
+
+
+class UserAlreadyExistsError(Exception):
+    """Raised when registering an email that already belongs to a user."""
+
+    def __init__(self, email: str) -> None:
+        """
+        Build the error for the conflicting email.
+
+        Args:
+            email: The email address that is already registered.
+        """
+        super().__init__(f'User with email {email} already exists')
+        self.email = email
+
+
+class ConcurrencyConflictError(Exception):
+    """Raised when an optimistic-locking update finds a newer version stored."""
+
+    def __init__(self, user_ids: Iterable[str]) -> None:
+        """
+        Build the error for the users whose stored version no longer matches.
+
+        Args:
+            user_ids: Ids of the users that were modified concurrently.
+        """
+        self.user_ids = tuple(user_ids)
+        super().__init__(
+            f'Concurrent modification detected for user(s): {", ".join(self.user_ids)}'
+        )
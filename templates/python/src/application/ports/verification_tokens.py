@@ -0,0 +1,42 @@
+"""Email Verification Token Port."""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Protocol
+
+
+class VerificationClaims(NamedTuple):
+    """What a valid token asserts."""
+
+    user_id: str
+    expires_at: float  # epoch seconds
+
+
+class InvalidTokenError(Exception):
+    """Raised when a token is malformed, forged or signed with an unknown key."""
+
+
+class ExpiredTokenError(InvalidTokenError):
+    """Raised when a genuine token is past its expiry."""
+
+    def __init__(self, claims: VerificationClaims) -> None:
+        """
+        Build the error.
+
+        Args:
+            claims: The claims of the expired token (to offer a new link).
+        """
+        super().__init__('Verification token expired')
+        self.claims = claims
+
+
+class VerificationTokens(Protocol):
+    """Issues and checks self-contained email-verification tokens."""
+
+    def issue(self, user_id: str, expires_at: float) -> str:
+        """Return a URL-safe token for the user, valid until `expires_at` (epoch seconds)."""
+        ...
+
+    def verify(self, token: str, now: float) -> VerificationClaims:
+        """Return the token's claims, raising InvalidTokenError or ExpiredTokenError."""
+        ...
@@ -0,0 +1,5 @@
+"""In-process scheduling of delayed jobs."""
+
+from .timing_wheel import Timer, TimingWheel
+
+__all__ = ['Timer', 'TimingWheel']
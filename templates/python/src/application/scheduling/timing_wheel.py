@@ -0,0 +1,172 @@
+"""Hierarchical timing wheel for large numbers of pending timers.
+
+Reminder and expiry jobs (one or two per unverified user) number in the
+millions and almost never need ordering beyond their tick. A heap costs
+O(log n) per insert and pop; a timing wheel costs O(1) for both:
+
+- Level 0 has `2**bits[0]` buckets, one per tick. Level k has `2**bits[k]`
+  buckets, each spanning the whole range of the levels below it.
+- A timer goes into the lowest level whose range covers its distance from
+  the current tick, in the bucket its deadline maps to.
+- Each tick empties one level-0 bucket: its timers are due. When the
+  level-0 index wraps to 0, the current bucket of level 1 is cascaded
+  (re-inserted, which lands its timers in level 0), and so on upwards.
+
+A timer is moved at most `len(bits) - 1` times over its life, so advancing
+costs O(1) amortized per timer plus O(1) per tick. This is the scheme of
+Varghese & Lauck's hierarchical wheels, as used by the classic Linux timer
+wheel (`bits=(8, 6, 6, 6, 6)` covers 2**32 ticks).
+
+Cancellation is lazy: `cancel` flags the `Timer` and it is dropped when its
+bucket is reached. Timers hold their payload, so memory is one small object
+per pending timer plus a list slot.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+
+class Timer:
+    """A scheduled payload; keep it to cancel the timer."""
+
+    __slots__ = ('deadline', 'payload', 'cancelled')
+
+    def __init__(self, deadline: int, payload: Any) -> None:
+        """
+        Build the timer.
+
+        Args:
+            deadline: Tick at which the timer is due.
+            payload: Anything; returned when the timer fires.
+        """
+        self.deadline = deadline
+        self.payload = payload
+        self.cancelled = False
+
+
+class TimingWheel:
+    """Hierarchical timing wheel keyed by integer ticks of `tick` seconds."""
+
+    def __init__(
+        self, tick: float = 1.0, bits: Sequence[int] = (8, 6, 6, 6, 6), start: float = 0.0
+    ) -> None:
+        """
+        Create an empty wheel.
+
+        Args:
+            tick: Seconds per tick; deadlines are rounded up to a tick.
+            bits: log2 of the bucket count of each level, lowest first.
+            start: Time (seconds, same clock as the deadlines) of the current tick.
+
+        Raises:
+            ValueError: If tick is not positive or bits is empty or not positive.
+        """
+        if tick <= 0:
+            raise ValueError('tick must be positive')
+        if not bits or min(bits) < 1:
+            raise ValueError('bits must be a non-empty sequence of positive sizes')
+        self.tick = tick
+        self._bits = tuple(bits)
+        self._shifts = [sum(self._bits[:level]) for level in range(len(self._bits))]
+        self._levels: list[list[list[Timer]]] = [[[] for _ in range(1 << b)] for b in self._bits]
+        self._span = 1 << sum(self._bits)  # ticks covered by the whole wheel
+        self._now = math.floor(start / tick)
+        self._pending = 0
+
+    def __len__(self) -> int:
+        """Number of pending (scheduled and not cancelled) timers."""
+        return self._pending
+
+    @property
+    def now(self) -> float:
+        """Time of the current tick, in seconds."""
+        return self._now * self.tick
+
+    def schedule(self, deadline: float, payload: Any) -> Timer:
+        """
+        Schedule a payload.
+
+        Args:
+            deadline: Time (seconds) at which the payload is due; a past
+                deadline is due at the next tick `advance` reaches.
+            payload: Returned by `advance` when due.
+
+        Returns:
+            The timer, for `cancel`.
+        """
+        timer = Timer(max(math.ceil(deadline / self.tick), self._now), payload)
+        self._insert(timer)
+        self._pending += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """
+        Cancel a pending timer.
+
+        Returns:
+            False if it had already fired or been cancelled.
+        """
+        if timer.cancelled:  # also set once fired
+            return False
+        timer.cancelled = True
+        self._pending -= 1
+        return True
+
+    def advance(self, now: float) -> list[Any]:
+        """
+        Move time forward and collect what became due.
+
+        Args:
+            now: Current time in seconds; earlier times are ignored.
+
+        Returns:
+            The payloads of the timers due at or before `now`, by tick.
+        """
+        return list(self._expire(math.floor(now / self.tick)))
+
+    def _insert(self, timer: Timer) -> None:
+        distance = timer.deadline - self._now
+        # Beyond the wheel: park in the top level's farthest bucket and re-cascade later.
+        timer_tick = timer.deadline if distance < self._span else self._now + self._span - 1
+        levels = self._levels
+        for level, shift in enumerate(self._shifts):
+            if level == len(levels) - 1 or distance < 1 << (shift + self._bits[level]):
+                mask = (1 << self._bits[level]) - 1
+                levels[level][(timer_tick >> shift) & mask].append(timer)
+                return
+
+    def _expire(self, until: int) -> Iterator[Any]:
+        level0 = self._levels[0]
+        mask0 = len(level0) - 1
+        while self._now <= until:
+            index = self._now & mask0
+            if index == 0:
+                self._cascade()
+            bucket = level0[index]
+            if bucket:
+                level0[index] = []
+                for timer in bucket:
+                    if timer.cancelled:
+                        continue
+                    if timer.deadline > self._now:  # parked beyond the wheel's range
+                        self._insert(timer)
+                        continue
+                    self._pending -= 1
+                    timer.cancelled = True  # fired: no longer cancellable
+                    yield timer.payload
+            self._now += 1
+
+    def _cascade(self) -> None:
+        for level in range(1, len(self._levels)):
+            shift = self._shifts[level]
+            index = (self._now >> shift) & ((1 << self._bits[level]) - 1)
+            bucket = self._levels[level][index]
+            self._levels[level][index] = []
+            for timer in bucket:
+                if not timer.cancelled:
+                    self._insert(timer)
+            if index != 0:
+                return
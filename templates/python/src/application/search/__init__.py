@@ -0,0 +1,5 @@
+"""In-process search over users."""
+
+from .user_search_index import PackedKeys, SearchHit, UserSearchIndex
+
+__all__ = ['PackedKeys', 'SearchHit', 'UserSearchIndex']
@@ -0,0 +1,394 @@
+"""In-process search over user emails and names.
+
+Support staff look users up by a fragment of their email or name. Scanning
+every `User` (or `ILIKE '%x%'`) costs O(n) per keystroke; `UserSearchIndex`
+answers from two structures kept current by `UserCreatedEvent` and
+`UserNameChangedEvent`:
+
+- Prefixes: the lower-cased email, the full name and every later word of the
+  name, kept as sorted entries packed into blocks of `block_size` joined
+  strings. Sorted order is a trie's leaf order, and the first entry of each
+  block plays the trie's upper levels: a prefix query bisects the block
+  heads, then walks forward while entries share the prefix. Packing keeps
+  the cost at a few bytes per key instead of a Python object per trie node.
+- Substrings: a trigram posting list (sorted `array('I')` of user numbers)
+  per distinct three-character slice of the email and name. A query's
+  three smallest trigram lists are intersected and the survivors are
+  checked against the text.
+
+Memory is bounded by `max_postings`: a trigram shared by more users than
+that (`com`, `@gm`, ...) becomes a stop-gram and its list is dropped, since
+it would select most of the population anyway. Queries use their other
+trigrams; a query made only of stop-grams checks users in order. Work per
+query is bounded too: the prefix walk stops after `scan_limit` entries and
+the substring check after `scan_limit` matches, so a fragment shared by
+millions of users ranks the first matches found rather than all of them.
+
+Hits are ranked: exact match, email prefix, name prefix, email substring,
+name substring; then shorter matched text, then the earlier indexed user.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from ...domain.entities.user import DomainEvent, User, UserCreatedEvent, UserNameChangedEvent
+
+MATCHES = ('exact', 'email_prefix', 'name_prefix', 'email_substring', 'name_substring')
+EXACT, EMAIL_PREFIX, NAME_PREFIX, EMAIL_SUBSTRING, NAME_SUBSTRING = range(len(MATCHES))
+
+_CONTROL = dict.fromkeys(range(32))  # folded text never holds the separators below
+_KEY_SEP = '\x00'  # between the key and its reference in a prefix entry
+_BLOCK_SEP = '\x01'  # between entries in a packed block
+_DOC_SEP = '\x00'  # between the folded email and name of a user
+_INTERSECTED = 3  # posting lists intersected per query, smallest first
+_BUILD_RUN = 1_000_000  # prefix entries sorted at a time by `build`
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A user matching a query, and how."""
+
+    user_id: str
+    match: str
+
+
+def fold(text: str) -> str:
+    """Lower-case text, drop control characters and collapse whitespace."""
+    return ' '.join(text.lower().translate(_CONTROL).split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the distinct three-character slices of already folded text."""
+    return {text[start : start + 3] for start in range(len(text) - 2)}
+
+
+class PackedKeys:
+    """Sorted strings packed into blocks of joined strings."""
+
+    def __init__(self, sorted_entries: Iterable[str] = (), *, block_size: int = 128) -> None:
+        """
+        Create the structure.
+
+        Args:
+            sorted_entries: Initial entries in ascending order, free of control characters.
+            block_size: Target entries per block.
+        """
+        self._block_size = block_size
+        self._blocks: list[str] = []
+        self._heads: list[str] = []
+        self._len = 0
+        chunk: list[str] = []
+        for entry in sorted_entries:
+            chunk.append(entry)
+            if len(chunk) == block_size:
+                self._append_block(chunk)
+                chunk = []
+        if chunk:
+            self._append_block(chunk)
+
+    def _append_block(self, entries: list[str]) -> None:
+        self._blocks.append(_BLOCK_SEP.join(entries))
+        self._heads.append(entries[0])
+        self._len += len(entries)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the entries in order."""
+        for block in self._blocks:
+            yield from block.split(_BLOCK_SEP)
+
+    def add(self, entry: str) -> None:
+        """Insert an entry."""
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append(entry)
+            self._heads.append(entry)
+            return
+        index = max(bisect_right(self._heads, entry) - 1, 0)
+        entries = self._blocks[index].split(_BLOCK_SEP)
+        insort(entries, entry)
+        if len(entries) > 2 * self._block_size:
+            half = len(entries) // 2
+            self._blocks[index : index + 1] = [
+                _BLOCK_SEP.join(entries[:half]),
+                _BLOCK_SEP.join(entries[half:]),
+            ]
+            self._heads[index : index + 1] = [entries[0], entries[half]]
+        else:
+            self._blocks[index] = _BLOCK_SEP.join(entries)
+            self._heads[index] = entries[0]
+
+    def remove(self, entry: str) -> None:
+        """
+        Remove an entry.
+
+        Raises:
+            KeyError: If the entry is not stored.
+        """
+        index = bisect_right(self._heads, entry) - 1
+        entries = self._blocks[index].split(_BLOCK_SEP) if index >= 0 else []
+        position = bisect_left(entries, entry)
+        if position == len(entries) or entries[position] != entry:
+            raise KeyError(entry)
+        del entries[position]
+        self._len -= 1
+        if entries:
+            self._blocks[index] = _BLOCK_SEP.join(entries)
+            self._heads[index] = entries[0]
+        else:
+            del self._blocks[index]
+            del self._heads[index]
+
+    def scan(self, prefix: str) -> Iterator[str]:
+        """Yield the entries starting with `prefix`, in order."""
+        index = max(bisect_right(self._heads, prefix) - 1, 0)
+        for block in self._blocks[index:]:
+            entries = block.split(_BLOCK_SEP)
+            for entry in entries[bisect_left(entries, prefix) :]:
+                if not entry.startswith(prefix):
+                    return
+                yield entry
+
+
+class UserSearchIndex:
+    """Prefix and substring search over user emails and names."""
+
+    def __init__(
+        self, *, max_postings: int = 50_000, scan_limit: int = 1_000, block_size: int = 128
+    ) -> None:
+        """
+        Create an empty index.
+
+        Args:
+            max_postings: Users a trigram may select before it becomes a stop-gram.
+            scan_limit: Maximum prefix entries walked, or matches collected by a
+                scan, per query.
+            block_size: Entries per packed block of the prefix index.
+        """
+        self._max_postings = max_postings
+        self._scan_limit = scan_limit
+        self._ids: list[str] = []
+        self._seqs: dict[str, int] = {}
+        self._docs: list[str] = []
+        self._postings: dict[str, array[int] | None] = {}
+        self._prefixes = PackedKeys(block_size=block_size)
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[tuple[str, str, str]],
+        *,
+        max_postings: int = 50_000,
+        scan_limit: int = 1_000,
+        block_size: int = 128,
+    ) -> UserSearchIndex:
+        """
+        Index a population in one pass, sorting the prefix entries once.
+
+        Args:
+            rows: (user id, email, name) of every user.
+            max_postings: See `__init__`.
+            scan_limit: See `__init__`.
+            block_size: See `__init__`.
+
+        Returns:
+            The populated index.
+        """
+        index = cls(max_postings=max_postings, scan_limit=scan_limit, block_size=block_size)
+        # Prefix entries are sorted and packed in runs, so only one run is ever
+        # held as separate strings, then the packed runs are merged.
+        runs: list[PackedKeys] = []
+        entries: list[str] = []
+        for user_id, email, name in rows:
+            if user_id in index._seqs:
+                continue
+            seq = index._append(user_id, email, name)
+            entries.extend(index._prefix_entries(seq))
+            if len(entries) >= _BUILD_RUN:
+                entries.sort()
+                runs.append(PackedKeys(entries, block_size=block_size))
+                entries = []
+        entries.sort()
+        runs.append(PackedKeys(entries, block_size=block_size))
+        merged = runs[0] if len(runs) == 1 else heapq.merge(*runs)
+        index._prefixes = PackedKeys(merged, block_size=block_size)
+        return index
+
+    @classmethod
+    def from_users(cls, users: Iterable[User], **options: int) -> UserSearchIndex:
+        """Index user aggregates (see `build`)."""
+        return cls.build(((user.id, user.email.value, user.name) for user in users), **options)
+
+    def __len__(self) -> int:
+        """Return the number of indexed users."""
+        return len(self._ids)
+
+    def __contains__(self, user_id: object) -> bool:
+        """Return whether a user is indexed."""
+        return user_id in self._seqs
+
+    @property
+    def stop_grams(self) -> int:
+        """Number of trigrams dropped for selecting more than `max_postings` users."""
+        return sum(1 for postings in self._postings.values() if postings is None)
+
+    def apply(self, event: DomainEvent) -> None:
+        """
+        Fold one domain event into the index; unrelated events are ignored.
+
+        Args:
+            event: A domain event raised by a User aggregate.
+        """
+        if isinstance(event, UserCreatedEvent):
+            self.add(event.user_id, event.email, event.name)
+        elif isinstance(event, UserNameChangedEvent):
+            self.rename(event.user_id, event.name)
+
+    def apply_all(self, events: Iterable[DomainEvent]) -> None:
+        """
+        Fold a batch of domain events into the index.
+
+        Args:
+            events: Domain events in the order they were raised.
+        """
+        for event in events:
+            self.apply(event)
+
+    def add(self, user_id: str, email: str, name: str) -> None:
+        """Index a user (no-op if already indexed)."""
+        if user_id in self._seqs:
+            return
+        seq = self._append(user_id, email, name)
+        for entry in self._prefix_entries(seq):
+            self._prefixes.add(entry)
+
+    def rename(self, user_id: str, name: str) -> None:
+        """Re-index a user's name (no-op if the user is unknown)."""
+        seq = self._seqs.get(user_id)
+        if seq is None:
+            return
+        email, old_name = self._docs[seq].split(_DOC_SEP)
+        new_name = fold(name)
+        old_grams = trigrams(email) | trigrams(old_name)
+        new_grams = trigrams(email) | trigrams(new_name)
+        for entry in self._name_entries(old_name, seq):
+            self._prefixes.remove(entry)
+        for gram in old_grams - new_grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                del postings[bisect_left(postings, seq)]
+        self._post(new_grams - old_grams, seq)
+        self._docs[seq] = email + _DOC_SEP + new_name
+        for entry in self._name_entries(new_name, seq):
+            self._prefixes.add(entry)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """
+        Return the best `limit` users whose email or name contains `query`.
+
+        Args:
+            query: Fragment of an email or name; case and spacing are ignored.
+            limit: Maximum number of hits.
+
+        Returns:
+            Hits, best first.
+        """
+        text = fold(query)
+        if not text or limit < 1:
+            return []
+        best: dict[int, tuple[int, int]] = {}  # user number -> (match, matched length)
+
+        def consider(seq: int, match: int, length: int) -> None:
+            if (match, length) < best.get(seq, (len(MATCHES), 0)):
+                best[seq] = (match, length)
+
+        for walked, entry in enumerate(self._prefixes.scan(text)):
+            if walked == self._scan_limit:
+                break
+            key, _, reference = entry.partition(_KEY_SEP)
+            kind = reference[0]  # e: email, n: full name, w: later word of the name
+            if key == text and kind != 'w':
+                match = EXACT
+            else:
+                match = EMAIL_PREFIX if kind == 'e' else NAME_PREFIX
+            consider(int(reference[1:]), match, len(key))
+
+        # Substring hits rank below every prefix hit: only look when there is room.
+        if len(text) >= 3 and len(best) < limit:
+            for seq, email, name in self._substring_matches(text):
+                if text in email:
+                    consider(seq, EMAIL_SUBSTRING, len(email))
+                else:
+                    consider(seq, NAME_SUBSTRING, len(name))
+
+        ranked = heapq.nsmallest(limit, best.items(), key=lambda item: (item[1], item[0]))
+        return [SearchHit(self._ids[seq], MATCHES[match]) for seq, (match, _) in ranked]
+
+    def _substring_matches(self, text: str) -> Iterator[tuple[int, str, str]]:
+        """(user number, email, name) of users containing `text`, up to `scan_limit` of them."""
+        lists = []
+        for gram in trigrams(text):
+            if gram not in self._postings:
+                return  # no user has this trigram
+            postings = self._postings[gram]
+            if postings is not None:
+                lists.append(postings)
+        lists.sort(key=len)
+        candidates: Iterable[int]
+        if not lists:
+            candidates = range(len(self._docs))  # no selective trigram: check everyone
+        elif len(lists) == 1:
+            candidates = lists[0]
+        else:
+            # The text check below filters exactly; a few lists narrow enough.
+            candidates = sorted(set(lists[0]).intersection(*lists[1:_INTERSECTED]))
+        found = 0
+        for seq in candidates:
+            doc = self._docs[seq]
+            if text in doc:
+                email, name = doc.split(_DOC_SEP)
+                yield seq, email, name
+                found += 1
+                if found == self._scan_limit:
+                    return
+
+    def _append(self, user_id: str, email: str, name: str) -> int:
+        seq = len(self._ids)
+        folded_email, folded_name = fold(email), fold(name)
+        self._ids.append(user_id)
+        self._seqs[user_id] = seq
+        self._docs.append(folded_email + _DOC_SEP + folded_name)
+        self._post(trigrams(folded_email) | trigrams(folded_name), seq)
+        return seq
+
+    def _post(self, grams: Iterable[str], seq: int) -> None:
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is None:
+                if gram in self._postings:
+                    continue  # stop-gram
+                postings = self._postings[gram] = array('I')
+            if not postings or postings[-1] < seq:
+                postings.append(seq)
+            else:
+                postings.insert(bisect_left(postings, seq), seq)
+            if len(postings) > self._max_postings:
+                self._postings[gram] = None
+
+    def _prefix_entries(self, seq: int) -> list[str]:
+        email, name = self._docs[seq].split(_DOC_SEP)
+        return [f'{email}{_KEY_SEP}e{seq}', *self._name_entries(name, seq)]
+
+    @staticmethod
+    def _name_entries(name: str, seq: int) -> list[str]:
+        words = dict.fromkeys(name.split(' ')[1:])
+        return [f'{name}{_KEY_SEP}n{seq}', *(f'{word}{_KEY_SEP}w{seq}' for word in words)]
+
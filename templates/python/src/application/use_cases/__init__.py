@@ -0,0 +1 @@
+"""Application use cases."""
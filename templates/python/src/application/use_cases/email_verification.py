@@ -0,0 +1,129 @@
+"""Email verification use case.
+
+Registration issues a signed, self-contained token (user id + expiry) for
+the verification link and schedules two jobs on a timing wheel: a reminder
+and the link's expiry. A click checks the token's signature and expiry
+without any token lookup, then loads the user once to apply
+`User.verify_email`. Nothing is stored per token, so there is no token
+table to read on each click or to sweep for expired rows.
+
+Jobs are not cancelled when the user verifies: `due` loads the users of the
+due jobs in one `find_by_ids` call and drops those already verified, which
+keeps the wheel free of a per-user timer index.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from ...domain.entities.user import User
+from ..ports.user_repository import UserRepository
+from ..ports.verification_tokens import InvalidTokenError, VerificationTokens
+from ..scheduling.timing_wheel import TimingWheel
+
+JOB_REMINDER = 'reminder'
+JOB_EXPIRY = 'expiry'
+
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFAULT_REMINDER = 24 * 3600.0
+
+
+class VerificationJob(NamedTuple):
+    """A reminder or expiry to act on for a still unverified user."""
+
+    kind: str
+    user_id: str
+
+
+class EmailVerificationHandler:
+    """Issues verification links, applies clicks and reports due reminder/expiry jobs."""
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        tokens: VerificationTokens,
+        *,
+        ttl: float = DEFAULT_TTL,
+        remind_after: float | None = DEFAULT_REMINDER,
+        scheduler: TimingWheel | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Wire the handler.
+
+        Args:
+            repository: Where users are loaded and saved.
+            tokens: Signs and checks the tokens.
+            ttl: Seconds a link stays valid.
+            remind_after: Seconds after issuing to remind an unverified user; None for no reminder.
+            scheduler: Wheel holding the jobs (epoch-seconds clock); a fresh one by default.
+            clock: Epoch-seconds time source (injectable for tests).
+        """
+        self._repository = repository
+        self._tokens = tokens
+        self._ttl = ttl
+        self._remind_after = remind_after
+        self._clock = clock
+        self.scheduler = scheduler if scheduler is not None else TimingWheel(start=clock())
+
+    def issue(self, user: User) -> str:
+        """
+        Create the verification token of a user and schedule its jobs.
+
+        Args:
+            user: A user whose email is not verified yet.
+
+        Returns:
+            The token to put in the verification link.
+        """
+        now = self._clock()
+        if self._remind_after is not None and self._remind_after < self._ttl:
+            reminder = VerificationJob(JOB_REMINDER, user.id)
+            self.scheduler.schedule(now + self._remind_after, reminder)
+        self.scheduler.schedule(now + self._ttl, VerificationJob(JOB_EXPIRY, user.id))
+        return self._tokens.issue(user.id, now + self._ttl)
+
+    def verify(self, token: str) -> User:
+        """
+        Apply a verification click.
+
+        Clicking a link again after success is not an error: the user is
+        returned unchanged.
+
+        Args:
+            token: Token from the link.
+
+        Returns:
+            The verified user.
+
+        Raises:
+            InvalidTokenError: If the token is forged, malformed or its user no longer exists.
+            ExpiredTokenError: If the link expired.
+        """
+        claims = self._tokens.verify(token, self._clock())
+        user = self._repository.find_by_id(claims.user_id)
+        if user is None:
+            raise InvalidTokenError('Verification token for an unknown user')
+        if not user.email_verified:
+            user.verify_email()
+            self._repository.save(user)
+        return user
+
+    def due(self) -> list[VerificationJob]:
+        """
+        Advance the scheduler to now and return the jobs still worth running.
+
+        Returns:
+            Due jobs whose user exists and is still unverified, in due order.
+        """
+        jobs: list[VerificationJob] = self.scheduler.advance(self._clock())
+        if not jobs:
+            return []
+        pending = {
+            user.id
+            for user in self._repository.find_by_ids({job.user_id for job in jobs})
+            if not user.email_verified
+        }
+        return [job for job in jobs if job.user_id in pending]
@@ -0,0 +1,227 @@
+"""Idempotent execution of use cases.
+
+Clients retrying during latency spikes send the same request several times.
+`IdempotentExecutor` runs an operation once per idempotency key and replays
+its response afterwards:
+
+1. A stored response for the key is returned as is (or rejected if the
+   request fingerprint differs: the key was reused for another request).
+2. Concurrent duplicates inside this process wait for the in-flight call
+   and share its response (coalescing, no extra work).
+3. Across processes the store's lock elects one executor; the others poll
+   for the stored response until `wait_timeout` expires.
+
+Only returned responses are stored; exceptions propagate to the caller and
+its coalesced waiters and leave the key free for a retry.
+
+Fingerprints are kept as long as the responses, so SECRET_FIELDS
+(passwords) are left out of them: a stored digest of a password is an
+offline guessing target.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..ports.idempotency_store import IdempotencyStore, StoredResponse
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_LOCK_TTL_SECONDS = 30.0
+# Body fields, at any depth, that never go into a request fingerprint.
+SECRET_FIELDS = frozenset({'password'})
+
+
+class IdempotencyKeyReusedError(Exception):
+    """Raised when a key is sent again with a different request."""
+
+    def __init__(self, key: str) -> None:
+        """
+        Build the error.
+
+        Args:
+            key: The reused idempotency key.
+        """
+        super().__init__(f'Idempotency key {key} was already used for a different request')
+        self.key = key
+
+
+class IdempotencyInProgressError(Exception):
+    """Raised when another process is still executing the request."""
+
+    def __init__(self, key: str) -> None:
+        """
+        Build the error.
+
+        Args:
+            key: The idempotency key still in flight.
+        """
+        super().__init__(f'A request with idempotency key {key} is still in progress')
+        self.key = key
+
+
+def request_fingerprint(method: str, path: str, body: Any) -> str:
+    """
+    Hash a request so reuse of a key for a different request can be detected.
+
+    Args:
+        method: HTTP method (or operation name).
+        path: Request path.
+        body: JSON-compatible payload; key order does not matter and
+            SECRET_FIELDS are left out.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    canonical = json.dumps(
+        [method.upper(), path, _without_secrets(body)], sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _without_secrets(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            name: _without_secrets(item)
+            for name, item in value.items()
+            if name not in SECRET_FIELDS
+        }
+    if isinstance(value, list | tuple):
+        return [_without_secrets(item) for item in value]
+    return value
+
+
+class _InFlight:
+    """Result slot shared by coalesced callers."""
+
+    __slots__ = ('done', 'error', 'fingerprint', 'response')
+
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+        self.response: StoredResponse | None = None
+        self.error: BaseException | None = None
+
+
+class IdempotentExecutor:
+    """Runs operations at most once per idempotency key."""
+
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        lock_ttl_seconds: float = DEFAULT_LOCK_TTL_SECONDS,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Configure the executor.
+
+        Args:
+            store: Where responses and locks live.
+            ttl_seconds: How long responses are replayed.
+            lock_ttl_seconds: Lock lifetime; bounds the damage of a crashed executor.
+            wait_timeout: How long a cross-process duplicate waits for the response.
+            poll_interval: Delay between store reads while waiting.
+        """
+        self._store = store
+        self._ttl = ttl_seconds
+        self._lock_ttl = lock_ttl_seconds
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, _InFlight] = {}
+        self.executions = 0
+        self.replays = 0
+
+    def execute(
+        self, key: str, fingerprint: str, operation: Callable[[], StoredResponse]
+    ) -> tuple[StoredResponse, bool]:
+        """
+        Run `operation` once for the key, or replay its response.
+
+        Args:
+            key: Client-supplied idempotency key.
+            fingerprint: Fingerprint of the request (see `request_fingerprint`).
+            operation: Produces the response; its `fingerprint` field is overwritten.
+
+        Returns:
+            The response and whether it was replayed rather than produced by this call.
+
+        Raises:
+            IdempotencyKeyReusedError: If the key belongs to a different request.
+            IdempotencyInProgressError: If another process did not finish in time.
+        """
+        stored = self._store.get(key)
+        if stored is not None:
+            return self._replay(key, fingerprint, stored), True
+
+        with self._lock:
+            slot = self._in_flight.get(key)
+            leader = slot is None
+            if slot is None:
+                slot = self._in_flight[key] = _InFlight(fingerprint)
+
+        if not leader:
+            if slot.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedError(key)
+            slot.done.wait()
+            if slot.error is not None:
+                raise slot.error
+            assert slot.response is not None  # noqa: S101 - set when no error
+            self._count_replay()
+            return slot.response, True
+
+        try:
+            response, replayed = self._execute_once(key, fingerprint, operation)
+            slot.response = response
+            return response, replayed
+        except BaseException as error:
+            slot.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            slot.done.set()
+
+    def _execute_once(
+        self, key: str, fingerprint: str, operation: Callable[[], StoredResponse]
+    ) -> tuple[StoredResponse, bool]:
+        """Take the store lock and run, or wait for the process holding it."""
+        deadline = time.monotonic() + self._wait_timeout
+        while (token := self._store.acquire(key, self._lock_ttl)) is None:
+            stored = self._store.get(key)
+            if stored is not None:
+                return self._replay(key, fingerprint, stored), True
+            if time.monotonic() >= deadline:
+                raise IdempotencyInProgressError(key)
+            time.sleep(self._poll_interval)
+
+        try:
+            # The previous holder may have stored the response just before releasing.
+            stored = self._store.get(key)
+            if stored is not None:
+                return self._replay(key, fingerprint, stored), True
+            result = operation()
+            response = StoredResponse(fingerprint, result.status_code, result.body)
+            self._store.put(key, response, self._ttl)
+            with self._lock:
+                self.executions += 1
+            return response, False
+        finally:
+            self._store.release(key, token)
+
+    def _replay(self, key: str, fingerprint: str, stored: StoredResponse) -> StoredResponse:
+        if stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReusedError(key)
+        self._count_replay()
+        return stored
+
+    def _count_replay(self) -> None:
+        with self._lock:
+            self.replays += 1
@@ -0,0 +1,210 @@
+"""Register User Account use case.
+
+Single registration validates the command, checks the email is free,
+hashes the password and saves the new user. Batch registration does the
+same for many commands with one email lookup and one save: each item is
+validated on its own (`Email.create`, `User.create`), duplicates inside
+the batch are detected through the Email value object's hash, and the
+outcome of every item is reported instead of failing the whole batch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ...domain.entities.user import DomainEvent, User, UserRole
+from ...domain.value_objects.email import Email
+from ..ports.password_hasher import PasswordHasher
+from ..ports.user_repository import UserAlreadyExistsError, UserRepository
+
+MIN_PASSWORD_LENGTH = 12
+MAX_NAME_LENGTH = 255
+
+STATUS_CREATED = 'created'
+STATUS_INVALID = 'invalid'
+STATUS_CONFLICT = 'conflict'
+
+
+class InvalidCommandError(ValueError):
+    """Raised when a command fails validation; carries every error message."""
+
+    def __init__(self, errors: list[str]) -> None:
+        """
+        Build the error.
+
+        Args:
+            errors: Human-readable validation messages.
+        """
+        super().__init__('; '.join(errors))
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class RegisterUserAccountCommand:
+    """Input of the use case, already normalized."""
+
+    email: str
+    name: str
+    password: str
+    role: UserRole = UserRole.USER
+
+    @classmethod
+    def create(
+        cls, email: str, name: str, password: str, role: UserRole | str | None = None
+    ) -> RegisterUserAccountCommand:
+        """
+        Normalize and validate raw input.
+
+        Args:
+            email: Raw email; trimmed and lower-cased.
+            name: Display name; trimmed.
+            password: Plain password.
+            role: Role value; USER by default.
+
+        Returns:
+            The command.
+
+        Raises:
+            InvalidCommandError: If any field is invalid (all errors are reported).
+        """
+        errors = []
+        email = (email or '').strip().lower()
+        name = (name or '').strip()
+        if not email:
+            errors.append('Email is required')
+        if not name:
+            errors.append('Name is required')
+        elif len(name) > MAX_NAME_LENGTH:
+            errors.append(f'Name must be at most {MAX_NAME_LENGTH} characters')
+        if len(password or '') < MIN_PASSWORD_LENGTH:
+            errors.append(f'Password must be at least {MIN_PASSWORD_LENGTH} characters')
+        try:
+            parsed_role = UserRole(role) if role is not None else UserRole.USER
+        except ValueError:
+            errors.append(f'Invalid role: {role}')
+            parsed_role = UserRole.USER
+        if errors:
+            raise InvalidCommandError(errors)
+        return cls(email=email, name=name, password=password, role=parsed_role)
+
+
+@dataclass(frozen=True)
+class RegisterUserAccountResult:
+    """Outcome of a successful registration."""
+
+    user_snapshot: dict[str, Any]
+    domain_events: list[DomainEvent] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Outcome of one item of a batch registration."""
+
+    index: int
+    status: str
+    result: RegisterUserAccountResult | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+class RegisterUserAccountHandler:
+    """Registers user accounts through the repository and password hasher ports."""
+
+    def __init__(self, repository: UserRepository, password_hasher: PasswordHasher) -> None:
+        """
+        Wire the handler to its ports.
+
+        Args:
+            repository: Where users are looked up and saved.
+            password_hasher: Hashes the plain password before it reaches the domain.
+        """
+        self._repository = repository
+        self._password_hasher = password_hasher
+
+    def execute(self, command: RegisterUserAccountCommand) -> RegisterUserAccountResult:
+        """
+        Register one account.
+
+        Args:
+            command: Validated input.
+
+        Returns:
+            Snapshot and domain events of the new user.
+
+        Raises:
+            InvalidEmailError: If the email violates the Email rules.
+            ValueError: If the user violates the User invariants.
+            UserAlreadyExistsError: If the email is already registered.
+        """
+        email = Email.create(command.email)
+        if self._repository.find_by_email(email) is not None:
+            raise UserAlreadyExistsError(email.value)
+        user = self._build_user(email, command)
+        self._repository.save(user)
+        return self._result(user)
+
+    def execute_batch(
+        self, commands: Sequence[RegisterUserAccountCommand | InvalidCommandError]
+    ) -> list[BatchItemResult]:
+        """
+        Register many accounts with one lookup and one save.
+
+        Args:
+            commands: Validated commands; an InvalidCommandError in a slot reports that
+                item as invalid (lets callers keep per-item input validation errors).
+
+        Returns:
+            One result per command, in input order.
+        """
+        results: list[BatchItemResult | None] = [None] * len(commands)
+        accepted: dict[Email, tuple[int, RegisterUserAccountCommand]] = {}
+        for index, command in enumerate(commands):
+            if isinstance(command, InvalidCommandError):
+                results[index] = BatchItemResult(index, STATUS_INVALID, errors=command.errors)
+                continue
+            try:
+                email = Email.create(command.email)
+            except ValueError as error:
+                results[index] = BatchItemResult(index, STATUS_INVALID, errors=[str(error)])
+                continue
+            if email in accepted:
+                results[index] = BatchItemResult(
+                    index, STATUS_CONFLICT, errors=[str(UserAlreadyExistsError(email.value))]
+                )
+                continue
+            accepted[email] = (index, command)
+
+        taken = {user.email.value.lower() for user in self._repository.find_by_emails(accepted)}
+        new_users: list[tuple[int, User]] = []
+        for email, (index, command) in accepted.items():
+            if email.value.lower() in taken:
+                results[index] = BatchItemResult(
+                    index, STATUS_CONFLICT, errors=[str(UserAlreadyExistsError(email.value))]
+                )
+                continue
+            try:
+                new_users.append((index, self._build_user(email, command)))
+            except ValueError as error:
+                results[index] = BatchItemResult(index, STATUS_INVALID, errors=[str(error)])
+
+        self._repository.save_all([user for _, user in new_users])
+        for index, user in new_users:
+            results[index] = BatchItemResult(index, STATUS_CREATED, result=self._result(user))
+        return [result for result in results if result is not None]
+
+    def _build_user(self, email: Email, command: RegisterUserAccountCommand) -> User:
+        """Hash the password and create the aggregate."""
+        return User.create(
+            email=email,
+            name=command.name,
+            password_hash=self._password_hasher.hash(command.password),
+            role=command.role,
+        )
+
+    @staticmethod
+    def _result(user: User) -> RegisterUserAccountResult:
+        """Snapshot the user and drain its events."""
+        events = user.get_domain_events()
+        user.clear_domain_events()
+        return RegisterUserAccountResult(user_snapshot=user.to_dict(), domain_events=events)
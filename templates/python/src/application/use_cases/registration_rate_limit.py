@@ -0,0 +1,109 @@
+"""Registration rate limiting.
+
+Checked before the password is hashed and `User.create` runs, so signup
+floods (typically from disposable domains missing from
+`Email.BLOCKED_DOMAINS`) are turned away before they cost any CPU. Two
+independent token buckets apply: one per email domain, charged one token
+per registration, and one per client, charged one token per request (a
+batch is one request, so the bulk endpoint stays usable).
+
+A request takes its tokens from every bucket or from none: when a bucket
+turns it away, the tokens already taken for it are refunded. A batch
+whose registrations for one domain exceed that bucket's capacity could
+never be allowed, so it is rejected as too large instead of rate limited.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from ...domain.value_objects.email import Email
+from ..ports.rate_limiter import RateLimiter
+
+
+class RegistrationRateLimitedError(Exception):
+    """Raised when a registration exceeds a domain or client budget."""
+
+    def __init__(self, scope: str, key: str, retry_after: float) -> None:
+        """
+        Build the error.
+
+        Args:
+            scope: 'domain' or 'client'.
+            key: The limited domain or client id.
+            retry_after: Seconds until the request could be allowed.
+        """
+        super().__init__(f'Too many registrations for {scope} {key}')
+        self.scope = scope
+        self.key = key
+        self.retry_after = retry_after
+
+
+class RegistrationBatchTooLargeError(Exception):
+    """Raised when a batch needs more tokens than a bucket can ever hold."""
+
+    def __init__(self, domain: str, count: int, capacity: float) -> None:
+        """
+        Build the error.
+
+        Args:
+            domain: The email domain.
+            count: Registrations for the domain in the batch.
+            capacity: Size of the domain bucket.
+        """
+        super().__init__(
+            f'{count} registrations for domain {domain} exceed the limit of {capacity:g}; '
+            'split the batch'
+        )
+        self.domain = domain
+        self.count = count
+        self.capacity = capacity
+
+
+class RegistrationRateLimiter:
+    """Applies the per-domain and per-client buckets to registrations."""
+
+    def __init__(self, by_domain: RateLimiter, by_client: RateLimiter | None = None) -> None:
+        """
+        Configure the buckets.
+
+        Args:
+            by_domain: Limiter keyed by email domain.
+            by_client: Limiter keyed by client id; None disables the client check.
+        """
+        self._by_domain = by_domain
+        self._by_client = by_client
+
+    def check(self, emails: Iterable[Email], client_id: str | None = None) -> None:
+        """
+        Take one token per registration from each domain and one from the client.
+
+        Args:
+            emails: Emails about to be registered (one for a single registration).
+            client_id: Caller identity established by the server (peer address, API
+                key...); None skips the client check.
+
+        Raises:
+            RegistrationBatchTooLargeError: If a domain's share of the batch exceeds the
+                domain bucket's capacity; retrying cannot help.
+            RegistrationRateLimitedError: On an exhausted bucket; nothing is taken.
+        """
+        domains = Counter(email.domain for email in emails)
+        capacity = self._by_domain.policy.capacity
+        for domain, count in domains.items():
+            if count > capacity:
+                raise RegistrationBatchTooLargeError(domain, count, capacity)
+        charges: list[tuple[str, str, RateLimiter, str, float]] = []
+        if self._by_client is not None and client_id is not None:
+            charges.append(('client', client_id, self._by_client, f'client:{client_id}', 1))
+        charges.extend(
+            ('domain', domain, self._by_domain, f'domain:{domain}', count)
+            for domain, count in domains.items()
+        )
+        for index, (scope, name, limiter, key, cost) in enumerate(charges):
+            decision = limiter.acquire(key, cost)
+            if not decision.allowed:
+                for _, _, taken_from, taken_key, taken in charges[:index]:
+                    taken_from.refund(taken_key, taken)
+                raise RegistrationRateLimitedError(scope, name, decision.retry_after)
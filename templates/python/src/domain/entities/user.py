@@ -15,6 +15,8 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from ..invariants import MaxLength, NonEmpty, Validated, compile_rules
+
 if TYPE_CHECKING:
     from ..value_objects.email import Email
 
@@ -27,7 +29,7 @@ class UserRole(str, Enum):
     GUEST = 'guest'
 
 
-@dataclass
+@dataclass(kw_only=True)
 class DomainEvent:
     """Base class for domain events."""
 
@@ -41,11 +43,39 @@ class UserCreatedEvent(DomainEvent):
 
     user_id: str
     email: str
+    role: str = UserRole.USER.value
+    name: str = ''
+
+
+@dataclass
+class EmailVerifiedEvent(DomainEvent):
+    """Event raised when a user verifies their email."""
+
+    user_id: str
+
+
+@dataclass
+class UserNameChangedEvent(DomainEvent):
+    """Event raised when a user changes their name."""
+
+    user_id: str
+    name: str
+
+
+_NAME_TOO_LONG = MaxLength('User name too long', limit=255)
+
+# change_name reports an empty name with its own, historical message
+_RENAME = compile_rules(
+    {'name': (NonEmpty('Name cannot be empty', strip=True), _NAME_TOO_LONG)},
+    name='User.change_name',
+)
 
 
-class User:
+class User(Validated):
     """User entity with business logic and invariant protection."""
 
+    INVARIANTS = {'name': (NonEmpty('User name cannot be empty', strip=True), _NAME_TOO_LONG)}
+
     def __init__(
         self,
         id: str,
@@ -56,6 +86,9 @@ class User:
         email_verified: bool,
         created_at: datetime,
         updated_at: datetime,
+        version: int = 0,
+        *,
+        validate: bool = True,
     ) -> None:
         """
         Construct a User entity from explicit state and enforce domain invariants.
@@ -69,6 +102,9 @@ class User:
             email_verified (bool): Whether the user's email has been verified.
             created_at (datetime): Creation timestamp.
             updated_at (datetime): Last update timestamp.
+            version (int): Optimistic-locking version of the persisted row; 0 means never persisted.
+            validate (bool): Check the invariants; pass False only for state already checked
+                against `INVARIANTS` (trusted construction).
         
         Raises:
             ValueError: If any domain invariant (e.g., name constraints) is violated.
@@ -81,9 +117,12 @@ class User:
         self._email_verified = email_verified
         self._created_at = created_at
         self._updated_at = updated_at
+        self._version = version
+        self._dirty_fields: set[str] = set()
         self._domain_events: list[DomainEvent] = []
 
-        self._validate()
+        if validate:
+            self._validate()
 
     @classmethod
     def create(
@@ -92,6 +131,8 @@ class User:
         name: str,
         password_hash: str,
         role: UserRole = UserRole.USER,
+        *,
+        validate: bool = True,
     ) -> User:
         """
         Create a new User with a generated id and timestamps, and record a UserCreatedEvent.
@@ -101,12 +142,15 @@ class User:
             name (str): User's display name.
             password_hash (str): Hashed password to store.
             role (UserRole): User role; defaults to UserRole.USER.
+            validate (bool): Check the invariants; False for a name already checked against
+                `INVARIANTS`, e.g. by a request model built from them.
         
         Returns:
             User: The newly created User instance.
         
         Raises:
-            ValueError: If user invariants (for example, name validation) are violated during construction.
+            ValueError: If user invariants (for example, name validation) are violated
+                during construction.
         """
         now = datetime.utcnow()
         user_id = str(uuid.uuid4())
@@ -120,10 +164,19 @@ class User:
             email_verified=False,
             created_at=now,
             updated_at=now,
+            validate=validate,
         )
 
         # Raise domain event
-        user._add_domain_event(UserCreatedEvent(user_id=user_id, email=email.value))
+        user._add_domain_event(
+            UserCreatedEvent(
+                user_id=user_id,
+                email=email.value,
+                role=role.value,
+                name=name,
+                occurred_at=now,
+            )
+        )
 
         return user
 
@@ -138,6 +191,7 @@ class User:
         email_verified: bool,
         created_at: datetime,
         updated_at: datetime,
+        version: int = 1,
     ) -> User:
         """
         Reconstructs a User from persisted data without emitting domain events.
@@ -151,6 +205,7 @@ class User:
             email_verified: Whether the user's email was verified.
             created_at: Timestamp when the user was created.
             updated_at: Timestamp of the last update.
+            version: Optimistic-locking version stored alongside the row.
         
         Returns:
             User instance reconstructed from the provided persisted fields.
@@ -164,28 +219,27 @@ class User:
             email_verified=email_verified,
             created_at=created_at,
             updated_at=updated_at,
+            version=version,
         )
 
     def _validate(self) -> None:
         """
         Ensure the user's name satisfies domain invariants.
         
-        Checks that the name is not empty or only whitespace and that its length does not exceed 255 characters.
+        Checks that the name is not empty or only whitespace and that its length does
+        not exceed 255 characters.
         
         Raises:
-            ValueError: If the name is empty or contains only whitespace, or if its length is greater than 255.
+            ValueError: If the name is empty or contains only whitespace, or if its length
+                is greater than 255.
         """
-        if not self._name or not self._name.strip():
-            raise ValueError('User name cannot be empty')
-
-        if len(self._name) > 255:
-            raise ValueError('User name too long')
+        self._validator.check(self._name)
 
     # Business methods (not just getters/setters)
 
     def verify_email(self) -> None:
         """
-        Mark the user's email as verified and update the updated_at timestamp.
+        Mark the user's email as verified, refresh updated_at and record an EmailVerifiedEvent.
         
         Raises:
             ValueError: If the user's email is already verified.
@@ -195,28 +249,32 @@ class User:
 
         self._email_verified = True
         self._updated_at = datetime.utcnow()
+        self._mark_dirty('email_verified')
 
         # Raise domain event
-        # self._add_domain_event(EmailVerifiedEvent(...))
+        self._add_domain_event(EmailVerifiedEvent(user_id=self._id))
 
     def change_name(self, new_name: str) -> None:
         """
-        Change the user's name and update the modification timestamp.
+        Change the user's name, update the modification timestamp and record a UserNameChangedEvent.
         
         Args:
             new_name (str): The new non-empty name for the user.
         
         Raises:
-            ValueError: If new_name is empty or contains only whitespace.
+            ValueError: If new_name is empty, contains only whitespace or is longer than 255.
         
         Notes:
             This method sets the user's name and updates `updated_at` to the current UTC time.
         """
-        if not new_name or not new_name.strip():
-            raise ValueError('Name cannot be empty')
+        _RENAME.check(new_name)
 
         self._name = new_name
         self._updated_at = datetime.utcnow()
+        self._mark_dirty('name')
+
+        # Raise domain event
+        self._add_domain_event(UserNameChangedEvent(user_id=self._id, name=new_name))
 
     def change_password(self, new_password_hash: str) -> None:
         """
@@ -227,6 +285,7 @@ class User:
         """
         self._password_hash = new_password_hash
         self._updated_at = datetime.utcnow()
+        self._mark_dirty('password_hash')
 
     def is_admin(self) -> bool:
         """
@@ -275,7 +334,8 @@ class User:
         Return the user's role within the system.
         
         Returns:
-            UserRole: The user's assigned role (e.g., UserRole.ADMIN, UserRole.USER, UserRole.GUEST).
+            UserRole: The user's assigned role (e.g., UserRole.ADMIN, UserRole.USER,
+                UserRole.GUEST).
         """
         return self._role
 
@@ -309,6 +369,76 @@ class User:
         """
         return self._updated_at
 
+    @property
+    def password_hash(self) -> str:
+        """
+        Stored password hash, exposed only for persistence adapters.
+        
+        Returns:
+            str: The password hash. Never include it in API responses.
+        """
+        return self._password_hash
+
+    @property
+    def version(self) -> int:
+        """
+        Optimistic-locking version of the last persisted state.
+        
+        Returns:
+            int: The version the row had when this instance was loaded or last flushed.
+        """
+        return self._version
+
+    # Change tracking
+
+    def _mark_dirty(self, field_name: str) -> None:
+        """
+        Record that a persisted field changed; `updated_at` always travels with it.
+        
+        Parameters:
+            field_name (str): Column name of the changed field.
+        """
+        self._dirty_fields.add(field_name)
+        self._dirty_fields.add('updated_at')
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """
+        Names of the persisted fields modified since the last load or flush.
+        
+        Returns:
+            frozenset[str]: Column names pending to be written.
+        """
+        return frozenset(self._dirty_fields)
+
+    def is_dirty(self) -> bool:
+        """
+        Determine whether the user has unsaved changes.
+        
+        Returns:
+            True if any persisted field changed since the last load or flush.
+        """
+        return bool(self._dirty_fields)
+
+    def is_new(self) -> bool:
+        """
+        Determine whether the user has never been persisted.
+        
+        Returns:
+            True if no version has been stored yet for this user.
+        """
+        return self._version == 0
+
+    def mark_persisted(self, version: int) -> None:
+        """
+        Acknowledge that pending changes were stored under a new version.
+        
+        Parameters:
+            version (int): The version now stored for this user's row.
+        """
+        self._version = version
+        self._dirty_fields.clear()
+
     # Domain events management
 
     def _add_domain_event(self, event: DomainEvent) -> None:
@@ -382,4 +512,4 @@ class User:
         Returns:
             int: Hash of the user's id.
         """
-        return hash(self._id)
\ No newline at end of file
+        return hash(self._id)
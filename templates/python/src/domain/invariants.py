@@ -0,0 +1,275 @@
+"""Declarative invariants for entities and value objects.
+
+A class lists its rules per field in `INVARIANTS`; subclassing `Validated`
+compiles them once, when the class is created, into a `Validator`: Python
+source generated for exactly those rules and `exec`-ed, the way
+`dataclasses` builds `__init__`. Each rule becomes an inline condition with
+its constants (limits, compiled patterns, frozensets) bound as globals, so a
+check costs what the hand-written `if` chain cost. Interpreting the rules
+instead, one call per rule, is what `exec` saves: 1.1-1.4x slower for
+`Email` and about 2x for `User` names (`benchmarks/bench_invariants.py`).
+
+- `Validator.check` raises the first violation, in declaration order, with
+  the class's error factory (`InvariantError` by default).
+- `Validator.violations` and `Validator.violations_many` collect every
+  violation instead (the first one of each field; later rules of a field may
+  rely on the earlier ones, as a domain check may on a format check).
+
+RULES:
+- No dependencies on infrastructure or application layers
+- Messages are fixed strings or `str.format` templates over `value` (the
+  field) and `key` (the part a membership rule looked at)
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import KW_ONLY, dataclass
+from typing import Any, ClassVar
+
+ErrorFactory = Callable[[str, str], Exception]
+
+
+class InvariantError(ValueError):
+    """Default error of `check`: the rule's message and its reason code."""
+
+    def __init__(self, message: str, reason: str) -> None:
+        """
+        Build the error.
+
+        Args:
+            message: Human-readable description.
+            reason: Reason code of the broken rule ('empty', 'too_long', ...).
+        """
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class Violation:
+    """A broken rule."""
+
+    field: str
+    message: str
+    reason: str
+    index: int | None = None  # position in the batch, for `violations_many`
+
+
+@dataclass(frozen=True)
+class Target:
+    """Where a rule's condition is rendered: the field variable and the globals."""
+
+    value: str  # name of the variable holding the field value
+    slot: str  # unique prefix for the names the rule binds
+    namespace: dict[str, Any]
+
+    def bind(self, suffix: str, constant: Any) -> str:
+        """Make `constant` a global of the generated code and return its name."""
+        name = f'{self.slot}_{suffix}'
+        self.namespace[name] = constant
+        return name
+
+
+@dataclass(frozen=True)
+class Rule(ABC):
+    """Base class of the rules; subclasses render their condition as source."""
+
+    message: str
+    reason: str
+
+    @abstractmethod
+    def condition(self, target: Target) -> str:
+        """Return a Python expression over `target.value` that is true when the rule is broken."""
+
+
+@dataclass(frozen=True)
+class NonEmpty(Rule):
+    """The value is not empty (nor only whitespace, with `strip`)."""
+
+    _: KW_ONLY
+    reason: str = 'empty'
+    strip: bool = False
+
+    def condition(self, target: Target) -> str:
+        """Render `not value` (or `not value.strip()` too)."""
+        value = target.value
+        return f'not {value} or not {value}.strip()' if self.strip else f'not {value}'
+
+
+@dataclass(frozen=True)
+class MaxLength(Rule):
+    """The value has at most `limit` characters."""
+
+    _: KW_ONLY
+    limit: int = 0
+    reason: str = 'too_long'
+
+    def condition(self, target: Target) -> str:
+        """Render `len(value) > limit` with the limit inlined."""
+        return f'len({target.value}) > {int(self.limit)}'
+
+
+@dataclass(frozen=True)
+class Matches(Rule):
+    """The value matches `pattern` (anchored at the start, as `re.match`)."""
+
+    _: KW_ONLY
+    pattern: str | re.Pattern[str] = ''
+    reason: str = 'invalid_format'
+
+    def condition(self, target: Target) -> str:
+        """Render a call of the bound `match` method of the compiled pattern."""
+        match = target.bind('match', re.compile(self.pattern).match)
+        return f'{match}({target.value}) is None'
+
+
+@dataclass(frozen=True)
+class OneOf(Rule):
+    """The value (or `key(value)`) is one of `values`."""
+
+    _: KW_ONLY
+    values: Iterable[Any] = ()
+    key: Callable[[Any], Any] | None = None
+    reason: str = 'not_allowed'
+    negate: ClassVar[bool] = False
+
+    def condition(self, target: Target) -> str:
+        """Render a frozenset membership test, binding the key to `<slot>_key`."""
+        values = target.bind('values', frozenset(self.values))
+        operator = 'in' if self.negate else 'not in'
+        key = target.value
+        if self.key is not None:
+            key = f'{target.bind("keyfunc", self.key)}({key})'
+        return f'({target.slot}_key := {key}) {operator} {values}'
+
+
+@dataclass(frozen=True)
+class NoneOf(OneOf):
+    """The value (or `key(value)`) is none of `values`."""
+
+    negate: ClassVar[bool] = True
+
+
+@dataclass(frozen=True)
+class Validator:
+    """Compiled rules of one class."""
+
+    fields: tuple[str, ...]
+    check: Callable[..., None]
+    violations: Callable[..., list[Violation]]
+    violations_many: Callable[[Iterable[Sequence[Any]]], list[Violation]]
+    source: str
+    error: ErrorFactory
+
+
+def compile_rules(
+    rules: Mapping[str, Sequence[Rule]],
+    *,
+    error: ErrorFactory = InvariantError,
+    name: str = 'rules',
+) -> Validator:
+    """
+    Generate and compile the validation functions for a set of rules.
+
+    Args:
+        rules: Field name -> rules, in the order they are checked.
+        error: Builds the exception `check` raises from (message, reason).
+        name: Label of the generated code in tracebacks.
+
+    Returns:
+        The compiled validator; its functions take one argument per field, in
+        the order of `rules`.
+    """
+    namespace: dict[str, Any] = {'_error': error, '_Violation': Violation}
+    fields = tuple(rules)
+    arguments = [f'v{position}' for position in range(len(fields))]
+    # (field, condition, message expression, reason) per rule, in order
+    compiled: list[list[tuple[str, str, str, str]]] = []
+    for position, (field, field_rules) in enumerate(rules.items()):
+        branch = []
+        for number, rule in enumerate(field_rules):
+            slot = f'_r{position}_{number}'
+            condition = rule.condition(Target(arguments[position], slot, namespace))
+            namespace[f'{slot}_message'] = rule.message
+            namespace[f'{slot}_reason'] = rule.reason
+            message = f'{slot}_message'
+            if '{' in rule.message:
+                key = f'{slot}_key' if isinstance(rule, OneOf) else 'None'
+                message += f'.format(value={arguments[position]}, key={key})'
+            branch.append((field, condition, message, f'{slot}_reason'))
+        if branch:  # a field without rules keeps its argument but checks nothing
+            compiled.append(branch)
+
+    signature = ', '.join(arguments)
+    lines = [f'def check({signature}):']
+    for branch in compiled:
+        for _, condition, message, reason in branch:
+            lines += [f'    if {condition}:', f'        raise _error({message}, {reason})']
+    lines.append('    return None')
+
+    def collect(indent: str, index: str) -> list[str]:
+        body = []
+        for branch in compiled:
+            for number, (field, condition, message, reason) in enumerate(branch):
+                keyword = 'if' if number == 0 else 'elif'
+                violation = f'_Violation({field!r}, {message}, {reason}, {index})'
+                body.append(f'{indent}{keyword} {condition}:')
+                body.append(f'{indent}    found.append({violation})')
+        return body or [f'{indent}pass']
+
+    lines += [f'def violations({signature}):', '    found = []']
+    lines += collect('    ', 'None')
+    lines += ['    return found']
+    unpack = f'{signature},' if len(arguments) == 1 else signature
+    lines += [
+        'def violations_many(rows):',
+        '    found = []',
+        f'    for index, ({unpack}) in enumerate(rows):',
+    ]
+    lines += collect('        ', 'index')
+    lines += ['    return found']
+
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, f'<invariants {name}>', 'exec'), namespace)  # noqa: S102
+    return Validator(
+        fields,
+        namespace['check'],
+        namespace['violations'],
+        namespace['violations_many'],
+        source,
+        error,
+    )
+
+
+class Validated:
+    """
+    Mixin compiling a class's `INVARIANTS` into `_validator` at class creation.
+
+    The error factory is a class keyword, inherited by subclasses:
+    `class Email(Validated, error=InvalidEmailError)`.
+    """
+
+    INVARIANTS: ClassVar[Mapping[str, Sequence[Rule]]] = {}
+    _validator: ClassVar[Validator]
+
+    def __init_subclass__(cls, error: ErrorFactory | None = None, **kwargs: Any) -> None:
+        """Compile the subclass's rules."""
+        super().__init_subclass__(**kwargs)
+        if error is None:
+            error = cls._validator.error if hasattr(cls, '_validator') else InvariantError
+        cls._validator = compile_rules(cls.INVARIANTS, error=error, name=cls.__qualname__)
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Sequence[Any]]) -> list[Violation]:
+        """
+        Validate a batch without raising.
+
+        Args:
+            rows: One sequence of field values per candidate, in `INVARIANTS` order.
+
+        Returns:
+            Every violation (the first of each field of each row), tagged with the row index.
+        """
+        return cls._validator.violations_many(rows)
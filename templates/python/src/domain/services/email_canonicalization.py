@@ -0,0 +1,122 @@
+"""Email canonicalization.
+
+`Email.__eq__` folds case only, so `John.Doe+promo@gmail.com` and
+`johndoe@gmail.com` are different emails although Gmail delivers both to
+the same mailbox. The canonical key applies the mailbox provider's own
+aliasing rules (sub-address tags, ignored dots, domain aliases) so that
+every alias of one mailbox maps to the same key.
+
+RULES:
+- No dependencies on infrastructure or application layers
+- Rules are per provider; unknown domains only fold case
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..value_objects.email import Email
+
+
+@dataclass(frozen=True)
+class ProviderRule:
+    """How one mailbox provider aliases local parts."""
+
+    tag_separator: str | None = None
+    ignore_dots: bool = False
+    canonical_domain: str | None = None
+
+    def apply(self, local: str, domain: str) -> str:
+        """
+        Canonicalize a lower-cased address split at the last `@`.
+
+        Args:
+            local: Local part.
+            domain: Domain part.
+
+        Returns:
+            The canonical `local@domain`.
+        """
+        if self.tag_separator is not None:
+            local = local.split(self.tag_separator, 1)[0]
+        if self.ignore_dots:
+            local = local.replace('.', '')
+        return f'{local}@{self.canonical_domain or domain}'
+
+
+_GMAIL = ProviderRule(tag_separator='+', ignore_dots=True, canonical_domain='gmail.com')
+_MICROSOFT = ProviderRule(tag_separator='+')
+_ICLOUD = ProviderRule(tag_separator='+', canonical_domain='icloud.com')
+_PLUS_TAGS = ProviderRule(tag_separator='+')
+_YAHOO = ProviderRule(tag_separator='-')
+
+DEFAULT_PROVIDER_RULES: Mapping[str, ProviderRule] = MappingProxyType(
+    {
+        'gmail.com': _GMAIL,
+        'googlemail.com': _GMAIL,
+        'outlook.com': _MICROSOFT,
+        'hotmail.com': _MICROSOFT,
+        'live.com': _MICROSOFT,
+        'icloud.com': _ICLOUD,
+        'me.com': _ICLOUD,
+        'mac.com': _ICLOUD,
+        'fastmail.com': _PLUS_TAGS,
+        'protonmail.com': _PLUS_TAGS,
+        'proton.me': _PLUS_TAGS,
+        'yahoo.com': _YAHOO,
+    }
+)
+
+CASE_ONLY = ProviderRule()
+
+
+class EmailCanonicalizer:
+    """Maps email addresses to the key of the mailbox they deliver to."""
+
+    def __init__(
+        self,
+        rules: Mapping[str, ProviderRule] = DEFAULT_PROVIDER_RULES,
+        default: ProviderRule = CASE_ONLY,
+    ) -> None:
+        """
+        Configure the provider rules.
+
+        Args:
+            rules: Rule per lower-cased domain.
+            default: Rule for domains not in `rules`; case folding only by default,
+                since most servers treat `+` and `.` as ordinary characters.
+        """
+        self._rules = dict(rules)
+        self._default = default
+
+    def canonical_key(self, email: Email) -> str:
+        """
+        Return the canonical key of an Email value object.
+
+        Args:
+            email: A validated email.
+
+        Returns:
+            The canonical address, e.g. `johndoe@gmail.com`.
+        """
+        return self.canonicalize(email.value)
+
+    def canonicalize(self, address: str) -> str:
+        """
+        Return the canonical key of a raw address.
+
+        Skips Email validation, for bulk jobs over addresses that were
+        validated when stored.
+
+        Args:
+            address: An address containing `@`.
+
+        Returns:
+            The canonical address.
+        """
+        local, _, domain = address.lower().rpartition('@')
+        return self._rules.get(domain, self._default).apply(local, domain)
@@ -13,9 +13,30 @@ import re
 from dataclasses import dataclass
 from typing import Final
 
+from ..invariants import Matches, MaxLength, NonEmpty, NoneOf, Validated
+
+
+class InvalidEmailError(ValueError):
+    """Email validation failure with a stable, low-cardinality reason code."""
+
+    def __init__(self, message: str, reason: str) -> None:
+        """
+        Build the error.
+        
+        Parameters:
+            message (str): Human-readable description.
+            reason (str): One of 'empty', 'invalid_format', 'too_long', 'blocked_domain'.
+        """
+        super().__init__(message)
+        self.reason = reason
+
+
+def _domain_part(value: str) -> str:
+    return value.split('@')[1]
+
 
 @dataclass(frozen=True)
-class Email:
+class Email(Validated, error=InvalidEmailError):
     """Email value object with validation and business rules."""
 
     _value: str
@@ -25,6 +46,23 @@ class Email:
     BLOCKED_DOMAINS: Final[tuple[str, ...]] = ('tempmail.com', 'throwaway.email')
     EMAIL_PATTERN: Final[re.Pattern] = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
 
+    # Checked in order; the domain rule relies on the format rule
+    INVARIANTS = {
+        'email': (
+            NonEmpty('Email cannot be empty'),
+            # Basic email validation
+            # In production, use a proper library like email-validator
+            Matches('Invalid email format: {value}', pattern=EMAIL_PATTERN),
+            MaxLength('Email too long', limit=MAX_LENGTH),
+            NoneOf(
+                'Email domain not allowed: {key}',
+                values=BLOCKED_DOMAINS,
+                key=_domain_part,
+                reason='blocked_domain',
+            ),
+        ),
+    }
+
     @classmethod
     def create(cls, email: str) -> Email:
         """
@@ -37,7 +75,7 @@ class Email:
             Email: A validated Email instance.
         
         Raises:
-            ValueError: If the provided email fails validation.
+            InvalidEmailError: If the provided email fails validation (a ValueError).
         """
         email_obj = cls(_value=email)
         email_obj._validate()
@@ -47,28 +85,15 @@ class Email:
         """
         Validate the stored email value against format and business rules.
         
+        The rules are the compiled `INVARIANTS`.
+
         Raises:
-            ValueError: If the email is empty.
-            ValueError: If the email does not match the required format.
-            ValueError: If the email length exceeds MAX_LENGTH.
-            ValueError: If the email's domain is in BLOCKED_DOMAINS.
+            InvalidEmailError: If the email is empty.
+            InvalidEmailError: If the email does not match the required format.
+            InvalidEmailError: If the email length exceeds MAX_LENGTH.
+            InvalidEmailError: If the email's domain is in BLOCKED_DOMAINS.
         """
-        if not self._value:
-            raise ValueError('Email cannot be empty')
-
-        # Basic email validation
-        # In production, use a proper library like email-validator
-        if not self.EMAIL_PATTERN.match(self._value):
-            raise ValueError(f'Invalid email format: {self._value}')
-
-        # Additional business rules
-        if len(self._value) > self.MAX_LENGTH:
-            raise ValueError('Email too long')
-
-        # Block certain domains
-        domain = self._value.split('@')[1]
-        if domain in self.BLOCKED_DOMAINS:
-            raise ValueError(f'Email domain not allowed: {domain}')
+        self._validator.check(self._value)
 
     @property
     def value(self) -> str:
@@ -80,6 +105,16 @@ class Email:
         """
         return self._value
 
+    @property
+    def domain(self) -> str:
+        """
+        Retrieve the domain part of the address, lower-cased.
+        
+        Returns:
+            The text after the `@`, e.g. 'example.com'.
+        """
+        return self._value.split('@')[1].lower()
+
     def __str__(self) -> str:
         """
         Return the email's string value.
@@ -91,7 +126,7 @@ class Email:
 
     def __eq__(self, other: object) -> bool:
         """
-        Compare this Email with another object for value equality using a case-insensitive comparison.
+        Compare this Email with another object for value equality, ignoring case.
         
         If the other object is not an Email, the comparison yields `false`.
         
@@ -99,7 +134,8 @@ class Email:
             other: Object to compare against this Email.
         
         Returns:
-            `true` if the other object is an Email with the same address ignoring case, `false` otherwise.
+            `true` if the other object is an Email with the same address ignoring case,
+            `false` otherwise.
         """
         if not isinstance(other, Email):
             return False
@@ -107,9 +143,9 @@ class Email:
 
     def __hash__(self) -> int:
         """
-        Return a hash suitable for use in hash-based collections that matches case-insensitive equality.
+        Return a hash for hash-based collections that matches case-insensitive equality.
         
         Returns:
             int: Hash of the email value converted to lowercase.
         """
-        return hash(self._value.lower())
\ No newline at end of file
+        return hash(self._value.lower())
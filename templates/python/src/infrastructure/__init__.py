@@ -0,0 +1 @@
+"""Infrastructure layer - Adapters for persistence, HTTP and integrations."""
@@ -0,0 +1 @@
+"""Read-side caches of user data shared between worker processes."""
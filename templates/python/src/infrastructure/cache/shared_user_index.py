@@ -0,0 +1,393 @@
+"""Read-mostly user index in POSIX shared memory.
+
+The parent process encodes every user once into a flat buffer; pre-fork
+workers attach to it and read it in place, so 32 workers share one copy
+and none of them rebuilds a dict of users on start-up.
+
+Buffer layout (little endian, 8-byte aligned sections):
+
+    header    magic, format, capacity, count, section offsets
+    email     `capacity` uint64 slots: crc32(lower(email)) << 32 | record + 1
+    id        `capacity` uint64 slots: crc32(id) << 32 | record + 1
+    records   `count` fixed-width records (see RECORD) of `User.to_dict` fields
+    heap      per record, its five strings back to back in UTF-8
+
+A record holds the heap offset and byte size of its string block plus the
+length in characters of each string, so materializing a record decodes one
+block and slices it, instead of decoding five separate strings.
+
+Both tables use open addressing with linear probing at a load factor of at
+most 0.5; an empty slot is 0. The upper 32 bits of a slot are the full
+hash, compared before touching the heap.
+
+Updates are versioned swaps: `SharedUserIndexPublisher.publish` writes a
+new segment `<prefix>.<generation>` and then bumps the generation stored in
+the control segment `<prefix>`; readers notice the new generation on their
+next lookup and re-attach. The old segment is unlinked right away; readers
+still mapping it keep a valid view until they move on.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from collections.abc import Iterable
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any
+
+from ...domain.entities.user import UserRole
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+MAGIC = b'USRIDX01'
+HEADER = struct.Struct('<8sIIQQQQQ')  # magic, format, _, capacity, count, records, heap, size
+# block offset, block bytes, chars of id/email/name/created_at/updated_at, role, verified
+RECORD = struct.Struct('<IHHHHHHBB')
+CONTROL = struct.Struct('<Q')  # generation
+
+_ROLE_VALUES: tuple[str, ...] = tuple(role.value for role in UserRole)
+_ROLE_CODES = {value: code for code, value in enumerate(_ROLE_VALUES)}
+_unpack_record = RECORD.unpack_from
+_SIZE = RECORD.size
+_STRING_FIELDS = ('id', 'email', 'name', 'created_at', 'updated_at')
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _capacity(count: int) -> int:
+    capacity = 8
+    while capacity < count * 2:
+        capacity *= 2
+    return capacity
+
+
+def _insert(table: memoryview, mask: int, key: str, record: int) -> None:
+    hashed = zlib.crc32(key.encode())
+    slot = hashed & mask
+    while table[slot]:
+        slot = (slot + 1) & mask
+    table[slot] = (hashed << 32) | (record + 1)
+
+
+def encode_user_index(users: Iterable[User]) -> bytes:
+    """
+    Encode users into the index layout.
+
+    Args:
+        users: Users to index; later duplicates of an id or email are ignored.
+
+    Returns:
+        The buffer to place in shared memory.
+    """
+    heap = bytearray()
+    records = bytearray()
+    email_keys: list[str] = []
+    id_keys: list[str] = []
+    seen_ids: set[str] = set()
+    seen_emails: set[str] = set()
+    for user in users:
+        data = user.to_dict()
+        email_key = data['email'].lower()
+        if data['id'] in seen_ids or email_key in seen_emails:
+            continue
+        seen_ids.add(data['id'])
+        seen_emails.add(email_key)
+        strings = [data[name] for name in _STRING_FIELDS]
+        block = ''.join(strings).encode()
+        records += RECORD.pack(
+            len(heap),
+            len(block),
+            *(len(string) for string in strings),
+            _ROLE_CODES[data['role']],
+            1 if data['email_verified'] else 0,
+        )
+        heap += block
+        email_keys.append(email_key)
+        id_keys.append(data['id'])
+
+    count = len(id_keys)
+    capacity = _capacity(count)
+    email_offset = _align(HEADER.size)
+    id_offset = email_offset + capacity * 8
+    records_offset = id_offset + capacity * 8
+    heap_offset = _align(records_offset + len(records))
+    size = heap_offset + len(heap)
+
+    buffer = bytearray(size)
+    HEADER.pack_into(buffer, 0, MAGIC, 1, 0, capacity, count, records_offset, heap_offset, size)
+    view = memoryview(buffer)
+    email_table = view[email_offset:id_offset].cast('Q')
+    id_table = view[id_offset:records_offset].cast('Q')
+    for record, (email_key, id_key) in enumerate(zip(email_keys, id_keys, strict=True)):
+        _insert(email_table, capacity - 1, email_key, record)
+        _insert(id_table, capacity - 1, id_key, record)
+    email_table.release()
+    id_table.release()
+    view.release()
+    buffer[records_offset : records_offset + len(records)] = records
+    buffer[heap_offset:] = heap
+    return bytes(buffer)
+
+
+class UserIndexView:
+    """Lookups over an encoded index, reading the buffer in place."""
+
+    def __init__(self, buffer: Any) -> None:
+        """
+        Wrap an encoded buffer.
+
+        Args:
+            buffer: Bytes-like object holding an encoded index (e.g. `SharedMemory.buf`).
+
+        Raises:
+            ValueError: If the buffer is not an encoded user index.
+        """
+        self._view = memoryview(buffer)
+        magic, _, _, capacity, count, records, heap, _ = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a user index buffer')
+        email_offset = _align(HEADER.size)
+        id_offset = email_offset + capacity * 8
+        self._mask = capacity - 1
+        self._count: int = count
+        self._records = records
+        self._heap = heap
+        self._email_table = self._view[email_offset:id_offset].cast('Q')
+        self._id_table = self._view[id_offset:records].cast('Q')
+
+    def _find(self, table: memoryview, key: str, email: bool) -> tuple[tuple[int, ...], str]:
+        """
+        Probe a table for `key`.
+
+        Returns:
+            The record fields and its decoded string block; empty ones if absent.
+        """
+        hashed = zlib.crc32(key.encode())
+        mask = self._mask
+        view = self._view
+        slot = hashed & mask
+        while True:
+            value = table[slot]
+            if not value:
+                return (), ''
+            if value >> 32 == hashed:
+                fields = _unpack_record(view, self._records + ((value & 0xFFFFFFFF) - 1) * _SIZE)
+                start = self._heap + fields[0]
+                block = str(view[start : start + fields[1]], 'utf-8')
+                if email:
+                    stored = block[fields[2] : fields[2] + fields[3]].lower()
+                else:
+                    stored = block[: fields[2]]
+                if stored == key:
+                    return fields, block
+            slot = (slot + 1) & mask
+
+    @staticmethod
+    def _record(fields: tuple[int, ...], block: str) -> dict[str, Any]:
+        end_id = fields[2]
+        end_email = end_id + fields[3]
+        end_name = end_email + fields[4]
+        end_created = end_name + fields[5]
+        return {
+            'id': block[:end_id],
+            'email': block[end_id:end_email],
+            'name': block[end_email:end_name],
+            'role': _ROLE_VALUES[fields[7]],
+            'email_verified': fields[8] == 1,
+            'created_at': block[end_name:end_created],
+            'updated_at': block[end_created:],
+        }
+
+    def get_by_id(self, user_id: str) -> dict[str, Any] | None:
+        """Return the `User.to_dict` record of the id, or None."""
+        fields, block = self._find(self._id_table, user_id, False)
+        return self._record(fields, block) if fields else None
+
+    def get_by_email(self, email: Email | str) -> dict[str, Any] | None:
+        """Return the record owning the email (case-insensitive), or None."""
+        fields, block = self._find_email(email)
+        return self._record(fields, block) if fields else None
+
+    def id_for_email(self, email: Email | str) -> str | None:
+        """Return the id of the user owning the email, or None."""
+        fields, block = self._find_email(email)
+        return block[: fields[2]] if fields else None
+
+    def _find_email(self, email: Email | str) -> tuple[tuple[int, ...], str]:
+        value = email if isinstance(email, str) else email.value
+        return self._find(self._email_table, value.lower(), True)
+
+    def __len__(self) -> int:
+        """Return the number of indexed users."""
+        return self._count
+
+    def release(self) -> None:
+        """Release the views so the underlying buffer can be closed."""
+        self._email_table.release()
+        self._id_table.release()
+        self._view.release()
+
+
+def _buffer(segment: shared_memory.SharedMemory) -> memoryview:
+    """Return the segment's mapping; `buf` is only None once the segment is closed."""
+    buf = segment.buf
+    if buf is None:
+        raise ValueError(f'Shared memory segment {segment.name} is closed')
+    return buf
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment.
+
+    Before Python 3.13 attaching registers the segment with the resource
+    tracker. Workers started by multiprocessing (fork or spawn, as uvicorn
+    and gunicorn do) share the publisher's tracker, so that is harmless;
+    unrelated processes should run 3.13+, where tracking is turned off.
+    """
+    if sys.version_info >= (3, 13):  # pragma: no cover - depends on interpreter
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedUserIndexPublisher:
+    """Owner of the index segments; lives in the parent process."""
+
+    def __init__(self, prefix: str = 'user-index') -> None:
+        """
+        Create the control segment (generation 0, nothing published).
+
+        Args:
+            prefix: Segment name prefix, unique per deployment on the host.
+        """
+        self.prefix = prefix
+        self.generation = 0
+        self.size = 0
+        self._control = shared_memory.SharedMemory(name=prefix, create=True, size=CONTROL.size)
+        self._control_buf = _buffer(self._control)
+        CONTROL.pack_into(self._control_buf, 0, 0)
+        self._segment: shared_memory.SharedMemory | None = None
+
+    def publish(self, users: Iterable[User]) -> int:
+        """
+        Encode the users into a new segment and make it current.
+
+        Args:
+            users: The full population to index.
+
+        Returns:
+            The new generation.
+        """
+        data = encode_user_index(users)
+        generation = self.generation + 1
+        segment = shared_memory.SharedMemory(
+            name=f'{self.prefix}.{generation}', create=True, size=len(data)
+        )
+        _buffer(segment)[: len(data)] = data
+        CONTROL.pack_into(self._control_buf, 0, generation)
+        previous, self._segment, self.generation = self._segment, segment, generation
+        self.size = len(data)
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+        return generation
+
+    def close(self) -> None:
+        """Unlink every segment; attached readers keep their current mapping."""
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+        self._control.close()
+        self._control.unlink()
+
+
+class SharedUserIndex:
+    """Worker-side reader that follows the publisher's generations."""
+
+    def __init__(self, prefix: str = 'user-index', *, attach_retries: int = 10) -> None:
+        """
+        Attach to the current generation.
+
+        Args:
+            prefix: The publisher's prefix.
+            attach_retries: Attempts when a generation is replaced while attaching.
+
+        Raises:
+            FileNotFoundError: If there is no publisher for the prefix.
+            LookupError: If nothing has been published yet.
+        """
+        self._control = _attach(prefix)
+        self._prefix = prefix
+        self._attach_retries = attach_retries
+        self._generation_view = _buffer(self._control)[: CONTROL.size].cast('Q')
+        self._segment: shared_memory.SharedMemory | None = None
+        self._index: UserIndexView | None = None
+        self.generation = 0
+        try:
+            self.refresh()
+        except LookupError:
+            self.close()
+            raise
+
+    def refresh(self) -> UserIndexView:
+        """
+        Switch to the published generation if it changed.
+
+        Returns:
+            The current view.
+
+        Raises:
+            LookupError: If nothing has been published yet.
+        """
+        generation = self._generation_view[0]
+        if generation == self.generation and self._index is not None:
+            return self._index
+        for _ in range(self._attach_retries):
+            generation = self._generation_view[0]
+            if generation == 0:
+                raise LookupError(f'No user index published under {self._prefix}')
+            try:
+                segment = _attach(f'{self._prefix}.{generation}')
+            except FileNotFoundError:
+                continue  # replaced between reading the generation and attaching
+            self._close_segment()
+            self._segment, self._index = segment, UserIndexView(_buffer(segment))
+            self.generation = generation
+            return self._index
+        raise LookupError(f'Could not attach to user index {self._prefix}')
+
+    def get_by_id(self, user_id: str) -> dict[str, Any] | None:
+        """Return the `User.to_dict` record of the id, or None."""
+        return self.refresh().get_by_id(user_id)
+
+    def get_by_email(self, email: Email | str) -> dict[str, Any] | None:
+        """Return the record owning the email (case-insensitive), or None."""
+        return self.refresh().get_by_email(email)
+
+    def id_for_email(self, email: Email | str) -> str | None:
+        """Return the id of the user owning the email, or None."""
+        return self.refresh().id_for_email(email)
+
+    def __len__(self) -> int:
+        """Return the number of users in the current generation."""
+        return len(self.refresh())
+
+    def _close_segment(self) -> None:
+        if self._index is not None:
+            self._index.release()
+            self._index = None
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def close(self) -> None:
+        """Detach from the segments (they are not unlinked)."""
+        self._close_segment()
+        self._generation_view.release()
+        self._control.close()
@@ -0,0 +1,293 @@
+"""Memory-mapped user snapshot files.
+
+A restarted worker opens the snapshot with `mmap` instead of re-querying
+the database: opening costs a header read whatever the size of the file,
+lookups binary-search the sorted indexes straight from the page cache, and
+a `User` is only materialized (via `User.from_persistence`) for the record a
+lookup returns. Every worker on the host shares the same cached pages.
+
+File layout (little endian):
+
+    header    magic, format, record size, count, section offsets, file size
+    heap      per record, its six strings back to back in UTF-8
+    records   `count` fixed-width records (see RECORD), 8-byte aligned
+    email     index sorted by lower(email): `count` uint64 key prefixes,
+              then `count` uint32 record numbers
+    id        the same, sorted by id
+
+A key prefix is the first 8 bytes of the UTF-8 key, zero padded, read as
+a big-endian integer. UTF-8 preserves code point order, so the prefixes
+sort like the keys: `bisect` narrows a lookup to the entries sharing its
+prefix in C, straight over the mapped array, and only those are compared
+by decoding their records.
+
+The writer streams: strings go to the heap as users arrive and records to a
+temporary file, so only the index keys are held in memory for sorting. The
+snapshot is written next to the target and renamed over it, so readers
+never see a partial file.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from ...domain.entities.user import User, UserRole
+from ...domain.value_objects.email import Email
+
+MAGIC = b'USRSNAP1'
+FORMAT = 1
+# magic, format, record size, count, records, email index, id index, file size
+HEADER = struct.Struct('<8sIIQQQQQ')
+# block offset, block bytes, chars of id/email/name/password_hash/created_at/updated_at,
+# role, verified, version
+RECORD = struct.Struct('<QIHHHHHHBBQ')
+
+_ROLES: tuple[UserRole, ...] = tuple(UserRole)
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES)}
+_unpack_record = RECORD.unpack_from
+_RECORD_SIZE = RECORD.size
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _index_size(count: int) -> int:
+    return _align(count * 12)
+
+
+def _prefix(key: str) -> int:
+    return int.from_bytes(key.encode()[:8].ljust(8, b'\0'), 'big')
+
+
+def _write_index(file: BinaryIO, keys: list[str]) -> None:
+    """Append the index of `keys` (indexed by record number) in key order."""
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    file.write(array('Q', [_prefix(keys[record]) for record in order]).tobytes())
+    file.write(array('I', order).tobytes())
+    file.write(bytes(_index_size(len(keys)) - len(keys) * 12))
+
+
+def write_user_snapshot(path: str | os.PathLike[str], users: Iterable[User]) -> int:
+    """
+    Write users to a snapshot file, replacing it atomically.
+
+    Typically fed from `SqlUserRepository.iter_all()`.
+
+    Args:
+        path: Target file.
+        users: Users to store; later duplicates of an id or email are ignored.
+
+    Returns:
+        The number of users written.
+    """
+    target = Path(path)
+    email_keys: list[str] = []
+    id_keys: list[str] = []
+    seen_ids: set[str] = set()
+    seen_emails: set[str] = set()
+    descriptor, temporary = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.')
+    try:
+        with os.fdopen(descriptor, 'wb') as file, tempfile.TemporaryFile() as records:
+            file.write(bytes(HEADER.size))
+            heap_size = 0
+            for user in users:
+                email_key = user.email.value.lower()
+                if user.id in seen_ids or email_key in seen_emails:
+                    continue
+                seen_ids.add(user.id)
+                seen_emails.add(email_key)
+                strings = (
+                    user.id,
+                    user.email.value,
+                    user.name,
+                    user.password_hash,
+                    user.created_at.isoformat(),
+                    user.updated_at.isoformat(),
+                )
+                block = ''.join(strings).encode()
+                records.write(
+                    RECORD.pack(
+                        heap_size,
+                        len(block),
+                        *map(len, strings),
+                        _ROLE_CODES[user.role],
+                        1 if user.email_verified else 0,
+                        user.version,
+                    )
+                )
+                file.write(block)
+                heap_size += len(block)
+                email_keys.append(email_key)
+                id_keys.append(user.id)
+            del seen_ids, seen_emails
+
+            count = len(id_keys)
+            records_offset = _align(HEADER.size + heap_size)
+            email_offset = _align(records_offset + count * _RECORD_SIZE)
+            id_offset = email_offset + _index_size(count)
+            size = id_offset + _index_size(count)
+            file.write(bytes(records_offset - HEADER.size - heap_size))
+            records.seek(0)
+            while chunk := records.read(1 << 20):
+                file.write(chunk)
+            file.write(bytes(email_offset - records_offset - count * _RECORD_SIZE))
+            _write_index(file, email_keys)
+            del email_keys
+            _write_index(file, id_keys)
+            file.seek(0)
+            file.write(
+                HEADER.pack(
+                    MAGIC, FORMAT, _RECORD_SIZE, count, records_offset, email_offset,
+                    id_offset, size,
+                )
+            )
+        os.replace(temporary, target)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return count
+
+
+class UserSnapshot:
+    """Read-only lookups over a snapshot file mapped into memory."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """
+        Map a snapshot file; no record is read until a lookup needs it.
+
+        Args:
+            path: Snapshot written by `write_user_snapshot`.
+
+        Raises:
+            ValueError: If the file is not a snapshot or is truncated.
+        """
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < HEADER.size:
+                raise ValueError('Not a user snapshot file')
+            magic, version, record_size, count, records, emails, ids, size = (
+                HEADER.unpack_from(self._map, 0)
+            )
+            if magic != MAGIC or version != FORMAT or record_size != _RECORD_SIZE:
+                raise ValueError('Not a user snapshot file')
+            if size != len(self._map):
+                raise ValueError('Truncated user snapshot file')
+        except ValueError:
+            self._map.close()
+            raise
+        self._count: int = count
+        self._records = records
+        self._view = memoryview(self._map)
+        self._email_index = self._index(emails)
+        self._id_index = self._index(ids)
+
+    def _index(self, offset: int) -> tuple[memoryview, memoryview]:
+        middle = offset + self._count * 8
+        return (
+            self._view[offset:middle].cast('Q'),
+            self._view[middle : middle + self._count * 4].cast('I'),
+        )
+
+    def _search(
+        self, index: tuple[memoryview, memoryview], key: str, email: bool
+    ) -> tuple[tuple[int, ...], str]:
+        """
+        Look `key` up: bisect the prefixes, then binary-search the ties by full key.
+
+        Returns:
+            The record fields and its decoded string block; empty ones if absent.
+        """
+        prefixes, records = index
+        prefix = _prefix(key)
+        low = bisect_left(prefixes, prefix)
+        high = bisect_right(prefixes, prefix, low)
+        view = self._map
+        while low < high:
+            middle = (low + high) // 2
+            fields = _unpack_record(view, self._records + records[middle] * _RECORD_SIZE)
+            start = HEADER.size + fields[0]
+            block = str(view[start : start + fields[1]], 'utf-8')
+            if email:
+                stored = block[fields[2] : fields[2] + fields[3]].lower()
+            else:
+                stored = block[: fields[2]]
+            if stored == key:
+                return fields, block
+            if stored < key:
+                low = middle + 1
+            else:
+                high = middle
+        return (), ''
+
+    @staticmethod
+    def _materialize(fields: tuple[int, ...], block: str) -> User:
+        end_id = fields[2]
+        end_email = end_id + fields[3]
+        end_name = end_email + fields[4]
+        end_hash = end_name + fields[5]
+        end_created = end_hash + fields[6]
+        return User.from_persistence(
+            id=block[:end_id],
+            email=Email.create(block[end_id:end_email]),
+            name=block[end_email:end_name],
+            password_hash=block[end_name:end_hash],
+            role=_ROLES[fields[8]],
+            email_verified=fields[9] == 1,
+            created_at=datetime.fromisoformat(block[end_hash:end_created]),
+            updated_at=datetime.fromisoformat(block[end_created:]),
+            version=fields[10],
+        )
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """Materialize the user with the id, or return None."""
+        fields, block = self._search(self._id_index, user_id, False)
+        return self._materialize(fields, block) if fields else None
+
+    def find_by_email(self, email: Email | str) -> User | None:
+        """Materialize the user owning the email (case-insensitive), or return None."""
+        fields, block = self._search_email(email)
+        return self._materialize(fields, block) if fields else None
+
+    def id_for_email(self, email: Email | str) -> str | None:
+        """Return the id of the user owning the email without materializing it."""
+        fields, block = self._search_email(email)
+        return block[: fields[2]] if fields else None
+
+    def _search_email(self, email: Email | str) -> tuple[tuple[int, ...], str]:
+        value = email if isinstance(email, str) else email.value
+        return self._search(self._email_index, value.lower(), True)
+
+    def __len__(self) -> int:
+        """Return the number of users in the snapshot."""
+        return self._count
+
+    def close(self) -> None:
+        """Unmap the file."""
+        for view in (*self._email_index, *self._id_index, self._view):
+            view.release()
+        self._map.close()
+
+    def __enter__(self) -> UserSnapshot:
+        """Return the snapshot itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unmap the file."""
+        self.close()
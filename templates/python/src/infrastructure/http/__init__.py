@@ -0,0 +1 @@
+"""HTTP adapter (FastAPI)."""
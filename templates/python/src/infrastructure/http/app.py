@@ -0,0 +1,347 @@
+"""FastAPI application exposing user registration.
+
+Endpoints:
+    POST /users         register one account (201, 400 validation, 409 conflict)
+    POST /users:batch   register up to 1000 accounts in one request; every item
+                        gets its own status and the results are streamed so
+                        large responses are not built in memory first.
+
+Both accept an optional `Idempotency-Key` header when the app is built with
+an `IdempotentExecutor`: retries replay the first response (with an
+`Idempotent-Replayed: true` header) instead of registering again.
+
+With a `RegistrationRateLimiter`, requests over the per-domain or per-client
+budget get 429 and a `Retry-After` header before any password is hashed.
+Replays of an idempotent request are not charged, and a limited attempt is
+not stored, so the client can retry it under the same key.
+The client is the peer address: a caller-supplied header could be rotated
+to get around the limit. A batch with more registrations for one domain
+than the domain budget holds gets 413, since waiting would not help.
+
+Routes are plain `def` functions: the use case is synchronous (password
+hashing is CPU bound), so FastAPI runs them in its thread pool instead of
+blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from typing import Annotated, Any
+
+from fastapi import FastAPI, Header, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from ...application.ports.idempotency_store import StoredResponse
+from ...application.ports.user_repository import UserAlreadyExistsError
+from ...application.use_cases.idempotency import (
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+    IdempotentExecutor,
+    request_fingerprint,
+)
+from ...application.use_cases.register_user_account import (
+    STATUS_CONFLICT,
+    STATUS_CREATED,
+    BatchItemResult,
+    InvalidCommandError,
+    RegisterUserAccountCommand,
+    RegisterUserAccountHandler,
+    RegisterUserAccountResult,
+)
+from ...application.use_cases.registration_rate_limit import (
+    RegistrationBatchTooLargeError,
+    RegistrationRateLimitedError,
+    RegistrationRateLimiter,
+)
+from ...domain.value_objects.email import Email
+from .schemas import RegisterUserRequest, RegisterUsersBatchRequest
+
+# Batch results are flushed to the client every STREAM_CHUNK_ITEMS items.
+STREAM_CHUNK_ITEMS = 100
+
+_HTTP_STATUS = {STATUS_CREATED: 201, STATUS_CONFLICT: 409}
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _user_data(result: RegisterUserAccountResult) -> dict[str, Any]:
+    """Public fields of the new user, in the API's camelCase."""
+    snapshot = result.user_snapshot
+    return {
+        'userId': snapshot['id'],
+        'email': snapshot['email'],
+        'name': snapshot['name'],
+        'role': snapshot['role'],
+        'createdAt': snapshot['created_at'],
+    }
+
+
+def _error(status_code: int, message: str, path: str, errors: list[str]) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            'success': False,
+            'message': message,
+            'errors': errors,
+            'timestamp': _timestamp(),
+            'path': path,
+        },
+    )
+
+
+def _to_command(item: RegisterUserRequest) -> RegisterUserAccountCommand:
+    return RegisterUserAccountCommand.create(item.email, item.name, item.password)
+
+
+def _item_payload(item: BatchItemResult) -> dict[str, Any]:
+    payload: dict[str, Any] = {'index': item.index, 'status': _HTTP_STATUS.get(item.status, 400)}
+    if item.result is not None:
+        payload['data'] = _user_data(item.result)
+    else:
+        payload['errors'] = item.errors
+    return payload
+
+
+def _stream_batch(results: list[BatchItemResult]) -> Iterator[bytes]:
+    """Yield the batch response body in chunks of STREAM_CHUNK_ITEMS items."""
+    created = sum(1 for item in results if item.status == STATUS_CREATED)
+    failed = len(results) - created
+    head = {'success': failed == 0, 'created': created, 'failed': failed}
+    yield json.dumps(head)[:-1].encode() + b', "results": ['
+    for start in range(0, len(results), STREAM_CHUNK_ITEMS):
+        chunk = results[start : start + STREAM_CHUNK_ITEMS]
+        body = ', '.join(json.dumps(_item_payload(item)) for item in chunk)
+        yield (', ' if start else '').encode() + body.encode()
+    yield b']}'
+
+
+def _parsed_emails(items: list[RegisterUserRequest]) -> list[Email]:
+    """Emails of the items that parse; the others fail validation later anyway."""
+    emails = []
+    for item in items:
+        try:
+            emails.append(Email.create(item.email.strip().lower()))
+        except ValueError:
+            continue
+    return emails
+
+
+def _replay_response(stored: StoredResponse, replayed: bool) -> Response:
+    headers = {'Idempotent-Replayed': 'true'} if replayed else None
+    return Response(
+        stored.body, status_code=stored.status_code, media_type='application/json', headers=headers
+    )
+
+
+def _validation_failed(request: Request, exc: RequestValidationError) -> JSONResponse:
+    errors = [
+        f'{".".join(str(part) for part in error["loc"][1:])}: {error["msg"]}'
+        for error in exc.errors()
+    ]
+    return _error(400, 'Validation failed', request.url.path, errors)
+
+
+def _rate_limited(
+    rate_limiter: RegistrationRateLimiter | None,
+    request: Request,
+    items: list[RegisterUserRequest],
+) -> Response | None:
+    """Return the 413 or 429 response when the registrations exceed a budget."""
+    if rate_limiter is None:
+        return None
+    client_id = request.client.host if request.client is not None else None
+    try:
+        rate_limiter.check(_parsed_emails(items), client_id)
+    except RegistrationBatchTooLargeError as error:
+        return _error(413, 'Batch too large', request.url.path, [str(error)])
+    except RegistrationRateLimitedError as error:
+        response = _error(429, 'Too many requests', request.url.path, [str(error)])
+        response.headers['Retry-After'] = str(max(1, math.ceil(error.retry_after)))
+        return response
+    return None
+
+
+class _RateLimitedError(Exception):
+    """Carries a 413/429 response out of an idempotent run so it is not stored."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def _idempotent(
+    idempotency: IdempotentExecutor,
+    rate_limiter: RegistrationRateLimiter | None,
+    request: Request,
+    key: str,
+    items: list[RegisterUserRequest],
+    payload: Any,
+    run: Callable[[], Response],
+) -> Response:
+    """
+    Run the request once per idempotency key and replay it afterwards.
+
+    The rate limiter is only charged when the request actually runs, so a retry
+    of a completed request replays its response instead of spending tokens. A
+    rate-limited attempt is not stored and leaves the key free for a retry.
+    """
+
+    def operation() -> StoredResponse:
+        limited = _rate_limited(rate_limiter, request, items)
+        if limited is not None:
+            raise _RateLimitedError(limited)
+        response = run()
+        return StoredResponse('', response.status_code, bytes(response.body))
+
+    fingerprint = request_fingerprint(request.method, request.url.path, payload)
+    try:
+        stored, replayed = idempotency.execute(key, fingerprint, operation)
+    except _RateLimitedError as error:
+        return error.response
+    except IdempotencyKeyReusedError as error:
+        return _error(422, 'Idempotency key reused', request.url.path, [str(error)])
+    except IdempotencyInProgressError as error:
+        return _error(409, 'Request in progress', request.url.path, [str(error)])
+    return _replay_response(stored, replayed)
+
+
+def _register_one(
+    handler: RegisterUserAccountHandler, body: RegisterUserRequest, path: str
+) -> JSONResponse:
+    try:
+        result = handler.execute(_to_command(body))
+    except InvalidCommandError as error:
+        return _error(400, 'Validation failed', path, error.errors)
+    except UserAlreadyExistsError as error:
+        return _error(409, 'User already exists', path, [str(error)])
+    except ValueError as error:
+        return _error(400, 'Validation failed', path, [str(error)])
+    return JSONResponse(
+        status_code=201,
+        content={
+            'success': True,
+            'message': 'User registered successfully',
+            'data': _user_data(result),
+        },
+    )
+
+
+def _register_many(
+    handler: RegisterUserAccountHandler, body: RegisterUsersBatchRequest
+) -> tuple[list[BatchItemResult], int]:
+    commands: list[RegisterUserAccountCommand | InvalidCommandError] = []
+    for item in body.items:
+        try:
+            commands.append(_to_command(item))
+        except InvalidCommandError as error:
+            commands.append(error)
+    results = handler.execute_batch(commands)
+    created = sum(1 for item in results if item.status == STATUS_CREATED)
+    # 201 when everything was created, 207 Multi-Status otherwise.
+    return results, 201 if created == len(results) else 207
+
+
+def _register_user(
+    handler: RegisterUserAccountHandler,
+    idempotency: IdempotentExecutor | None,
+    rate_limiter: RegistrationRateLimiter | None,
+    body: RegisterUserRequest,
+    request: Request,
+    idempotency_key: str | None,
+) -> Response:
+    """Body of POST /users."""
+    path = request.url.path
+    if idempotency is None or idempotency_key is None:
+        limited = _rate_limited(rate_limiter, request, [body])
+        return limited or _register_one(handler, body, path)
+    return _idempotent(
+        idempotency,
+        rate_limiter,
+        request,
+        idempotency_key,
+        [body],
+        body.model_dump(),
+        lambda: _register_one(handler, body, path),
+    )
+
+
+def _register_users_batch(
+    handler: RegisterUserAccountHandler,
+    idempotency: IdempotentExecutor | None,
+    rate_limiter: RegistrationRateLimiter | None,
+    body: RegisterUsersBatchRequest,
+    request: Request,
+    idempotency_key: str | None,
+) -> Response:
+    """Body of POST /users:batch."""
+    if idempotency is None or idempotency_key is None:
+        limited = _rate_limited(rate_limiter, request, body.items)
+        if limited is not None:
+            return limited
+        results, status_code = _register_many(handler, body)
+        return StreamingResponse(
+            _stream_batch(results), status_code=status_code, media_type='application/json'
+        )
+
+    def run() -> Response:
+        # A replayable response has to be kept whole, so it is not streamed.
+        results, status_code = _register_many(handler, body)
+        return Response(
+            b''.join(_stream_batch(results)),
+            status_code=status_code,
+            media_type='application/json',
+        )
+
+    return _idempotent(
+        idempotency, rate_limiter, request, idempotency_key, body.items, body.model_dump(), run
+    )
+
+
+def create_app(
+    handler: RegisterUserAccountHandler,
+    idempotency: IdempotentExecutor | None = None,
+    rate_limiter: RegistrationRateLimiter | None = None,
+) -> FastAPI:
+    """
+    Build the application around a configured use case.
+
+    Args:
+        handler: The registration use case, already wired to its adapters.
+        idempotency: When given, requests carrying an `Idempotency-Key` header run
+            at most once per key and later duplicates replay the stored response.
+        rate_limiter: When given, registrations are limited per email domain and client.
+
+    Returns:
+        The FastAPI application.
+    """
+    app = FastAPI(title='User Accounts')
+
+    @app.exception_handler(RequestValidationError)
+    def request_validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
+        return _validation_failed(request, exc)
+
+    @app.post('/users', status_code=201)
+    def register_user(
+        body: RegisterUserRequest,
+        request: Request,
+        idempotency_key: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        return _register_user(handler, idempotency, rate_limiter, body, request, idempotency_key)
+
+    @app.post('/users:batch')
+    def register_users_batch(
+        body: RegisterUsersBatchRequest,
+        request: Request,
+        idempotency_key: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        return _register_users_batch(
+            handler, idempotency, rate_limiter, body, request, idempotency_key
+        )
+
+    return app
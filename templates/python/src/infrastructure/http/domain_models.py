@@ -0,0 +1,167 @@
+"""Pydantic v2 models that produce and serialize domain objects directly.
+
+Request side: `DomainRules` is `Annotated` metadata that makes pydantic-core
+run a domain class's compiled `INVARIANTS` for one field, right after its
+own string parsing, and build the value object from the checked string
+(`Email(value)`: trusted construction, no second `Email.create`). A model
+made of such fields, like `UserDraft`, can then create the `User` with
+`validate=False`. Rule failures become pydantic errors whose type is the
+domain reason code ('invalid_format', 'too_long', ...) and whose message
+is the domain message.
+
+Response side: `UserSerializer` compiles a pydantic-core `SchemaSerializer`
+that reads the entity's attributes (`_id`, `_email`, ...) and writes them
+under public names, so a `User` becomes a dict or JSON bytes without
+`to_dict` or an intermediate model. `SNAPSHOT_FIELDS` matches `to_dict`
+(for naive datetimes, which is what the entity stores); `RESPONSE_FIELDS`
+is the API's camelCase `data` object.
+
+The HTTP routes in `app` do not use these models yet. They keep plain
+string fields so an invalid batch item gets its own 400 instead of failing
+the whole request, which means a registration there still parses its email
+twice: once for the rate limiter and once in the use case. The single parse
+above only holds for callers that build a `UserDraft` themselves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, PydanticCustomError, SchemaSerializer, core_schema
+
+from ...domain.entities.user import User, UserRole
+from ...domain.invariants import Validated, compile_rules
+from ...domain.value_objects.email import Email
+
+
+def _pydantic_error(message: str, reason: str) -> Exception:
+    # The message is passed as context: user input in it must not be read as a template.
+    return PydanticCustomError(reason, '{message}', {'message': message})
+
+
+@dataclass(frozen=True)
+class DomainRules:
+    """
+    `Annotated` metadata validating a string with the rules of `owner.INVARIANTS[field]`.
+
+    Attributes:
+        owner: The entity or value object declaring the rules.
+        field: Key of the rules in `owner.INVARIANTS`.
+        build: Trusted constructor applied to the checked string (e.g. `Email`);
+            the string itself is the value when None.
+        strip: Trim whitespace before the rules run.
+        lower: Lower-case before the rules run.
+    """
+
+    owner: type[Validated]
+    field: str
+    build: Callable[[str], Any] | None = None
+    strip: bool = True
+    lower: bool = False
+
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Chain pydantic-core string parsing, the compiled rules and the constructor."""
+        check = compile_rules(
+            {self.field: self.owner.INVARIANTS[self.field]},
+            error=_pydantic_error,
+            name=f'{self.owner.__qualname__}.{self.field} (pydantic)',
+        ).check
+        build = self.build
+
+        def validate(value: str) -> Any:
+            check(value)
+            return value if build is None else build(value)
+
+        return core_schema.no_info_after_validator_function(
+            validate,
+            core_schema.str_schema(strip_whitespace=self.strip, to_lower=self.lower),
+            serialization=core_schema.to_string_ser_schema(),
+        )
+
+
+EmailValue = Annotated[Email, DomainRules(Email, 'email', build=Email, lower=True)]
+UserName = Annotated[str, DomainRules(User, 'name')]
+
+
+class UserDraft(BaseModel):
+    """The user-provided fields of a new `User`, checked once by pydantic-core."""
+
+    model_config = ConfigDict(frozen=True)
+
+    email: EmailValue
+    name: UserName
+    role: UserRole = UserRole.USER
+
+    def to_user(self, password_hash: str) -> User:
+        """
+        Create the user without re-checking what the model already validated.
+
+        Args:
+            password_hash: Hash of the password (never the plain text).
+
+        Returns:
+            The new user, with its UserCreatedEvent recorded.
+        """
+        return User.create(self.email, self.name, password_hash, self.role, validate=False)
+
+
+_USER_ATTRIBUTES: Mapping[str, CoreSchema] = {
+    'id': core_schema.str_schema(),
+    'email': core_schema.any_schema(serialization=core_schema.to_string_ser_schema()),
+    'name': core_schema.str_schema(),
+    'role': core_schema.enum_schema(UserRole, list(UserRole), sub_type='str'),
+    'email_verified': core_schema.bool_schema(),
+    'created_at': core_schema.datetime_schema(),
+    'updated_at': core_schema.datetime_schema(),
+}
+
+# Public name -> User attribute (without the leading underscore).
+SNAPSHOT_FIELDS: Mapping[str, str] = {name: name for name in _USER_ATTRIBUTES}
+RESPONSE_FIELDS: Mapping[str, str] = {
+    'userId': 'id',
+    'email': 'email',
+    'name': 'name',
+    'role': 'role',
+    'createdAt': 'created_at',
+}
+
+
+class UserSerializer:
+    """Serializes `User` entities through pydantic-core, straight from their attributes."""
+
+    def __init__(self, fields: Mapping[str, str] = SNAPSHOT_FIELDS) -> None:
+        """
+        Compile the serializer.
+
+        Args:
+            fields: Output key -> User attribute name (one of SNAPSHOT_FIELDS' values).
+                Attributes left out, and always the password hash, are not written.
+        """
+        schema = core_schema.model_fields_schema(
+            {
+                f'_{attribute}': core_schema.model_field(
+                    _USER_ATTRIBUTES[attribute], serialization_alias=key
+                )
+                for key, attribute in fields.items()
+            }
+        )
+        self._serializer = SchemaSerializer(core_schema.model_schema(User, schema))
+
+    def to_python(self, user: User) -> dict[str, Any]:
+        """Return the user as a JSON-compatible dict."""
+        data: dict[str, Any] = self._serializer.to_python(user, mode='json', by_alias=True)
+        return data
+
+    def to_json(self, user: User) -> bytes:
+        """Return the user as JSON bytes."""
+        return self._serializer.to_json(user, by_alias=True)
+
+    def to_json_many(self, users: list[User]) -> list[bytes]:
+        """Return each user as JSON bytes."""
+        to_json = self._serializer.to_json
+        return [to_json(user, by_alias=True) for user in users]
@@ -0,0 +1,27 @@
+"""Request and response models of the HTTP adapter."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_ITEMS = 1000
+
+
+class RegisterUserRequest(BaseModel):
+    """
+    Body of `POST /users`; field rules live in RegisterUserAccountCommand.
+
+    There is no `role`: registration is unauthenticated, so it always creates
+    a USER and a `role` sent by the caller is ignored like any unknown field.
+    Other roles are granted through an authorized path.
+    """
+
+    email: str
+    name: str
+    password: str
+
+
+class RegisterUsersBatchRequest(BaseModel):
+    """Body of `POST /users:batch`."""
+
+    items: list[RegisterUserRequest] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
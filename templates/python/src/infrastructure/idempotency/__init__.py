@@ -0,0 +1 @@
+"""Idempotency store adapters."""
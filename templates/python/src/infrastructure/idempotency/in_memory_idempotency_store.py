@@ -0,0 +1,92 @@
+"""Bounded in-memory idempotency store.
+
+Responses live in an LRU-ordered dict capped at `max_entries`; expired
+entries are dropped when read and evicted from the old end on writes.
+Suitable for a single process; use the Redis store when several workers
+must share keys.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from ...application.ports.idempotency_store import StoredResponse
+
+
+class InMemoryIdempotencyStore:
+    """IdempotencyStore adapter backed by process memory."""
+
+    def __init__(
+        self, *, max_entries: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Create an empty store.
+
+        Args:
+            max_entries: Maximum stored responses; least recently used ones go first.
+            clock: Monotonic time source in seconds (injectable for tests).
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError('max_entries must be positive')
+        self._max_entries = max_entries
+        self._clock = clock
+        self._responses: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+        self._locks: dict[str, tuple[float, str]] = {}
+        self._mutex = threading.Lock()
+
+    def get(self, key: str) -> StoredResponse | None:
+        """Return the live response for the key and mark it recently used."""
+        with self._mutex:
+            entry = self._responses.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= self._clock():
+                del self._responses[key]
+                return None
+            self._responses.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: StoredResponse, ttl_seconds: float) -> None:
+        """Store the response, evicting expired then least recently used entries."""
+        with self._mutex:
+            now = self._clock()
+            self._responses[key] = (now + ttl_seconds, response)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self._max_entries:
+                self._responses.popitem(last=False)
+            # Opportunistic sweep of the oldest entries that already expired.
+            while self._responses:
+                oldest_key, (expires_at, _) = next(iter(self._responses.items()))
+                if expires_at > now:
+                    break
+                del self._responses[oldest_key]
+
+    def acquire(self, key: str, ttl_seconds: float) -> str | None:
+        """Take the in-flight lock unless a live one exists and return its owner token."""
+        with self._mutex:
+            now = self._clock()
+            held = self._locks.get(key)
+            if held is not None and held[0] > now:
+                return None
+            token = secrets.token_hex(16)
+            self._locks[key] = (now + ttl_seconds, token)
+            return token
+
+    def release(self, key: str, token: str) -> None:
+        """Drop the in-flight lock if `token` still owns it."""
+        with self._mutex:
+            held = self._locks.get(key)
+            if held is not None and held[1] == token:
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        """Return the number of stored responses (expired ones included until swept)."""
+        return len(self._responses)
@@ -0,0 +1,98 @@
+"""Redis idempotency store.
+
+Responses are stored as JSON strings under `<prefix>:<key>` with a
+millisecond TTL (`SET ... PX`); the in-flight lock is `<prefix>:lock:<key>`
+taken with `SET NX PX`, so a crashed worker's lock expires on its own. The
+lock's value is a random owner token and RELEASE_SCRIPT deletes it only
+while it still holds that token: a worker that outlived its lock must not
+free the lock another worker took since. Any client exposing `get`,
+`set(name, value, px=, nx=)` and `eval` works: `redis.Redis`, a cluster
+client or a test fake.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+from typing import Any, Protocol
+
+from ...application.ports.idempotency_store import StoredResponse
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisClient(Protocol):
+    """The subset of the redis-py client the store uses."""
+
+    def get(self, name: str) -> Any:
+        """Return the value stored at `name`, or None."""
+        ...
+
+    def set(self, name: str, value: Any, *, px: int | None = None, nx: bool = False) -> Any:
+        """Store `value`; with nx=True only if absent. Returns a truthy value on success."""
+        ...
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        """Run a Lua script."""
+        ...
+
+
+class RedisIdempotencyStore:
+    """IdempotencyStore adapter shared by every worker connected to Redis."""
+
+    def __init__(self, client: RedisClient, *, prefix: str = 'idempotency') -> None:
+        """
+        Wrap a Redis client.
+
+        Args:
+            client: Connected client (bytes or decoded responses).
+            prefix: Namespace for the keys.
+        """
+        self._client = client
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f'{self._prefix}:{key}'
+
+    def _lock_key(self, key: str) -> str:
+        return f'{self._prefix}:lock:{key}'
+
+    def get(self, key: str) -> StoredResponse | None:
+        """Return the stored response, or None if absent or expired."""
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            return None
+        document = json.loads(raw)
+        return StoredResponse(
+            fingerprint=document['fingerprint'],
+            status_code=document['status_code'],
+            body=document['body'].encode(),
+        )
+
+    def put(self, key: str, response: StoredResponse, ttl_seconds: float) -> None:
+        """Store the response with a TTL."""
+        document = {
+            'fingerprint': response.fingerprint,
+            'status_code': response.status_code,
+            'body': response.body.decode(),
+        }
+        self._client.set(self._key(key), json.dumps(document), px=_milliseconds(ttl_seconds))
+
+    def acquire(self, key: str, ttl_seconds: float) -> str | None:
+        """Take the lock with `SET NX PX`, storing a fresh owner token in it."""
+        token = secrets.token_hex(16)
+        taken = self._client.set(self._lock_key(key), token, px=_milliseconds(ttl_seconds), nx=True)
+        return token if taken else None
+
+    def release(self, key: str, token: str) -> None:
+        """Delete the lock if it still holds `token` (compare-and-delete in Lua)."""
+        self._client.eval(RELEASE_SCRIPT, 1, self._lock_key(key), token)
+
+
+def _milliseconds(seconds: float) -> int:
+    return max(1, int(seconds * 1000))
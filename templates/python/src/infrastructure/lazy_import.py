@@ -0,0 +1,38 @@
+"""Deferred imports for heavy optional integrations.
+
+Keeps cold start cheap: the module object is created up front but its code
+only runs on the first attribute access (`importlib.util.LazyLoader`).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return `name` as a module whose import runs on first attribute access.
+
+    Args:
+        name: Absolute module name, e.g. 'opentelemetry.metrics'.
+
+    Returns:
+        The (possibly not yet executed) module.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
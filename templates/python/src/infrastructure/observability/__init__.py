@@ -0,0 +1 @@
+"""Observability adapters (metrics, tracing, profiling, logging, load and soak testing)."""
@@ -0,0 +1,335 @@
+"""Non-blocking structured logging for domain operations.
+
+Writing a JSON line to stdout from the registration path puts a syscall
+(and whatever the pipe or terminal on the other end does) inside every
+request. Here the request thread only runs structlog's cheap processors and
+appends the event dict to a bounded in-memory queue; a background thread
+renders the records to JSON and writes them in batches with one `write`
+and one `flush` each.
+
+- The queue is a `collections.deque`: `append` and `popleft` are atomic
+  under the GIL, so producers take no lock. When it holds `capacity`
+  records new ones are dropped and counted rather than blocking the
+  request; the writer reports the drops as a `log.dropped` record.
+- The writer wakes when a batch is full or every `flush_interval` seconds,
+  whichever comes first. Draining takes a lock, so `flush()` called on
+  another thread never races the writer for the queue or the stream.
+- `DomainLogger` wraps the domain hot paths the same way the metrics
+  instrumentor does (`HotPathPatcher`, fully reversible) and samples per
+  operation: high-volume successes can be logged at a fraction of their
+  rate while rejections are kept. Sampled-out calls are counted, and every
+  record carries its `sample_rate` so counts can be scaled back up.
+
+Usage:
+    writer = BatchingLogWriter(sys.stdout)
+    writer.start()
+    enable_domain_logging(writer.get_logger(), sample_rates={'user.create': 0.1})
+    ...
+    disable_domain_logging()
+    writer.close()
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import IO, Any
+
+import structlog
+from structlog.typing import EventDict, Processor
+
+from ...domain.entities.user import User
+from ...domain.value_objects.email import Email
+from .hot_paths import HotPath, HotPathPatcher
+
+LOGGED_HOT_PATHS: tuple[HotPath, ...] = (
+    HotPath(Email, 'create', 'email.create'),
+    HotPath(User, 'create', 'user.create'),
+    HotPath(User, 'verify_email', 'user.verify_email'),
+)
+
+
+class _QueueLogger:
+    """structlog logger whose every method enqueues the processed event dict."""
+
+    def __init__(self, enqueue: Callable[[EventDict], None]) -> None:
+        self._enqueue = enqueue
+
+    def msg(self, event_dict: EventDict) -> None:  # one positional arg: see _hand_off
+        self._enqueue(event_dict)
+
+    debug = info = warning = error = critical = exception = msg
+
+
+def _add_timestamp(_logger: Any, _method: str, event_dict: EventDict) -> EventDict:
+    event_dict['timestamp'] = time.time()  # formatted by the writer thread
+    return event_dict
+
+
+def _hand_off(_logger: Any, _method: str, event_dict: EventDict) -> Any:
+    return (event_dict,), {}
+
+
+class BatchingLogWriter:
+    """Bounded record queue drained to a text stream by a background thread."""
+
+    def __init__(
+        self,
+        stream: IO[str],
+        *,
+        capacity: int = 65_536,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+        renderer: Processor | None = None,
+    ) -> None:
+        """
+        Configure the writer; call `start` to run it.
+
+        Args:
+            stream: Where rendered lines go (stdout, a file...).
+            capacity: Records held at most before new ones are dropped.
+            batch_size: Queued records that wake the writer early.
+            flush_interval: Seconds between writes when traffic is low.
+            renderer: structlog renderer run on the writer thread; JSON by default.
+
+        Raises:
+            ValueError: If capacity, batch_size or flush_interval is not positive.
+        """
+        if capacity < 1 or batch_size < 1 or flush_interval <= 0:
+            raise ValueError('capacity, batch_size and flush_interval must be positive')
+        self._stream = stream
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._render = renderer or structlog.processors.JSONRenderer()
+        self._queue: deque[EventDict] = deque()
+        self._wakeup = threading.Event()
+        self._drain_lock = threading.Lock()
+        self._closing = False
+        self._thread: threading.Thread | None = None
+        self.written = 0
+        self.dropped = 0  # approximate under contention: increments are not atomic
+        self._reported_drops = 0
+
+    def start(self) -> None:
+        """Start the background writer thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the writer after writing everything already queued."""
+        if self._thread is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+
+    def get_logger(self, **initial_values: Any) -> Any:
+        """
+        Build a structlog logger that enqueues into this writer.
+
+        Args:
+            **initial_values: Context bound to every record of the logger.
+
+        Returns:
+            A filtering bound logger (INFO and above).
+        """
+        return structlog.wrap_logger(
+            _QueueLogger(self.enqueue),
+            processors=[structlog.processors.add_log_level, _add_timestamp, _hand_off],
+            wrapper_class=structlog.make_filtering_bound_logger(20),  # logging.INFO
+            cache_logger_on_first_use=True,
+            **initial_values,
+        )
+
+    def enqueue(self, event_dict: EventDict) -> None:
+        """Queue one processed record, or count it as dropped if the queue is full."""
+        queue = self._queue
+        if len(queue) >= self._capacity:
+            self.dropped += 1
+            return
+        queue.append(event_dict)
+        if len(queue) == self._batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write everything queued now, on the calling thread."""
+        self._drain()
+
+    def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self) -> None:
+        with self._drain_lock:  # the only consumer of the queue at any time
+            queue = self._queue
+            lines: list[str] = []
+            while queue:
+                lines.append(self._line(queue.popleft()))
+                if len(lines) == self._batch_size:
+                    self._write(lines)
+                    lines = []
+            drops = self.dropped - self._reported_drops
+            if drops:
+                self._reported_drops += drops
+                record = {'event': 'log.dropped', 'level': 'warning', 'count': drops}
+                lines.append(self._line({**record, 'timestamp': time.time()}))
+            if lines:
+                self._write(lines)
+
+    def _line(self, event_dict: EventDict) -> str:
+        event_dict['timestamp'] = datetime.fromtimestamp(event_dict['timestamp'], UTC).isoformat()
+        line = self._render(None, '', event_dict)
+        return line.decode() if isinstance(line, bytes | bytearray) else str(line)
+
+    def _write(self, lines: list[str]) -> None:
+        self._stream.write('\n'.join(lines) + '\n')
+        self._stream.flush()
+        self.written += len(lines)
+
+
+class DomainLogger:
+    """Installs and removes sampled logging wrappers around domain operations."""
+
+    def __init__(self) -> None:
+        """Create a domain logger in the disabled state."""
+        self._patcher = HotPathPatcher()
+        self.sampled_out: Counter[str] = Counter()
+
+    @property
+    def is_installed(self) -> bool:
+        """Whether the wrappers are currently installed."""
+        return self._patcher.is_patched
+
+    def install(
+        self,
+        logger: Any,
+        *,
+        sample_rates: Mapping[str, float] | None = None,
+        rejection_sample_rate: float = 1.0,
+    ) -> None:
+        """
+        Start logging the domain operations.
+
+        Args:
+            logger: structlog logger to emit to, e.g. `BatchingLogWriter.get_logger()`.
+            sample_rates: Fraction (0..1) of successful calls logged, by operation
+                ('email.create', 'user.create', 'user.verify_email'); 1.0 if absent.
+            rejection_sample_rate: Fraction of rejected calls (ValueError) logged.
+
+        Raises:
+            ValueError: If a rate is outside [0, 1].
+        """
+        rates = dict(sample_rates or {})
+        if not all(0.0 <= rate <= 1.0 for rate in [*rates.values(), rejection_sample_rate]):
+            raise ValueError('sample rates must be between 0 and 1')
+        if self.is_installed:
+            return
+        self._patcher.patch(
+            LOGGED_HOT_PATHS,
+            lambda func, operation: self._wrap(
+                func, operation, logger, rates.get(operation, 1.0), rejection_sample_rate
+            ),
+        )
+
+    def uninstall(self) -> None:
+        """Restore the original functions; sampling counts are kept."""
+        self._patcher.restore()
+
+    def _wrap(
+        self,
+        func: Callable[..., Any],
+        operation: str,
+        logger: Any,
+        sample_rate: float,
+        rejection_sample_rate: float,
+    ) -> Callable[..., Any]:
+        """Build the logging wrapper for one function."""
+        sampled_out = self.sampled_out
+        sampled = random.random  # noqa: S311 - sampling, not cryptography
+        describe, of_result = _DESCRIBERS[operation]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                result = func(*args, **kwargs)
+            except ValueError as error:
+                if sampled() < rejection_sample_rate:
+                    logger.warning(
+                        operation,
+                        outcome=getattr(error, 'reason', 'invalid'),
+                        sample_rate=rejection_sample_rate,
+                    )
+                else:
+                    sampled_out[operation] += 1
+                raise
+            if sampled() < sample_rate:
+                fields = describe(result if of_result else args[0])
+                logger.info(operation, outcome='ok', sample_rate=sample_rate, **fields)
+            else:
+                sampled_out[operation] += 1
+            return result
+
+        return wrapper
+
+
+def _describe_email(email: Email) -> dict[str, Any]:
+    return {'email_domain': email.domain}
+
+
+def _describe_new_user(user: User) -> dict[str, Any]:
+    return {'user_id': user.id, 'role': user.role.value}
+
+
+def _describe_user(user: User) -> dict[str, Any]:
+    return {'user_id': user.id}
+
+
+# Operation -> (describer, whether it describes the result rather than `self`).
+_DESCRIBERS: dict[str, tuple[Callable[[Any], dict[str, Any]], bool]] = {
+    'email.create': (_describe_email, True),
+    'user.create': (_describe_new_user, True),
+    'user.verify_email': (_describe_user, False),
+}
+
+_domain_logger = DomainLogger()
+
+
+def enable_domain_logging(
+    logger: Any,
+    *,
+    sample_rates: Mapping[str, float] | None = None,
+    rejection_sample_rate: float = 1.0,
+) -> DomainLogger:
+    """
+    Enable domain logging on the process-wide domain logger.
+
+    Args:
+        logger: structlog logger to emit to.
+        sample_rates: Fraction of successful calls logged, by operation.
+        rejection_sample_rate: Fraction of rejected calls logged.
+
+    Returns:
+        The process-wide domain logger.
+    """
+    _domain_logger.install(
+        logger, sample_rates=sample_rates, rejection_sample_rate=rejection_sample_rate
+    )
+    return _domain_logger
+
+
+def disable_domain_logging() -> None:
+    """Disable domain logging on the process-wide domain logger."""
+    _domain_logger.uninstall()
@@ -0,0 +1,136 @@
+"""Registry of the entry points observability adapters wrap.
+
+Wrapping happens in place on the owning class and is fully reversible, so
+the uninstrumented code path carries no overhead at all.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+from ...application.use_cases.register_user_account import RegisterUserAccountHandler
+from ...domain.entities.user import User
+from ...domain.value_objects.email import Email
+from ..persistence.in_memory_user_repository import InMemoryUserRepository
+from ..persistence.sql_user_repository import SqlUserRepository
+from ..security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+
+class HotPath(NamedTuple):
+    """A method to wrap and the operation name it is reported under."""
+
+    owner: type
+    attribute: str
+    operation: str
+
+
+DOMAIN_HOT_PATHS: tuple[HotPath, ...] = (
+    HotPath(Email, 'create', 'email.create'),
+    HotPath(User, 'create', 'user.create'),
+    HotPath(User, 'from_persistence', 'user.hydrate'),
+    HotPath(User, 'to_dict', 'user.serialize'),
+)
+
+# The registration use case and the password hashing it spends most of its time in.
+REGISTRATION_HOT_PATHS: tuple[HotPath, ...] = (
+    HotPath(RegisterUserAccountHandler, 'execute', 'registration.execute'),
+    HotPath(RegisterUserAccountHandler, 'execute_batch', 'registration.execute_batch'),
+    HotPath(Pbkdf2PasswordHasher, 'hash', 'password.hash'),
+    HotPath(Pbkdf2PasswordHasher, 'verify', 'password.verify'),
+)
+
+# Both adapters: the in-memory one is what `main` wires without a database.
+REPOSITORY_HOT_PATHS: tuple[HotPath, ...] = (
+    HotPath(InMemoryUserRepository, 'find_by_id', 'repository.find_by_id'),
+    HotPath(InMemoryUserRepository, 'find_by_email', 'repository.find_by_email'),
+    HotPath(InMemoryUserRepository, 'find_by_emails', 'repository.find_by_emails'),
+    HotPath(InMemoryUserRepository, 'save', 'repository.save'),
+    HotPath(InMemoryUserRepository, 'save_all', 'repository.save_all'),
+    HotPath(SqlUserRepository, 'find_by_id', 'repository.find_by_id'),
+    HotPath(SqlUserRepository, 'find_by_email', 'repository.find_by_email'),
+    HotPath(SqlUserRepository, 'find_by_emails', 'repository.find_by_emails'),
+    HotPath(SqlUserRepository, 'insert_many', 'repository.insert_many'),
+    HotPath(SqlUserRepository, 'update_dirty', 'repository.update_dirty'),
+)
+
+WrapperFactory = Callable[[Callable[..., Any], str], Callable[..., Any]]
+
+
+class _Layer(NamedTuple):
+    """One patcher's wrapper as installed on a hot path."""
+
+    patcher: HotPathPatcher
+    operation: str
+    make_wrapper: WrapperFactory
+    replacement: Any
+
+
+# (owner, attribute) -> (the unpatched attribute, wrappers on top of it, oldest first).
+# Shared by every patcher so they can be removed in any order.
+_STACKS: dict[tuple[type, str], tuple[Any, list[_Layer]]] = {}
+_STACKS_LOCK = threading.Lock()
+
+
+def _wrapped(current: Any, make_wrapper: WrapperFactory, operation: str) -> Any:
+    """Wrap `current`, unwrapping and re-wrapping classmethods and staticmethods."""
+    if isinstance(current, classmethod | staticmethod):
+        return type(current)(make_wrapper(current.__func__, operation))
+    return make_wrapper(current, operation)
+
+
+class HotPathPatcher:
+    """Installs wrappers on hot paths and restores the originals."""
+
+    def __init__(self) -> None:
+        """Create a patcher with nothing installed."""
+        self._paths: list[tuple[type, str]] = []
+
+    @property
+    def is_patched(self) -> bool:
+        """Whether any wrapper is currently installed."""
+        return bool(self._paths)
+
+    def patch(self, paths: Iterable[HotPath], make_wrapper: WrapperFactory) -> None:
+        """
+        Replace each hot path with `make_wrapper(function, operation)`.
+
+        Classmethods and staticmethods are unwrapped and re-wrapped so the
+        wrapper always receives the plain function. A path already wrapped by
+        another patcher is wrapped again on top.
+
+        Args:
+            paths: Methods to wrap.
+            make_wrapper: Builds the wrapper for one function.
+        """
+        with _STACKS_LOCK:
+            for owner, attribute, operation in paths:
+                key = (owner, attribute)
+                _, layers = _STACKS.setdefault(key, (owner.__dict__[attribute], []))
+                replacement = _wrapped(owner.__dict__[attribute], make_wrapper, operation)
+                setattr(owner, attribute, replacement)
+                layers.append(_Layer(self, operation, make_wrapper, replacement))
+                self._paths.append(key)
+
+    def restore(self) -> None:
+        """
+        Remove this patcher's wrappers, most recent first.
+
+        Wrappers other patchers installed on top are rebuilt around whatever
+        lies below, so patchers can be restored in any order.
+        """
+        with _STACKS_LOCK:
+            for key in reversed(self._paths):
+                original, layers = _STACKS[key]
+                index = max(i for i, layer in enumerate(layers) if layer.patcher is self)
+                above = layers[index + 1 :]
+                del layers[index:]
+                current = layers[-1].replacement if layers else original
+                for layer in above:
+                    current = _wrapped(current, layer.make_wrapper, layer.operation)
+                    layers.append(layer._replace(replacement=current))
+                setattr(*key, current)
+                if not layers:
+                    del _STACKS[key]
+            self._paths.clear()
@@ -0,0 +1,155 @@
+"""HDR-style latency histogram.
+
+Latencies are recorded as integer microseconds into log-linear buckets, as
+HdrHistogram does: values below `2 * 10**digits` get a bucket each, and
+above that every power-of-two range is split into the same number of
+equal sub-buckets. Memory grows with the number of distinct buckets hit
+(a few thousand for any realistic latency range), not with the samples,
+and every value is kept within `10**-digits` relative error.
+
+A histogram only summarizes what it is given. For load tests, record the
+time from when a request was *scheduled* to be sent, not from when the
+client got round to sending it; otherwise a stalled server also stalls
+the client and the slow period is hidden (coordinated omission). See
+`open_loop_load`.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9, 99.99)
+
+
+class LatencyHistogram:
+    """Counts of latencies in log-linear buckets with bounded relative error."""
+
+    def __init__(self, significant_digits: int = 3) -> None:
+        """
+        Configure the precision.
+
+        Args:
+            significant_digits: Decimal digits kept for every value (1-5).
+
+        Raises:
+            ValueError: If significant_digits is out of range.
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError('significant_digits must be between 1 and 5')
+        self.significant_digits = significant_digits
+        self._bits = math.ceil(math.log2(2 * 10**significant_digits))
+        self._half = 1 << (self._bits - 1)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        self._total = 0
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self._bits
+        if shift <= 0:
+            return value
+        return shift * self._half + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Largest value that falls into bucket `index`."""
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half) << shift) + (1 << shift) - 1
+
+    def record(self, microseconds: int, count: int = 1) -> None:
+        """
+        Add `count` occurrences of a latency.
+
+        Args:
+            microseconds: The latency; negative values are clamped to 0.
+            count: How many samples to add.
+        """
+        value = max(0, int(microseconds))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        if self.count == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += count
+        self._total += value * count
+
+    def record_seconds(self, seconds: float) -> None:
+        """Add one latency measured in seconds."""
+        self.record(round(seconds * 1_000_000))
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """
+        Add every sample of another histogram with the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.significant_digits != self.significant_digits:
+            raise ValueError('cannot merge histograms of different precision')
+        if other.count == 0:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self._total += other._total
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in microseconds (exact, not bucketed)."""
+        return self._total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Latency at or below which `percentile` percent of the samples fall.
+
+        Returns the highest value equivalent to the bucket that holds the
+        sample, capped at the recorded maximum, so it never understates.
+
+        Args:
+            percentile: Between 0 and 100.
+        """
+        if self.count == 0:
+            return 0
+        wanted = max(1, math.ceil(self.count * min(100.0, max(0.0, percentile)) / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= wanted:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max  # pragma: no cover - seen reaches count
+
+    def count_at_or_below(self, microseconds: int) -> int:
+        """
+        Samples whose bucket lies entirely at or below a latency.
+
+        Samples in the bucket straddling the threshold count as above it, so
+        the result is conservative by at most the histogram's precision.
+        """
+        return sum(
+            count
+            for index, count in self._counts.items()
+            if self._highest_equivalent(index) <= microseconds
+        )
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, Any]:
+        """
+        Summarize in milliseconds for reports.
+
+        Returns:
+            count, min, mean, max and `p<percentile>` entries.
+        """
+        summary: dict[str, Any] = {
+            'count': self.count,
+            'min': self.min / 1000,
+            'mean': round(self.mean / 1000, 3),
+            'max': self.max / 1000,
+        }
+        for percentile in percentiles:
+            summary[f'p{percentile:g}'] = self.percentile(percentile) / 1000
+        return summary
@@ -0,0 +1,283 @@
+"""Soak runs that watch a workload's memory for leaks.
+
+`run_soak` calls a workload cycle (create an aggregate, mutate it, clear
+its events, ...) over and over until a time budget or cycle count runs
+out. Every `sample_interval` seconds it collects garbage and samples the
+process RSS, and the memory traced by `tracemalloc` once tracing is on.
+Cycles run in batches between clock reads; each batch is sized from the
+pace of the previous one to end by the next sample, phase change or
+deadline, so a slow workload overshoots them by about one cycle.
+
+Tracing every allocation slows a domain workload down about tenfold, so a
+run has two phases:
+
+- untraced, for the first `1 - trace_share` of the budget (and of
+  `max_cycles`): full speed, RSS samples only. This is where the millions
+  of cycles happen.
+- traced, for the rest: `tracemalloc` samples, with snapshots at its
+  start and at the end of the run.
+
+Growth is measured from the first sample of each phase, so whatever the
+warm-up before it allocated (filled caches, interned strings, grown free
+lists) is not counted; memory that keeps growing after it is what a
+long-running worker would also accumulate. A series is flagged when at
+least `monotonic_fraction` of its sample-to-sample steps go up and it grew
+by more than `min_growth_bytes`; RSS is judged on the untraced phase only,
+since tracemalloc's own bookkeeping also grows the RSS. The report lists
+the call sites whose retained allocations grew most during the traced
+phase.
+"""
+
+from __future__ import annotations
+
+import gc
+import math
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Most cycles run between clock checks, so the check stays off the profile.
+CHECK_EVERY = 1_000
+
+
+class MemorySample(NamedTuple):
+    """Memory after `cycles` cycles, `elapsed` seconds into the run."""
+
+    elapsed: float
+    cycles: int
+    rss_bytes: int
+    traced_bytes: int | None  # None before tracing started
+
+
+class AllocationSite(NamedTuple):
+    """Growth of the memory retained by one call stack between two snapshots."""
+
+    size_diff: int
+    count_diff: int
+    traceback: tuple[str, ...]  # `file:line`, innermost frame first
+
+
+@dataclass
+class SoakReport:
+    """What a soak run did and whether its memory kept growing."""
+
+    cycles: int
+    elapsed: float
+    samples: list[MemorySample] = field(default_factory=list)
+    traced_from_cycle: int | None = None  # None when tracemalloc never ran
+    rss_growth: int = 0  # bytes over the untraced samples
+    traced_growth: int = 0  # bytes over the traced samples
+    bytes_per_cycle: float = 0.0  # traced growth per cycle, RSS growth when not traced
+    rss_monotonic: bool = False
+    traced_monotonic: bool = False
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def leak_suspected(self) -> bool:
+        """Whether the RSS or the traced memory grew monotonically."""
+        return self.rss_monotonic or self.traced_monotonic
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain data for JSON reports."""
+        data = asdict(self)
+        data['samples'] = [sample._asdict() for sample in self.samples]
+        data['top_sites'] = [site._asdict() for site in self.top_sites]
+        data['leak_suspected'] = self.leak_suspected
+        return data
+
+
+def read_rss_bytes() -> int:
+    """
+    Resident set size of this process.
+
+    Reads /proc/self/statm on Linux; elsewhere falls back to the peak RSS
+    from getrusage, which can only grow.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:  # pragma: no cover - not Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def grows_monotonically(values: Sequence[int], min_growth: int, fraction: float) -> bool:
+    """
+    Tell whether a series keeps growing.
+
+    Args:
+        values: Samples in time order.
+        min_growth: Smallest total growth (last minus first) that counts.
+        fraction: Share of steps that must go up.
+
+    Returns:
+        True with at least two steps, enough of them upward and enough total growth.
+    """
+    steps = [after - before for before, after in zip(values, values[1:], strict=False)]
+    if len(steps) < 2 or values[-1] - values[0] < min_growth:
+        return False
+    return sum(step > 0 for step in steps) >= fraction * len(steps)
+
+
+def _where(frame: tracemalloc.Frame) -> str:
+    path = Path(frame.filename)
+    if path.is_relative_to(Path.cwd()):
+        path = path.relative_to(Path.cwd())
+    return f'{path}:{frame.lineno}'
+
+
+def top_allocation_sites(
+    baseline: tracemalloc.Snapshot, final: tracemalloc.Snapshot, top: int
+) -> list[AllocationSite]:
+    """
+    Call stacks whose retained memory grew most between two snapshots.
+
+    Allocations made by tracemalloc and by this module are left out.
+    """
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ]
+    differences = final.filter_traces(ignore).compare_to(
+        baseline.filter_traces(ignore), 'traceback'
+    )
+    return [
+        AllocationSite(
+            difference.size_diff,
+            difference.count_diff,
+            tuple(_where(frame) for frame in reversed(difference.traceback)),
+        )
+        for difference in differences
+        if difference.size_diff > 0
+    ][:top]
+
+
+def run_soak(
+    cycle: Callable[[int], object],
+    *,
+    budget_seconds: float,
+    max_cycles: int | None = None,
+    sample_interval: float = 1.0,
+    trace_share: float = 0.2,
+    trace_frames: int = 5,
+    top: int = 10,
+    min_growth_bytes: int = 1 << 20,
+    monotonic_fraction: float = 0.8,
+    clock: Callable[[], float] = time.monotonic,
+    rss: Callable[[], int] = read_rss_bytes,
+) -> SoakReport:
+    """
+    Run a workload until the budget is spent and report its memory growth.
+
+    Args:
+        cycle: Called with the cycle number; should leave nothing behind.
+        budget_seconds: Wall-clock budget for the cycles (sampling included).
+        max_cycles: Stop earlier after this many cycles; None runs the whole budget.
+        sample_interval: Seconds between memory samples.
+        trace_share: Trailing share of the run traced by tracemalloc; 0 samples RSS only.
+        trace_frames: Frames kept per allocation by tracemalloc.
+        top: Allocation sites in the report.
+        min_growth_bytes: Smallest growth over a phase that can be flagged.
+        monotonic_fraction: Share of upward steps needed to flag a series.
+        clock: Monotonic time source (injectable for tests).
+        rss: Reads the resident set size (injectable for tests).
+
+    Returns:
+        Samples, growth, the leak verdict and the top growing call sites.
+
+    Raises:
+        ValueError: If the budget or sample interval is not positive, or the
+            trace share is outside [0, 1].
+        RuntimeError: If tracing is wanted but tracemalloc is already running.
+    """
+    _check_settings(budget_seconds, sample_interval, trace_share)
+    trace_after_cycles = max_cycles * (1 - trace_share) if max_cycles and trace_share else None
+    start = now = clock()
+    deadline = start + budget_seconds
+    trace_at = start + budget_seconds * (1 - trace_share) if trace_share else math.inf
+    report = SoakReport(cycles=0, elapsed=0.0)
+    baseline: tracemalloc.Snapshot | None = None
+
+    def sample() -> None:
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] if baseline is not None else None
+        report.samples.append(MemorySample(clock() - start, report.cycles, rss(), traced))
+
+    try:
+        next_sample = start + sample_interval
+        batch, seconds_per_cycle = 1, 0.0
+        while (max_cycles is None or report.cycles < max_cycles) and now < deadline:
+            horizon = min(next_sample, deadline, trace_at if baseline is None else math.inf)
+            batch = _next_batch(batch, seconds_per_cycle, horizon - now)
+            end = report.cycles + batch
+            if max_cycles is not None:
+                end = min(end, max_cycles)
+            for index in range(report.cycles, end):
+                cycle(index)
+            began, now = now, clock()
+            seconds_per_cycle = (now - began) / (end - report.cycles)
+            report.cycles = end
+            if baseline is None and (
+                now >= trace_at or (trace_after_cycles is not None and end >= trace_after_cycles)
+            ):
+                sample()  # last untraced sample
+                tracemalloc.start(trace_frames)
+                gc.collect()
+                baseline = tracemalloc.take_snapshot()
+                report.traced_from_cycle = end
+                sample()
+            elif now >= next_sample:
+                sample()
+            else:
+                continue
+            now = clock()
+            next_sample = now + sample_interval
+        sample()
+        report.elapsed = clock() - start
+        _judge(report, min_growth_bytes, monotonic_fraction)
+        if baseline is not None:
+            report.top_sites = top_allocation_sites(baseline, tracemalloc.take_snapshot(), top)
+    finally:
+        if baseline is not None:
+            tracemalloc.stop()
+    return report
+
+
+def _next_batch(previous: int, seconds_per_cycle: float, remaining: float) -> int:
+    """Cycles that fit in `remaining` seconds, from 1 up to CHECK_EVERY or twice `previous`."""
+    limit = min(CHECK_EVERY, 2 * previous)
+    if seconds_per_cycle <= 0:
+        return limit
+    return max(1, min(limit, int(remaining / seconds_per_cycle)))
+
+
+def _check_settings(budget_seconds: float, sample_interval: float, trace_share: float) -> None:
+    if budget_seconds <= 0 or sample_interval <= 0:
+        raise ValueError('budget_seconds and sample_interval must be positive')
+    if not 0 <= trace_share <= 1:
+        raise ValueError('trace_share must be between 0 and 1')
+    if trace_share and tracemalloc.is_tracing():
+        raise RuntimeError('tracemalloc is already tracing; stop it or pass trace_share=0')
+
+
+def _judge(report: SoakReport, min_growth: int, fraction: float) -> None:
+    """Fill in growth and verdicts from the samples."""
+    untraced = [sample for sample in report.samples if sample.traced_bytes is None]
+    traced = [sample for sample in report.samples if sample.traced_bytes is not None]
+    if untraced:
+        rss_series = [sample.rss_bytes for sample in untraced]
+        report.rss_growth = rss_series[-1] - rss_series[0]
+        report.rss_monotonic = grows_monotonically(rss_series, min_growth, fraction)
+    if traced:
+        traced_series = [sample.traced_bytes or 0 for sample in traced]
+        report.traced_growth = traced_series[-1] - traced_series[0]
+        report.traced_monotonic = grows_monotonically(traced_series, min_growth, fraction)
+    phase, growth = (traced, report.traced_growth) if traced else (untraced, report.rss_growth)
+    if phase and phase[-1].cycles > phase[0].cycles:
+        report.bytes_per_cycle = growth / (phase[-1].cycles - phase[0].cycles)
@@ -0,0 +1,161 @@
+"""Open-loop load generation with coordinated-omission-free latencies.
+
+A closed-loop load test (N clients, each sending its next request when
+the previous one returns) slows down with the server it measures: during
+a stall no requests are sent, so the stall shows up as one slow sample
+instead of every request that real users would have sent meanwhile.
+
+`run_open_loop` instead fixes every request's send time up front from the
+arrival rate (evenly spaced, or exponential gaps for Poisson arrivals) and
+sends it at that time whatever is still in flight. Each request's
+*response time* is measured from its scheduled time, so time spent queued
+behind a stall, or behind the client's own `max_in_flight` cap, is
+counted; *service time* (from the actual send) is kept separately to show
+how much of the latency was queueing.
+
+The generator does not know about HTTP: `send` is any coroutine that
+performs request number `index` and returns a status code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+
+from .latency_histogram import LatencyHistogram
+
+# Status recorded for a request that raised instead of returning a status.
+TRANSPORT_ERROR = 0
+
+ARRIVALS = ('constant', 'poisson')
+
+
+@dataclass
+class LoadResult:
+    """Outcome of an open-loop run (requests scheduled after the warm-up)."""
+
+    rate: float
+    duration: float
+    statuses: Counter[int] = field(default_factory=Counter)
+    response_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    max_send_lag: float = 0.0  # worst delay between a scheduled and an actual send, seconds
+    elapsed: float = 0.0  # first scheduled send to last response, seconds
+
+    @property
+    def requests(self) -> int:
+        """Requests recorded."""
+        return sum(self.statuses.values())
+
+    @property
+    def achieved_rate(self) -> float:
+        """Responses per second over the measured period."""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+
+def arrival_offsets(
+    rate: float, duration: float, arrivals: str = 'constant', seed: int | None = None
+) -> Iterator[float]:
+    """
+    Yield scheduled send times, in seconds from the start of the run.
+
+    Args:
+        rate: Mean requests per second.
+        duration: Length of the schedule in seconds.
+        arrivals: `constant` spacing or `poisson` (exponential gaps).
+        seed: Seed for Poisson gaps.
+
+    Raises:
+        ValueError: If the rate is not positive or the arrival process is unknown.
+    """
+    if rate <= 0:
+        raise ValueError('rate must be positive')
+    if arrivals not in ARRIVALS:
+        raise ValueError(f'arrivals must be one of {", ".join(ARRIVALS)}')
+    if arrivals == 'constant':
+        for index in range(int(rate * duration)):
+            yield index / rate
+        return
+    rng = random.Random(seed)
+    offset = rng.expovariate(rate)
+    while offset < duration:
+        yield offset
+        offset += rng.expovariate(rate)
+
+
+async def run_open_loop(
+    send: Callable[[int], Awaitable[int]],
+    *,
+    rate: float,
+    duration: float,
+    warmup: float = 0.0,
+    arrivals: str = 'constant',
+    seed: int | None = None,
+    max_in_flight: int = 1_000,
+    clock: Callable[[], float] = time.perf_counter,
+) -> LoadResult:
+    """
+    Send requests on a fixed schedule and record their latencies.
+
+    Args:
+        send: Performs request `index` and returns its status code; exceptions are
+            recorded as TRANSPORT_ERROR.
+        rate: Mean requests per second.
+        duration: Seconds of scheduled sends, including the warm-up.
+        warmup: Leading seconds whose requests are sent but not recorded.
+        arrivals: `constant` or `poisson`.
+        seed: Seed for Poisson arrivals.
+        max_in_flight: Requests allowed outstanding at once; later ones wait for a
+            slot, and the wait counts toward their response time.
+        clock: Monotonic time source (injectable for tests).
+
+    Returns:
+        Status counts and latency histograms of the recorded requests.
+
+    Raises:
+        ValueError: If the warm-up is not shorter than the duration or
+            max_in_flight is not positive.
+    """
+    if not 0 <= warmup < duration:
+        raise ValueError('warmup must be shorter than the duration')
+    if max_in_flight < 1:
+        raise ValueError('max_in_flight must be positive')
+    result = LoadResult(rate=rate, duration=duration - warmup)
+    slots = asyncio.Semaphore(max_in_flight)
+    pending: set[asyncio.Task[None]] = set()
+    start = clock()
+    measured_from = start + warmup
+    last_response = measured_from
+
+    async def fire(index: int, scheduled: float) -> None:
+        nonlocal last_response
+        async with slots:
+            sent = clock()
+            try:
+                status = await send(index)
+            except Exception:  # noqa: BLE001 - a failed request is a result, not a crash
+                status = TRANSPORT_ERROR
+            done = clock()
+        if scheduled < measured_from:
+            return
+        result.statuses[status] += 1
+        result.response_time.record_seconds(done - scheduled)
+        result.service_time.record_seconds(done - sent)
+        result.max_send_lag = max(result.max_send_lag, sent - scheduled)
+        last_response = max(last_response, done)
+
+    for index, offset in enumerate(arrival_offsets(rate, duration, arrivals, seed)):
+        scheduled = start + offset
+        delay = scheduled - clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(fire(index, scheduled))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    await asyncio.gather(*pending)
+    result.elapsed = last_response - measured_from
+    return result
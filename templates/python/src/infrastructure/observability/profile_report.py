@@ -0,0 +1,119 @@
+"""Text report for profiles written by `DomainProfiler.dump()`.
+
+Usage:
+    python -m src.infrastructure.observability.profile_report profiles/ --top 10
+
+For each operation it shows call counts and latency from summary.json,
+the frames with the most self time and the heaviest full stacks. The
+`.folded` files can also be fed directly to flamegraph.pl or speedscope.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from pathlib import Path
+
+
+def read_folded(path: Path) -> dict[str, float]:
+    """
+    Parse a collapsed-stack file.
+
+    Args:
+        path: File with `frame;frame;frame weight` lines.
+
+    Returns:
+        Weight (microseconds) per stack.
+    """
+    stacks: defaultdict[str, float] = defaultdict(float)
+    for line in path.read_text().splitlines():
+        stack, _, weight = line.rpartition(' ')
+        if stack:
+            stacks[stack] += float(weight)
+    return stacks
+
+
+def self_time_by_frame(stacks: Mapping[str, float]) -> dict[str, float]:
+    """
+    Sum self time per leaf frame across stacks.
+
+    Args:
+        stacks: Weight per collapsed stack.
+
+    Returns:
+        Weight per frame.
+    """
+    frames: defaultdict[str, float] = defaultdict(float)
+    for stack, weight in stacks.items():
+        frames[stack.rsplit(';', 1)[-1]] += weight
+    return frames
+
+
+def _heaviest(weights: Mapping[str, float], top: int) -> list[tuple[str, float]]:
+    return sorted(weights.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def build_report(directory: Path, top: int = 10) -> str:
+    """
+    Render the report for a dump directory.
+
+    Args:
+        directory: Directory containing summary.json and `.folded` files.
+        top: Rows per table.
+
+    Returns:
+        The report text.
+
+    Raises:
+        FileNotFoundError: If summary.json is missing.
+    """
+    summary = json.loads((directory / 'summary.json').read_text())
+    lines = [f'Profile report for {directory} (slow threshold {summary["slow_threshold_ms"]} ms)']
+    operations = summary['operations']
+    for name in sorted(operations, key=lambda key: -operations[key]['total_ms']):
+        info = operations[name]
+        mean = info['total_ms'] / info['calls'] if info['calls'] else 0.0
+        lines += [
+            '',
+            f'== {name}: {info["calls"]} calls, {info["profiled_calls"]} profiled, '
+            f'mean {mean:.3f} ms, max {info["max_ms"]:.3f} ms',
+        ]
+        folded = directory / f'{name}.folded'
+        stacks = read_folded(folded) if folded.exists() else {}
+        total = sum(stacks.values()) or 1.0
+        lines.append('  self time by frame:')
+        for frame, weight in _heaviest(self_time_by_frame(stacks), top):
+            lines.append(f'    {weight / total:6.1%} {weight:12.1f} us  {frame}')
+        lines.append('  heaviest stacks:')
+        for stack, weight in _heaviest(stacks, top):
+            lines.append(f'    {weight / total:6.1%} {weight:12.1f} us  {stack}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments without the program name; `sys.argv[1:]` by default.
+
+    Returns:
+        Process exit status.
+    """
+    parser = argparse.ArgumentParser(description='Summarize DomainProfiler dumps.')
+    parser.add_argument('directory', type=Path, nargs='?', default=Path('profiles'))
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+    try:
+        sys.stdout.write(build_report(args.directory, args.top))
+    except FileNotFoundError:
+        sys.stderr.write(f'No profile dump found in {args.directory}\n')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Profiling mode for the request path.
+
+When enabled, every call to a hot path (the registration use case, password
+hashing, domain entry points and repository calls) runs under a
+deterministic `sys.setprofile` collector that charges self time to the full
+call stack. Hot paths called inside another one, such as the hashing inside
+a registration, belong to the outer operation's stacks. Stacks are
+aggregated per operation in the collapsed format consumed by flamegraph.pl,
+speedscope or inferno:
+
+    user.create;user.py:create;user.py:__init__;user.py:_validate 12.5
+
+(weights are microseconds). Only calls slower than the configured threshold
+are kept, and profiles are written on demand (`dump()`, SIGUSR2) or at exit.
+
+Enable with environment variables:
+    PROFILING_ENABLED=1           turn profiling mode on
+    PROFILING_SLOW_MS=50          keep only calls at least this slow (default 0: all)
+    PROFILING_OUTPUT_DIR=profiles where `.folded` files and summary.json go
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from .hot_paths import (
+    DOMAIN_HOT_PATHS,
+    REGISTRATION_HOT_PATHS,
+    REPOSITORY_HOT_PATHS,
+    HotPathPatcher,
+)
+
+_TRUTHY = frozenset({'1', 'true', 'yes', 'on'})
+
+
+class StackCollector:
+    """`sys.setprofile` callback that accumulates self time per call stack."""
+
+    def __init__(self, root: str) -> None:
+        """
+        Start an empty collection.
+
+        Args:
+            root: Label of the bottom frame, usually the operation name.
+        """
+        self.stacks: Counter[tuple[str, ...]] = Counter()  # nanoseconds
+        self._stack: list[str] = [root]
+        self._last = time.perf_counter_ns()
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        """Charge elapsed time to the current stack, then apply the event."""
+        now = time.perf_counter_ns()
+        self.stacks[tuple(self._stack)] += now - self._last
+        if event == 'call':
+            code = frame.f_code
+            self._stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+        elif event == 'c_call':
+            self._stack.append(getattr(arg, '__qualname__', None) or repr(arg))
+        elif len(self._stack) > 1:  # return, c_return, c_exception
+            self._stack.pop()
+        self._last = time.perf_counter_ns()
+
+
+@dataclass
+class OperationProfile:
+    """Aggregated profile of one operation."""
+
+    calls: int = 0
+    profiled_calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    stacks: Counter[tuple[str, ...]] = field(default_factory=Counter)  # nanoseconds
+
+    def folded(self) -> list[str]:
+        """Render the stacks as collapsed lines weighted in microseconds."""
+        return [
+            f'{";".join(stack)} {nanoseconds / 1e3:.1f}'
+            for stack, nanoseconds in sorted(self.stacks.items())
+            if nanoseconds > 0
+        ]
+
+
+class DomainProfiler:
+    """Profiles hot-path calls and keeps the stacks of the slow ones."""
+
+    def __init__(
+        self,
+        *,
+        slow_threshold_ms: float = 0.0,
+        output_dir: Path | str = 'profiles',
+        include_repository: bool = True,
+    ) -> None:
+        """
+        Configure the profiler (it starts disabled).
+
+        Args:
+            slow_threshold_ms: Calls faster than this are counted but their stacks dropped.
+            output_dir: Directory `dump()` writes to by default.
+            include_repository: Also profile the repository calls.
+        """
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.output_dir = Path(output_dir)
+        self.profiles: dict[str, OperationProfile] = {}
+        self._paths = (
+            REGISTRATION_HOT_PATHS
+            + DOMAIN_HOT_PATHS
+            + (REPOSITORY_HOT_PATHS if include_repository else ())
+        )
+        self._patcher = HotPathPatcher()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether the hot paths are currently wrapped."""
+        return self._patcher.is_patched
+
+    def enable(self) -> None:
+        """Start profiling the hot paths."""
+        if not self.is_enabled:
+            self._patcher.patch(self._paths, self._wrap)
+
+    def disable(self) -> None:
+        """Stop profiling; collected profiles are kept."""
+        self._patcher.restore()
+
+    def reset(self) -> None:
+        """Discard collected profiles."""
+        with self._lock:
+            self.profiles.clear()
+
+    def _wrap(self, func: Callable[..., Any], operation: str) -> Callable[..., Any]:
+        """Build the profiling wrapper for one function."""
+        local = self._local
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Nested hot paths (User.create inside a repository call...) are
+            # part of the outer operation's stacks.
+            if getattr(local, 'active', False):
+                return func(*args, **kwargs)
+            local.active = True
+            collector = StackCollector(operation)
+            previous = sys.getprofile()
+            start = time.perf_counter()
+            sys.setprofile(collector)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sys.setprofile(previous)
+                elapsed = time.perf_counter() - start
+                local.active = False
+                self._record(operation, elapsed, collector.stacks)
+
+        return functools.wraps(func)(wrapper)
+
+    def _record(self, operation: str, elapsed: float, stacks: Counter[tuple[str, ...]]) -> None:
+        """Fold one call into its operation profile."""
+        with self._lock:
+            profile = self.profiles.setdefault(operation, OperationProfile())
+            profile.calls += 1
+            profile.total_seconds += elapsed
+            profile.max_seconds = max(profile.max_seconds, elapsed)
+            if elapsed >= self.slow_threshold:
+                profile.profiled_calls += 1
+                profile.stacks.update(stacks)
+
+    def dump(self, directory: Path | str | None = None) -> list[Path]:
+        """
+        Write one `<operation>.folded` file per operation plus `summary.json`.
+
+        Args:
+            directory: Destination; `output_dir` by default.
+
+        Returns:
+            Paths of the written files.
+        """
+        target = Path(directory) if directory is not None else self.output_dir
+        target.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            snapshot = dict(self.profiles)
+            summary = {
+                name: {
+                    'calls': profile.calls,
+                    'profiled_calls': profile.profiled_calls,
+                    'total_ms': round(profile.total_seconds * 1000, 3),
+                    'max_ms': round(profile.max_seconds * 1000, 3),
+                }
+                for name, profile in snapshot.items()
+            }
+            folded = {name: profile.folded() for name, profile in snapshot.items()}
+
+        written = []
+        for name, lines in folded.items():
+            path = target / f'{name}.folded'
+            path.write_text('\n'.join(lines) + '\n' if lines else '')
+            written.append(path)
+        summary_path = target / 'summary.json'
+        document = {'slow_threshold_ms': self.slow_threshold * 1000, 'operations': summary}
+        summary_path.write_text(json.dumps(document, indent=2) + '\n')
+        written.append(summary_path)
+        return written
+
+    def install_dump_signal(self, signum: int = signal.SIGUSR2) -> None:
+        """
+        Dump profiles whenever the process receives `signum` (main thread only).
+
+        Args:
+            signum: Signal number, SIGUSR2 by default.
+        """
+        signal.signal(signum, lambda *_: self.dump())
+
+
+def profiler_from_env(environ: Mapping[str, str] | None = None) -> DomainProfiler | None:
+    """
+    Build a profiler from PROFILING_* variables.
+
+    Args:
+        environ: Variables to read; `os.environ` by default.
+
+    Returns:
+        A disabled profiler when PROFILING_ENABLED is truthy, otherwise None.
+    """
+    env = os.environ if environ is None else environ
+    if env.get('PROFILING_ENABLED', '').strip().lower() not in _TRUTHY:
+        return None
+    return DomainProfiler(
+        slow_threshold_ms=float(env.get('PROFILING_SLOW_MS', '0')),
+        output_dir=env.get('PROFILING_OUTPUT_DIR', 'profiles'),
+    )
+
+
+def enable_profiling_from_env(environ: Mapping[str, str] | None = None) -> DomainProfiler | None:
+    """
+    Turn profiling mode on when requested by the environment.
+
+    Enables the profiler, dumps on SIGUSR2 when called from the main thread
+    and dumps once more at interpreter exit.
+
+    Args:
+        environ: Variables to read; `os.environ` by default.
+
+    Returns:
+        The running profiler, or None when profiling mode is off.
+    """
+    profiler = profiler_from_env(environ)
+    if profiler is None:
+        return None
+    profiler.enable()
+    if threading.current_thread() is threading.main_thread():
+        profiler.install_dump_signal()
+    atexit.register(profiler.dump)
+    return profiler
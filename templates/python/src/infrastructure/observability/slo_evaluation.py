@@ -0,0 +1,189 @@
+"""Evaluate the SLO file against the results of a load test.
+
+`config/observability/slos.yaml` declares ratio SLIs as Prometheus-style
+selectors and SLOs on top of them. The selectors understood here are the
+two forms the file uses:
+
+- `http_requests{status_code!~'5..'}`: good requests by status code (`=`,
+  `!=`, `=~` and `!~` matchers). Requests that got no response at all
+  (TRANSPORT_ERROR) are never good.
+- `http_request_duration_seconds{le='0.5'}`: requests answered within the
+  bound. An SLO's `threshold_ms` overrides the selector's bound.
+
+Every SLI is reported with its ratio against its own target; only SLOs
+decide whether the run passed. The window and error-budget settings
+describe production alerting and are not evaluated.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .open_loop_load import TRANSPORT_ERROR, LoadResult
+
+_SELECTOR = re.compile(r"^\s*(\w+)\{(\w+)\s*(=~|!~|!=|=)\s*'([^']*)'\}\s*$")
+_MATCHERS: dict[str, Callable[[str, str], bool]] = {
+    '=': lambda pattern, value: value == pattern,
+    '!=': lambda pattern, value: value != pattern,
+    '=~': lambda pattern, value: re.fullmatch(pattern, value) is not None,
+    '!~': lambda pattern, value: re.fullmatch(pattern, value) is None,
+}
+
+
+class UnsupportedIndicatorError(ValueError):
+    """An SLI's good_events selector is not one the evaluator understands."""
+
+
+@dataclass(frozen=True)
+class IndicatorResult:
+    """Measured ratio of one SLI or SLO."""
+
+    name: str
+    sli: str
+    target: float
+    good: int
+    total: int
+    ratio: float
+    passed: bool
+    threshold_ms: float | None = None
+
+
+@dataclass(frozen=True)
+class SloReport:
+    """Every SLO and SLI of the file, measured on one run."""
+
+    objectives: list[IndicatorResult]
+    indicators: list[IndicatorResult]
+
+    @property
+    def passed(self) -> bool:
+        """Whether every SLO was met."""
+        return all(objective.passed for objective in self.objectives)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain data for JSON reports."""
+        return {
+            'passed': self.passed,
+            'objectives': [asdict(objective) for objective in self.objectives],
+            'indicators': [asdict(indicator) for indicator in self.indicators],
+        }
+
+
+def load_slo_file(path: Path) -> dict[str, Any]:
+    """
+    Read an SLO file.
+
+    Args:
+        path: YAML file with service_level_indicators and service_level_objectives.
+
+    Returns:
+        The parsed document.
+    """
+    with path.open() as file:
+        document: dict[str, Any] = yaml.safe_load(file)
+    return document
+
+
+def find_slo_file(start: Path, relative: str = 'config/observability/slos.yaml') -> Path:
+    """
+    Find the SLO file in `start` or the closest parent that has it.
+
+    Raises:
+        FileNotFoundError: If no parent has the file.
+    """
+    for directory in (start.resolve(), *start.resolve().parents):
+        candidate = directory / relative
+        if candidate.is_file():
+            return candidate
+    raise FileNotFoundError(f'{relative} not found above {start}')
+
+
+def parse_target(target: float | str) -> float:
+    """Turn `99.9%` or `0.999` into a ratio."""
+    if isinstance(target, str) and target.strip().endswith('%'):
+        return float(target.strip()[:-1]) / 100
+    return float(target)
+
+
+def _good_events(selector: str, result: LoadResult, threshold_ms: float | None) -> int:
+    match = _SELECTOR.match(selector)
+    if match is None:
+        raise UnsupportedIndicatorError(f'unsupported selector: {selector}')
+    metric, label, operator, value = match.groups()
+    if metric == 'http_requests' and label == 'status_code':
+        matches = _MATCHERS[operator]
+        return sum(
+            count
+            for status, count in result.statuses.items()
+            if status != TRANSPORT_ERROR and matches(value, str(status))
+        )
+    if metric == 'http_request_duration_seconds' and label == 'le' and operator == '=':
+        bound = threshold_ms / 1000 if threshold_ms is not None else float(value)
+        return result.response_time.count_at_or_below(round(bound * 1_000_000))
+    raise UnsupportedIndicatorError(f'unsupported selector: {selector}')
+
+
+def _measure(
+    name: str,
+    sli_name: str,
+    sli: dict[str, Any],
+    target: float,
+    result: LoadResult,
+    threshold_ms: float | None = None,
+) -> IndicatorResult:
+    good = _good_events(sli['good_events'], result, threshold_ms)
+    total = result.requests
+    ratio = good / total if total else 0.0
+    return IndicatorResult(
+        name=name,
+        sli=sli_name,
+        target=target,
+        good=good,
+        total=total,
+        ratio=ratio,
+        passed=total > 0 and ratio >= target,
+        threshold_ms=threshold_ms,
+    )
+
+
+def evaluate(document: dict[str, Any], result: LoadResult) -> SloReport:
+    """
+    Measure every SLI and SLO of an SLO document on a load-test result.
+
+    Args:
+        document: Parsed SLO file.
+        result: The run to judge.
+
+    Returns:
+        One result per SLO (which decide `passed`) and per SLI.
+
+    Raises:
+        UnsupportedIndicatorError: If a selector cannot be evaluated.
+        KeyError: If an SLO names an SLI the file does not define.
+    """
+    slis: dict[str, dict[str, Any]] = document.get('service_level_indicators') or {}
+    slos: dict[str, dict[str, Any]] = document.get('service_level_objectives') or {}
+    indicators = [
+        _measure(name, name, sli, parse_target(sli['target']), result) for name, sli in slis.items()
+    ]
+    objectives = []
+    for name, slo in slos.items():
+        sli = slis[slo['sli']]
+        threshold = slo.get('threshold_ms')
+        objectives.append(
+            _measure(
+                name,
+                slo['sli'],
+                sli,
+                parse_target(slo.get('target', sli['target'])),
+                result,
+                float(threshold) if threshold is not None else None,
+            )
+        )
+    return SloReport(objectives=objectives, indicators=indicators)
@@ -0,0 +1,303 @@
+"""Chunked online backfill of users-table columns.
+
+A new column (say `email_canonical`) is filled in from what the domain
+knows about each user. One `UPDATE` over the whole table holds its row
+locks, and grows the WAL, for as long as the table is big. `BackfillRunner`
+instead walks the table in id order (keyset pagination: `WHERE id > last
+ORDER BY id LIMIT n`, an index range scan however far it has gone) and
+writes each chunk in its own short transaction:
+
+- Rows are hydrated with `User.from_persistence` (via `row_to_user`) and
+  the backfill's transform returns the new column values. Rows the domain
+  rejects (legacy data failing validation) are counted and left alone.
+- Updates are guarded by the row version read with the chunk. A row the
+  application changed in between is skipped rather than overwritten with a
+  stale value: deploy the application writing the new column first, then
+  backfill the rows written before it.
+- The chunk's last id and counters are upserted into a checkpoint table in
+  the same transaction as the chunk, so a restarted run continues exactly
+  where the last committed chunk ended.
+- Chunk size adapts to keep each chunk's transaction near
+  `target_chunk_seconds`, and `max_rows_per_second` throttles the whole
+  run so it leaves room for production traffic.
+- `progress` is called after every chunk with a `BackfillProgress`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from ...domain.entities.user import User
+from .sql_user_repository import USER_COLUMNS, DbConnection, row_to_user
+
+CHECKPOINTS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    name TEXT PRIMARY KEY,
+    last_id TEXT,
+    rows_done BIGINT NOT NULL,
+    rows_failed BIGINT NOT NULL,
+    rows_skipped BIGINT NOT NULL,
+    completed BOOLEAN NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class Backfill:
+    """A named fill of `columns` computed from each user."""
+
+    name: str
+    columns: tuple[str, ...]
+    transform: Callable[[User], Sequence[Any]]  # values in `columns` order
+
+
+class BackfillProgress(NamedTuple):
+    """State of a backfill after a chunk (or at the end of a run)."""
+
+    name: str
+    rows: int  # rows visited, including failed and skipped ones
+    failed: int  # rejected by the domain or the transform
+    skipped: int  # changed by the application since they were read
+    total: int | None  # rows in the table when the run started
+    last_id: str | None
+    chunk_size: int  # size of the next chunk
+    rows_per_second: float  # over this run
+    completed: bool
+
+
+class BackfillRunner:
+    """Runs backfills over a users table in adaptive, checkpointed chunks."""
+
+    def __init__(
+        self,
+        connection: DbConnection,
+        *,
+        table: str = 'users',
+        checkpoint_table: str = 'backfill_checkpoints',
+        placeholder: str = '?',
+        batch_size: int = 500,
+        initial_chunk: int = 1_000,
+        min_chunk: int = 100,
+        max_chunk: int = 20_000,
+        target_chunk_seconds: float = 0.2,
+        max_rows_per_second: float | None = None,
+        progress: Callable[[BackfillProgress], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Configure the runner.
+
+        Args:
+            connection: DB-API connection; the runner commits after every chunk.
+            table: Name of the users table.
+            checkpoint_table: Name of the checkpoint table.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Maximum rows per `UPDATE` statement within a chunk.
+            initial_chunk: Rows in the first chunk.
+            min_chunk: Smallest chunk the adaptation may choose.
+            max_chunk: Largest chunk the adaptation may choose.
+            target_chunk_seconds: Chunk transaction time the adaptation aims for.
+            max_rows_per_second: Throughput cap; None runs flat out.
+            progress: Called after every chunk.
+            clock: Monotonic time source (injectable for tests).
+            sleep: Pauses for throttling (injectable for tests).
+
+        Raises:
+            ValueError: If the chunk bounds are not 0 < min <= initial <= max, or the
+                batch size, target or cap is not positive.
+        """
+        if not 0 < min_chunk <= initial_chunk <= max_chunk or batch_size < 1:
+            raise ValueError('chunk sizes must satisfy 0 < min <= initial <= max')
+        if target_chunk_seconds <= 0:
+            raise ValueError('target_chunk_seconds must be positive')
+        if max_rows_per_second is not None and max_rows_per_second <= 0:
+            raise ValueError('max_rows_per_second must be positive')
+        self._connection = connection
+        self._table = table
+        self._checkpoint_table = checkpoint_table
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+        self._initial_chunk = initial_chunk
+        self._min_chunk = min_chunk
+        self._max_chunk = max_chunk
+        self._target = target_chunk_seconds
+        self._max_rate = max_rows_per_second
+        self._progress = progress
+        self._clock = clock
+        self._sleep = sleep
+        self._select = f'SELECT {", ".join(USER_COLUMNS)} FROM {table}'
+        self.chunk_seconds: list[float] = []  # transaction time of each chunk of the last run
+
+    def create_schema(self) -> None:
+        """Create the checkpoint table if it does not exist."""
+        self._connection.cursor().execute(
+            CHECKPOINTS_TABLE_DDL.format(table=self._checkpoint_table)
+        )
+        self._connection.commit()
+
+    def checkpoint(self, name: str) -> BackfillProgress | None:
+        """
+        Return the committed progress of a backfill, or None if it never ran.
+
+        Args:
+            name: Name of the backfill.
+        """
+        cursor = self._connection.cursor()
+        cursor.execute(
+            f'SELECT last_id, rows_done, rows_failed, rows_skipped, completed '
+            f'FROM {self._checkpoint_table} WHERE name = {self._placeholder}',
+            (name,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        last_id, rows, failed, skipped, completed = row
+        return BackfillProgress(
+            name, rows, failed, skipped, None, last_id, self._initial_chunk, 0.0, bool(completed)
+        )
+
+    def reset(self, name: str) -> None:
+        """
+        Forget the progress of a backfill so the next run starts over.
+
+        Args:
+            name: Name of the backfill.
+        """
+        self._connection.cursor().execute(
+            f'DELETE FROM {self._checkpoint_table} WHERE name = {self._placeholder}', (name,)
+        )
+        self._connection.commit()
+
+    def run(
+        self, backfill: Backfill, *, max_chunks: int | None = None, count_total: bool = True
+    ) -> BackfillProgress:
+        """
+        Run (or resume) a backfill until the table is done or `max_chunks` ran.
+
+        Args:
+            backfill: What to fill.
+            max_chunks: Stop after this many chunks (time-boxed runs); None runs to the end.
+            count_total: Count the table's rows first, for progress reporting.
+
+        Returns:
+            The progress at the end of this run.
+        """
+        saved = self.checkpoint(backfill.name)
+        if saved is not None and saved.completed:
+            return saved
+        last_id = saved.last_id if saved else None
+        rows, failed, skipped = (saved.rows, saved.failed, saved.skipped) if saved else (0, 0, 0)
+        total = self._count() if count_total else None
+        chunk = self._initial_chunk
+        self.chunk_seconds = []
+        started, visited_now, chunks = self._clock(), 0, 0
+        progress = BackfillProgress(
+            backfill.name, rows, failed, skipped, total, last_id, chunk, 0.0, False
+        )
+        while max_chunks is None or chunks < max_chunks:
+            chunk_started = self._clock()
+            page = self._page(last_id, chunk)
+            done = len(page) < chunk
+            if page:
+                chunk_failed, chunk_skipped = self._fill(backfill, page)
+                last_id = page[-1][0]
+                rows += len(page)
+                failed += chunk_failed
+                skipped += chunk_skipped
+            self._save(backfill.name, last_id, rows, failed, skipped, done)
+            self._connection.commit()
+            elapsed = self._clock() - chunk_started
+            self.chunk_seconds.append(elapsed)
+            visited_now += len(page)
+            chunks += 1
+            chunk = self._adapt(chunk, elapsed)
+            rate = visited_now / max(self._clock() - started, 1e-9)
+            progress = BackfillProgress(
+                backfill.name, rows, failed, skipped, total, last_id, chunk, rate, done
+            )
+            if self._progress is not None:
+                self._progress(progress)
+            if done:
+                return progress
+            self._throttle(len(page), elapsed)
+        return progress
+
+    def _count(self) -> int:
+        cursor = self._connection.cursor()
+        cursor.execute(f'SELECT COUNT(*) FROM {self._table}')
+        return int(cursor.fetchone()[0])
+
+    def _page(self, after_id: str | None, limit: int) -> list[Any]:
+        cursor = self._connection.cursor()
+        order = f'ORDER BY id LIMIT {int(limit)}'
+        if after_id is None:
+            cursor.execute(f'{self._select} {order}')
+        else:
+            cursor.execute(f'{self._select} WHERE id > {self._placeholder} {order}', (after_id,))
+        return cursor.fetchall()
+
+    def _fill(self, backfill: Backfill, page: list[Any]) -> tuple[int, int]:
+        """Transform and write one chunk; return (failed, skipped) counts."""
+        version = USER_COLUMNS.index('version')
+        updates: list[tuple[Any, ...]] = []
+        failed = 0
+        for row in page:
+            try:
+                values = tuple(backfill.transform(row_to_user(row)))
+            except ValueError:
+                failed += 1
+                continue
+            updates.append((row[0], row[version], *values))
+        written = 0
+        cursor = self._connection.cursor()
+        for start in range(0, len(updates), self._batch_size):
+            batch = updates[start : start + self._batch_size]
+            cursor.execute(
+                self._update_statement(backfill.columns, len(batch)),
+                [value for update in batch for value in update],
+            )
+            written += len(cursor.fetchall())
+        return failed, len(updates) - written
+
+    def _update_statement(self, columns: tuple[str, ...], rows: int) -> str:
+        """Build a version-guarded `WITH fill(...) AS (VALUES ...) UPDATE ... FROM fill`."""
+        tuple_sql = '(' + ', '.join([self._placeholder] * (len(columns) + 2)) + ')'
+        assignments = ', '.join(f'{column} = fill.{column}' for column in columns)
+        table = self._table
+        return (
+            f'WITH fill(id, version, {", ".join(columns)}) AS '
+            f'(VALUES {", ".join([tuple_sql] * rows)}) '
+            f'UPDATE {table} SET {assignments} '
+            f'FROM fill WHERE {table}.id = fill.id AND {table}.version = fill.version '
+            f'RETURNING {table}.id'
+        )
+
+    def _save(
+        self, name: str, last_id: str | None, rows: int, failed: int, skipped: int, done: bool
+    ) -> None:
+        markers = ', '.join([self._placeholder] * 6)
+        self._connection.cursor().execute(
+            f'INSERT INTO {self._checkpoint_table} '
+            f'(name, last_id, rows_done, rows_failed, rows_skipped, completed) '
+            f'VALUES ({markers}) ON CONFLICT (name) DO UPDATE SET '
+            f'last_id = excluded.last_id, rows_done = excluded.rows_done, '
+            f'rows_failed = excluded.rows_failed, rows_skipped = excluded.rows_skipped, '
+            f'completed = excluded.completed',
+            (name, last_id, rows, failed, skipped, done),
+        )
+
+    def _adapt(self, chunk: int, elapsed: float) -> int:
+        """Scale the chunk toward the target time, at most 2x per step."""
+        factor = min(2.0, max(0.5, self._target / max(elapsed, 1e-6)))
+        return max(self._min_chunk, min(self._max_chunk, int(chunk * factor)))
+
+    def _throttle(self, rows: int, elapsed: float) -> None:
+        if self._max_rate is None:
+            return
+        pause = rows / self._max_rate - elapsed
+        if pause > 0:
+            self._sleep(pause)
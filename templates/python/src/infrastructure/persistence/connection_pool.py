@@ -0,0 +1,91 @@
+"""Bounded pool of DB-API connections.
+
+Connections are opened lazily up to `size` and handed out last-in,
+first-out, so a lightly loaded pool keeps reusing its warmest connection.
+A caller that finds the pool exhausted waits up to `timeout` seconds.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from .sql_user_repository import DbConnection
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection became free within the pool timeout."""
+
+
+class ConnectionPool:
+    """Thread-safe pool of connections to one database."""
+
+    def __init__(
+        self, factory: Callable[[], DbConnection], size: int = 5, timeout: float = 5.0
+    ) -> None:
+        """
+        Create an empty pool.
+
+        Args:
+            factory: Opens a new connection.
+            size: Maximum open connections.
+            timeout: Seconds to wait for a free connection.
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size < 1:
+            raise ValueError('size must be positive')
+        self._factory = factory
+        self._size = size
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[DbConnection] = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def opened(self) -> int:
+        """Number of connections opened so far."""
+        return self._opened
+
+    @contextmanager
+    def connection(self) -> Iterator[DbConnection]:
+        """
+        Borrow a connection for the duration of the block.
+
+        Yields:
+            A connection; the caller ends its transaction before the block exits.
+
+        Raises:
+            PoolTimeoutError: If every connection stayed busy for `timeout` seconds.
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def _acquire(self) -> DbConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self._size:
+                self._opened += 1
+                opening = True
+            else:
+                opening = False
+        if opening:
+            try:
+                return self._factory()
+            except BaseException:
+                with self._lock:
+                    self._opened -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self._timeout)
+        except queue.Empty:
+            raise PoolTimeoutError(f'No connection free after {self._timeout}s') from None
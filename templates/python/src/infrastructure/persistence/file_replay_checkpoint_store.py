@@ -0,0 +1,59 @@
+"""Replay checkpoints as pickle files, one per partition.
+
+Each save writes a temporary file and renames it over the previous one, so
+a crash mid-write leaves the last complete checkpoint in place. The files
+hold pickled projections: only point the store at a directory the replay
+itself writes to.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+from ...application.ports.replay_checkpoint_store import ReplayCheckpoint
+
+
+class FileReplayCheckpointStore:
+    """ReplayCheckpointStore adapter writing to a local directory."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """
+        Bind the store to a directory, created on first save.
+
+        Args:
+            directory: Where the checkpoint files live.
+        """
+        self._directory = Path(directory)
+
+    def load_all(self) -> list[ReplayCheckpoint]:
+        """Return every stored checkpoint, by partition."""
+        if not self._directory.is_dir():
+            return []
+        checkpoints = []
+        for path in sorted(self._directory.glob('partition-*.ckpt')):
+            with path.open('rb') as file:
+                checkpoints.append(pickle.load(file))  # noqa: S301 - written by save()
+        return sorted(checkpoints, key=lambda checkpoint: checkpoint.partition)
+
+    def save(self, checkpoint: ReplayCheckpoint) -> None:
+        """
+        Replace the checkpoint of the partition atomically.
+
+        Args:
+            checkpoint: Progress of one partition.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f'partition-{checkpoint.partition}.ckpt'
+        temporary = path.with_suffix('.tmp')
+        with temporary.open('wb') as file:
+            pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    def clear(self) -> None:
+        """Delete every checkpoint file."""
+        for path in self._directory.glob('partition-*.ckpt'):
+            path.unlink()
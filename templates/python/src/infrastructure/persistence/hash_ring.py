@@ -0,0 +1,74 @@
+"""Consistent hashing with virtual nodes.
+
+Each node owns `vnodes` points on a 64-bit ring (the BLAKE2b hash of
+`<node>#<i>`); a key belongs to the first point at or after its own hash,
+wrapping around. Adding or removing a node only moves the keys of the arcs
+it gains or loses, about 1/N of them, and the virtual nodes spread each
+node's share evenly around the ring.
+
+Rings are immutable: `with_node` and `without_node` return new rings, so a
+router can keep the old ring next to the new one while data moves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_left
+from collections.abc import Iterable
+
+DEFAULT_VNODES = 160
+
+
+def ring_hash(key: str) -> int:
+    """Return the 64-bit ring position of a key."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """Maps string keys to node names."""
+
+    def __init__(self, nodes: Iterable[str], vnodes: int = DEFAULT_VNODES) -> None:
+        """
+        Place every node's virtual points on the ring.
+
+        Args:
+            nodes: Distinct node names.
+            vnodes: Points per node; more points, more even shares.
+
+        Raises:
+            ValueError: If there are no nodes, duplicate names or vnodes < 1.
+        """
+        names = tuple(nodes)
+        if not names:
+            raise ValueError('A hash ring needs at least one node')
+        if len(set(names)) != len(names):
+            raise ValueError('Node names must be unique')
+        if vnodes < 1:
+            raise ValueError('vnodes must be positive')
+        self.nodes = names
+        self.vnodes = vnodes
+        points = sorted(
+            (ring_hash(f'{name}#{index}'), name) for name in names for index in range(vnodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [name for _, name in points]
+
+    def node_for(self, key: str) -> str:
+        """Return the node owning `key`."""
+        index = bisect_left(self._points, ring_hash(key))
+        return self._owners[index if index < len(self._owners) else 0]
+
+    def with_node(self, name: str) -> HashRing:
+        """Return a ring with one more node."""
+        return HashRing((*self.nodes, name), self.vnodes)
+
+    def without_node(self, name: str) -> HashRing:
+        """
+        Return a ring without the node.
+
+        Raises:
+            ValueError: If the node is not on the ring.
+        """
+        if name not in self.nodes:
+            raise ValueError(f'Unknown node: {name}')
+        return HashRing((node for node in self.nodes if node != name), self.vnodes)
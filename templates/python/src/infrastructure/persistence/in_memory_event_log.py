@@ -0,0 +1,64 @@
+"""In-memory Event Log.
+
+Meant for tests and local runs. Events are kept in one list per bucket, so
+reading a bucket never touches the others. The log pickles with its
+contents, which is how replay worker processes receive it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections.abc import Iterator, Sequence
+
+from ...application.ports.event_log import BUCKETS, StoredEvent, bucket_of
+from ...domain.entities.user import DomainEvent
+
+
+class InMemoryEventLog:
+    """EventLog adapter backed by process memory (single writer)."""
+
+    def __init__(self) -> None:
+        """Create an empty log."""
+        self._buckets: list[list[StoredEvent]] = [[] for _ in range(BUCKETS)]
+        self._head = 0
+
+    def append(self, aggregate_id: str, events: Sequence[DomainEvent]) -> int:
+        """
+        Append the events of one aggregate.
+
+        Args:
+            aggregate_id: Id of the aggregate that raised the events.
+            events: Events in the order they were raised.
+
+        Returns:
+            Position of the last appended event (the head).
+        """
+        bucket = self._buckets[bucket_of(aggregate_id)]
+        for event in events:
+            self._head += 1
+            bucket.append(StoredEvent(self._head, event))
+        return self._head
+
+    def head(self) -> int:
+        """Return the position of the last event, 0 for an empty log."""
+        return self._head
+
+    def read_bucket(self, bucket: int, after: int, until: int) -> Iterator[StoredEvent]:
+        """
+        Yield the events of a bucket in a position range.
+
+        Args:
+            bucket: Bucket number.
+            after: Exclusive lower bound on the position.
+            until: Inclusive upper bound on the position.
+
+        Yields:
+            Stored events, by position.
+        """
+        stored = self._buckets[bucket]
+        start = bisect.bisect_right(stored, after, key=lambda item: item.position)
+        for item in itertools.islice(stored, start, None):
+            if item.position > until:
+                return
+            yield item
@@ -0,0 +1,80 @@
+"""In-memory User Repository.
+
+Meant for tests, local runs and documentation. Keeps users in dicts keyed by
+id and by lower-cased email, mirroring the TypeScript
+InMemoryUserAccountRepository stub.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+
+class InMemoryUserRepository:
+    """UserRepository adapter backed by process memory."""
+
+    def __init__(self, seed: Iterable[User] = ()) -> None:
+        """
+        Create the repository, optionally pre-loaded.
+
+        Args:
+            seed: Users to store up front.
+        """
+        self._by_id: dict[str, User] = {}
+        self._by_email: dict[str, User] = {}
+        self._lock = threading.Lock()
+        self.save_all(list(seed))
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """Return the user with the given id, or None."""
+        return self._by_id.get(user_id)
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """Return the users with any of the ids."""
+        found = {}
+        for user_id in user_ids:
+            user = self._by_id.get(user_id)
+            if user is not None:
+                found[user_id] = user
+        return list(found.values())
+
+    def find_by_email(self, email: Email) -> User | None:
+        """Return the user owning the email (case-insensitive), or None."""
+        return self._by_email.get(email.value.lower())
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """Return the users owning any of the emails."""
+        found = {}
+        for email in emails:
+            user = self._by_email.get(email.value.lower())
+            if user is not None:
+                found[user.id] = user
+        return list(found.values())
+
+    def save(self, user: User) -> None:
+        """Store the user and mark its state as persisted."""
+        self.save_all([user])
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """Store several users and mark their state as persisted."""
+        with self._lock:
+            for user in users:
+                self._by_id[user.id] = user
+                self._by_email[user.email.value.lower()] = user
+                user.mark_persisted(user.version + 1)
+
+    def list(self) -> list[User]:
+        """Return every stored user."""
+        return list(self._by_id.values())
+
+    def clear(self) -> None:
+        """Remove every stored user."""
+        with self._lock:
+            self._by_id.clear()
+            self._by_email.clear()
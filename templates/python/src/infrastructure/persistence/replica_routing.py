@@ -0,0 +1,224 @@
+"""Read-replica routing with read-your-writes sessions.
+
+Writes go to the primary; reads go to replicas, round robin, each through
+its own connection pool. Replicas lag, so every session remembers the
+primary position (a WAL LSN on PostgreSQL) reached by its own last write,
+and a read is only routed to a replica that has replayed at least that
+far. A user a caller has just created is therefore always visible to that
+caller, while sessions that wrote nothing can read from any replica.
+
+Replica positions are cached. Positions only grow, so a cached position
+that is already far enough is safe to trust; a replica that looks behind
+is re-checked at most once per `position_ttl`, and if none has caught up
+the read falls back to the primary.
+
+The session position is a plain integer, so an HTTP layer can hand it to
+the client (e.g. in a cookie) and restore it with `ReplicaRouter.session`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .connection_pool import ConnectionPool
+from .sql_user_repository import DbConnection, SqlUserRepository
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+T = TypeVar('T')
+
+
+def postgres_primary_position(connection: DbConnection) -> int:
+    """Return the primary's current WAL position in bytes."""
+    cursor = connection.cursor()
+    cursor.execute("SELECT pg_current_wal_lsn() - '0/0'")
+    return int(cursor.fetchone()[0])
+
+
+def postgres_replica_position(connection: DbConnection) -> int:
+    """Return the WAL position a replica has replayed, in bytes (0 if unknown)."""
+    cursor = connection.cursor()
+    cursor.execute("SELECT pg_last_wal_replay_lsn() - '0/0'")
+    value = cursor.fetchone()[0]
+    return int(value) if value is not None else 0
+
+
+@dataclass(frozen=True)
+class DatabaseNode:
+    """A database server: its connection pool and how to read its position."""
+
+    name: str
+    pool: ConnectionPool
+    position: Callable[[DbConnection], Any]
+
+
+class ReplicaRouter:
+    """Routes repository calls between a primary and its replicas."""
+
+    def __init__(
+        self,
+        primary: DatabaseNode,
+        replicas: Sequence[DatabaseNode],
+        *,
+        placeholder: str = '?',
+        batch_size: int = 500,
+        position_ttl: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a router.
+
+        Args:
+            primary: The node taking writes (and reads no replica can serve).
+            replicas: Read-only nodes replaying the primary.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Maximum rows per statement.
+            position_ttl: Minimum seconds between position checks of a lagging replica.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+        self._position_ttl = position_ttl
+        self._clock = clock
+        # name -> (position, checked at); -inf forces a check on first need
+        self._positions = {replica.name: (0, float('-inf')) for replica in self.replicas}
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+        self.reads: Counter[str] = Counter()
+
+    def session(self, position: int = 0) -> RoutedUserRepository:
+        """
+        Start (or resume) a caller's session.
+
+        Args:
+            position: Position returned by a previous session of the same caller.
+
+        Returns:
+            A repository whose reads see the session's own writes.
+        """
+        return RoutedUserRepository(self, position)
+
+    def _repository(self, connection: DbConnection) -> SqlUserRepository:
+        return SqlUserRepository(
+            connection, placeholder=self._placeholder, batch_size=self._batch_size
+        )
+
+    def write(self, work: Callable[[SqlUserRepository], None]) -> int:
+        """
+        Run `work` in a primary transaction and commit it.
+
+        Returns:
+            The primary position after the commit.
+        """
+        with self.primary.pool.connection() as connection:
+            try:
+                work(self._repository(connection))
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            position = int(self.primary.position(connection))
+            connection.rollback()
+        return position
+
+    def read(self, required: int, query: Callable[[SqlUserRepository], T]) -> T:
+        """
+        Run `query` on a replica at or past `required`, else on the primary.
+
+        Args:
+            required: Minimum primary position the data read must include.
+            query: Repository call to run.
+        """
+        node = self._replica_at(required)
+        with self._lock:
+            if node is not None:
+                self.reads['replica'] += 1
+            else:
+                self.reads['primary'] += 1
+                if self.replicas:
+                    self.reads['lag_fallback'] += 1
+        with (node or self.primary).pool.connection() as connection:
+            try:
+                return query(self._repository(connection))
+            finally:
+                connection.rollback()
+
+    def _replica_at(self, required: int) -> DatabaseNode | None:
+        """Pick a replica that has replayed `required`, round robin; None if none has."""
+        if not self.replicas:
+            return None
+        count = len(self.replicas)
+        start = next(self._next)
+        now = self._clock()
+        for replica in (self.replicas[(start + i) % count] for i in range(count)):
+            known, checked_at = self._positions[replica.name]
+            if known >= required:
+                return replica
+            if now - checked_at < self._position_ttl:
+                continue
+            with replica.pool.connection() as connection:
+                position = int(replica.position(connection))
+                connection.rollback()
+            with self._lock:
+                if position >= self._positions[replica.name][0]:
+                    self._positions[replica.name] = (position, now)
+            if position >= required:
+                return replica
+        return None
+
+
+class RoutedUserRepository:
+    """UserRepository adapter for one session of a `ReplicaRouter`."""
+
+    def __init__(self, router: ReplicaRouter, position: int = 0) -> None:
+        """
+        Bind the session to its router.
+
+        Args:
+            router: The router shared by all sessions.
+            position: Primary position the session's reads must include.
+        """
+        self._router = router
+        self._position = position
+
+    @property
+    def position(self) -> int:
+        """Primary position of the session's last write (hand it back to resume)."""
+        return self._position
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """Load a user by id from a fresh-enough replica."""
+        return self._router.read(self._position, lambda users: users.find_by_id(user_id))
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """Load users by id in one query on a fresh-enough replica."""
+        keys = list(user_ids)
+        return self._router.read(self._position, lambda users: users.find_by_ids(keys))
+
+    def find_by_email(self, email: Email) -> User | None:
+        """Load a user by email (case-insensitive) from a fresh-enough replica."""
+        return self._router.read(self._position, lambda users: users.find_by_email(email))
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """Load users by email in one query on a fresh-enough replica."""
+        keys = list(emails)
+        return self._router.read(self._position, lambda users: users.find_by_emails(keys))
+
+    def save(self, user: User) -> None:
+        """Store a user on the primary and advance the session position."""
+        self.save_all([user])
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """Store users on the primary in one transaction and advance the session position."""
+        position = self._router.write(lambda repository: repository.save_all(users))
+        self._position = max(self._position, position)
@@ -0,0 +1,578 @@
+"""Sharded user storage over several SQL databases.
+
+Users live on the shard that owns `User.id` on a consistent-hash ring
+(`HashRing`, virtual nodes). Email uniqueness cannot rely on each shard's
+unique index, so every shard also holds a partition of an email directory
+(`SqlEmailDirectory`), placed by the same ring on the normalized email:
+registration claims the email first and inserts the user second, and
+`find_by_email` is two point queries (directory, then user) whatever the
+number of shards. A claim left without a user by a crash between the two
+steps is taken over once it is older than `claim_timeout`.
+
+Batch operations group their keys by shard and run the groups in parallel
+on a thread pool (drivers release the GIL while they wait on the database),
+then merge the results. Each shard has one connection, used under a lock;
+every call commits its own shard transactions, so the repository is its
+own unit of work and there is no cross-shard atomicity.
+
+Rebalancing is online. `add_shard` and `remove_shard` install a new ring
+but keep the previous one until `rebalance` has moved the rows whose owner
+changed. Meanwhile a key whose owner changed is routed to both shards and
+handled under both locks: reads look in both, new rows go to the new owner
+and updates go wherever the row is. `rebalance` moves rows page by page
+holding the source and destination locks, so every operation sees each row
+in exactly one place. Ring changes wait for in-flight calls to finish.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, TypeVar
+
+from ...application.ports.user_repository import (
+    ConcurrencyConflictError,
+    UserAlreadyExistsError,
+)
+from .hash_ring import DEFAULT_VNODES, HashRing
+from .sql_email_directory import Claim, SqlEmailDirectory
+from .sql_user_repository import DbConnection, SqlUserRepository
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+T = TypeVar('T')
+R = TypeVar('R')
+Route = tuple[str, ...]  # (owner,), or (previous owner, owner) while rebalancing
+
+
+class _Shard:
+    """One database: its user table, its directory partition and its lock."""
+
+    def __init__(
+        self, name: str, connection: DbConnection, placeholder: str, batch_size: int
+    ) -> None:
+        self.name = name
+        self.connection = connection
+        self.users = SqlUserRepository(connection, placeholder=placeholder, batch_size=batch_size)
+        self.emails = SqlEmailDirectory(connection, placeholder=placeholder, batch_size=batch_size)
+        self.lock = threading.Lock()
+
+    def create_schema(self) -> None:
+        self.users.create_schema()
+        self.emails.create_schema()
+        self.connection.commit()
+
+
+class _Gate:
+    """Lets calls run concurrently unless a ring change holds it exclusively."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._active = 0
+        self._closed = False
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        with self._condition:
+            while self._closed:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                if not self._active:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        with self._condition:
+            while self._closed:
+                self._condition.wait()
+            self._closed = True
+            while self._active:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._closed = False
+                self._condition.notify_all()
+
+
+class ShardedUserRepository:
+    """UserRepository adapter spreading users over several databases."""
+
+    def __init__(
+        self,
+        connections: Mapping[str, DbConnection],
+        *,
+        placeholder: str = '?',
+        vnodes: int = DEFAULT_VNODES,
+        batch_size: int = 500,
+        claim_timeout: float = 60.0,
+        max_workers: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Route over the given shards.
+
+        Args:
+            connections: Shard name -> DB-API connection. Connections are used
+                from pool threads (open sqlite3 ones with `check_same_thread=False`).
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            vnodes: Virtual nodes per shard on the hash ring.
+            batch_size: Maximum rows per statement on each shard.
+            claim_timeout: Seconds after which a claim without a user may be taken over.
+            max_workers: Threads for fan-out (defaults to the executor's default).
+            clock: Epoch-seconds time source for claims (injectable for tests).
+        """
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+        self._claim_timeout = claim_timeout
+        self._clock = clock
+        self._shards = {
+            name: _Shard(name, connection, placeholder, batch_size)
+            for name, connection in connections.items()
+        }
+        self._ring = HashRing(self._shards, vnodes)
+        self._previous: HashRing | None = None
+        self._gate = _Gate()
+        self._rebalance_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='user-shard')
+
+    @property
+    def shard_names(self) -> tuple[str, ...]:
+        """Names of the shards on the current ring."""
+        return self._ring.nodes
+
+    @property
+    def rebalancing(self) -> bool:
+        """Whether rows are still owed to a new ring."""
+        return self._previous is not None
+
+    def shard_for(self, user_id: str) -> str:
+        """Return the shard owning a user id on the current ring."""
+        return self._ring.node_for(user_id)
+
+    def create_schema(self) -> None:
+        """Create the user and directory tables on every shard."""
+        for shard in self._shards.values():
+            with shard.lock:
+                shard.create_schema()
+
+    def close(self) -> None:
+        """Stop the fan-out threads; connections stay open (the caller owns them)."""
+        self._executor.shutdown()
+
+    # Routing and fan-out
+
+    def _route(self, key: str) -> Route:
+        owner = self._ring.node_for(key)
+        if self._previous is None:
+            return (owner,)
+        old = self._previous.node_for(key)
+        return (owner,) if old == owner else (old, owner)
+
+    def _group(self, items: Iterable[T], key: Callable[[T], str]) -> dict[Route, list[T]]:
+        groups: dict[Route, list[T]] = {}
+        for item in items:
+            groups.setdefault(self._route(key(item)), []).append(item)
+        return groups
+
+    @contextmanager
+    def _locked(self, route: Route) -> Iterator[list[_Shard]]:
+        """Hold the locks of the route's shards (in name order, so never deadlocking)."""
+        shards = [self._shards[name] for name in route]
+        ordered = sorted(shards, key=lambda shard: shard.name)
+        for shard in ordered:
+            shard.lock.acquire()
+        try:
+            yield shards
+        finally:
+            for shard in reversed(ordered):
+                shard.lock.release()
+
+    def _run(
+        self, groups: Mapping[Route, T], task: Callable[[list[_Shard], T], R]
+    ) -> tuple[dict[Route, R], dict[Route, BaseException]]:
+        """
+        Run `task` once per route, holding its locks; in parallel when there are several.
+
+        Returns:
+            Results and exceptions by route; every task has finished.
+        """
+
+        def call(route: Route) -> R:
+            with self._locked(route) as shards:
+                return task(shards, groups[route])
+
+        results: dict[Route, R] = {}
+        errors: dict[Route, BaseException] = {}
+        if len(groups) == 1:
+            route = next(iter(groups))
+            try:
+                results[route] = call(route)
+            except Exception as error:
+                errors[route] = error
+            return results, errors
+        futures = {route: self._executor.submit(call, route) for route in groups}
+        for route, future in futures.items():
+            failure = future.exception()
+            if failure is None:
+                results[route] = future.result()
+            else:
+                errors[route] = failure
+        return results, errors
+
+    def _gather(
+        self, groups: Mapping[Route, T], task: Callable[[list[_Shard], T], R]
+    ) -> list[R]:
+        results, errors = self._run(groups, task)
+        if errors:
+            raise next(iter(errors.values()))
+        return list(results.values())
+
+    # Reads
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """
+        Load a user from the shard owning its id.
+
+        Args:
+            user_id: The user identifier.
+
+        Returns:
+            The user, or None if it does not exist.
+        """
+        found = self.find_by_ids([user_id])
+        return found[0] if found else None
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """
+        Load users by id, querying the owning shards in parallel.
+
+        Args:
+            user_ids: User identifiers.
+
+        Returns:
+            Matching users, in no particular order.
+        """
+        with self._gate.shared():
+            return self._find_by_ids(user_ids)
+
+    def _find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        def task(shards: list[_Shard], ids: list[str]) -> list[User]:
+            found: list[User] = []
+            for shard in shards:
+                found.extend(shard.users.find_by_ids(ids))
+            return found
+
+        groups = self._group(dict.fromkeys(user_ids), lambda user_id: user_id)
+        return [user for found in self._gather(groups, task) for user in found]
+
+    def find_by_email(self, email: Email) -> User | None:
+        """
+        Load a user by email through the directory (case-insensitive).
+
+        Args:
+            email: The email value object.
+
+        Returns:
+            The user, or None if no user owns the email.
+        """
+        found = self.find_by_emails([email])
+        return found[0] if found else None
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """
+        Load users by email: directory lookups, then user lookups, each fanned out.
+
+        Args:
+            emails: Email value objects; duplicates are ignored.
+
+        Returns:
+            Matching users, in no particular order.
+        """
+        keys = list(dict.fromkeys(email.value.lower() for email in emails))
+        with self._gate.shared():
+            claims = self._find_claims(keys)
+            users = self._find_by_ids(user_id for user_id, _ in claims.values())
+        owners = {user_id: key for key, (user_id, _) in claims.items()}
+        return [user for user in users if owners.get(user.id) == user.email.value.lower()]
+
+    def _find_claims(self, keys: Iterable[str]) -> dict[str, Claim]:
+        def task(shards: list[_Shard], chunk: list[str]) -> dict[str, Claim]:
+            claims: dict[str, Claim] = {}
+            for shard in shards:
+                claims.update(shard.emails.find(chunk))
+            return claims
+
+        claims: dict[str, Claim] = {}
+        for found in self._gather(self._group(keys, lambda key: key), task):
+            claims.update(found)
+        return claims
+
+    # Writes
+
+    def save(self, user: User) -> None:
+        """
+        Insert a new user or write the dirty fields of a loaded one.
+
+        Args:
+            user: The user to store.
+
+        Raises:
+            UserAlreadyExistsError: If a new user's email belongs to another user.
+            ConcurrencyConflictError: If the stored version changed since the user was loaded.
+        """
+        self.save_all([user])
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """
+        Claim the emails of new users, insert them, then update the loaded ones.
+
+        Every phase fans out over the shards involved. If a claim conflicts, the
+        claims already made are released and nothing is written.
+
+        Args:
+            users: Users to store.
+
+        Raises:
+            UserAlreadyExistsError: If a new user's email belongs to another user.
+            ConcurrencyConflictError: If a stored version changed since a user was loaded.
+        """
+        new = [user for user in users if user.is_new()]
+        loaded = [user for user in users if not user.is_new()]
+        with self._gate.shared():
+            if new:
+                self._insert(new)
+            if loaded:
+                self._update(loaded)
+
+    def _insert(self, users: list[User]) -> None:
+        owners = {user.email.value.lower(): user.id for user in users}
+        self._claim(owners)
+
+        def task(shards: list[_Shard], group: list[User]) -> None:
+            owner = shards[-1]
+            try:
+                owner.users.insert_many(group)
+                owner.connection.commit()
+            except Exception:
+                owner.connection.rollback()
+                raise
+
+        _, errors = self._run(self._group(users, lambda user: user.id), task)
+        if errors:
+            failed = set(errors)
+            self._release(
+                {
+                    user.email.value.lower(): user.id
+                    for user in users
+                    if self._route(user.id) in failed
+                }
+            )
+            raise next(iter(errors.values()))
+
+    def _claim(self, owners: dict[str, str]) -> None:
+        """Claim every key or none; take over stale claims of users that never got stored."""
+        now = self._clock()
+
+        def task(shards: list[_Shard], keys: list[str]) -> dict[str, Claim]:
+            owner = shards[-1]
+            # While rebalancing the key may still be claimed on the previous shard.
+            held = shards[0].emails.find(keys) if len(shards) == 2 else {}
+            conflicts = {key: claim for key, claim in held.items() if claim[0] != owners[key]}
+            wanted = {key: owners[key] for key in keys if key not in held}
+            try:
+                conflicts.update(owner.emails.claim(wanted, now))
+                owner.connection.commit()
+            except Exception:
+                owner.connection.rollback()
+                raise
+            return conflicts
+
+        conflicts: dict[str, Claim] = {}
+        for found in self._gather(self._group(owners, lambda key: key), task):
+            conflicts.update(found)
+        if conflicts:
+            conflicts = self._take_over_stale(conflicts, owners, now)
+        if conflicts:
+            self._release({key: owners[key] for key in owners if key not in conflicts})
+            raise UserAlreadyExistsError(next(iter(conflicts)))
+
+    def _take_over_stale(
+        self, conflicts: dict[str, Claim], owners: dict[str, str], now: float
+    ) -> dict[str, Claim]:
+        """Return the conflicts left after taking over old claims whose user does not exist."""
+        cutoff = now - self._claim_timeout
+        old = {key: claim for key, claim in conflicts.items() if claim[1] < cutoff}
+        if not old:
+            return conflicts
+        existing = {user.id for user in self._find_by_ids(claim[0] for claim in old.values())}
+        stale = {key: claim[0] for key, claim in old.items() if claim[0] not in existing}
+
+        def task(shards: list[_Shard], keys: list[str]) -> list[str]:
+            taken = []
+            for shard in shards:
+                for key in keys:
+                    if shard.emails.take_over(key, stale[key], owners[key], now):
+                        taken.append(key)
+                shard.connection.commit()
+            return taken
+
+        for taken in self._gather(self._group(stale, lambda key: key), task):
+            for key in taken:
+                del conflicts[key]
+        return conflicts
+
+    def _release(self, owners: dict[str, str]) -> None:
+        def task(shards: list[_Shard], keys: list[str]) -> None:
+            for shard in shards:
+                shard.emails.release({key: owners[key] for key in keys})
+                shard.connection.commit()
+
+        if owners:
+            self._gather(self._group(owners, lambda key: key), task)
+
+    def _update(self, users: list[User]) -> None:
+        def task(shards: list[_Shard], group: list[User]) -> None:
+            placement = {user.id: shards[-1] for user in group}
+            if len(shards) == 2:
+                for user in shards[0].users.find_by_ids(placement):
+                    placement[user.id] = shards[0]
+            for shard in shards:
+                try:
+                    shard.users.update_dirty(
+                        user for user in group if placement[user.id] is shard
+                    )
+                    shard.connection.commit()
+                except Exception:
+                    shard.connection.rollback()
+                    raise
+
+        _, errors = self._run(self._group(users, lambda user: user.id), task)
+        if not errors:
+            return
+        conflicts = [
+            error for error in errors.values() if isinstance(error, ConcurrencyConflictError)
+        ]
+        if len(conflicts) == len(errors):
+            raise ConcurrencyConflictError(
+                user_id for error in conflicts for user_id in error.user_ids
+            )
+        raise next(iter(errors.values()))
+
+    # Rebalancing
+
+    def add_shard(self, name: str, connection: DbConnection) -> None:
+        """
+        Add a shard (creating its tables) and start routing its share of keys to it.
+
+        Call `rebalance` to move the existing rows it now owns.
+
+        Raises:
+            RuntimeError: If a rebalance is still in progress.
+            ValueError: If the name is taken.
+        """
+        if name in self._shards:
+            raise ValueError(f'Shard already exists: {name}')
+        shard = _Shard(name, connection, self._placeholder, self._batch_size)
+        shard.create_schema()
+        with self._gate.exclusive():
+            self._start_rebalance(self._ring.with_node(name))
+            self._shards[name] = shard
+
+    def remove_shard(self, name: str) -> None:
+        """
+        Stop routing new keys to a shard; `rebalance` then drains it.
+
+        Raises:
+            RuntimeError: If a rebalance is still in progress.
+            ValueError: If the shard is unknown or the last one.
+        """
+        if len(self._ring.nodes) == 1:
+            raise ValueError('Cannot remove the last shard')
+        with self._gate.exclusive():
+            self._start_rebalance(self._ring.without_node(name))
+
+    def _start_rebalance(self, ring: HashRing) -> None:
+        if self._previous is not None:
+            raise RuntimeError('A rebalance is already in progress')
+        self._previous, self._ring = self._ring, ring
+
+    def rebalance(self, page_size: int = 1000) -> int:
+        """
+        Move every row whose owner changed to its new shard, while serving traffic.
+
+        Args:
+            page_size: Rows read per page from each source shard.
+
+        Returns:
+            Number of user rows moved.
+        """
+        with self._rebalance_lock:
+            previous = self._previous
+            if previous is None:
+                return 0
+            moved = 0
+            for name in previous.nodes:
+                moved += self._drain(name, page_size, users=True)
+                self._drain(name, page_size, users=False)
+            with self._gate.exclusive():
+                self._previous = None
+                for name in set(self._shards) - set(self._ring.nodes):
+                    del self._shards[name]
+            return moved
+
+    def _drain(self, name: str, page_size: int, users: bool) -> int:
+        """Move the user (or directory) rows of one shard that belong elsewhere now."""
+        source = self._shards[name]
+        after: str | None = None
+        moved = 0
+        while True:
+            with self._gate.shared():
+                with source.lock:
+                    if users:
+                        page = [user.id for user in source.users.page_after(after, page_size)]
+                    else:
+                        page = [row[0] for row in source.emails.page_after(after, page_size)]
+                leaving: dict[str, list[str]] = {}
+                for key in page:
+                    owner = self._ring.node_for(key)
+                    if owner != name:
+                        leaving.setdefault(owner, []).append(key)
+                for destination, keys in leaving.items():
+                    with self._locked((name, destination)) as (_, target):
+                        moved += self._move(source, target, keys, users)
+            if len(page) < page_size:
+                return moved
+            after = page[-1]
+
+    @staticmethod
+    def _move(source: _Shard, target: _Shard, keys: list[str], users: bool) -> int:
+        """Copy rows to the target and delete them from the source (target committed first)."""
+        if users:
+            rows = source.users.find_by_ids(keys)
+            target.users.delete_many(keys)
+            target.users.insert_persisted(rows)
+            count = len(rows)
+        else:
+            claims = source.emails.find(keys)
+            target.emails.delete(keys)
+            target.emails.insert_rows((key, *claim) for key, claim in claims.items())
+            count = len(claims)
+        target.connection.commit()
+        if users:
+            source.users.delete_many(keys)
+        else:
+            source.emails.delete(keys)
+        source.connection.commit()
+        return count
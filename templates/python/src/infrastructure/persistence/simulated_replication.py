@@ -0,0 +1,181 @@
+"""Stand-in primary and replica databases with replication delay.
+
+For tests and benchmarks of replica routing without a PostgreSQL cluster.
+Every node is a SQLite file. The primary's connections record the write
+statements of each transaction and append them to a shared log on commit;
+a log entry's 1-based index is the primary position it produced (the
+stand-in for a WAL LSN). A replica applies the entries committed at least
+`delay` seconds ago, lazily, before each statement run on one of its
+connections or when asked for its position, so what it serves is exactly
+what a replica lagging by `delay` would serve.
+
+Each node also counts the statements it executed, to measure load.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+Statement = tuple[str, Any]  # sql, parameters (a sequence, or a list of them for executemany)
+
+PRIMARY = 'primary'
+
+
+class _Cursor:
+    def __init__(self, connection: _NodeConnection) -> None:
+        self._connection = connection
+        self._cursor = connection.raw.cursor()
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def execute(self, operation: str, parameters: Sequence[Any] = (), /) -> Any:
+        self._connection.before(operation, parameters, many=False)
+        return self._cursor.execute(operation, parameters)
+
+    def executemany(self, operation: str, seq_of_parameters: Iterable[Sequence[Any]], /) -> Any:
+        rows = list(seq_of_parameters)
+        self._connection.before(operation, rows, many=True)
+        return self._cursor.executemany(operation, rows)
+
+    def fetchone(self) -> Any:
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> list[Any]:
+        return self._cursor.fetchall()
+
+
+class _NodeConnection:
+    """Connection to one node; counts statements and takes part in replication."""
+
+    def __init__(self, replication: SimulatedReplication, node: str) -> None:
+        self.replication = replication
+        self.node = node
+        self.raw = sqlite3.connect(replication.path(node), check_same_thread=False)
+        self._pending: list[tuple[str, Any, bool]] = []
+
+    def cursor(self) -> _Cursor:
+        return _Cursor(self)
+
+    def before(self, operation: str, parameters: Any, many: bool) -> None:
+        self.replication.count(self.node)
+        if self.node == PRIMARY:
+            if not operation.lstrip().upper().startswith('SELECT'):
+                self._pending.append((operation, parameters, many))
+        else:
+            self.replication.catch_up(self.node)
+
+    def commit(self) -> None:
+        self.raw.commit()
+        if self._pending:
+            self.replication.append(self._pending)
+            self._pending = []
+
+    def rollback(self) -> None:
+        self.raw.rollback()
+        self._pending = []
+
+    def position(self) -> int:
+        """Return the node's position: last committed (primary) or applied (replica) entry."""
+        self.replication.count(self.node)
+        return self.replication.position(self.node)
+
+    def close(self) -> None:
+        self.raw.close()
+
+
+class SimulatedReplication:
+    """A primary and any number of lagging replicas, as SQLite files in a directory."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        delay: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create the primary; replicas are added with `add_replica`.
+
+        Args:
+            directory: Where the database files live.
+            delay: Seconds between a commit on the primary and its replay on replicas.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.delay = delay
+        self._directory = Path(directory)
+        self._clock = clock
+        self._log: list[tuple[float, list[tuple[str, Any, bool]]]] = []
+        self._applied: dict[str, int] = {}
+        self._appliers: dict[str, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        self.statements: Counter[str] = Counter()
+
+    def path(self, node: str) -> str:
+        """Return the database file of a node."""
+        return str(self._directory / f'{node}.sqlite3')
+
+    def add_replica(self, name: str) -> None:
+        """Add an empty replica that will replay the whole log."""
+        with self._lock:
+            self._appliers[name] = sqlite3.connect(self.path(name), check_same_thread=False)
+            self._applied[name] = 0
+
+    def connect(self, node: str = PRIMARY) -> _NodeConnection:
+        """Open a connection to the primary or to a replica."""
+        return _NodeConnection(self, node)
+
+    def connector(self, node: str = PRIMARY) -> Callable[[], _NodeConnection]:
+        """Return a factory of connections to the node (for a connection pool)."""
+        return lambda: self.connect(node)
+
+    def count(self, node: str) -> None:
+        """Count one statement run on the node."""
+        with self._lock:
+            self.statements[node] += 1
+
+    def append(self, transaction: list[tuple[str, Any, bool]]) -> None:
+        """Log a committed primary transaction."""
+        with self._lock:
+            self._log.append((self._clock(), transaction))
+
+    def position(self, node: str) -> int:
+        """Return the last committed (primary) or applied (replica) log position."""
+        if node == PRIMARY:
+            with self._lock:
+                return len(self._log)
+        return self.catch_up(node)
+
+    def catch_up(self, node: str) -> int:
+        """Apply the log entries old enough to have reached the replica; return its position."""
+        with self._lock:
+            applied = self._applied[node]
+            visible_before = self._clock() - self.delay
+            applier = self._appliers[node]
+            while applied < len(self._log) and self._log[applied][0] <= visible_before:
+                for operation, parameters, many in self._log[applied][1]:
+                    if many:
+                        applier.executemany(operation, parameters)
+                    else:
+                        applier.execute(operation, parameters)
+                applier.commit()
+                applied += 1
+            self._applied[node] = applied
+            return applied
+
+    def close(self) -> None:
+        """Close the replicas' apply connections."""
+        for applier in self._appliers.values():
+            applier.close()
+
+
+def simulated_position(connection: Any) -> int:
+    """Position reader for `DatabaseNode`s backed by a `SimulatedReplication`."""
+    return int(connection.position())
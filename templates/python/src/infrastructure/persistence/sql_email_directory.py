@@ -0,0 +1,163 @@
+"""SQL email directory: normalized email -> user id.
+
+One partition of the global email index used by `ShardedUserRepository`:
+rows live on the shard that owns the normalized email, so the primary key
+on `email` keeps addresses unique across all shards even though users are
+spread by id. A row is a *claim*, written before the user row and timed so
+that claims orphaned by a crash can be recognised and taken over.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+from .sql_user_repository import DbConnection
+
+EMAIL_DIRECTORY_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    email TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    claimed_at DOUBLE PRECISION NOT NULL
+)
+"""
+
+Claim = tuple[str, float]  # user id, claimed at (epoch seconds)
+
+
+class SqlEmailDirectory:
+    """Email claims stored in one database."""
+
+    def __init__(
+        self,
+        connection: DbConnection,
+        *,
+        table: str = 'user_email_directory',
+        placeholder: str = '?',
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Bind the directory to a connection.
+
+        Args:
+            connection: DB-API connection; transactions are managed by the caller.
+            table: Name of the directory table.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Maximum keys per statement.
+        """
+        self._connection = connection
+        self._table = table
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+
+    def create_schema(self) -> None:
+        """Create the directory table if it does not exist."""
+        self._connection.cursor().execute(EMAIL_DIRECTORY_DDL.format(table=self._table))
+
+    def find(self, keys: Iterable[str]) -> dict[str, Claim]:
+        """
+        Look up claims, `batch_size` keys per query.
+
+        Args:
+            keys: Normalized (lower-case) emails.
+
+        Returns:
+            The claim of every key that has one.
+        """
+        keys = list(dict.fromkeys(keys))
+        claims: dict[str, Claim] = {}
+        cursor = self._connection.cursor()
+        for start in range(0, len(keys), self._batch_size):
+            chunk = keys[start : start + self._batch_size]
+            markers = ', '.join([self._placeholder] * len(chunk))
+            cursor.execute(
+                f'SELECT email, user_id, claimed_at FROM {self._table} '
+                f'WHERE email IN ({markers})',
+                chunk,
+            )
+            claims.update((email, (user_id, at)) for email, user_id, at in cursor.fetchall())
+        return claims
+
+    def claim(self, owners: Mapping[str, str], claimed_at: float) -> dict[str, Claim]:
+        """
+        Claim emails for users; keys already claimed by another user are left alone.
+
+        Args:
+            owners: Normalized email -> id of the user registering it.
+            claimed_at: Claim time in epoch seconds.
+
+        Returns:
+            The existing claims of the keys held by other users.
+        """
+        if not owners:
+            return {}
+        markers = ', '.join([self._placeholder] * 3)
+        self._connection.cursor().executemany(
+            f'INSERT INTO {self._table} (email, user_id, claimed_at) VALUES ({markers}) '
+            'ON CONFLICT (email) DO NOTHING',
+            [(key, user_id, claimed_at) for key, user_id in owners.items()],
+        )
+        return {
+            key: claim for key, claim in self.find(owners).items() if claim[0] != owners[key]
+        }
+
+    def take_over(self, key: str, stale_owner: str, owner: str, claimed_at: float) -> bool:
+        """
+        Move a claim to another user if it still belongs to `stale_owner`.
+
+        Returns:
+            Whether the claim moved.
+        """
+        p = self._placeholder
+        cursor = self._connection.cursor()
+        cursor.execute(
+            f'UPDATE {self._table} SET user_id = {p}, claimed_at = {p} '
+            f'WHERE email = {p} AND user_id = {p}',
+            (owner, claimed_at, key, stale_owner),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, owners: Mapping[str, str]) -> None:
+        """
+        Delete claims, each only if it still belongs to the given user.
+
+        Args:
+            owners: Normalized email -> id of the user holding it.
+        """
+        if owners:
+            self._connection.cursor().executemany(
+                f'DELETE FROM {self._table} '
+                f'WHERE email = {self._placeholder} AND user_id = {self._placeholder}',
+                list(owners.items()),
+            )
+
+    def page_after(self, after_key: str | None, limit: int) -> list[tuple[str, str, float]]:
+        """
+        Return the next `limit` rows (email, user id, claimed at) in email order.
+
+        Args:
+            after_key: Last email of the previous page, or None for the first page.
+            limit: Maximum rows to return.
+        """
+        cursor = self._connection.cursor()
+        select = f'SELECT email, user_id, claimed_at FROM {self._table}'
+        page = f'ORDER BY email LIMIT {int(limit)}'
+        if after_key is None:
+            cursor.execute(f'{select} {page}')
+        else:
+            cursor.execute(f'{select} WHERE email > {self._placeholder} {page}', (after_key,))
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def insert_rows(self, rows: Iterable[tuple[str, str, float]]) -> None:
+        """Insert (email, user id, claimed at) rows as they are, e.g. when moving them."""
+        markers = ', '.join([self._placeholder] * 3)
+        self._connection.cursor().executemany(
+            f'INSERT INTO {self._table} (email, user_id, claimed_at) VALUES ({markers})',
+            list(rows),
+        )
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Delete the rows of the given emails, whoever holds them."""
+        self._connection.cursor().executemany(
+            f'DELETE FROM {self._table} WHERE email = {self._placeholder}',
+            [(key,) for key in keys],
+        )
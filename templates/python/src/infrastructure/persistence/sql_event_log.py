@@ -0,0 +1,217 @@
+"""SQL Event Log.
+
+One row per domain event, keyed by its global position, with the bucket of
+its aggregate stored alongside so a replay worker can read its buckets
+through the `(bucket, position)` index without scanning the others. Event
+fields other than the id and timestamp are kept as a JSON object.
+
+The log opens its connection lazily from a factory and drops it when
+pickled, so replay worker processes each open their own.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from ...application.ports.event_log import StoredEvent, bucket_of
+from ...domain.entities.user import (
+    DomainEvent,
+    EmailVerifiedEvent,
+    UserCreatedEvent,
+    UserNameChangedEvent,
+)
+from .sql_user_repository import DbConnection
+
+EVENTS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    position BIGINT PRIMARY KEY,
+    bucket INTEGER NOT NULL,
+    aggregate_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    occurred_at TIMESTAMP NOT NULL,
+    payload TEXT NOT NULL
+)
+"""
+
+EVENTS_INDEX_DDL = (
+    'CREATE INDEX IF NOT EXISTS {table}_bucket_position ON {table} (bucket, position)'
+)
+
+EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    'UserCreated': UserCreatedEvent,
+    'EmailVerified': EmailVerifiedEvent,
+    'UserNameChanged': UserNameChangedEvent,
+}
+_TYPE_NAMES = {event_type: name for name, event_type in EVENT_TYPES.items()}
+_PAYLOAD_FIELDS = {
+    event_type: tuple(
+        field.name
+        for field in dataclasses.fields(event_type)
+        if field.name not in ('event_id', 'occurred_at')
+    )
+    for event_type in EVENT_TYPES.values()
+}
+
+
+def event_to_row(position: int, aggregate_id: str, event: DomainEvent) -> tuple[Any, ...]:
+    """
+    Flatten an event into an events-table row.
+
+    Args:
+        position: Global position of the event.
+        aggregate_id: Id of the aggregate that raised it.
+        event: A registered domain event.
+
+    Returns:
+        (position, bucket, aggregate id, type, event id, occurred at, payload).
+    """
+    event_type = type(event)
+    payload = {name: getattr(event, name) for name in _PAYLOAD_FIELDS[event_type]}
+    return (
+        position,
+        bucket_of(aggregate_id),
+        aggregate_id,
+        _TYPE_NAMES[event_type],
+        event.event_id,
+        event.occurred_at,
+        json.dumps(payload, separators=(',', ':')),
+    )
+
+
+def row_to_event(
+    event_type: str, event_id: str, occurred_at: datetime | str, payload: str
+) -> DomainEvent:
+    """
+    Rebuild an event from its stored columns.
+
+    Args:
+        event_type: Registered type name.
+        event_id: Id of the event.
+        occurred_at: Timestamp, native (psycopg) or ISO string (sqlite3).
+        payload: JSON object of the remaining fields.
+
+    Returns:
+        The domain event.
+    """
+    if not isinstance(occurred_at, datetime):
+        occurred_at = datetime.fromisoformat(occurred_at)
+    return EVENT_TYPES[event_type](
+        event_id=event_id, occurred_at=occurred_at, **json.loads(payload)
+    )
+
+
+class SqlEventLog:
+    """EventLog adapter over a DB-API database (single writer)."""
+
+    def __init__(
+        self,
+        factory: Callable[[], DbConnection],
+        *,
+        table: str = 'domain_events',
+        placeholder: str = '?',
+        batch_size: int = 5_000,
+    ) -> None:
+        """
+        Configure the log; the connection is opened on first use.
+
+        Args:
+            factory: Opens a connection; must be picklable for parallel replay
+                (e.g. `functools.partial(sqlite3.connect, path)`).
+            table: Name of the events table.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Rows fetched per query when reading.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        self._factory = factory
+        self._table = table
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+        self._connection: DbConnection | None = None
+        self._head: int | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the configuration only; the receiving process reconnects."""
+        return {**self.__dict__, '_connection': None, '_head': None}
+
+    @property
+    def connection(self) -> DbConnection:
+        """The log's connection; transactions are managed by the caller."""
+        if self._connection is None:
+            self._connection = self._factory()
+        return self._connection
+
+    def create_schema(self) -> None:
+        """Create the events table and its bucket index if they do not exist."""
+        cursor = self.connection.cursor()
+        cursor.execute(EVENTS_TABLE_DDL.format(table=self._table))
+        cursor.execute(EVENTS_INDEX_DDL.format(table=self._table))
+
+    def append(self, aggregate_id: str, events: Sequence[DomainEvent]) -> int:
+        """
+        Insert the events of one aggregate after the current head.
+
+        Args:
+            aggregate_id: Id of the aggregate that raised the events.
+            events: Events in the order they were raised.
+
+        Returns:
+            Position of the last appended event (the head).
+        """
+        head = self.head()
+        rows = [
+            event_to_row(head + offset, aggregate_id, event)
+            for offset, event in enumerate(events, start=1)
+        ]
+        if rows:
+            markers = ', '.join([self._placeholder] * len(rows[0]))
+            self.connection.cursor().executemany(
+                f'INSERT INTO {self._table} VALUES ({markers})', rows
+            )
+            self._head = head + len(rows)
+        return self.head()
+
+    def head(self) -> int:
+        """Return the position of the last event, 0 for an empty log."""
+        if self._head is None:
+            cursor = self.connection.cursor()
+            cursor.execute(f'SELECT COALESCE(MAX(position), 0) FROM {self._table}')
+            self._head = int(cursor.fetchone()[0])
+        return self._head
+
+    def read_bucket(self, bucket: int, after: int, until: int) -> Iterator[StoredEvent]:
+        """
+        Yield the events of a bucket in a position range, `batch_size` rows per query.
+
+        Args:
+            bucket: Bucket number.
+            after: Exclusive lower bound on the position.
+            until: Inclusive upper bound on the position.
+
+        Yields:
+            Stored events, by position.
+        """
+        marker = self._placeholder
+        statement = (
+            f'SELECT position, event_type, event_id, occurred_at, payload FROM {self._table} '
+            f'WHERE bucket = {marker} AND position > {marker} AND position <= {marker} '
+            f'ORDER BY position LIMIT {self._batch_size}'
+        )
+        cursor = self.connection.cursor()
+        while True:
+            cursor.execute(statement, (bucket, after, until))
+            rows = cursor.fetchall()
+            for position, event_type, event_id, occurred_at, payload in rows:
+                event = row_to_event(event_type, event_id, occurred_at, payload)
+                yield StoredEvent(position, event)
+            if len(rows) < self._batch_size:
+                return
+            after = rows[-1][0]
@@ -0,0 +1,431 @@
+"""SQL User Repository.
+
+Works on any DB-API 2.0 connection (sqlite3 for tests and benchmarks,
+psycopg for PostgreSQL). Statements only use portable SQL: `WITH ... VALUES`,
+`UPDATE ... FROM` and `RETURNING` (PostgreSQL 9.5+, SQLite 3.35+).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any, Protocol
+
+from ...application.ports.user_repository import ConcurrencyConflictError
+from ...domain.entities.user import User, UserRole
+from ...domain.value_objects.email import Email
+
+USER_COLUMNS: tuple[str, ...] = (
+    'id',
+    'email',
+    'name',
+    'password_hash',
+    'role',
+    'email_verified',
+    'created_at',
+    'updated_at',
+    'version',
+)
+
+USERS_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL,
+    email_verified BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+)
+"""
+
+
+class DbCursor(Protocol):
+    """Subset of the DB-API 2.0 cursor used by the SQL adapters."""
+
+    def execute(self, operation: str, parameters: Sequence[Any] = ..., /) -> Any:
+        """Execute a single statement."""
+        ...
+
+    def executemany(self, operation: str, seq_of_parameters: Iterable[Sequence[Any]], /) -> Any:
+        """Execute a statement once per parameter set."""
+        ...
+
+    def fetchone(self) -> Any:
+        """Fetch the next row."""
+        ...
+
+    def fetchall(self) -> list[Any]:
+        """Fetch all remaining rows."""
+        ...
+
+    @property
+    def rowcount(self) -> int:
+        """Rows affected by the last DML statement."""
+        ...
+
+
+class DbConnection(Protocol):
+    """Subset of the DB-API 2.0 connection used by the SQL adapters."""
+
+    def cursor(self) -> DbCursor:
+        """Open a new cursor."""
+        ...
+
+    def commit(self) -> None:
+        """Commit the current transaction."""
+        ...
+
+    def rollback(self) -> None:
+        """Roll back the current transaction."""
+        ...
+
+
+def _to_datetime(value: datetime | str) -> datetime:
+    """Accept both native timestamps (psycopg) and ISO strings (sqlite3)."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def user_to_row(user: User) -> tuple[Any, ...]:
+    """
+    Flatten a User into a row ordered like USER_COLUMNS.
+
+    Args:
+        user: The user to serialize.
+
+    Returns:
+        Tuple of column values, including the password hash.
+    """
+    return (
+        user.id,
+        user.email.value,
+        user.name,
+        user.password_hash,
+        user.role.value,
+        user.email_verified,
+        user.created_at,
+        user.updated_at,
+        user.version,
+    )
+
+
+def row_to_user(row: Sequence[Any]) -> User:
+    """
+    Rebuild a User from a row ordered like USER_COLUMNS.
+
+    Args:
+        row: Column values as returned by the driver.
+
+    Returns:
+        The hydrated User, without domain events or pending changes.
+    """
+    return User.from_persistence(
+        id=row[0],
+        email=Email.create(row[1]),
+        name=row[2],
+        password_hash=row[3],
+        role=UserRole(row[4]),
+        email_verified=bool(row[5]),
+        created_at=_to_datetime(row[6]),
+        updated_at=_to_datetime(row[7]),
+        version=row[8],
+    )
+
+
+class SqlUserRepository:
+    """UserRepository adapter with batched inserts and dirty-field updates."""
+
+    def __init__(
+        self,
+        connection: DbConnection,
+        *,
+        table: str = 'users',
+        placeholder: str = '?',
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Bind the repository to a connection.
+
+        Args:
+            connection: DB-API connection; transactions are managed by the caller.
+            table: Name of the users table.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Maximum rows per multi-row statement.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        self._connection = connection
+        self._table = table
+        self._placeholder = placeholder
+        self._batch_size = batch_size
+        self._select = f'SELECT {", ".join(USER_COLUMNS)} FROM {table}'
+
+    def create_schema(self) -> None:
+        """Create the users table if it does not exist."""
+        self._connection.cursor().execute(USERS_TABLE_DDL.format(table=self._table))
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """
+        Load a user by id.
+
+        Args:
+            user_id: The user identifier.
+
+        Returns:
+            The user, or None if no row matches.
+        """
+        cursor = self._connection.cursor()
+        cursor.execute(f'{self._select} WHERE id = {self._placeholder}', (user_id,))
+        row = cursor.fetchone()
+        return row_to_user(row) if row is not None else None
+
+    def find_by_email(self, email: Email) -> User | None:
+        """
+        Load a user by email, ignoring case like `Email.__eq__`.
+
+        Args:
+            email: The email value object.
+
+        Returns:
+            The user, or None if no row matches.
+        """
+        cursor = self._connection.cursor()
+        cursor.execute(
+            f'{self._select} WHERE lower(email) = {self._placeholder}',
+            (email.value.lower(),),
+        )
+        row = cursor.fetchone()
+        return row_to_user(row) if row is not None else None
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """
+        Load the users owning any of the emails, `batch_size` emails per query.
+
+        Args:
+            emails: Email value objects; duplicates are ignored.
+
+        Returns:
+            Matching users, in no particular order.
+        """
+        keys = list(dict.fromkeys(email.value.lower() for email in emails))
+        users: list[User] = []
+        cursor = self._connection.cursor()
+        for start in range(0, len(keys), self._batch_size):
+            chunk = keys[start : start + self._batch_size]
+            markers = ', '.join([self._placeholder] * len(chunk))
+            cursor.execute(f'{self._select} WHERE lower(email) IN ({markers})', chunk)
+            users.extend(row_to_user(row) for row in cursor.fetchall())
+        return users
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """
+        Load the users with any of the ids, `batch_size` ids per query.
+
+        Args:
+            user_ids: User identifiers; duplicates are ignored.
+
+        Returns:
+            Matching users, in no particular order.
+        """
+        keys = list(dict.fromkeys(user_ids))
+        users: list[User] = []
+        cursor = self._connection.cursor()
+        for start in range(0, len(keys), self._batch_size):
+            chunk = keys[start : start + self._batch_size]
+            markers = ', '.join([self._placeholder] * len(chunk))
+            cursor.execute(f'{self._select} WHERE id IN ({markers})', chunk)
+            users.extend(row_to_user(row) for row in cursor.fetchall())
+        return users
+
+    def page_after(self, after_id: str | None, limit: int) -> list[User]:
+        """
+        Load the next `limit` users in id order (keyset pagination).
+
+        `WHERE id > last ORDER BY id` is an index range scan however far the
+        scan has gone, unlike `OFFSET`.
+
+        Args:
+            after_id: Last id of the previous page, or None for the first page.
+            limit: Maximum users to return.
+
+        Returns:
+            The page; shorter than `limit` only at the end of the table.
+        """
+        cursor = self._connection.cursor()
+        page = f'ORDER BY id LIMIT {int(limit)}'
+        if after_id is None:
+            cursor.execute(f'{self._select} {page}')
+        else:
+            cursor.execute(f'{self._select} WHERE id > {self._placeholder} {page}', (after_id,))
+        return [row_to_user(row) for row in cursor.fetchall()]
+
+    def iter_all(self) -> Iterator[User]:
+        """
+        Stream every user in id order, `batch_size` rows per query.
+
+        Yields:
+            Hydrated users, without domain events or pending changes.
+        """
+        after_id = None
+        while True:
+            users = self.page_after(after_id, self._batch_size)
+            yield from users
+            if len(users) < self._batch_size:
+                return
+            after_id = users[-1].id
+
+    def save(self, user: User) -> None:
+        """
+        Insert a new user or write the dirty fields of a loaded one.
+
+        Args:
+            user: The user to store.
+
+        Raises:
+            ConcurrencyConflictError: If the stored version changed since the user was loaded.
+        """
+        if user.is_new():
+            self.insert_many([user])
+        else:
+            self.update_dirty([user])
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """
+        Insert the new users and write the dirty fields of the loaded ones.
+
+        Args:
+            users: Users to store.
+
+        Raises:
+            ConcurrencyConflictError: If a stored version changed since a user was loaded.
+        """
+        self.insert_many([user for user in users if user.is_new()])
+        self.update_dirty(user for user in users if not user.is_new())
+
+    def insert_many(self, users: Sequence[User]) -> None:
+        """
+        Insert never-persisted users and mark them as version 1.
+
+        Args:
+            users: New users (`is_new()` must be true).
+        """
+        if not users:
+            return
+        markers = ', '.join([self._placeholder] * len(USER_COLUMNS))
+        statement = f'INSERT INTO {self._table} ({", ".join(USER_COLUMNS)}) VALUES ({markers})'
+        rows = [user_to_row(user)[:-1] + (1,) for user in users]
+        self._connection.cursor().executemany(statement, rows)
+        for user in users:
+            user.mark_persisted(1)
+
+    def insert_persisted(self, users: Sequence[User]) -> None:
+        """
+        Insert already-persisted users as they are, keeping their versions.
+
+        Used to move rows between databases (e.g. shard rebalancing).
+
+        Args:
+            users: Loaded users without pending changes.
+        """
+        if not users:
+            return
+        markers = ', '.join([self._placeholder] * len(USER_COLUMNS))
+        statement = f'INSERT INTO {self._table} ({", ".join(USER_COLUMNS)}) VALUES ({markers})'
+        self._connection.cursor().executemany(statement, [user_to_row(user) for user in users])
+
+    def delete_many(self, user_ids: Iterable[str]) -> int:
+        """
+        Delete the rows of the given ids, `batch_size` ids per statement.
+
+        Args:
+            user_ids: User identifiers; unknown ids are ignored.
+
+        Returns:
+            Number of rows deleted.
+        """
+        keys = list(dict.fromkeys(user_ids))
+        deleted = 0
+        cursor = self._connection.cursor()
+        for start in range(0, len(keys), self._batch_size):
+            chunk = keys[start : start + self._batch_size]
+            markers = ', '.join([self._placeholder] * len(chunk))
+            cursor.execute(f'DELETE FROM {self._table} WHERE id IN ({markers})', chunk)
+            deleted += cursor.rowcount
+        return deleted
+
+    def update_dirty(self, users: Iterable[User]) -> int:
+        """
+        Write only the changed columns of the given users, checking versions.
+
+        Users are grouped by their set of dirty columns so each group becomes
+        one multi-row `UPDATE ... FROM (VALUES ...)` per `batch_size` rows.
+        Clean users are skipped. Versions are bumped only after every
+        statement matched all of its rows.
+
+        Args:
+            users: Loaded users, possibly with pending changes.
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            ConcurrencyConflictError: If any row's stored version no longer matches.
+        """
+        groups: dict[tuple[str, ...], list[User]] = {}
+        for user in users:
+            if user.is_dirty():
+                groups.setdefault(tuple(sorted(user.dirty_fields)), []).append(user)
+
+        written: list[User] = []
+        for columns, group in groups.items():
+            for start in range(0, len(group), self._batch_size):
+                chunk = group[start : start + self._batch_size]
+                self._update_chunk(columns, chunk)
+                written.extend(chunk)
+
+        for user in written:
+            user.mark_persisted(user.version + 1)
+        return len(written)
+
+    def _update_chunk(self, columns: tuple[str, ...], users: Sequence[User]) -> None:
+        """Run one multi-row optimistic update and raise on version mismatches."""
+        cursor = self._connection.cursor()
+        cursor.execute(
+            self._update_statement(columns, len(users)), self._update_params(columns, users)
+        )
+        updated = {row[0] for row in cursor.fetchall()}
+        if len(updated) != len(users):
+            raise ConcurrencyConflictError(user.id for user in users if user.id not in updated)
+
+    def _update_statement(self, columns: tuple[str, ...], rows: int) -> str:
+        """Build `WITH dirty(...) AS (VALUES ...) UPDATE ... FROM dirty` for a chunk."""
+        width = len(columns) + 2
+        tuple_sql = '(' + ', '.join([self._placeholder] * width) + ')'
+        assignments = ', '.join(f'{column} = dirty.{column}' for column in columns)
+        table = self._table
+        return (
+            f'WITH dirty(id, version, {", ".join(columns)}) AS '
+            f'(VALUES {", ".join([tuple_sql] * rows)}) '
+            f'UPDATE {table} SET {assignments}, version = {table}.version + 1 '
+            f'FROM dirty WHERE {table}.id = dirty.id AND {table}.version = dirty.version '
+            f'RETURNING {table}.id'
+        )
+
+    @staticmethod
+    def _update_params(columns: tuple[str, ...], users: Sequence[User]) -> list[Any]:
+        """Flatten the chunk's id, expected version and dirty values into one list."""
+        indexes = [USER_COLUMNS.index(column) for column in columns]
+        params: list[Any] = []
+        for user in users:
+            row = user_to_row(user)
+            params.append(user.id)
+            params.append(user.version)
+            params.extend(row[index] for index in indexes)
+        return params
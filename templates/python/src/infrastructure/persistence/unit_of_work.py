@@ -0,0 +1,192 @@
+"""SQL Unit of Work for the User aggregate.
+
+Keeps an identity map of the users loaded or added during a business
+transaction and, on commit, writes only what changed: new users in one
+batched insert, modified users grouped by dirty columns into multi-row
+updates guarded by the `version` column (optimistic locking, no row locks).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from .sql_user_repository import DbConnection, SqlUserRepository
+
+if TYPE_CHECKING:
+    from ...domain.entities.user import User
+    from ...domain.value_objects.email import Email
+
+
+class TrackedUserRepository:
+    """Repository view that registers every loaded user in its unit of work."""
+
+    def __init__(self, unit_of_work: SqlUserUnitOfWork) -> None:
+        """
+        Bind the view to its unit of work.
+
+        Args:
+            unit_of_work: The owner of the identity map.
+        """
+        self._uow = unit_of_work
+
+    def find_by_id(self, user_id: str) -> User | None:
+        """
+        Return the tracked instance for the id, loading it on first access.
+
+        Args:
+            user_id: The user identifier.
+
+        Returns:
+            The user, or None if it does not exist.
+        """
+        tracked = self._uow.identity_map.get(user_id)
+        if tracked is not None:
+            return tracked
+        return self._uow.track(self._uow.repository.find_by_id(user_id))
+
+    def find_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """
+        Return the tracked instances for the ids, loading the missing ones in one query.
+
+        Args:
+            user_ids: User identifiers.
+
+        Returns:
+            The tracked users that exist.
+        """
+        identity_map = self._uow.identity_map
+        keys = list(dict.fromkeys(user_ids))
+        missing = [user_id for user_id in keys if user_id not in identity_map]
+        for user in self._uow.repository.find_by_ids(missing) if missing else []:
+            self._uow.track(user)
+        return [identity_map[user_id] for user_id in keys if user_id in identity_map]
+
+    def find_by_email(self, email: Email) -> User | None:
+        """
+        Load a user by email and start tracking it.
+
+        Args:
+            email: The email value object.
+
+        Returns:
+            The tracked user, or None if it does not exist.
+        """
+        return self._uow.track(self._uow.repository.find_by_email(email))
+
+    def find_by_emails(self, emails: Iterable[Email]) -> list[User]:
+        """
+        Load users by email in one query and start tracking them.
+
+        Args:
+            emails: Email value objects.
+
+        Returns:
+            The tracked users.
+        """
+        found = self._uow.repository.find_by_emails(emails)
+        return [tracked for user in found if (tracked := self._uow.track(user)) is not None]
+
+    def save(self, user: User) -> None:
+        """
+        Register a user so its state is written on commit.
+
+        Args:
+            user: A new or loaded user.
+        """
+        self._uow.track(user)
+
+    def save_all(self, users: Sequence[User]) -> None:
+        """
+        Register several users so their state is written on commit.
+
+        Args:
+            users: New or loaded users.
+        """
+        for user in users:
+            self._uow.track(user)
+
+
+class SqlUserUnitOfWork:
+    """Tracks users for one transaction and flushes only dirty fields."""
+
+    def __init__(
+        self,
+        connection: DbConnection,
+        *,
+        table: str = 'users',
+        placeholder: str = '?',
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Create a unit of work on top of a DB-API connection.
+
+        Args:
+            connection: Connection whose transaction this unit of work controls.
+            table: Name of the users table.
+            placeholder: Driver parameter marker (`?` for sqlite3, `%s` for psycopg).
+            batch_size: Maximum rows per multi-row statement.
+        """
+        self._connection = connection
+        self.repository = SqlUserRepository(
+            connection, table=table, placeholder=placeholder, batch_size=batch_size
+        )
+        self.users = TrackedUserRepository(self)
+        self.identity_map: dict[str, User] = {}
+
+    def track(self, user: User | None) -> User | None:
+        """
+        Add a user to the identity map, keeping the first instance seen per id.
+
+        Args:
+            user: The user to track; None is passed through.
+
+        Returns:
+            The tracked instance for that id, or None.
+        """
+        if user is None:
+            return None
+        return self.identity_map.setdefault(user.id, user)
+
+    def flush(self) -> int:
+        """
+        Write pending inserts and dirty-field updates without committing.
+
+        Returns:
+            Number of users written.
+
+        Raises:
+            ConcurrencyConflictError: If a tracked user was modified concurrently.
+        """
+        tracked = list(self.identity_map.values())
+        new_users = [user for user in tracked if user.is_new()]
+        self.repository.insert_many(new_users)
+        updated = self.repository.update_dirty(user for user in tracked if user.is_dirty())
+        return len(new_users) + updated
+
+    def commit(self) -> None:
+        """Flush pending changes and commit the transaction."""
+        self.flush()
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        """Roll back the transaction and forget every tracked user."""
+        self._connection.rollback()
+        self.identity_map.clear()
+
+    def __enter__(self) -> SqlUserUnitOfWork:
+        """Start a business transaction."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit on success, roll back when the block raised."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
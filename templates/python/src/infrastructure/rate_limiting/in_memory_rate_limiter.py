@@ -0,0 +1,135 @@
+"""Compact in-process token buckets.
+
+Buckets are not objects: each key owns a slot of two adjacent doubles
+(tokens, last refill time) in one `array('d')`, so a bucket sits in a
+single cache line, and a dict maps keys to slots. A million active keys
+cost a few dozen bytes each beyond the key strings. Refill is
+lazy, computed from the elapsed time when a key is touched. Eviction is
+periodic and incremental: at most once per `sweep_interval` a call advances
+a cursor over `sweep_batch` slots and frees the buckets that have refilled
+completely, which is exactly the state of a key that has no bucket, so
+evicting them changes no decision.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from collections.abc import Callable
+
+from ...application.ports.rate_limiter import RateLimitDecision, TokenBucketPolicy
+
+
+class InMemoryRateLimiter:
+    """RateLimiter adapter for a single process."""
+
+    def __init__(
+        self,
+        policy: TokenBucketPolicy,
+        *,
+        sweep_interval: float = 1.0,
+        sweep_batch: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create an empty limiter.
+
+        Args:
+            policy: Capacity and refill rate of every bucket.
+            sweep_interval: Minimum seconds between eviction sweeps.
+            sweep_batch: Slots examined per sweep; 0 disables eviction.
+            clock: Monotonic time source in seconds (injectable for tests).
+        """
+        self.policy = policy
+        self._capacity = policy.capacity
+        self._rate = policy.refill_per_second
+        self._sweep_interval = sweep_interval
+        self._sweep_batch = sweep_batch
+        self._next_sweep = 0.0
+        self._clock = clock
+        self._slots: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._buckets = array('d')  # [tokens, updated] per slot
+        self._free: list[int] = []
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        """
+        Take `cost` tokens from the key's bucket if it holds enough.
+
+        Args:
+            key: Bucket key (e.g. `domain:example.com`).
+            cost: Tokens to take.
+
+        Returns:
+            The decision; `retry_after` is the wait until `cost` tokens are available.
+        """
+        capacity = self._capacity
+        rate = self._rate
+        with self._lock:
+            now = self._clock()
+            buckets = self._buckets
+            slot = self._slots.get(key)
+            if slot is None:
+                tokens = capacity
+                offset = self._allocate(key) * 2
+            else:
+                offset = slot * 2
+                tokens = buckets[offset] + (now - buckets[offset + 1]) * rate
+                if tokens > capacity:
+                    tokens = capacity
+            allowed = tokens >= cost
+            if allowed:
+                tokens = min(capacity, tokens - cost)  # a negative cost refunds
+            buckets[offset] = tokens
+            buckets[offset + 1] = now
+            if now >= self._next_sweep and self._sweep_batch:
+                self._next_sweep = now + self._sweep_interval
+                self._sweep(now)
+        if allowed:
+            return RateLimitDecision(True, tokens)
+        return RateLimitDecision(False, tokens, (cost - tokens) / rate)
+
+    def refund(self, key: str, cost: float = 1.0) -> None:
+        """
+        Give back tokens taken by `acquire`, up to the bucket's capacity.
+
+        Args:
+            key: Bucket key.
+            cost: Tokens to give back.
+        """
+        self.acquire(key, -cost)
+
+    def _allocate(self, key: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+            self._buckets.extend((0.0, 0.0))
+        self._slots[key] = slot
+        return slot
+
+    def _sweep(self, now: float) -> None:
+        """Free up to `sweep_batch` slots whose buckets are full again."""
+        size = len(self._keys)
+        if not size:
+            return
+        full_after = self.policy.seconds_to_full
+        cursor = self._cursor
+        for _ in range(min(self._sweep_batch, size)):
+            key = self._keys[cursor]
+            # Tokens never go below zero, so seconds_to_full idle means a full bucket.
+            if key is not None and now - self._buckets[cursor * 2 + 1] >= full_after:
+                del self._slots[key]
+                self._keys[cursor] = None
+                self._free.append(cursor)
+            cursor = cursor + 1 if cursor + 1 < size else 0
+        self._cursor = cursor
+
+    def __len__(self) -> int:
+        """Return the number of keys holding a bucket."""
+        return len(self._slots)
@@ -0,0 +1,111 @@
+"""Redis token buckets updated atomically by a Lua script.
+
+Each key is a hash `{tokens, ts}`; the script refills it from the elapsed
+server time (`TIME`, so node clocks do not matter), takes the tokens if
+enough are available and sets the key to expire once the bucket would be
+full again, which is how idle buckets are evicted. A negative cost gives
+tokens back (capped at the capacity), which is how `refund` works. The
+script is loaded once and run with EVALSHA, reloading it if the server
+lost its cache.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+from ...application.ports.rate_limiter import RateLimitDecision, TokenBucketPolicy
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+  tokens = capacity
+else
+  tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local allowed = 0
+if tokens >= cost then
+  tokens = math.min(capacity, tokens - cost)
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisScriptClient(Protocol):
+    """The subset of the redis-py client the limiter uses."""
+
+    def script_load(self, script: str) -> Any:
+        """Cache the script on the server and return its SHA1."""
+        ...
+
+    def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> Any:
+        """Run a cached script."""
+        ...
+
+
+class RedisRateLimiter:
+    """RateLimiter adapter shared by every node connected to Redis."""
+
+    def __init__(
+        self, client: RedisScriptClient, policy: TokenBucketPolicy, *, prefix: str = 'ratelimit'
+    ) -> None:
+        """
+        Wrap a Redis client.
+
+        Args:
+            client: Connected client.
+            policy: Capacity and refill rate of every bucket.
+            prefix: Namespace for the keys.
+        """
+        self._client = client
+        self.policy = policy
+        self._prefix = prefix
+        self._sha: str | None = None
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        """
+        Take `cost` tokens from the key's bucket atomically.
+
+        Args:
+            key: Bucket key.
+            cost: Tokens to take.
+
+        Returns:
+            The decision.
+        """
+        args = (f'{self._prefix}:{key}', self.policy.capacity, self.policy.refill_per_second, cost)
+        try:
+            allowed, remaining = self._client.evalsha(self._script_sha(), 1, *args)
+        except Exception as error:  # redis.exceptions.NoScriptError without importing redis
+            if not str(error).startswith('NOSCRIPT'):
+                raise
+            self._sha = None
+            allowed, remaining = self._client.evalsha(self._script_sha(), 1, *args)
+        tokens = float(remaining)
+        if int(allowed):
+            return RateLimitDecision(True, tokens)
+        return RateLimitDecision(False, tokens, (cost - tokens) / self.policy.refill_per_second)
+
+    def refund(self, key: str, cost: float = 1.0) -> None:
+        """
+        Give back tokens taken by `acquire`, up to the bucket's capacity.
+
+        Args:
+            key: Bucket key.
+            cost: Tokens to give back.
+        """
+        self.acquire(key, -cost)
+
+    def _script_sha(self) -> str:
+        if self._sha is None:
+            sha = self._client.script_load(TOKEN_BUCKET_SCRIPT)
+            self._sha = sha.decode() if isinstance(sha, bytes) else sha
+        return self._sha
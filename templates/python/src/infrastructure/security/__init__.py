@@ -0,0 +1 @@
+"""Security adapters (password hashing, tokens)."""
@@ -0,0 +1,72 @@
+"""PBKDF2-SHA256 password hasher (stdlib only).
+
+Hash format: `pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>`, so the
+work factor can be raised later without invalidating stored hashes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import secrets
+
+DEFAULT_ITERATIONS = 600_000
+MIN_ITERATIONS = 1_000
+_ALGORITHM = 'pbkdf2_sha256'
+
+
+class Pbkdf2PasswordHasher:
+    """PasswordHasher adapter based on `hashlib.pbkdf2_hmac`."""
+
+    def __init__(self, iterations: int | None = None) -> None:
+        """
+        Configure the work factor.
+
+        Args:
+            iterations: PBKDF2 rounds; PASSWORD_HASH_ITERATIONS or 600k by default.
+
+        Raises:
+            ValueError: If iterations is below MIN_ITERATIONS.
+        """
+        if iterations is None:
+            iterations = int(os.environ.get('PASSWORD_HASH_ITERATIONS', DEFAULT_ITERATIONS))
+        if iterations < MIN_ITERATIONS:
+            raise ValueError(f'iterations must be at least {MIN_ITERATIONS}')
+        self.iterations = iterations
+
+    def hash(self, plain_password: str) -> str:
+        """
+        Hash a password with a random salt.
+
+        Args:
+            plain_password: The password to hash.
+
+        Returns:
+            The encoded hash.
+        """
+        salt = secrets.token_bytes(16)
+        digest = hashlib.pbkdf2_hmac('sha256', plain_password.encode(), salt, self.iterations)
+        return f'{_ALGORITHM}${self.iterations}${salt.hex()}${digest.hex()}'
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        """
+        Check a password against an encoded hash in constant time.
+
+        Args:
+            plain_password: Candidate password.
+            password_hash: Hash produced by `hash`.
+
+        Returns:
+            True if the password matches.
+        """
+        try:
+            algorithm, iterations, salt, expected = password_hash.split('$')
+        except ValueError:
+            return False
+        if algorithm != _ALGORITHM:
+            return False
+        digest = hashlib.pbkdf2_hmac(
+            'sha256', plain_password.encode(), bytes.fromhex(salt), int(iterations)
+        )
+        return hmac.compare_digest(digest.hex(), expected)
@@ -0,0 +1,105 @@
+"""Composition root.
+
+Wires the use cases to their adapters and exposes the ASGI application:
+
+    uvicorn src.main:app
+
+Storage is in memory; swap `InMemoryUserRepository` for a SQL adapter in a
+real deployment. Idempotency keys and rate-limit buckets are kept in
+process memory, or in Redis when REDIS_URL is set so every worker shares
+them. Registration budgets per minute come from
+RATE_LIMIT_DOMAIN_PER_MINUTE (registrations per email domain, default 100)
+and RATE_LIMIT_CLIENT_PER_MINUTE (requests per client address, default 20).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from fastapi import FastAPI
+
+from .application.ports.idempotency_store import IdempotencyStore
+from .application.ports.rate_limiter import RateLimiter, TokenBucketPolicy
+from .application.use_cases.idempotency import IdempotentExecutor
+from .application.use_cases.register_user_account import RegisterUserAccountHandler
+from .application.use_cases.registration_rate_limit import RegistrationRateLimiter
+from .infrastructure.http.app import create_app
+from .infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from .infrastructure.observability.profiling import enable_profiling_from_env
+from .infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from .infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+from .infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+
+def _redis_client() -> Any | None:
+    """Connect to REDIS_URL, importing redis only when it is configured."""
+    redis_url = os.environ.get('REDIS_URL')
+    if not redis_url:
+        return None
+    import redis
+
+    return redis.Redis.from_url(redis_url)
+
+
+def build_idempotency_store(redis_client: Any | None = None) -> IdempotencyStore:
+    """
+    Choose the idempotency backend.
+
+    Args:
+        redis_client: Shared Redis client, if configured.
+
+    Returns:
+        A Redis store when a client is given, otherwise a bounded in-memory store.
+    """
+    if redis_client is None:
+        return InMemoryIdempotencyStore()
+    from .infrastructure.idempotency.redis_idempotency_store import RedisIdempotencyStore
+
+    return RedisIdempotencyStore(redis_client)
+
+
+def build_rate_limiter(redis_client: Any | None = None) -> RegistrationRateLimiter:
+    """
+    Build the registration budgets from RATE_LIMIT_* variables.
+
+    Args:
+        redis_client: Shared Redis client, if configured.
+
+    Returns:
+        Per-domain and per-client limiters, Redis-backed when a client is given.
+    """
+
+    def limiter(variable: str, default: str) -> RateLimiter:
+        per_minute = float(os.environ.get(variable, default))
+        policy = TokenBucketPolicy(capacity=per_minute, refill_per_second=per_minute / 60)
+        if redis_client is None:
+            return InMemoryRateLimiter(policy)
+        from .infrastructure.rate_limiting.redis_rate_limiter import RedisRateLimiter
+
+        return RedisRateLimiter(redis_client, policy)
+
+    return RegistrationRateLimiter(
+        by_domain=limiter('RATE_LIMIT_DOMAIN_PER_MINUTE', '100'),
+        by_client=limiter('RATE_LIMIT_CLIENT_PER_MINUTE', '20'),
+    )
+
+
+def build_app() -> FastAPI:
+    """
+    Build the application with in-memory storage and PBKDF2 hashing.
+
+    Returns:
+        The FastAPI application.
+    """
+    enable_profiling_from_env()
+    redis_client = _redis_client()
+    handler = RegisterUserAccountHandler(InMemoryUserRepository(), Pbkdf2PasswordHasher())
+    return create_app(
+        handler,
+        IdempotentExecutor(build_idempotency_store(redis_client)),
+        build_rate_limiter(redis_client),
+    )
+
+
+app = build_app()
@@ -0,0 +1,160 @@
+"""Integration tests for the chunked users-table backfill (sqlite3)."""
+
+import itertools
+import sqlite3
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.services.email_canonicalization import EmailCanonicalizer
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.backfill import Backfill, BackfillRunner
+from src.infrastructure.persistence.sql_user_repository import SqlUserRepository
+
+pytestmark = pytest.mark.integration
+
+CANONICAL = Backfill(
+    'email_canonical',
+    ('email_canonical',),
+    lambda user: (EmailCanonicalizer().canonical_key(user.email),),
+)
+
+
+@pytest.fixture()
+def connection():
+    connection = sqlite3.connect(':memory:')
+    repository = SqlUserRepository(connection)
+    repository.create_schema()
+    repository.insert_many(
+        [
+            User.create(
+                email=Email.create(f'first.last+{index}@gmail.com'),
+                name=f'User {index}',
+                password_hash='hash',
+            )
+            for index in range(25)
+        ]
+    )
+    connection.execute('ALTER TABLE users ADD COLUMN email_canonical TEXT')
+    connection.commit()
+    return connection
+
+
+def runner(connection, **options):
+    runner = BackfillRunner(connection, initial_chunk=4, min_chunk=2, max_chunk=8, **options)
+    runner.create_schema()
+    return runner
+
+
+def canonical_column(connection):
+    return [row[0] for row in connection.execute('SELECT email_canonical FROM users ORDER BY id')]
+
+
+class TestBackfillRunner:
+    """Test suite for keyset-chunked, checkpointed backfills."""
+
+    def test_fills_every_row_and_reports_progress(self, connection):
+        """Should fill the column through the domain and report each chunk."""
+        reports = []
+
+        progress = runner(connection, progress=reports.append).run(CANONICAL)
+
+        assert canonical_column(connection) == ['firstlast@gmail.com'] * 25
+        assert progress.completed
+        assert progress.rows == progress.total == 25
+        assert (progress.failed, progress.skipped) == (0, 0)
+        assert [report.rows for report in reports] == sorted(report.rows for report in reports)
+        assert len(reports) > 3
+
+    def test_resumes_from_the_committed_checkpoint(self, connection):
+        """Should continue after the last committed chunk instead of starting over."""
+        first = runner(connection).run(CANONICAL, max_chunks=2)
+        assert not first.completed
+        assert canonical_column(connection).count(None) == 25 - first.rows
+
+        resumed = runner(connection).run(CANONICAL)
+
+        assert resumed.completed
+        assert resumed.rows == 25
+        assert None not in canonical_column(connection)
+        assert runner(connection).run(CANONICAL) == runner(connection).checkpoint(
+            'email_canonical'
+        )
+
+    def test_reset_starts_over(self, connection):
+        """Should revisit every row after a reset."""
+        backfill_runner = runner(connection)
+        backfill_runner.run(CANONICAL)
+
+        backfill_runner.reset('email_canonical')
+
+        assert backfill_runner.checkpoint('email_canonical') is None
+        assert backfill_runner.run(CANONICAL).rows == 25
+
+    def test_counts_rows_the_domain_rejects(self, connection):
+        """Should leave rows with invalid legacy data untouched."""
+        connection.execute(
+            "INSERT INTO users (id, email, name, password_hash, role, email_verified, "
+            "created_at, updated_at, version) VALUES ('zzz', 'not-an-email', 'Legacy', 'h', "
+            "'user', 0, '2020-01-01 00:00:00', '2020-01-01 00:00:00', 1)"
+        )
+
+        progress = runner(connection).run(CANONICAL)
+
+        assert progress.failed == 1
+        assert progress.rows == 26
+        assert canonical_column(connection)[-1] is None
+
+    def test_skips_rows_changed_since_they_were_read(self, connection):
+        """Should not overwrite a row the application updated mid-chunk."""
+        [changed_id] = connection.execute('SELECT id FROM users ORDER BY id LIMIT 1').fetchone()
+
+        def transform(user):
+            if user.id == changed_id:  # a concurrent write lands after the chunk was read
+                connection.execute(
+                    "UPDATE users SET version = version + 1, email_canonical = 'app' WHERE id = ?",
+                    (user.id,),
+                )
+            return (user.email.value.lower(),)
+
+        progress = runner(connection).run(Backfill('lower', ('email_canonical',), transform))
+
+        assert progress.skipped == 1
+        assert canonical_column(connection)[0] == 'app'
+
+    def test_adapts_chunk_size_to_latency(self, connection):
+        """Should shrink slow chunks and grow fast ones within the bounds."""
+        slow = itertools.count(step=1.0)  # every chunk appears to take a second
+        shrinking = []
+        runner(connection, clock=lambda: next(slow), progress=shrinking.append).run(
+            CANONICAL, max_chunks=3
+        )
+        fast = itertools.repeat(0.0)
+        growing = []
+        runner(connection, clock=lambda: next(fast), progress=growing.append).run(
+            Backfill('other', CANONICAL.columns, CANONICAL.transform), max_chunks=3
+        )
+
+        assert [report.chunk_size for report in shrinking] == [2, 2, 2]
+        assert [report.chunk_size for report in growing] == [8, 8, 8]
+
+    def test_throttles_to_the_rate_cap(self, connection):
+        """Should sleep so the run stays under max_rows_per_second."""
+        pauses = []
+        backfill_runner = runner(
+            connection,
+            max_rows_per_second=100,
+            clock=lambda: 0.0,
+            sleep=pauses.append,
+        )
+
+        backfill_runner.run(CANONICAL, max_chunks=2)
+
+        assert pauses == [pytest.approx(0.04), pytest.approx(0.08)]
+
+    def test_rejects_invalid_settings(self, connection):
+        """Should refuse inconsistent chunk bounds and rates."""
+        with pytest.raises(ValueError, match='chunk sizes'):
+            BackfillRunner(connection, initial_chunk=10, max_chunk=5)
+        with pytest.raises(ValueError, match='max_rows_per_second'):
+            BackfillRunner(connection, max_rows_per_second=0)
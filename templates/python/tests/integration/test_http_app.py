@@ -0,0 +1,241 @@
+"""Integration tests for the registration HTTP endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.application.ports.rate_limiter import TokenBucketPolicy
+from src.application.use_cases.idempotency import IdempotentExecutor
+from src.application.use_cases.register_user_account import RegisterUserAccountHandler
+from src.application.use_cases.registration_rate_limit import RegistrationRateLimiter
+from src.infrastructure.http.app import create_app
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+pytestmark = pytest.mark.integration
+
+PASSWORD = 'correct-horse-battery'
+
+
+@pytest.fixture()
+def repository():
+    return InMemoryUserRepository()
+
+
+@pytest.fixture()
+def executor():
+    return IdempotentExecutor(InMemoryIdempotencyStore())
+
+
+@pytest.fixture()
+def client(repository, executor):
+    handler = RegisterUserAccountHandler(repository, Pbkdf2PasswordHasher(iterations=1_000))
+    return TestClient(create_app(handler, executor))
+
+
+def body(email='john@example.com', name='John Doe', password=PASSWORD):
+    return {'email': email, 'name': name, 'password': password}
+
+
+class TestRegisterUser:
+    def test_created(self, client):
+        response = client.post('/users', json=body())
+
+        assert response.status_code == 201
+        payload = response.json()
+        assert payload['success'] is True
+        assert payload['message'] == 'User registered successfully'
+        assert payload['data']['email'] == 'john@example.com'
+        assert payload['data']['role'] == 'user'
+
+    def test_caller_cannot_choose_a_role(self, client, repository):
+        response = client.post('/users', json={**body(), 'role': 'admin'})
+        batch = client.post(
+            '/users:batch', json={'items': [{**body(email='root@example.com'), 'role': 'admin'}]}
+        )
+
+        assert response.status_code == 201
+        assert response.json()['data']['role'] == 'user'
+        assert batch.status_code == 201
+        assert {user.role.value for user in repository.list()} == {'user'}
+
+    def test_validation_failed(self, client):
+        response = client.post('/users', json=body(password='short'))
+
+        assert response.status_code == 400
+        payload = response.json()
+        assert payload['message'] == 'Validation failed'
+        assert payload['path'] == '/users'
+        assert payload['errors'] == ['Password must be at least 12 characters']
+
+    def test_invalid_email(self, client):
+        response = client.post('/users', json=body(email='not-an-email'))
+
+        assert response.status_code == 400
+
+    def test_missing_field(self, client):
+        response = client.post('/users', json={'email': 'john@example.com'})
+
+        assert response.status_code == 400
+        assert response.json()['success'] is False
+
+    def test_conflict(self, client):
+        client.post('/users', json=body())
+
+        response = client.post('/users', json=body(email='JOHN@example.com'))
+
+        assert response.status_code == 409
+
+
+class TestRegisterUsersBatch:
+    def test_all_created(self, client, repository):
+        items = [body(email=f'user{i}@example.com') for i in range(250)]
+
+        response = client.post('/users:batch', json={'items': items})
+
+        assert response.status_code == 201
+        payload = response.json()
+        assert payload['created'] == 250
+        assert [item['index'] for item in payload['results']] == list(range(250))
+        assert len(repository.list()) == 250
+
+    def test_partial_failure(self, client):
+        client.post('/users', json=body(email='taken@example.com'))
+        items = [
+            body(email='new@example.com'),
+            body(email='taken@example.com'),
+            body(email='x@example.com', password='short'),
+        ]
+
+        response = client.post('/users:batch', json={'items': items})
+
+        assert response.status_code == 207
+        payload = response.json()
+        assert payload['success'] is False
+        assert (payload['created'], payload['failed']) == (1, 2)
+        assert [item['status'] for item in payload['results']] == [201, 409, 400]
+        assert payload['results'][0]['data']['email'] == 'new@example.com'
+
+    def test_rejects_oversized_batch(self, client):
+        items = [body(email=f'user{i}@example.com') for i in range(1001)]
+
+        response = client.post('/users:batch', json={'items': items})
+
+        assert response.status_code == 400
+
+
+class TestIdempotencyKey:
+    def test_retry_replays_first_response(self, client, executor):
+        headers = {'Idempotency-Key': 'abc'}
+
+        first = client.post('/users', json=body(), headers=headers)
+        retry = client.post('/users', json=body(), headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers['Idempotent-Replayed'] == 'true'
+        assert 'Idempotent-Replayed' not in first.headers
+        assert executor.executions == 1
+
+    def test_key_reused_for_other_body(self, client):
+        client.post('/users', json=body(), headers={'Idempotency-Key': 'abc'})
+
+        response = client.post(
+            '/users', json=body(email='other@example.com'), headers={'Idempotency-Key': 'abc'}
+        )
+
+        assert response.status_code == 422
+
+    def test_without_key_runs_every_time(self, client):
+        client.post('/users', json=body())
+
+        assert client.post('/users', json=body()).status_code == 409
+
+    def test_batch_retry_replays(self, client, repository):
+        items = [body(email=f'user{i}@example.com') for i in range(3)]
+        headers = {'Idempotency-Key': 'batch-1'}
+
+        first = client.post('/users:batch', json={'items': items}, headers=headers)
+        retry = client.post('/users:batch', json={'items': items}, headers=headers)
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert len(repository.list()) == 3
+
+
+class TestRateLimiting:
+    @pytest.fixture()
+    def client(self, repository, executor):
+        handler = RegisterUserAccountHandler(repository, Pbkdf2PasswordHasher(iterations=1_000))
+        rate_limiter = RegistrationRateLimiter(
+            by_domain=InMemoryRateLimiter(TokenBucketPolicy(2, 0.01)),
+            by_client=InMemoryRateLimiter(TokenBucketPolicy(5, 0.01)),
+        )
+        return TestClient(create_app(handler, executor, rate_limiter))
+
+    def test_domain_flood_gets_429(self, client, repository):
+        statuses = [
+            client.post('/users', json=body(email=f'user{i}@flood.io')).status_code
+            for i in range(3)
+        ]
+
+        assert statuses == [201, 201, 429]
+        assert len(repository.list()) == 2
+
+    def test_retry_after_header(self, client):
+        for i in range(2):
+            client.post('/users', json=body(email=f'user{i}@flood.io'))
+
+        response = client.post('/users', json=body(email='late@flood.io'))
+
+        assert response.headers['Retry-After'] == '100'
+        assert response.json()['message'] == 'Too many requests'
+
+    def test_client_budget_counts_requests(self, client):
+        items = [body(email=f'user{i}@domain{i}.com') for i in range(50)]
+        batch = client.post('/users:batch', json={'items': items})
+        statuses = [
+            client.post(
+                '/users', json=body(email=f'solo{i}@other{i}.com'), headers={'X-Client-Id': str(i)}
+            ).status_code
+            for i in range(5)
+        ]
+
+        assert batch.status_code == 201
+        assert statuses == [201, 201, 201, 201, 429]
+
+    def test_retry_replays_after_the_budget_is_spent(self, client, repository):
+        headers = {'Idempotency-Key': 'retry-1'}
+        first = client.post('/users', json=body(email='user0@flood.io'), headers=headers)
+        client.post('/users', json=body(email='user1@flood.io'))
+
+        retry = client.post('/users', json=body(email='user0@flood.io'), headers=headers)
+
+        assert client.post('/users', json=body(email='late@flood.io')).status_code == 429
+        assert retry.status_code == 201
+        assert retry.headers['Idempotent-Replayed'] == 'true'
+        assert retry.json() == first.json()
+        assert len(repository.list()) == 2
+
+    def test_rate_limited_attempt_is_not_stored(self, client):
+        for i in range(2):
+            client.post('/users', json=body(email=f'user{i}@flood.io'))
+        headers = {'Idempotency-Key': 'late-1'}
+
+        first = client.post('/users', json=body(email='late@flood.io'), headers=headers)
+        again = client.post('/users', json=body(email='late@flood.io'), headers=headers)
+
+        assert first.status_code == 429
+        assert again.status_code == 429
+        assert 'Idempotent-Replayed' not in again.headers
+
+    def test_batch_over_the_domain_budget_gets_413(self, client, repository):
+        items = [body(email=f'user{i}@flood.io') for i in range(3)]
+
+        response = client.post('/users:batch', json={'items': items})
+
+        assert response.status_code == 413
+        assert 'Retry-After' not in response.headers
+        assert repository.list() == []
+        assert client.post('/users', json=body(email='first@flood.io')).status_code == 201
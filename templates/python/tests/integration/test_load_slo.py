@@ -0,0 +1,44 @@
+"""Integration test: open-loop registration load judged by slos.yaml."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.application.use_cases.idempotency import IdempotentExecutor
+from src.application.use_cases.register_user_account import RegisterUserAccountHandler
+from src.infrastructure.http.app import create_app
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.observability.open_loop_load import run_open_loop
+from src.infrastructure.observability.slo_evaluation import evaluate, find_slo_file, load_slo_file
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+
+PASSWORD = 'correct-horse-battery'
+
+
+async def test_registration_load_meets_the_slos():
+    """Should register every user on schedule and pass the SLO file."""
+    handler = RegisterUserAccountHandler(
+        InMemoryUserRepository(), Pbkdf2PasswordHasher(iterations=1_000)
+    )
+    app = create_app(handler, IdempotentExecutor(InMemoryIdempotencyStore()))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://load') as client:
+
+        async def send(index):
+            response = await client.post(
+                '/users',
+                json={'email': f'load{index}@example.com', 'name': 'Load', 'password': PASSWORD},
+                headers={'Idempotency-Key': f'load-{index}'},
+            )
+            return response.status_code
+
+        result = await run_open_loop(send, rate=50, duration=0.6, warmup=0.1)
+
+    report = evaluate(load_slo_file(find_slo_file(Path(__file__).parent)), result)
+
+    assert result.statuses == {201: 25}
+    assert report.passed, report.to_dict()
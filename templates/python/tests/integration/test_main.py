@@ -0,0 +1,57 @@
+"""Smoke tests for the composition root."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import main
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.idempotency.redis_idempotency_store import RedisIdempotencyStore
+from src.infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+from src.infrastructure.rate_limiting.redis_rate_limiter import RedisRateLimiter
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture()
+def environment(monkeypatch):
+    for variable in ('REDIS_URL', 'PROFILING_ENABLED'):
+        monkeypatch.delenv(variable, raising=False)
+    monkeypatch.setenv('PASSWORD_HASH_ITERATIONS', '1000')
+    monkeypatch.setenv('RATE_LIMIT_DOMAIN_PER_MINUTE', '100')
+    monkeypatch.setenv('RATE_LIMIT_CLIENT_PER_MINUTE', '2')
+    return monkeypatch
+
+
+def test_build_app_wires_registration_idempotency_and_rate_limits(environment):
+    client = TestClient(main.build_app())
+    user = {'email': 'smoke@example.com', 'name': 'Smoke', 'password': 'correct-horse-battery'}
+
+    created = client.post('/users', json=user, headers={'Idempotency-Key': 'smoke-1'})
+    replayed = client.post('/users', json=user, headers={'Idempotency-Key': 'smoke-1'})
+    second = client.post('/users', json={**user, 'email': 'second@example.com'})
+    limited = client.post('/users', json={**user, 'email': 'other@example.com'})
+
+    assert created.status_code == 201
+    assert created.json()['data']['email'] == 'smoke@example.com'
+    assert replayed.headers['Idempotent-Replayed'] == 'true'
+    assert second.status_code == 201
+    assert limited.status_code == 429
+
+
+def test_backends_follow_the_redis_client(environment):
+    redis_client = object()
+
+    assert isinstance(main.build_idempotency_store(), InMemoryIdempotencyStore)
+    assert isinstance(main.build_idempotency_store(redis_client), RedisIdempotencyStore)
+    limiter = main.build_rate_limiter(redis_client)
+    assert isinstance(limiter._by_domain, RedisRateLimiter)
+    assert limiter._by_domain.policy.capacity == 100
+    assert isinstance(main.build_rate_limiter()._by_client, InMemoryRateLimiter)
+
+
+def test_redis_client_comes_from_redis_url(environment):
+    assert main._redis_client() is None
+
+    environment.setenv('REDIS_URL', 'redis://localhost:6379/0')
+
+    assert main._redis_client() is not None
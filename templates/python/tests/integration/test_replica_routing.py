@@ -0,0 +1,140 @@
+"""Integration tests for replica routing over simulated lagging replicas (sqlite3)."""
+
+import sqlite3
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.connection_pool import ConnectionPool
+from src.infrastructure.persistence.replica_routing import DatabaseNode, ReplicaRouter
+from src.infrastructure.persistence.simulated_replication import (
+    PRIMARY,
+    SimulatedReplication,
+    simulated_position,
+)
+
+pytestmark = pytest.mark.integration
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def replication(tmp_path, clock):
+    replication = SimulatedReplication(tmp_path, delay=1.0, clock=clock)
+    for name in ('replica-a', 'replica-b'):
+        replication.add_replica(name)
+    yield replication
+    replication.close()
+
+
+def node(replication, name):
+    pool = ConnectionPool(replication.connector(name), size=2)
+    return DatabaseNode(name, pool, simulated_position)
+
+
+def make_router(replication, clock, replicas=('replica-a', 'replica-b')):
+    router = ReplicaRouter(
+        node(replication, PRIMARY),
+        [node(replication, name) for name in replicas],
+        position_ttl=0.5,
+        clock=clock,
+    )
+    router.write(lambda users: users.create_schema())
+    clock.now += replication.delay
+    return router
+
+
+def make_user(index):
+    return User.create(Email.create(f'user{index}@example.com'), f'User {index}', 'hash')
+
+
+class TestReplicaRouter:
+    def test_caller_reads_its_own_write_while_replicas_lag(self, replication, clock):
+        router = make_router(replication, clock)
+        writer = router.session()
+        user = make_user(1)
+
+        writer.save(user)
+
+        assert writer.position > 0
+        assert writer.find_by_id(user.id).name == 'User 1'
+        assert writer.find_by_email(Email.create('USER1@example.com')).id == user.id
+        assert router.reads['lag_fallback'] == 2
+        # Another session tolerates the lag and reads a replica that has not replayed it.
+        assert router.session().find_by_id(user.id) is None
+
+    def test_reads_move_to_replicas_once_they_catch_up(self, replication, clock):
+        router = make_router(replication, clock)
+        writer = router.session()
+        user = make_user(1)
+        writer.save(user)
+        clock.now += replication.delay
+
+        primary_before = replication.statements[PRIMARY]
+        for _ in range(4):
+            assert writer.find_by_id(user.id) is not None
+
+        assert replication.statements[PRIMARY] == primary_before
+        assert replication.statements['replica-a'] > 0
+        assert replication.statements['replica-b'] > 0
+        assert router.reads['replica'] == 4
+
+    def test_resumed_session_keeps_read_your_writes(self, replication, clock):
+        router = make_router(replication, clock)
+        first = router.session()
+        users = [make_user(i) for i in range(3)]
+        first.save_all(users)
+
+        resumed = router.session(first.position)
+
+        found = resumed.find_by_emails(user.email for user in users)
+        assert sorted(user.id for user in found) == sorted(user.id for user in users)
+
+    def test_lagging_replicas_are_rechecked_at_most_once_per_ttl(self, replication, clock):
+        router = make_router(replication, clock)
+        writer = router.session()
+        writer.save(make_user(1))
+        before = replication.statements['replica-a'] + replication.statements['replica-b']
+
+        for _ in range(10):
+            writer.find_by_email(Email.create('user1@example.com'))
+
+        checks = (
+            replication.statements['replica-a']
+            + replication.statements['replica-b']
+            - before
+        )
+        assert checks == 2  # one position check per replica within the ttl
+        assert router.reads['lag_fallback'] == 10
+
+    def test_failed_write_keeps_position_and_rolls_back(self, replication, clock):
+        router = make_router(replication, clock)
+        session = router.session()
+        session.save(make_user(1))
+        position = session.position
+
+        with pytest.raises(sqlite3.IntegrityError):
+            session.save_all([make_user(2), make_user(1)])
+
+        assert session.position == position
+        assert session.find_by_email(Email.create('user2@example.com')) is None
+
+    def test_without_replicas_everything_reads_the_primary(self, replication, clock):
+        router = make_router(replication, clock, replicas=())
+        session = router.session()
+        session.save(make_user(1))
+
+        assert session.find_by_email(Email.create('user1@example.com')) is not None
+        assert router.reads == {'primary': 1}
@@ -0,0 +1,224 @@
+"""Integration tests for the sharded user repository (several sqlite3 databases)."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.application.ports.user_repository import (
+    ConcurrencyConflictError,
+    UserAlreadyExistsError,
+)
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.sharded_user_repository import ShardedUserRepository
+
+pytestmark = pytest.mark.integration
+
+
+def connect():
+    return sqlite3.connect(':memory:', check_same_thread=False)
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def connections():
+    conns = {f'shard-{i}': connect() for i in range(4)}
+    yield conns
+    for conn in conns.values():
+        conn.close()
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def repository(connections, clock):
+    repo = ShardedUserRepository(connections, batch_size=7, clock=clock)
+    repo.create_schema()
+    yield repo
+    repo.close()
+
+
+def make_user(index):
+    return User.create(
+        email=Email.create(f'user{index}@example.com'),
+        name=f'User {index}',
+        password_hash=f'hash{index}',
+    )
+
+
+def ids_on(connection):
+    return {row[0] for row in connection.execute('SELECT id FROM users')}
+
+
+def emails_on(connection):
+    return {row[0] for row in connection.execute('SELECT email FROM user_email_directory')}
+
+
+class TestShardedUserRepository:
+    def test_users_and_email_claims_land_on_their_owners(self, repository, connections):
+        users = [make_user(i) for i in range(60)]
+        repository.save_all(users)
+
+        for user in users:
+            owner = repository.shard_for(user.id)
+            assert user.id in ids_on(connections[owner])
+            assert user.version == 1
+        assert sum(len(ids_on(conn)) for conn in connections.values()) == 60
+        assert sum(len(emails_on(conn)) for conn in connections.values()) == 60
+        assert all(ids_on(conn) for conn in connections.values())
+
+    def test_lookups_by_id_and_email(self, repository):
+        users = [make_user(i) for i in range(30)]
+        repository.save_all(users)
+
+        assert repository.find_by_id(users[3].id).name == 'User 3'
+        assert repository.find_by_id('missing') is None
+        assert repository.find_by_email(Email.create('USER7@Example.com')).id == users[7].id
+        assert repository.find_by_email(Email.create('nobody@example.com')) is None
+
+    def test_find_by_emails_fans_out_and_merges(self, repository):
+        users = [make_user(i) for i in range(40)]
+        repository.save_all(users)
+        emails = [users[i].email for i in range(0, 40, 3)] + [Email.create('nobody@example.com')]
+
+        found = repository.find_by_emails(emails)
+
+        assert sorted(user.id for user in found) == sorted(users[i].id for i in range(0, 40, 3))
+
+    def test_email_is_unique_across_shards(self, repository, connections):
+        repository.save(make_user(1))
+        duplicate = User.create(Email.create('USER1@example.com'), 'Dup', 'h')
+        batch = [make_user(2), make_user(3), duplicate]
+
+        with pytest.raises(UserAlreadyExistsError):
+            repository.save_all(batch)
+
+        assert sum(len(ids_on(conn)) for conn in connections.values()) == 1
+        assert set().union(*(emails_on(conn) for conn in connections.values())) == {
+            'user1@example.com'
+        }
+
+    def test_saving_the_same_new_user_twice_is_not_a_conflict_on_claims(self, repository):
+        user = make_user(1)
+        repository._claim({'user1@example.com': user.id})
+
+        repository.save(user)
+
+        assert repository.find_by_email(user.email).id == user.id
+
+    def test_stale_claim_without_user_is_taken_over(self, repository, clock):
+        repository._claim({'user1@example.com': 'crashed-before-insert'})
+        with pytest.raises(UserAlreadyExistsError):
+            repository.save(make_user(1))
+
+        clock.now += 61
+        user = make_user(1)
+        repository.save(user)
+
+        assert repository.find_by_email(user.email).id == user.id
+
+    def test_updates_dirty_users_and_detects_conflicts(self, repository):
+        users = [make_user(i) for i in range(10)]
+        repository.save_all(users)
+        loaded = repository.find_by_ids(user.id for user in users)
+        for user in loaded:
+            user.change_name(f'Renamed {user.name}')
+
+        repository.save_all(loaded)
+
+        assert repository.find_by_id(users[0].id).name == 'Renamed User 0'
+        assert all(user.version == 2 for user in loaded)
+        stale = users[:3]
+        for user in stale:
+            user.change_name('Stale')
+        with pytest.raises(ConcurrencyConflictError) as conflict:
+            repository.save_all(stale)
+        assert set(conflict.value.user_ids) == {user.id for user in stale}
+
+    def test_online_add_shard_serves_reads_and_writes_before_and_after_moving(
+        self, repository, connections
+    ):
+        users = [make_user(i) for i in range(80)]
+        repository.save_all(users)
+        extra = connect()
+        repository.add_shard('shard-4', extra)
+        assert repository.rebalancing
+        assert 'shard-4' in repository.shard_names
+
+        # Before any row moved: everything is still readable and writable.
+        assert len(repository.find_by_ids(user.id for user in users)) == 80
+        assert len(repository.find_by_emails(user.email for user in users)) == 80
+        late = make_user(999)
+        repository.save(late)
+        user = repository.find_by_id(users[5].id)
+        user.change_name('Changed during rebalance')
+        repository.save(user)
+        with pytest.raises(UserAlreadyExistsError):
+            repository.save(User.create(users[9].email, 'Dup', 'h'))
+
+        moved = repository.rebalance(page_size=9)
+
+        assert not repository.rebalancing
+        assert moved == len(ids_on(extra)) - (repository.shard_for(late.id) == 'shard-4')
+        assert moved > 0
+        for user in [*users, late]:
+            assert user.id in ids_on(connections.get(repository.shard_for(user.id), extra))
+        total = sum(len(ids_on(conn)) for conn in [*connections.values(), extra])
+        assert total == 81
+        assert repository.find_by_id(users[5].id).name == 'Changed during rebalance'
+        assert len(repository.find_by_emails(user.email for user in users)) == 80
+        assert repository.rebalance() == 0
+
+    def test_remove_shard_drains_it(self, repository, connections):
+        users = [make_user(i) for i in range(50)]
+        repository.save_all(users)
+
+        repository.remove_shard('shard-0')
+        with pytest.raises(RuntimeError, match='in progress'):
+            repository.remove_shard('shard-1')
+        repository.rebalance(page_size=4)
+
+        assert repository.shard_names == ('shard-1', 'shard-2', 'shard-3')
+        assert ids_on(connections['shard-0']) == set()
+        assert emails_on(connections['shard-0']) == set()
+        assert len(repository.find_by_emails(user.email for user in users)) == 50
+
+    def test_reads_never_miss_rows_while_rebalancing_concurrently(self, repository):
+        users = [make_user(i) for i in range(200)]
+        repository.save_all(users)
+        repository.add_shard('shard-4', connect())
+        misses = []
+
+        def read():
+            while repository.rebalancing:
+                found = repository.find_by_ids(user.id for user in users)
+                if len(found) != len(users):
+                    misses.append(len(found))
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        repository.rebalance(page_size=5)
+        reader.join()
+
+        assert misses == []
+
+    def test_shard_management_errors(self, repository):
+        with pytest.raises(ValueError, match='already exists'):
+            repository.add_shard('shard-0', connect())
+        with pytest.raises(ValueError, match='Unknown node'):
+            repository.remove_shard('nope')
+        single = ShardedUserRepository({'only': connect()})
+        with pytest.raises(ValueError, match='last shard'):
+            single.remove_shard('only')
+        single.close()
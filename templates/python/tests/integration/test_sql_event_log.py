@@ -0,0 +1,83 @@
+"""Integration tests for the SQL event log and parallel replay (sqlite3)."""
+
+import functools
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from src.application.analytics.event_replay import replay
+from src.application.analytics.user_statistics import UserStatistics
+from src.application.ports.event_log import bucket_of
+from src.domain.entities.user import (
+    EmailVerifiedEvent,
+    UserCreatedEvent,
+    UserNameChangedEvent,
+    UserRole,
+)
+from src.infrastructure.persistence.file_replay_checkpoint_store import (
+    FileReplayCheckpointStore,
+)
+from src.infrastructure.persistence.sql_event_log import SqlEventLog
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture()
+def log(tmp_path):
+    log = SqlEventLog(functools.partial(sqlite3.connect, tmp_path / 'events.db'), batch_size=3)
+    log.create_schema()
+    moment = datetime(2024, 3, 1, 9, 30)
+    for index in range(40):
+        user_id = f'user-{index}'
+        events = [
+            UserCreatedEvent(
+                user_id=user_id,
+                email=f'u{index}@example.com',
+                role=UserRole.ADMIN.value if index == 0 else UserRole.USER.value,
+                name=f'User {index}',
+                occurred_at=moment,
+            )
+        ]
+        if index % 4 == 0:
+            events.append(EmailVerifiedEvent(user_id=user_id))
+        log.append(user_id, events)
+    log.connection.commit()
+    return log
+
+
+class TestSqlEventLog:
+    """Test suite for storing and reading events."""
+
+    def test_round_trips_events_by_bucket(self, log):
+        """Should read back the events of a bucket, fields intact, in order."""
+        log.append('user-7', [UserNameChangedEvent(user_id='user-7', name='Renamed')])
+
+        stored = list(log.read_bucket(bucket_of('user-7'), 0, log.head()))
+        mine = [item.event for item in stored if item.event.user_id == 'user-7']
+
+        assert [type(event) for event in mine] == [UserCreatedEvent, UserNameChangedEvent]
+        assert mine[0].email == 'u7@example.com'
+        assert mine[0].name == 'User 7'
+        assert mine[0].occurred_at == datetime(2024, 3, 1, 9, 30)
+        assert mine[1].name == 'Renamed'
+        assert [item.position for item in stored] == sorted(item.position for item in stored)
+        assert all(bucket_of(item.event.user_id) == bucket_of('user-7') for item in stored)
+
+    def test_head_is_read_from_the_table(self, log, tmp_path):
+        """Should find the head of an existing log."""
+        reopened = SqlEventLog(functools.partial(sqlite3.connect, tmp_path / 'events.db'))
+
+        assert reopened.head() == log.head() == 50
+
+    def test_parallel_replay_with_checkpoints(self, log, tmp_path):
+        """Should rebuild statistics in worker processes, each with its own connection."""
+        store = FileReplayCheckpointStore(tmp_path / 'checkpoints')
+
+        result = replay(log, UserStatistics, workers=2, checkpoints=store, checkpoint_every=4)
+
+        assert result.events == 50
+        assert result.projection.total == 40
+        assert result.projection.verified == 10
+        assert result.projection.admins == 1
+        assert store.load_all() == []
@@ -0,0 +1,229 @@
+"""Integration tests for the SQL User repository and unit of work (sqlite3)."""
+
+import sqlite3
+
+import pytest
+
+from src.application.ports.user_repository import ConcurrencyConflictError
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.sql_user_repository import SqlUserRepository
+from src.infrastructure.persistence.unit_of_work import SqlUserUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+class RecordingConnection:
+    """Wrap a sqlite3 connection and record every executed statement."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.statements = []
+
+    def cursor(self):
+        recorder = self
+
+        class _Cursor:
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            def execute(self, sql, params=()):
+                recorder.statements.append(sql)
+                return self._cursor.execute(sql, params)
+
+            def executemany(self, sql, rows):
+                recorder.statements.append(sql)
+                return self._cursor.executemany(sql, rows)
+
+            def fetchone(self):
+                return self._cursor.fetchone()
+
+            def fetchall(self):
+                return self._cursor.fetchall()
+
+        return _Cursor(self._connection.cursor())
+
+    def commit(self):
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+
+@pytest.fixture()
+def connection():
+    conn = sqlite3.connect(':memory:')
+    SqlUserRepository(conn).create_schema()
+    yield conn
+    conn.close()
+
+
+def make_user(index: int) -> User:
+    return User.create(
+        email=Email.create(f'user{index}@example.com'),
+        name=f'User {index}',
+        password_hash=f'hash{index}',
+    )
+
+
+def seed(connection, count: int) -> list[str]:
+    users = [make_user(i) for i in range(count)]
+    with SqlUserUnitOfWork(connection) as uow:
+        for user in users:
+            uow.users.save(user)
+    return [user.id for user in users]
+
+
+class TestSqlUserUnitOfWork:
+    """Test suite for dirty tracking, batching and optimistic locking."""
+
+    def test_commit_inserts_new_users_at_version_one(self, connection):
+        """Should insert new users and mark them persisted."""
+        user = make_user(1)
+
+        with SqlUserUnitOfWork(connection) as uow:
+            uow.users.save(user)
+
+        loaded = SqlUserRepository(connection).find_by_id(user.id)
+        assert loaded is not None
+        assert loaded.version == 1
+        assert loaded.email == user.email
+        assert loaded.password_hash == 'hash1'
+        assert user.is_new() is False
+
+    def test_find_by_email_is_case_insensitive(self, connection):
+        """Should match emails the same way Email.__eq__ does."""
+        seed(connection, 1)
+
+        found = SqlUserRepository(connection).find_by_email(Email.create('USER0@example.com'))
+
+        assert found is not None
+        assert found.name == 'User 0'
+
+    def test_find_by_emails_chunks_lookups(self, connection):
+        """Should load several users by email, batch_size emails per query."""
+        seed(connection, 5)
+        recorder = RecordingConnection(connection)
+        emails = [Email.create(f'USER{i}@example.com') for i in (0, 2, 4)]
+        emails.append(Email.create('missing@example.com'))
+
+        found = SqlUserRepository(recorder, batch_size=2).find_by_emails(emails)
+
+        assert sorted(user.name for user in found) == ['User 0', 'User 2', 'User 4']
+        assert len(recorder.statements) == 2
+
+    def test_iter_all_pages_by_id(self, connection):
+        """Should stream every user in id order with keyset pagination."""
+        ids = seed(connection, 5)
+        recorder = RecordingConnection(connection)
+
+        users = list(SqlUserRepository(recorder, batch_size=2).iter_all())
+
+        assert [user.id for user in users] == sorted(ids)
+        assert all(user.version == 1 for user in users)
+        assert len(recorder.statements) == 3
+        assert 'WHERE id >' in recorder.statements[-1]
+
+    def test_save_all_inserts_new_and_updates_dirty(self, connection):
+        """Should insert new users and write the changes of loaded ones."""
+        [user_id] = seed(connection, 1)
+        repository = SqlUserRepository(connection)
+        loaded = repository.find_by_id(user_id)
+        loaded.change_name('Renamed')
+        new_user = make_user(9)
+
+        repository.save_all([loaded, new_user])
+
+        assert repository.find_by_id(user_id).name == 'Renamed'
+        assert repository.find_by_id(new_user.id).version == 1
+        assert loaded.version == 2
+
+    def test_identity_map_returns_same_instance(self, connection):
+        """Should return the tracked instance on repeated lookups."""
+        [user_id] = seed(connection, 1)
+
+        with SqlUserUnitOfWork(connection) as uow:
+            assert uow.users.find_by_id(user_id) is uow.users.find_by_id(user_id)
+
+    def test_find_by_ids_loads_only_untracked_users(self, connection):
+        """Should answer tracked ids from the identity map and load the rest in one query."""
+        ids = seed(connection, 3)
+        recorder = RecordingConnection(connection)
+
+        with SqlUserUnitOfWork(recorder) as uow:
+            first = uow.users.find_by_id(ids[0])
+            found = uow.users.find_by_ids([ids[2], ids[0], 'missing', ids[2]])
+
+        assert [user.id for user in found] == [ids[2], ids[0]]
+        assert found[1] is first
+        assert len(recorder.statements) == 2
+
+    def test_clean_users_are_not_written(self, connection):
+        """Should issue no update when nothing changed."""
+        ids = seed(connection, 3)
+        recorder = RecordingConnection(connection)
+
+        with SqlUserUnitOfWork(recorder) as uow:
+            for user_id in ids:
+                uow.users.find_by_id(user_id)
+            recorder.statements.clear()
+
+        assert not any(sql.startswith('WITH dirty') for sql in recorder.statements)
+
+    def test_flush_groups_updates_by_dirty_columns(self, connection):
+        """Should emit one multi-row statement per dirty-column set and chunk."""
+        ids = seed(connection, 5)
+        recorder = RecordingConnection(connection)
+
+        with SqlUserUnitOfWork(recorder, batch_size=2) as uow:
+            users = [uow.users.find_by_id(user_id) for user_id in ids]
+            for user in users[:3]:
+                user.change_name(f'Renamed {user.id}')
+            for user in users[3:]:
+                user.verify_email()
+            recorder.statements.clear()
+
+        updates = [sql for sql in recorder.statements if sql.startswith('WITH dirty')]
+        assert len(updates) == 3
+        assert all('password_hash' not in sql for sql in updates)
+
+        reloaded = SqlUserRepository(connection).find_by_id(ids[0])
+        assert reloaded.name == f'Renamed {ids[0]}'
+        assert reloaded.version == 2
+        assert SqlUserRepository(connection).find_by_id(ids[4]).email_verified is True
+
+    def test_stale_version_raises_conflict_and_rolls_back(self, connection):
+        """Should reject a write based on an outdated version."""
+        [user_id] = seed(connection, 1)
+        repository = SqlUserRepository(connection)
+        stale = repository.find_by_id(user_id)
+
+        fresh = repository.find_by_id(user_id)
+        fresh.change_name('First Writer')
+        repository.save(fresh)
+        connection.commit()
+
+        stale.change_name('Second Writer')
+        with pytest.raises(ConcurrencyConflictError) as error, SqlUserUnitOfWork(connection) as uow:
+            uow.users.save(stale)
+
+        assert error.value.user_ids == (user_id,)
+        assert stale.is_dirty() is True
+        assert repository.find_by_id(user_id).name == 'First Writer'
+
+    def test_new_user_changed_before_flush_is_inserted_once(self, connection):
+        """Should insert the latest state without a follow-up update."""
+        user = make_user(1)
+        user.change_name('Changed Before Insert')
+        recorder = RecordingConnection(connection)
+
+        with SqlUserUnitOfWork(recorder) as uow:
+            uow.users.save(user)
+
+        assert not any(sql.startswith('WITH dirty') for sql in recorder.statements)
+        assert SqlUserRepository(connection).find_by_id(user.id).name == 'Changed Before Insert'
+
+    def test_rejects_non_positive_batch_size(self, connection):
+        """Should validate the batch size."""
+        with pytest.raises(ValueError, match='batch_size must be positive'):
+            SqlUserRepository(connection, batch_size=0)
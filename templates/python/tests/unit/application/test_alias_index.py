@@ -0,0 +1,46 @@
+"""Unit tests for the alias cluster index."""
+
+import pytest
+
+from src.application.dedupe import AliasCluster, AliasIndex
+from src.domain.value_objects.email import Email
+
+ENTRIES = [
+    ('u1', 'john.doe@gmail.com'),
+    ('u2', 'jane@example.com'),
+    ('u3', 'JohnDoe+promo@gmail.com'),
+    ('u4', 'john.doe+x@example.com'),
+    ('u5', 'j.o.h.n.d.o.e@googlemail.com'),
+    ('u6', 'JANE@example.com'),
+]
+
+
+@pytest.mark.parametrize('exact', [True, False])
+def test_finds_alias_clusters(exact):
+    index = AliasIndex(exact=exact)
+
+    index.add_all(ENTRIES)
+
+    assert list(index.clusters()) == [
+        AliasCluster('johndoe@gmail.com', ('u1', 'u3', 'u5')),
+        AliasCluster('jane@example.com', ('u2', 'u6')),
+    ]
+    assert len(index) == 3
+    assert index.size == 6
+
+
+def test_add_accepts_email_value_objects():
+    index = AliasIndex()
+
+    assert index.add(1, Email.create('John.Doe+a@gmail.com')) == 'johndoe@gmail.com'
+    index.add(2, 'johndoe@gmail.com')
+
+    assert [cluster.members for cluster in index.clusters()] == [(1, 2)]
+
+
+def test_no_clusters_without_aliases():
+    index = AliasIndex()
+
+    index.add_all([(i, f'user{i}@example.com') for i in range(10)])
+
+    assert list(index.clusters()) == []
@@ -0,0 +1,87 @@
+"""Unit tests for the email verification use case."""
+
+import pytest
+
+from src.application.ports.verification_tokens import ExpiredTokenError, InvalidTokenError
+from src.application.use_cases.email_verification import (
+    JOB_EXPIRY,
+    JOB_REMINDER,
+    EmailVerificationHandler,
+    VerificationJob,
+)
+from src.domain.entities.user import EmailVerifiedEvent, User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.hmac_verification_tokens import HmacVerificationTokens
+
+DAY = 24 * 3600.0
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return Clock()
+
+
+@pytest.fixture()
+def users():
+    return [User.create(Email.create(f'u{i}@example.com'), f'User {i}', 'hash') for i in range(3)]
+
+
+@pytest.fixture()
+def repository(users):
+    return InMemoryUserRepository(users)
+
+
+@pytest.fixture()
+def handler(repository, clock):
+    tokens = HmacVerificationTokens({'k1': b'k' * 32}, active_key='k1')
+    return EmailVerificationHandler(repository, tokens, clock=clock)
+
+
+class TestEmailVerificationHandler:
+    def test_click_verifies_once_and_is_idempotent(self, handler, repository, users):
+        token = handler.issue(users[0])
+        users[0].clear_domain_events()
+
+        verified = handler.verify(token)
+        again = handler.verify(token)
+
+        assert verified is again is repository.find_by_id(users[0].id)
+        assert verified.email_verified
+        assert [type(event) for event in verified.get_domain_events()] == [EmailVerifiedEvent]
+
+    def test_expired_and_foreign_tokens(self, handler, repository, users, clock):
+        token = handler.issue(users[0])
+        repository.clear()
+
+        with pytest.raises(InvalidTokenError, match='unknown user'):
+            handler.verify(token)
+        clock.now += 8 * DAY
+        with pytest.raises(ExpiredTokenError):
+            handler.verify(token)
+
+    def test_due_jobs_skip_verified_users(self, handler, users, clock):
+        for user in users:
+            handler.issue(user)
+        handler.verify(handler.issue(users[1]))
+
+        clock.now += DAY
+        reminders = handler.due()
+        clock.now += 6 * DAY
+        expiries = handler.due()
+
+        assert reminders == [
+            VerificationJob(JOB_REMINDER, users[0].id),
+            VerificationJob(JOB_REMINDER, users[2].id),
+        ]
+        assert [job.kind for job in expiries] == [JOB_EXPIRY, JOB_EXPIRY]
+        assert handler.due() == []
+        assert len(handler.scheduler) == 0
@@ -0,0 +1,181 @@
+"""Unit tests for partitioned event replay."""
+
+from datetime import datetime
+
+import pytest
+
+from src.application.analytics.event_replay import replay
+from src.application.analytics.user_statistics import UserStatistics
+from src.application.ports.event_log import BUCKETS, bucket_of
+from src.domain.entities.user import (
+    EmailVerifiedEvent,
+    UserCreatedEvent,
+    UserNameChangedEvent,
+)
+from src.infrastructure.persistence.file_replay_checkpoint_store import (
+    FileReplayCheckpointStore,
+)
+from src.infrastructure.persistence.in_memory_event_log import InMemoryEventLog
+
+
+class UserHistory:
+    """Projection recording each user's events in the order they were applied."""
+
+    def __init__(self):
+        self.events = {}
+
+    def apply(self, event):
+        if isinstance(event, UserCreatedEvent):
+            assert event.user_id not in self.events, 'created twice'
+            self.events[event.user_id] = ['created']
+        elif isinstance(event, EmailVerifiedEvent):
+            self.events[event.user_id].append('verified')
+        elif isinstance(event, UserNameChangedEvent):
+            self.events[event.user_id].append(event.name)
+
+    def merge(self, other):
+        assert not self.events.keys() & other.events.keys(), 'partitions overlap'
+        self.events.update(other.events)
+
+
+class CrashingHistory(UserHistory):
+    """Fails once it has seen `limit` events, like a worker killed mid-replay."""
+
+    limit = 10**9
+
+    def apply(self, event):
+        super().apply(event)
+        if sum(len(events) for events in self.events.values()) >= self.limit:
+            raise RuntimeError('crash')
+
+
+def build_log(users: int = 60) -> InMemoryEventLog:
+    log = InMemoryEventLog()
+    moment = datetime(2024, 1, 1)
+    for index in range(users):
+        user_id = f'user-{index}'
+        domain = 'example.com' if index % 3 else 'gmail.com'
+        log.append(
+            user_id,
+            [UserCreatedEvent(user_id=user_id, email=f'u{index}@{domain}', occurred_at=moment)],
+        )
+    for index in range(0, users, 2):  # interleave later events of many users
+        user_id = f'user-{index}'
+        log.append(user_id, [UserNameChangedEvent(user_id=user_id, name=f'first {index}')])
+        log.append(user_id, [EmailVerifiedEvent(user_id=user_id)])
+        log.append(user_id, [UserNameChangedEvent(user_id=user_id, name=f'second {index}')])
+    return log
+
+
+def expected_history(users: int = 60):
+    return {
+        f'user-{index}': (
+            ['created', f'first {index}', 'verified', f'second {index}']
+            if index % 2 == 0
+            else ['created']
+        )
+        for index in range(users)
+    }
+
+
+class TestEventLog:
+    """Test suite for the bucketed in-memory log."""
+
+    def test_reads_a_bucket_in_a_position_range(self):
+        """Should return only the bucket's events within (after, until]."""
+        log = build_log()
+        bucket = bucket_of('user-0')
+
+        positions = [stored.position for stored in log.read_bucket(bucket, 0, log.head())]
+        later = [stored.position for stored in log.read_bucket(bucket, positions[0], positions[2])]
+
+        assert positions == sorted(positions)
+        assert later == positions[1:3]
+        assert 0 <= bucket < BUCKETS
+
+
+class TestReplay:
+    """Test suite for the partitioned replay engine."""
+
+    @pytest.mark.parametrize(('workers', 'partitions'), [(1, 1), (1, 7), (2, 4)])
+    def test_keeps_per_user_order_across_partitions(self, workers, partitions):
+        """Should apply each user's events in log order whatever the partitioning."""
+        log = build_log()
+
+        result = replay(log, UserHistory, workers=workers, partitions=partitions)
+
+        assert result.projection.events == expected_history()
+        assert result.events == result.replayed == log.head()
+        assert result.head == log.head()
+
+    def test_merged_statistics_match_a_single_pass(self):
+        """Should merge partial statistics into the same totals as a serial replay."""
+        log = build_log()
+
+        serial = replay(log, UserStatistics).projection
+        merged = replay(log, UserStatistics, partitions=5).projection
+
+        assert merged.to_dict() == serial.to_dict()
+        assert merged.total == 60
+        assert merged.verified == 30
+
+    def test_resumes_from_checkpoints_after_a_crash(self, tmp_path):
+        """Should continue from saved progress and clear it once done."""
+        log = build_log()
+        store = FileReplayCheckpointStore(tmp_path)
+        CrashingHistory.limit = 50
+        with pytest.raises(RuntimeError, match='crash'):
+            replay(log, CrashingHistory, partitions=3, checkpoints=store, checkpoint_every=5)
+        saved = store.load_all()
+        assert saved
+        assert all(checkpoint.head == log.head() for checkpoint in saved)
+
+        CrashingHistory.limit = 10**9
+        log.append('late-user', [UserCreatedEvent(user_id='late-user', email='late@example.com')])
+        result = replay(log, CrashingHistory, partitions=3, checkpoints=store, checkpoint_every=5)
+
+        assert result.projection.events == expected_history()  # up to the original head
+        assert result.head == log.head() - 1
+        assert result.events == result.head
+        assert 0 < result.replayed < result.events
+        assert store.load_all() == []
+
+    def test_discards_checkpoints_of_another_partitioning(self, tmp_path):
+        """Should start over when the stored checkpoints used other partitions."""
+        log = build_log()
+        store = FileReplayCheckpointStore(tmp_path)
+        CrashingHistory.limit = 20
+        with pytest.raises(RuntimeError, match='crash'):
+            replay(log, CrashingHistory, partitions=2, checkpoints=store, checkpoint_every=5)
+        CrashingHistory.limit = 10**9
+
+        result = replay(log, CrashingHistory, partitions=3, checkpoints=store)
+
+        assert result.replayed == result.events == log.head()
+        assert result.projection.events == expected_history()
+
+    def test_discards_checkpoints_of_another_projection(self, tmp_path):
+        """Should start over when the stored checkpoints were built by another factory."""
+        log = build_log()
+        store = FileReplayCheckpointStore(tmp_path)
+        CrashingHistory.limit = 20
+        with pytest.raises(RuntimeError, match='crash'):
+            replay(log, CrashingHistory, partitions=2, checkpoints=store, checkpoint_every=5)
+        CrashingHistory.limit = 10**9
+        assert {checkpoint.factory for checkpoint in store.load_all()} == {
+            f'{__name__}.CrashingHistory'
+        }
+
+        result = replay(log, UserHistory, partitions=2, checkpoints=store)
+
+        assert type(result.projection) is UserHistory
+        assert result.replayed == result.events == log.head()
+        assert result.projection.events == expected_history()
+
+    def test_rejects_invalid_settings(self):
+        """Should refuse non-positive sizes and more partitions than buckets."""
+        log = build_log()
+        with pytest.raises(ValueError, match='must be positive'):
+            replay(log, UserHistory, workers=0)
+        with pytest.raises(ValueError, match='cannot exceed'):
+            replay(log, UserHistory, partitions=BUCKETS + 1)
@@ -0,0 +1,160 @@
+"""Unit tests for idempotent execution."""
+
+import threading
+
+import pytest
+
+from src.application.ports.idempotency_store import StoredResponse
+from src.application.use_cases.idempotency import (
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+    IdempotentExecutor,
+    request_fingerprint,
+)
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+
+
+def response(body=b'{"ok": true}', status_code=201):
+    return StoredResponse('', status_code, body)
+
+
+@pytest.fixture()
+def store():
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture()
+def executor(store):
+    return IdempotentExecutor(store, wait_timeout=0.2, poll_interval=0.01)
+
+
+def test_fingerprint_ignores_key_order():
+    assert request_fingerprint('post', '/users', {'a': 1, 'b': 2}) == request_fingerprint(
+        'POST', '/users', {'b': 2, 'a': 1}
+    )
+    assert request_fingerprint('POST', '/users', {'a': 1}) != request_fingerprint(
+        'POST', '/users', {'a': 2}
+    )
+
+
+def test_fingerprint_leaves_passwords_out():
+    single = {'email': 'a@example.com', 'password': 'first-secret'}
+    batch = {'items': [single]}
+
+    assert request_fingerprint('POST', '/users', single) == request_fingerprint(
+        'POST', '/users', {**single, 'password': 'other-secret'}
+    )
+    assert request_fingerprint('POST', '/b', batch) == request_fingerprint(
+        'POST', '/b', {'items': [{'email': 'a@example.com'}]}
+    )
+
+
+def test_runs_once_and_replays(executor):
+    calls = []
+
+    def operation():
+        calls.append(1)
+        return response()
+
+    first, first_replayed = executor.execute('key', 'fp', operation)
+    second, second_replayed = executor.execute('key', 'fp', operation)
+
+    assert len(calls) == 1
+    assert (first_replayed, second_replayed) == (False, True)
+    assert first == second
+    assert first.fingerprint == 'fp'
+    assert (executor.executions, executor.replays) == (1, 1)
+
+
+def test_rejects_key_reused_for_other_request(executor):
+    executor.execute('key', 'fp', response)
+
+    with pytest.raises(IdempotencyKeyReusedError):
+        executor.execute('key', 'other', response)
+
+
+def test_failed_operation_is_not_stored(executor):
+    def failing():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        executor.execute('key', 'fp', failing)
+
+    _, replayed = executor.execute('key', 'fp', response)
+    assert replayed is False
+
+
+def test_coalesces_concurrent_duplicates(executor):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return response()
+
+    results = []
+
+    def call():
+        results.append(executor.execute('key', 'fp', slow))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 6
+    assert sum(1 for _, replayed in results if replayed) == 5
+
+
+def test_coalesced_waiters_see_the_error(executor):
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('boom')
+
+    def call():
+        try:
+            executor.execute('key', 'fp', failing)
+        except RuntimeError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    started.wait(5)
+    threads.append(threading.Thread(target=call))
+    threads[1].start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+
+
+def test_waits_for_other_process_holding_the_lock(store, executor):
+    store.acquire('key', 30)
+    store.put('key', StoredResponse('fp', 201, b'{}'), 60)
+
+    stored, replayed = executor.execute('key', 'fp', response)
+
+    assert replayed is True
+    assert stored.body == b'{}'
+
+
+def test_gives_up_when_other_process_does_not_finish(store, executor):
+    store.acquire('key', 30)
+
+    with pytest.raises(IdempotencyInProgressError):
+        executor.execute('key', 'fp', response)
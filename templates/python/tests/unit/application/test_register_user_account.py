@@ -0,0 +1,125 @@
+"""Unit tests for the RegisterUserAccount use case."""
+
+import pytest
+
+from src.application.ports.user_repository import UserAlreadyExistsError
+from src.application.use_cases.register_user_account import (
+    STATUS_CONFLICT,
+    STATUS_CREATED,
+    STATUS_INVALID,
+    InvalidCommandError,
+    RegisterUserAccountCommand,
+    RegisterUserAccountHandler,
+)
+from src.domain.entities.user import UserCreatedEvent, UserRole
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+
+PASSWORD = 'correct-horse-battery'
+
+
+class FakeHasher:
+    def hash(self, plain_password):
+        return f'hashed:{plain_password}'
+
+    def verify(self, plain_password, password_hash):
+        return password_hash == f'hashed:{plain_password}'
+
+
+class CountingRepository(InMemoryUserRepository):
+    def __init__(self):
+        self.calls = []
+        super().__init__()
+
+    def find_by_emails(self, emails):
+        self.calls.append('find_by_emails')
+        return super().find_by_emails(emails)
+
+    def save_all(self, users):
+        self.calls.append('save_all')
+        super().save_all(users)
+
+
+@pytest.fixture()
+def repository():
+    return CountingRepository()
+
+
+@pytest.fixture()
+def handler(repository):
+    return RegisterUserAccountHandler(repository, FakeHasher())
+
+
+def command(email='john@example.com', name='John Doe', password=PASSWORD, role=None):
+    return RegisterUserAccountCommand.create(email, name, password, role)
+
+
+class TestRegisterUserAccountCommand:
+    def test_normalizes_input(self):
+        cmd = command(email='  John@Example.COM ', name=' John ', role='admin')
+
+        assert cmd.email == 'john@example.com'
+        assert cmd.name == 'John'
+        assert cmd.role == UserRole.ADMIN
+
+    def test_reports_every_error(self):
+        with pytest.raises(InvalidCommandError) as exc_info:
+            command(email=' ', name='', password='short', role='root')
+
+        assert exc_info.value.errors == [
+            'Email is required',
+            'Name is required',
+            'Password must be at least 12 characters',
+            'Invalid role: root',
+        ]
+
+
+class TestExecute:
+    def test_registers_user(self, handler, repository):
+        result = handler.execute(command())
+
+        assert result.user_snapshot['email'] == 'john@example.com'
+        assert 'password_hash' not in result.user_snapshot
+        assert isinstance(result.domain_events[0], UserCreatedEvent)
+        stored = repository.find_by_id(result.user_snapshot['id'])
+        assert stored.password_hash == f'hashed:{PASSWORD}'
+        assert not stored.is_new()
+
+    def test_rejects_registered_email(self, handler):
+        handler.execute(command())
+
+        with pytest.raises(UserAlreadyExistsError):
+            handler.execute(command(email='JOHN@example.com'))
+
+
+class TestExecuteBatch:
+    def test_reports_each_item(self, handler, repository):
+        handler.execute(command(email='taken@example.com'))
+        repository.calls.clear()
+        commands = [
+            command(email='a@example.com'),
+            command(email='taken@example.com'),
+            command(email='bad-email'),
+            command(email='a@example.com'),
+            InvalidCommandError(['Name is required']),
+            command(email='b@tempmail.com'),
+            command(email='c@example.com'),
+        ]
+
+        results = handler.execute_batch(commands)
+
+        assert [item.status for item in results] == [
+            STATUS_CREATED,
+            STATUS_CONFLICT,
+            STATUS_INVALID,
+            STATUS_CONFLICT,
+            STATUS_INVALID,
+            STATUS_INVALID,
+            STATUS_CREATED,
+        ]
+        assert [item.index for item in results] == list(range(7))
+        assert results[4].errors == ['Name is required']
+        assert repository.calls == ['find_by_emails', 'save_all']
+        assert len(repository.list()) == 3
+
+    def test_empty_batch(self, handler):
+        assert handler.execute_batch([]) == []
@@ -0,0 +1,81 @@
+"""Unit tests for registration rate limiting."""
+
+import pytest
+
+from src.application.ports.rate_limiter import TokenBucketPolicy
+from src.application.use_cases.registration_rate_limit import (
+    RegistrationBatchTooLargeError,
+    RegistrationRateLimitedError,
+    RegistrationRateLimiter,
+)
+from src.domain.value_objects.email import Email
+from src.infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+
+
+def limiter(domain_capacity=2, client_capacity=10):
+    return RegistrationRateLimiter(
+        by_domain=InMemoryRateLimiter(TokenBucketPolicy(domain_capacity, 0.001)),
+        by_client=InMemoryRateLimiter(TokenBucketPolicy(client_capacity, 0.001)),
+    )
+
+
+def test_limits_per_domain():
+    registrations = limiter()
+    registrations.check([Email.create('a@spam.io')], 'c1')
+    registrations.check([Email.create('b@SPAM.io')], 'c2')
+
+    with pytest.raises(RegistrationRateLimitedError) as exc_info:
+        registrations.check([Email.create('c@spam.io')], 'c3')
+
+    assert exc_info.value.scope == 'domain'
+    assert exc_info.value.key == 'spam.io'
+    assert exc_info.value.retry_after > 0
+    registrations.check([Email.create('a@example.com')], 'c3')
+
+
+def test_limits_client_requests():
+    registrations = limiter(domain_capacity=100, client_capacity=2)
+    registrations.check([Email.create('a@one.com'), Email.create('b@two.com')], 'client')
+    registrations.check([Email.create(f'c{i}@three.com') for i in range(5)], 'client')
+
+    with pytest.raises(RegistrationRateLimitedError) as exc_info:
+        registrations.check([Email.create('d@four.com')], 'client')
+
+    assert exc_info.value.scope == 'client'
+
+
+def test_batch_costs_one_domain_token_per_email():
+    registrations = limiter(domain_capacity=3)
+    registrations.check([Email.create(f'u{i}@bulk.com') for i in range(2)], 'client')
+
+    with pytest.raises(RegistrationRateLimitedError):
+        registrations.check([Email.create(f'v{i}@bulk.com') for i in range(2)], 'client')
+
+
+def test_batch_over_domain_capacity_is_too_large():
+    registrations = limiter(domain_capacity=3)
+
+    with pytest.raises(RegistrationBatchTooLargeError) as exc_info:
+        registrations.check([Email.create(f'u{i}@bulk.com') for i in range(4)], 'client')
+
+    assert (exc_info.value.domain, exc_info.value.count) == ('bulk.com', 4)
+    registrations.check([Email.create(f'u{i}@bulk.com') for i in range(3)], 'client')
+
+
+def test_rejection_takes_no_tokens():
+    by_domain = InMemoryRateLimiter(TokenBucketPolicy(2, 0.001))
+    by_client = InMemoryRateLimiter(TokenBucketPolicy(10, 0.001))
+    registrations = RegistrationRateLimiter(by_domain, by_client)
+    registrations.check([Email.create('a@spam.io'), Email.create('b@spam.io')], 'other')
+
+    with pytest.raises(RegistrationRateLimitedError):
+        registrations.check([Email.create('a@ok.com'), Email.create('c@spam.io')], 'client')
+
+    assert by_client.acquire('client:client', 0).remaining == pytest.approx(10)
+    assert by_domain.acquire('domain:ok.com', 0).remaining == pytest.approx(2)
+
+
+def test_client_check_is_optional():
+    registrations = RegistrationRateLimiter(InMemoryRateLimiter(TokenBucketPolicy(5, 1)))
+
+    registrations.check([Email.create('a@example.com')], None)
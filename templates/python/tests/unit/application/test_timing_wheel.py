@@ -0,0 +1,78 @@
+"""Unit tests for the hierarchical timing wheel."""
+
+import math
+import random
+
+import pytest
+
+from src.application.scheduling import TimingWheel
+
+
+class TestTimingWheel:
+    def test_fires_each_timer_at_its_tick(self):
+        wheel = TimingWheel(tick=0.5, start=10)
+        wheel.schedule(12.2, 'b')
+        wheel.schedule(11.0, 'a')
+        wheel.schedule(12.4, 'c')
+
+        assert wheel.advance(10.9) == []
+        assert wheel.advance(11.0) == ['a']
+        assert wheel.advance(13) == ['b', 'c']
+        assert len(wheel) == 0
+        assert wheel.now == 13.5
+
+    def test_past_deadlines_fire_at_the_next_tick(self):
+        wheel = TimingWheel(start=100)
+        wheel.advance(105)
+
+        wheel.schedule(50, 'late')
+
+        assert wheel.advance(105) == []
+        assert wheel.advance(106) == ['late']
+
+    def test_cancelled_and_fired_timers(self):
+        wheel = TimingWheel()
+        kept = wheel.schedule(5, 'kept')
+        dropped = wheel.schedule(5, 'dropped')
+
+        assert wheel.cancel(dropped)
+        assert not wheel.cancel(dropped)
+        assert len(wheel) == 1
+        assert wheel.advance(5) == ['kept']
+        assert not wheel.cancel(kept)
+
+    def test_deadlines_beyond_the_wheel_are_parked(self):
+        wheel = TimingWheel(bits=(2, 2))  # 16 ticks of range
+
+        wheel.schedule(40, 'far')
+
+        assert wheel.advance(39) == []
+        assert wheel.advance(40) == ['far']
+
+    @pytest.mark.parametrize('bits', [(1,), (2, 2, 2), (8, 6, 6, 6, 6)])
+    def test_matches_a_reference_under_random_load(self, bits):
+        rng = random.Random(7)
+        wheel = TimingWheel(bits=bits, start=3)
+        pending = {}
+        now = 3.0
+        for step in range(2_000):
+            for n in range(rng.randrange(4)):
+                deadline = now + rng.choice([-2, 5, 300, 9_000]) * rng.random()
+                pending[step, n] = (wheel.schedule(deadline, (step, n)), deadline)
+            if pending and rng.random() < 0.2:
+                timer, _ = pending.pop(rng.choice(list(pending)))
+                wheel.cancel(timer)
+            now += rng.random() * 3
+
+            for key in wheel.advance(now):
+                _, deadline = pending.pop(key)
+                assert math.ceil(deadline) <= math.floor(now)
+
+            assert all(timer.deadline > math.floor(now) for timer, _ in pending.values())
+        assert len(wheel) == len(pending)
+
+    def test_rejects_bad_configuration(self):
+        with pytest.raises(ValueError, match='tick'):
+            TimingWheel(tick=0)
+        with pytest.raises(ValueError, match='bits'):
+            TimingWheel(bits=())
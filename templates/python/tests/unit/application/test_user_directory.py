@@ -0,0 +1,190 @@
+"""Unit tests for the event-driven user directory projection."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.application.analytics.user_directory import OrderedIndex, UserDirectory
+from src.domain.entities.user import User, UserCreatedEvent, UserRole
+from src.domain.value_objects.email import Email
+
+START = datetime(2024, 1, 1)
+
+
+def make_user(index, role=UserRole.USER, verified=False):
+    created = START + timedelta(minutes=index)
+    return User.from_persistence(
+        id=f'user-{index}',
+        email=Email.create(f'user{index}@example.com'),
+        name=f'User {index}',
+        password_hash='hash',
+        role=role,
+        email_verified=verified,
+        created_at=created,
+        updated_at=created,
+    )
+
+
+def listing(directory, **filters):
+    return [entry.user_id for entry in directory.page(limit=1_000, **filters).entries]
+
+
+@pytest.fixture()
+def population():
+    rng = random.Random(7)
+    return [
+        make_user(index, rng.choice(list(UserRole)), rng.random() < 0.5) for index in range(300)
+    ]
+
+
+def expected(users, role=None, verified=None):
+    order = list(UserRole)
+    matching = [
+        user
+        for user in users
+        if (role is None or user.role == role)
+        and (verified is None or user.email_verified == verified)
+    ]
+    matching.sort(key=lambda user: user.created_at, reverse=True)
+    if role is not None or verified is not None:
+        matching.sort(key=lambda user: (order.index(user.role), not user.email_verified))
+    return [user.id for user in matching]
+
+
+class TestOrderedIndex:
+    def test_matches_a_sorted_list_under_random_inserts_and_removes(self):
+        rng = random.Random(1)
+        index = OrderedIndex(load=4)
+        reference = []
+
+        for _ in range(2_000):
+            if reference and rng.random() < 0.4:
+                key = rng.choice(reference)
+                reference.remove(key)
+                index.remove(key)
+            else:
+                key = rng.randrange(500)
+                reference.append(key)
+                index.add(key)
+            reference.sort()
+
+        assert list(index) == reference
+        assert len(index) == len(reference)
+        assert index.slice(10, 35) == reference[10:35]
+        for key in (-1, 0, 250, 499, 500):
+            assert index.rank(key) == sum(1 for item in reference if item < key)
+
+    def test_remove_missing_key_raises(self):
+        index = OrderedIndex([1, 3, 5], load=2)
+
+        with pytest.raises(KeyError):
+            index.remove(4)
+        with pytest.raises(KeyError):
+            index.remove(6)
+
+    def test_slice_clamps_out_of_range_bounds(self):
+        index = OrderedIndex(range(10), load=3)
+
+        assert index.slice(-5, 3) == [0, 1, 2]
+        assert index.slice(8, 50) == [8, 9]
+        assert index.slice(20, 30) == []
+
+
+class TestUserDirectory:
+    @pytest.mark.parametrize(
+        ('role', 'verified'),
+        [
+            (None, None),
+            (UserRole.ADMIN, None),
+            ('guest', False),
+            (None, True),
+            (UserRole.USER, True),
+        ],
+    )
+    def test_rebuild_lists_in_directory_order(self, population, role, verified):
+        directory = UserDirectory.from_users(population, load=8)
+
+        assert listing(directory, role=role, verified=verified) == expected(
+            population, role, verified
+        )
+        assert directory.count(role=role, verified=verified) == len(
+            expected(population, role, verified)
+        )
+
+    def test_events_keep_views_equal_to_a_rebuild(self, population):
+        directory = UserDirectory(load=8)
+        users = []
+        for user in population:
+            fresh = User.create(user.email, user.name, 'hash', role=user.role)
+            if user.email_verified:
+                fresh.verify_email()
+            directory.apply_all(fresh.get_domain_events())
+            users.append(fresh)
+
+        rebuilt = UserDirectory.from_users(users, load=8)
+
+        for filters in ({}, {'role': UserRole.GUEST}, {'verified': True}, {'verified': False}):
+            assert listing(directory, **filters) == listing(rebuilt, **filters)
+            assert listing(directory, **filters) == expected(users, **filters)
+
+    def test_parallel_rebuild_matches_serial_rebuild(self, population):
+        serial = UserDirectory.from_users(population)
+        parallel = UserDirectory.from_users(population, workers=2)
+
+        assert listing(parallel) == listing(serial)
+        assert listing(parallel, verified=False) == listing(serial, verified=False)
+
+    def test_pages_walk_the_listing_across_groups(self, population):
+        directory = UserDirectory.from_users(population, load=8)
+        walked = []
+        offset = 0
+        while offset is not None:
+            page = directory.page(verified=True, offset=offset, limit=17)
+            walked.extend(entry.user_id for entry in page.entries)
+            offset = page.next_offset
+
+        assert walked == expected(population, verified=True)
+        assert directory.page(offset=10_000).entries == []
+
+    def test_entries_decode_the_listed_state(self):
+        user = make_user(5, UserRole.ADMIN, verified=True)
+        directory = UserDirectory.from_users([user])
+
+        [entry] = directory.page().entries
+
+        assert entry.user_id == 'user-5'
+        assert entry.role is UserRole.ADMIN
+        assert entry.email_verified is True
+        assert entry.created_at == user.created_at
+
+    def test_replayed_and_unknown_events_are_ignored(self):
+        directory = UserDirectory()
+        user = User.create(Email.create('a@example.com'), 'A', 'hash')
+        user.verify_email()
+        events = user.get_domain_events()
+
+        directory.apply_all(events + events)
+        directory.mark_verified('unknown')
+
+        assert len(directory) == 1
+        assert user.id in directory
+        assert directory.count(verified=True) == 1
+
+    def test_aware_creation_times_are_normalized_to_utc(self):
+        directory = UserDirectory()
+        local = timezone(timedelta(hours=2))
+        directory.apply(
+            UserCreatedEvent(
+                user_id='late', email='late@example.com', occurred_at=datetime(2024, 1, 1, 12)
+            )
+        )
+        directory.apply(
+            UserCreatedEvent(
+                user_id='early',
+                email='early@example.com',
+                occurred_at=datetime(2024, 1, 1, 13, tzinfo=local),
+            )
+        )
+
+        assert listing(directory) == ['late', 'early']
@@ -0,0 +1,152 @@
+"""Unit tests for the batching user loader."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.application.loaders import UserLoader
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+class CountingRepository(InMemoryUserRepository):
+    def __init__(self, seed=()):
+        self.calls = []
+        self.failures = 0
+        super().__init__(seed)
+
+    def find_by_ids(self, user_ids):
+        user_ids = list(user_ids)
+        self.calls.append(('ids', sorted(user_ids)))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError('database unavailable')
+        return super().find_by_ids(user_ids)
+
+    def find_by_emails(self, emails):
+        emails = list(emails)
+        self.calls.append(('emails', sorted(email.value for email in emails)))
+        return super().find_by_emails(emails)
+
+
+@pytest.fixture()
+def users():
+    return [
+        User.create(Email.create(f'user{i}@example.com'), f'User {i}', 'hash') for i in range(5)
+    ]
+
+
+@pytest.fixture()
+def repository(users):
+    return CountingRepository(users)
+
+
+async def test_loads_of_one_tick_share_one_query(repository, users):
+    loader = UserLoader(repository)
+    ids = [users[0].id, users[1].id, users[0].id, 'missing']
+
+    found = await asyncio.gather(*(loader.load(user_id) for user_id in ids))
+
+    assert found == [users[0], users[1], users[0], None]
+    assert repository.calls == [('ids', sorted([users[0].id, users[1].id, 'missing']))]
+
+
+async def test_results_are_cached_per_loader(repository, users):
+    loader = UserLoader(repository)
+
+    assert await loader.load(users[2].id) is users[2]
+    assert await loader.load(users[2].id) is users[2]
+    assert await loader.load_many([users[2].id, users[3].id]) == [users[2], users[3]]
+
+    assert [call[1] for call in repository.calls] == [[users[2].id], [users[3].id]]
+    assert await UserLoader(repository).load(users[2].id) is users[2]
+    assert len(repository.calls) == 3
+
+
+async def test_emails_are_deduplicated_case_insensitively(repository, users):
+    loader = UserLoader(repository)
+
+    found = await asyncio.gather(
+        loader.load_by_email(Email.create('USER1@example.com')),
+        loader.load_by_email(Email.create('user1@EXAMPLE.com')),
+        loader.load_by_email(Email.create('nobody@example.com')),
+    )
+
+    assert found == [users[1], users[1], None]
+    assert repository.calls == [('emails', ['USER1@example.com', 'nobody@example.com'])]
+
+
+async def test_a_user_found_by_email_answers_its_id(repository, users):
+    loader = UserLoader(repository)
+
+    await loader.load_by_email(users[4].email)
+
+    assert await loader.load(users[4].id) is users[4]
+    assert len(repository.calls) == 1
+
+
+async def test_max_batch_splits_queries(repository, users):
+    loader = UserLoader(repository, max_batch=2)
+
+    await loader.load_many([user.id for user in users])
+
+    assert [len(keys) for _, keys in repository.calls] == [2, 2, 1]
+    assert loader.batches == 3
+
+
+async def test_failures_reach_every_caller_and_are_not_cached(repository, users):
+    repository.failures = 1
+    loader = UserLoader(repository)
+
+    results = await asyncio.gather(
+        loader.load(users[0].id), loader.load(users[1].id), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert await loader.load(users[0].id) is users[0]
+
+
+async def test_prime_and_clear(repository, users):
+    loader = UserLoader(repository)
+    newcomer = User.create(Email.create('new@example.com'), 'New', 'hash')
+
+    loader.prime(newcomer)
+    assert await loader.load(newcomer.id) is newcomer
+    assert await loader.load_by_email(Email.create('NEW@example.com')) is newcomer
+    assert repository.calls == []
+
+    loader.clear(newcomer)
+    assert await loader.load(newcomer.id) is None
+    loader.clear_all()
+    assert await loader.load(newcomer.id) is None
+    assert len(repository.calls) == 2
+
+
+async def test_cancelled_caller_does_not_cancel_the_others(repository, users):
+    loader = UserLoader(repository)
+    first = asyncio.ensure_future(loader.load(users[0].id))
+    second = asyncio.ensure_future(loader.load(users[0].id))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second is users[0]
+
+
+async def test_executor_runs_batches_off_the_loop(repository, users):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        loader = UserLoader(repository, executor=executor)
+
+        found = await asyncio.gather(loader.load(users[0].id), loader.load(users[1].id))
+
+    assert found == [users[0], users[1]]
+    assert len(repository.calls) == 1
+
+
+async def test_max_batch_must_be_positive(repository):
+    with pytest.raises(ValueError, match='max_batch must be positive'):
+        UserLoader(repository, max_batch=0)
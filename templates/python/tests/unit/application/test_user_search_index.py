@@ -0,0 +1,146 @@
+"""Unit tests for the user search index."""
+
+import random
+
+import pytest
+
+from src.application.search import user_search_index
+from src.application.search.user_search_index import PackedKeys, UserSearchIndex
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+
+PEOPLE = [
+    ('u1', 'ana.garcia@example.com', 'Ana García'),
+    ('u2', 'anabel@corp.io', 'Anabel Ruiz'),
+    ('u3', 'jgarcia@example.com', 'Juan Garcia Lopez'),
+    ('u4', 'ops@example.com', 'Ops Team'),
+    ('u5', 'Ana@Mail.org', 'Ana'),
+]
+
+
+@pytest.fixture()
+def index():
+    return UserSearchIndex.build(PEOPLE, block_size=2)
+
+
+def hits(index, query, limit=10):
+    return [(hit.user_id, hit.match) for hit in index.search(query, limit)]
+
+
+class TestPackedKeys:
+    def test_matches_a_sorted_list_under_random_adds_and_removes(self):
+        rng = random.Random(3)
+        keys = PackedKeys(block_size=3)
+        reference = set()
+
+        for _ in range(1_000):
+            word = ''.join(rng.choices('abc', k=rng.randrange(1, 5)))
+            if word in reference:
+                keys.remove(word)
+                reference.discard(word)
+            else:
+                keys.add(word)
+                reference.add(word)
+
+        assert len(keys) == len(reference)
+        for prefix in ('', 'a', 'ab', 'cab', 'bbbb', 'z'):
+            assert list(keys.scan(prefix)) == sorted(w for w in reference if w.startswith(prefix))
+
+    def test_remove_missing_entry_raises(self):
+        keys = PackedKeys(['b', 'd'], block_size=1)
+
+        for missing in ('a', 'c', 'e'):
+            with pytest.raises(KeyError):
+                keys.remove(missing)
+
+
+class TestUserSearchIndex:
+    def test_ranks_exact_then_prefixes_then_shorter_text(self, index):
+        assert hits(index, 'ana') == [
+            ('u5', 'exact'),
+            ('u2', 'email_prefix'),
+            ('u1', 'email_prefix'),
+        ]
+
+    def test_prefix_of_a_later_name_word(self, index):
+        assert hits(index, 'LOPEZ') == [('u3', 'name_prefix')]
+        assert hits(index, 'garc') == [('u1', 'name_prefix'), ('u3', 'name_prefix')]
+
+    def test_substring_inside_an_email(self, index):
+        assert hits(index, 'rp.i') == [('u2', 'email_substring')]
+        assert hits(index, '@example') == [
+            ('u4', 'email_substring'),
+            ('u3', 'email_substring'),
+            ('u1', 'email_substring'),
+        ]
+
+    def test_queries_are_folded(self, index):
+        assert hits(index, '  JUAN   garcia ') == [('u3', 'name_prefix')]
+        assert hits(index, '') == []
+        assert hits(index, 'ana', limit=0) == []
+
+    def test_unknown_fragment_finds_nothing(self, index):
+        assert hits(index, 'zzz') == []
+        assert hits(index, 'anaz') == []
+
+    def test_limit_keeps_the_best_hits(self, index):
+        assert hits(index, 'ana', limit=1) == [('u5', 'exact')]
+
+    def test_events_index_new_users_and_renames(self):
+        index = UserSearchIndex()
+        user = User.create(Email.create('dev@example.com'), 'Grace Hopper', 'hash')
+        index.apply_all(user.get_domain_events())
+        assert hits(index, 'hopp') == [(user.id, 'name_prefix')]
+
+        user.change_name('Ada Lovelace')
+        index.apply_all(user.get_domain_events())
+        index.apply_all(user.get_domain_events())  # replays are harmless
+
+        assert len(index) == 1
+        assert user.id in index
+        assert hits(index, 'hopp') == []
+        assert hits(index, 'love') == [(user.id, 'name_prefix')]
+        assert hits(index, 'velac') == [(user.id, 'name_substring')]
+        assert hits(index, 'dev@') == [(user.id, 'email_prefix')]
+
+    def test_rename_of_unknown_user_is_ignored(self, index):
+        index.rename('nobody', 'Someone')
+
+        assert len(index) == len(PEOPLE)
+
+    def test_common_trigrams_become_stop_grams(self):
+        rows = [(f'u{i}', f'user{i}@example.com', f'Name {i}') for i in range(50)]
+        index = UserSearchIndex.build(rows, max_postings=10, scan_limit=5)
+
+        assert index.stop_grams > 0
+        # 'ample.c' is made of stop-grams only: answered by a bounded scan.
+        assert len(index.search('ample.c', limit=50)) == 5
+        # Selective trigrams still find the user among stop-grams.
+        assert hits(index, 'user42@exa') == [('u42', 'email_prefix')]
+        assert hits(index, 'er42@exa') == [('u42', 'email_substring')]
+
+    def test_from_users_matches_incremental_indexing(self):
+        users = [
+            User.create(Email.create(f'person{i}@example.com'), f'Person {i}', 'hash')
+            for i in range(30)
+        ]
+        incremental = UserSearchIndex(block_size=4)
+        for user in users:
+            incremental.apply_all(user.get_domain_events())
+
+        built = UserSearchIndex.from_users(users, block_size=4)
+
+        for query in ('person1', 'son2', 'n 7', '@exa'):
+            assert hits(built, query) == hits(incremental, query)
+
+    def test_build_merges_sorted_runs(self, monkeypatch):
+        monkeypatch.setattr(user_search_index, '_BUILD_RUN', 4)
+
+        index = UserSearchIndex.build(PEOPLE, block_size=2)
+
+        assert hits(index, 'ana') == [
+            ('u5', 'exact'),
+            ('u2', 'email_prefix'),
+            ('u1', 'email_prefix'),
+        ]
+        assert hits(index, 'lopez') == [('u3', 'name_prefix')]
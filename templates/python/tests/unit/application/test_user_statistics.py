@@ -0,0 +1,109 @@
+"""Unit tests for user population statistics."""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.application.analytics.user_statistics import UserColumns, UserStatistics
+from src.domain.entities.user import User, UserRole
+from src.domain.value_objects.email import Email
+
+
+def make_user(email: str, role: UserRole = UserRole.USER, verified: bool = False, day: int = 1):
+    created = datetime(2024, 1, day, 12, 0)
+    return User.from_persistence(
+        id=email,
+        email=Email.create(email),
+        name='User',
+        password_hash='hash',
+        role=role,
+        email_verified=verified,
+        created_at=created,
+        updated_at=created,
+    )
+
+
+@pytest.fixture()
+def population():
+    return [
+        make_user('a@gmail.com', UserRole.ADMIN, verified=True, day=1),
+        make_user('b@gmail.com', verified=True, day=1),
+        make_user('c@Example.com', day=2),
+        make_user('d@gmail.com', UserRole.GUEST, day=3),
+    ]
+
+
+class TestUserStatistics:
+    """Test suite for full and incremental statistics."""
+
+    @pytest.mark.parametrize('use_numpy', [False, True])
+    def test_compute_full_statistics(self, population, use_numpy):
+        """Should count roles, verification, domains and signups."""
+        if use_numpy:
+            pytest.importorskip('numpy')
+
+        stats = UserStatistics.compute(population, use_numpy=use_numpy)
+
+        assert stats.total == 4
+        assert stats.admins == 1
+        assert stats.verified == 2
+        assert stats.unverified == 2
+        assert stats.top_domains(1) == [('gmail.com', 3)]
+        assert stats.signup_histogram() == [
+            (date(2024, 1, 1), 2),
+            (date(2024, 1, 2), 1),
+            (date(2024, 1, 3), 1),
+        ]
+
+    def test_numpy_and_array_paths_agree(self, population):
+        """Should produce identical output with and without NumPy."""
+        pytest.importorskip('numpy')
+        columns = UserColumns.from_users(population)
+
+        with_numpy = UserStatistics.from_columns(columns, use_numpy=True)
+        without_numpy = UserStatistics.from_columns(columns, use_numpy=False)
+
+        assert with_numpy.to_dict() == without_numpy.to_dict()
+
+    def test_empty_population(self):
+        """Should handle an empty collection."""
+        stats = UserStatistics.compute([])
+
+        assert stats.to_dict()['total'] == 0
+        assert stats.signup_histogram() == []
+
+    def test_incremental_updates_match_full_recompute(self):
+        """Should reach the same numbers from domain events."""
+        users = [
+            User.create(email=Email.create('x@gmail.com'), name='X', password_hash='h'),
+            User.create(
+                email=Email.create('y@corp.io'),
+                name='Y',
+                password_hash='h',
+                role=UserRole.ADMIN,
+            ),
+        ]
+        users[1].verify_email()
+        stats = UserStatistics()
+
+        for user in users:
+            stats.apply_all(user.get_domain_events())
+
+        assert stats.to_dict() == UserStatistics.compute(users).to_dict()
+
+    def test_apply_ignores_unrelated_events(self):
+        """Should not change counters for unknown events."""
+        from src.domain.entities.user import DomainEvent
+
+        stats = UserStatistics()
+        stats.apply(DomainEvent())
+
+        assert stats.total == 0
+
+    def test_to_dict_shape(self, population):
+        """Should serialize to JSON-friendly primitives."""
+        data = UserStatistics.compute(population, use_numpy=False).to_dict(top_domains=5)
+
+        assert data['roles'] == {'admin': 1, 'user': 2, 'guest': 1}
+        assert data['top_domains'][1] == {'domain': 'example.com', 'count': 1}
+        assert data['signups_per_day'][0] == {'day': '2024-01-01', 'count': 2}
@@ -0,0 +1,72 @@
+"""Unit tests for the connection pool."""
+
+import threading
+
+import pytest
+
+from src.infrastructure.persistence.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    pass
+
+
+class TestConnectionPool:
+    def test_opens_lazily_and_reuses_connections(self):
+        opened = []
+        pool = ConnectionPool(lambda: opened.append(FakeConnection()) or opened[-1], size=3)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert pool.opened == 1
+
+    def test_hands_out_distinct_connections_up_to_size(self):
+        pool = ConnectionPool(FakeConnection, size=2, timeout=0.01)
+
+        with pool.connection() as first, pool.connection() as second:
+            assert first is not second
+            with pytest.raises(PoolTimeoutError), pool.connection():
+                pass
+        assert pool.opened == 2
+
+    def test_waiter_gets_the_released_connection(self):
+        pool = ConnectionPool(FakeConnection, size=1, timeout=5)
+        borrowed = []
+        release = threading.Event()
+
+        def hold():
+            with pool.connection() as connection:
+                borrowed.append(connection)
+                release.wait()
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        while not borrowed:
+            pass
+        threading.Timer(0.01, release.set).start()
+        with pool.connection() as connection:
+            assert connection is borrowed[0]
+        holder.join()
+
+    def test_failed_open_frees_the_slot(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError('connection refused')
+            return FakeConnection()
+
+        pool = ConnectionPool(factory, size=1)
+        with pytest.raises(OSError), pool.connection():
+            pass
+        with pool.connection() as connection:
+            assert isinstance(connection, FakeConnection)
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError, match='positive'):
+            ConnectionPool(FakeConnection, size=0)
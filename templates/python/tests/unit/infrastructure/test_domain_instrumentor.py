@@ -0,0 +1,140 @@
+"""Unit tests for the domain OpenTelemetry instrumentor."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from src.application.use_cases.register_user_account import (
+    RegisterUserAccountCommand,
+    RegisterUserAccountHandler,
+)
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.domain_instrumentor import DomainInstrumentor
+from src.infrastructure.observability.domain_logging import DomainLogger
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+
+@pytest.fixture()
+def reader():
+    return InMemoryMetricReader()
+
+
+@pytest.fixture()
+def instrumentor(reader):
+    instrumentor = DomainInstrumentor()
+    instrumentor.instrument(meter_provider=MeterProvider(metric_readers=[reader]), sample_rate=1.0)
+    yield instrumentor
+    instrumentor.uninstrument()
+
+
+def collect(reader):
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                for point in metric.data.data_points:
+                    key = (metric.name, point.attributes['operation'], point.attributes['outcome'])
+                    points[key] = point
+    return points
+
+
+class TestDomainInstrumentor:
+    """Test suite for domain hot-path metrics."""
+
+    def test_counts_successful_calls(self, instrumentor, reader):
+        """Should count every instrumented call."""
+        user = User.create(email=Email.create('a@example.com'), name='A', password_hash='h')
+        user.to_dict()
+
+        points = collect(reader)
+
+        assert points[('domain.operations', 'email.create', 'ok')].value == 1
+        assert points[('domain.operations', 'user.create', 'ok')].value == 1
+        assert points[('domain.operations', 'user.serialize', 'ok')].value == 1
+        assert points[('domain.operation.duration', 'email.create', 'ok')].count == 1
+
+    def test_counts_registrations_and_password_hashing(self, instrumentor, reader):
+        """Should count the registration use case and the hashing it runs."""
+        handler = RegisterUserAccountHandler(
+            InMemoryUserRepository(), Pbkdf2PasswordHasher(iterations=1_000)
+        )
+
+        handler.execute(RegisterUserAccountCommand.create('a@example.com', 'A', 'correct-horse'))
+
+        points = collect(reader)
+
+        assert points[('domain.operations', 'registration.execute', 'ok')].value == 1
+        assert points[('domain.operations', 'password.hash', 'ok')].value == 1
+
+    def test_records_rejection_reasons(self, instrumentor, reader):
+        """Should label rejected emails with the validation reason."""
+        with pytest.raises(ValueError, match='Email domain not allowed'):
+            Email.create('user@tempmail.com')
+        with pytest.raises(ValueError, match='Invalid email format'):
+            Email.create('not-an-email')
+
+        points = collect(reader)
+
+        assert points[('domain.operations', 'email.create', 'blocked_domain')].value == 1
+        assert points[('domain.operations', 'email.create', 'invalid_format')].value == 1
+
+    def test_zero_sample_rate_skips_latency(self, reader):
+        """Should count calls without recording latency when not sampled."""
+        instrumentor = DomainInstrumentor()
+        instrumentor.instrument(
+            meter_provider=MeterProvider(metric_readers=[reader]), sample_rate=0.0
+        )
+        try:
+            Email.create('a@example.com')
+        finally:
+            instrumentor.uninstrument()
+
+        points = collect(reader)
+        assert points[('domain.operations', 'email.create', 'ok')].value == 1
+        assert ('domain.operation.duration', 'email.create', 'ok') not in points
+
+    def test_uninstrument_restores_original_functions(self):
+        """Should leave the domain untouched once disabled."""
+        original_create = Email.__dict__['create']
+        original_to_dict = User.__dict__['to_dict']
+        instrumentor = DomainInstrumentor()
+
+        instrumentor.instrument(meter_provider=MeterProvider())
+        assert instrumentor.is_instrumented is True
+        instrumentor.uninstrument()
+
+        assert Email.__dict__['create'] is original_create
+        assert User.__dict__['to_dict'] is original_to_dict
+        assert instrumentor.is_instrumented is False
+
+    def test_patchers_can_be_removed_out_of_order(self, reader):
+        """Should keep logging and drop metrics when uninstrumented under the logger."""
+        original_create = Email.__dict__['create']
+        logger = MagicMock()
+        instrumentor = DomainInstrumentor()
+        domain_logger = DomainLogger()
+
+        instrumentor.instrument(meter_provider=MeterProvider(metric_readers=[reader]))
+        domain_logger.install(logger)
+        instrumentor.uninstrument()
+        try:
+            Email.create('a@example.com')
+        finally:
+            domain_logger.uninstall()
+        Email.create('b@example.com')
+
+        assert Email.__dict__['create'] is original_create
+        assert instrumentor.is_instrumented is False
+        assert not instrumentor.counts
+        logger.info.assert_called_once_with(
+            'email.create', outcome='ok', sample_rate=1.0, email_domain='example.com'
+        )
+
+    def test_rejects_invalid_sample_rate(self):
+        """Should validate the sample rate."""
+        with pytest.raises(ValueError, match='sample_rate'):
+            DomainInstrumentor().instrument(meter_provider=MeterProvider(), sample_rate=2.0)
@@ -0,0 +1,190 @@
+"""Unit tests for the non-blocking domain logging pipeline."""
+
+import io
+import json
+import threading
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.domain_logging import BatchingLogWriter, DomainLogger
+
+
+@pytest.fixture()
+def stream():
+    return io.StringIO()
+
+
+@pytest.fixture()
+def writer(stream):
+    return BatchingLogWriter(stream, capacity=100, batch_size=10)
+
+
+@pytest.fixture()
+def domain_logger():
+    domain_logger = DomainLogger()
+    yield domain_logger
+    domain_logger.uninstall()
+
+
+def records(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def register(email: str) -> User:
+    return User.create(email=Email.create(email), name='Logged', password_hash='hash')
+
+
+class TestBatchingLogWriter:
+    """Test suite for the bounded queue and its writer."""
+
+    def test_nothing_is_written_on_the_calling_thread(self, writer, stream):
+        """Should only queue records until the writer drains them."""
+        writer.get_logger().info('hello', answer=42)
+
+        assert stream.getvalue() == ''
+        writer.flush()
+        [record] = records(stream)
+        assert record['event'] == 'hello'
+        assert record['answer'] == 42
+        assert record['level'] == 'info'
+        assert record['timestamp'].endswith('+00:00')
+
+    def test_drops_and_reports_records_beyond_capacity(self, stream):
+        """Should count records that do not fit and log the count once."""
+        writer = BatchingLogWriter(stream, capacity=3, batch_size=10)
+        logger = writer.get_logger()
+        for index in range(5):
+            logger.info('event', index=index)
+
+        writer.flush()
+
+        assert writer.dropped == 2
+        assert [record.get('index') for record in records(stream)] == [0, 1, 2, None]
+        assert records(stream)[-1] == {
+            'event': 'log.dropped',
+            'level': 'warning',
+            'count': 2,
+            'timestamp': records(stream)[-1]['timestamp'],
+        }
+
+    def test_filters_below_info(self, writer, stream):
+        """Should not queue debug records."""
+        writer.get_logger().debug('noise')
+
+        writer.flush()
+
+        assert stream.getvalue() == ''
+
+    def test_background_thread_writes_in_batches(self, stream):
+        """Should write everything queued before close, batch by batch."""
+        writes = []
+
+        class RecordingStream(io.StringIO):
+            def write(self, text):
+                writes.append(text.count('\n'))
+                return super().write(text)
+
+        stream = RecordingStream()
+        writer = BatchingLogWriter(stream, batch_size=4, flush_interval=10)
+        logger = writer.get_logger(service='users')
+        writer.start()
+        for index in range(10):
+            logger.info('event', index=index)
+        writer.close()
+
+        assert [record['index'] for record in records(stream)] == list(range(10))
+        assert all(record['service'] == 'users' for record in records(stream))
+        assert max(writes) <= 4
+        assert writer.written == 10
+
+    def test_flush_alongside_the_writer_thread(self, stream):
+        """Should write every record exactly once when flush races the writer."""
+        writer = BatchingLogWriter(stream, batch_size=1, flush_interval=0.001)
+        logger = writer.get_logger()
+        writer.start()
+        done = threading.Event()
+
+        def flush_repeatedly():
+            while not done.is_set():
+                writer.flush()
+
+        flusher = threading.Thread(target=flush_repeatedly)
+        flusher.start()
+        for index in range(2_000):
+            logger.info('event', index=index)
+        done.set()
+        flusher.join()
+        writer_alive = writer._thread is not None and writer._thread.is_alive()
+        writer.close()
+
+        assert writer_alive
+        assert sorted(record['index'] for record in records(stream)) == list(range(2_000))
+        assert writer.written == 2_000
+
+    def test_rejects_invalid_settings(self, stream):
+        """Should refuse non-positive sizes."""
+        with pytest.raises(ValueError, match='must be positive'):
+            BatchingLogWriter(stream, capacity=0)
+
+
+class TestDomainLogger:
+    """Test suite for the sampled domain operation wrappers."""
+
+    def test_logs_domain_operations(self, writer, stream, domain_logger):
+        """Should log creations, verifications and their identifiers."""
+        domain_logger.install(writer.get_logger())
+        user = register('a@example.com')
+        user.verify_email()
+
+        writer.flush()
+
+        assert [
+            (record['event'], record.get('user_id'), record.get('email_domain'))
+            for record in records(stream)
+        ] == [
+            ('email.create', None, 'example.com'),
+            ('user.create', user.id, None),
+            ('user.verify_email', user.id, None),
+        ]
+
+    def test_logs_rejections_with_reason(self, writer, stream, domain_logger):
+        """Should log rejected emails as warnings and re-raise."""
+        domain_logger.install(writer.get_logger())
+
+        with pytest.raises(ValueError, match='Email domain not allowed'):
+            Email.create('user@tempmail.com')
+
+        writer.flush()
+        [record] = records(stream)
+        assert record['level'] == 'warning'
+        assert record['outcome'] == 'blocked_domain'
+
+    def test_samples_successes_and_counts_the_rest(self, writer, stream, domain_logger):
+        """Should skip unsampled calls but keep rejections."""
+        domain_logger.install(writer.get_logger(), sample_rates={'email.create': 0.0})
+        Email.create('a@example.com')
+        with pytest.raises(ValueError, match='Invalid email format'):
+            Email.create('not-an-email')
+
+        writer.flush()
+
+        assert [record['outcome'] for record in records(stream)] == ['invalid_format']
+        assert domain_logger.sampled_out['email.create'] == 1
+
+    def test_uninstall_restores_the_domain(self, writer, stream, domain_logger):
+        """Should stop logging once uninstalled."""
+        domain_logger.install(writer.get_logger())
+        domain_logger.uninstall()
+
+        register('a@example.com')
+        writer.flush()
+
+        assert not domain_logger.is_installed
+        assert stream.getvalue() == ''
+
+    def test_rejects_invalid_rates(self, writer, domain_logger):
+        """Should refuse rates outside [0, 1]."""
+        with pytest.raises(ValueError, match='between 0 and 1'):
+            domain_logger.install(writer.get_logger(), sample_rates={'user.create': 2.0})
@@ -0,0 +1,109 @@
+"""Unit tests for the pydantic models that map to domain objects."""
+
+import json
+from datetime import datetime
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.domain.entities.user import User, UserCreatedEvent, UserRole
+from src.domain.value_objects.email import Email
+from src.infrastructure.http.domain_models import (
+    RESPONSE_FIELDS,
+    DomainRules,
+    EmailValue,
+    UserDraft,
+    UserSerializer,
+)
+
+
+def errors(payload):
+    with pytest.raises(ValidationError) as error:
+        UserDraft.model_validate(payload)
+    return [(e['loc'], e['type'], e['msg']) for e in error.value.errors()]
+
+
+class TestUserDraft:
+    def test_builds_domain_objects_from_normalized_input(self):
+        draft = UserDraft.model_validate_json(
+            b'{"email": "  Ada@Example.COM ", "name": " Ada Lovelace ", "role": "admin"}'
+        )
+
+        assert draft.email == Email.create('ada@example.com')
+        assert draft.email.value == 'ada@example.com'
+        assert draft.name == 'Ada Lovelace'
+        assert draft.role is UserRole.ADMIN
+
+    def test_reports_domain_messages_and_reason_codes(self):
+        assert errors({'email': 'no-at-sign', 'name': '', 'role': 'root'})[:2] == [
+            (('email',), 'invalid_format', 'Invalid email format: no-at-sign'),
+            (('name',), 'empty', 'User name cannot be empty'),
+        ]
+        assert errors({'email': 'me@tempmail.com', 'name': 'x' * 256}) == [
+            (('email',), 'blocked_domain', 'Email domain not allowed: tempmail.com'),
+            (('name',), 'too_long', 'User name too long'),
+        ]
+
+    def test_braces_in_input_are_not_templates(self):
+        assert errors({'email': '{message}', 'name': 'Ada'}) == [
+            (('email',), 'invalid_format', 'Invalid email format: {message}'),
+        ]
+
+    def test_to_user_skips_revalidation(self, monkeypatch):
+        draft = UserDraft(email='ada@example.com', name='Ada')
+        monkeypatch.setattr(User, '_validate', lambda self: pytest.fail('validated twice'))
+
+        user = draft.to_user('hash')
+
+        assert user.email is draft.email
+        assert (user.name, user.role) == ('Ada', UserRole.USER)
+        [event] = user.get_domain_events()
+        assert isinstance(event, UserCreatedEvent)
+        assert event.email == 'ada@example.com'
+
+    def test_email_value_serializes_as_string(self):
+        class Contact(BaseModel):
+            email: EmailValue
+            backup: Annotated[str, DomainRules(Email, 'email', strip=False)] = 'a@b.co'
+
+        contact = Contact(email='A@B.co')
+
+        assert json.loads(contact.model_dump_json()) == {'email': 'a@b.co', 'backup': 'a@b.co'}
+        with pytest.raises(ValidationError):
+            Contact(email='a@b.co', backup=' a@b.co')
+
+
+class TestUserSerializer:
+    @pytest.fixture()
+    def user(self):
+        return User.from_persistence(
+            id='u1',
+            email=Email.create('ada@example.com'),
+            name='Ada',
+            password_hash='secret-hash',
+            role=UserRole.GUEST,
+            email_verified=True,
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+            updated_at=datetime(2024, 1, 2, 3, 4, 5, 6),
+        )
+
+    def test_snapshot_matches_to_dict(self, user):
+        serializer = UserSerializer()
+
+        assert serializer.to_python(user) == user.to_dict()
+        assert json.loads(serializer.to_json(user)) == user.to_dict()
+        assert b'secret-hash' not in serializer.to_json(user)
+
+    def test_response_fields(self, user):
+        serializer = UserSerializer(RESPONSE_FIELDS)
+
+        [payload] = serializer.to_json_many([user])
+
+        assert json.loads(payload) == {
+            'userId': 'u1',
+            'email': 'ada@example.com',
+            'name': 'Ada',
+            'role': 'guest',
+            'createdAt': '2024-01-02T03:04:05',
+        }
@@ -0,0 +1,52 @@
+"""Unit tests for the consistent-hash ring."""
+
+from collections import Counter
+
+import pytest
+
+from src.infrastructure.persistence.hash_ring import HashRing
+
+KEYS = [f'user-{i}' for i in range(20_000)]
+
+
+class TestHashRing:
+    def test_keys_spread_evenly_over_nodes(self):
+        ring = HashRing(['a', 'b', 'c', 'd'])
+
+        shares = Counter(ring.node_for(key) for key in KEYS)
+
+        assert set(shares) == {'a', 'b', 'c', 'd'}
+        assert max(shares.values()) < 1.25 * len(KEYS) / 4
+
+    def test_routing_is_deterministic(self):
+        assert [HashRing(['a', 'b']).node_for(key) for key in KEYS[:50]] == [
+            HashRing(['b', 'a']).node_for(key) for key in KEYS[:50]
+        ]
+
+    def test_adding_a_node_only_moves_keys_to_it(self):
+        ring = HashRing(['a', 'b', 'c'])
+        grown = ring.with_node('d')
+
+        moved = [key for key in KEYS if ring.node_for(key) != grown.node_for(key)]
+
+        assert all(grown.node_for(key) == 'd' for key in moved)
+        assert 0.15 < len(moved) / len(KEYS) < 0.35
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        ring = HashRing(['a', 'b', 'c'])
+        shrunk = ring.without_node('b')
+
+        moved = [key for key in KEYS if ring.node_for(key) != shrunk.node_for(key)]
+
+        assert all(ring.node_for(key) == 'b' for key in moved)
+        assert shrunk.nodes == ('a', 'c')
+
+    def test_rejects_invalid_rings(self):
+        with pytest.raises(ValueError, match='at least one node'):
+            HashRing([])
+        with pytest.raises(ValueError, match='unique'):
+            HashRing(['a', 'a'])
+        with pytest.raises(ValueError, match='vnodes'):
+            HashRing(['a'], vnodes=0)
+        with pytest.raises(ValueError, match='Unknown node'):
+            HashRing(['a']).without_node('b')
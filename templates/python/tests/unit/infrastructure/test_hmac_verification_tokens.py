@@ -0,0 +1,80 @@
+"""Unit tests for the HMAC email-verification tokens."""
+
+import pytest
+
+from src.application.ports.verification_tokens import (
+    ExpiredTokenError,
+    InvalidTokenError,
+    VerificationClaims,
+)
+from src.infrastructure.security.hmac_verification_tokens import HmacVerificationTokens
+
+OLD = b'o' * 32
+NEW = b'n' * 32
+
+
+@pytest.fixture()
+def tokens():
+    return HmacVerificationTokens({'k1': OLD}, active_key='k1')
+
+
+class TestHmacVerificationTokens:
+    def test_round_trip(self, tokens):
+        token = tokens.issue('user:1', expires_at=1_000.9)
+
+        assert tokens.verify(token, now=999) == VerificationClaims('user:1', 1_000.0)
+        assert '=' not in token
+        assert '/' not in token
+        assert '+' not in token
+
+    def test_expired(self, tokens):
+        token = tokens.issue('u1', expires_at=1_000)
+
+        with pytest.raises(ExpiredTokenError) as error:
+            tokens.verify(token, now=1_000)
+        assert error.value.claims.user_id == 'u1'
+
+    @pytest.mark.parametrize(
+        'mangle',
+        [
+            lambda token: token[:-2] + ('AA' if not token.endswith('AA') else 'BB'),
+            lambda token: 'x' + token,
+            lambda token: token.split('.')[0],
+            lambda token: token + 'é',
+            lambda token: 'not a token',
+            lambda token: '',
+        ],
+    )
+    def test_tampered_tokens_are_invalid(self, tokens, mangle):
+        token = tokens.issue('u1', expires_at=1_000)
+
+        with pytest.raises(InvalidTokenError):
+            tokens.verify(mangle(token), now=0)
+
+    def test_changing_the_claims_breaks_the_signature(self, tokens):
+        forged = HmacVerificationTokens({'k1': b'f' * 32}, active_key='k1').issue('admin', 9e9)
+
+        with pytest.raises(InvalidTokenError, match='signature'):
+            tokens.verify(forged, now=0)
+
+    def test_rotation_keeps_old_links_valid(self, tokens):
+        old_token = tokens.issue('u1', expires_at=1_000)
+        rotated = HmacVerificationTokens({'k1': OLD, 'k2': NEW}, active_key='k2')
+        retired = HmacVerificationTokens({'k2': NEW}, active_key='k2')
+
+        assert rotated.verify(old_token, now=0).user_id == 'u1'
+        assert retired.verify(rotated.issue('u2', 1_000), now=0).user_id == 'u2'
+        with pytest.raises(InvalidTokenError, match='Malformed'):
+            retired.verify(old_token, now=0)
+
+    @pytest.mark.parametrize(
+        ('keys', 'active', 'message'),
+        [
+            ({'k1': OLD}, 'k2', 'Unknown active key'),
+            ({'a:b': OLD}, 'a:b', 'must not contain'),
+            ({'k1': b'short'}, 'k1', 'at least 32 bytes'),
+        ],
+    )
+    def test_rejects_bad_keys(self, keys, active, message):
+        with pytest.raises(ValueError, match=message):
+            HmacVerificationTokens(keys, active_key=active)
@@ -0,0 +1,133 @@
+"""Unit tests for the idempotency store adapters."""
+
+import pytest
+
+from src.application.ports.idempotency_store import StoredResponse
+from src.infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from src.infrastructure.idempotency.redis_idempotency_store import (
+    RELEASE_SCRIPT,
+    RedisIdempotencyStore,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Local stand-in for redis.Redis: GET, SET with PX/NX and the release script."""
+
+    def __init__(self, clock):
+        self._clock = clock
+        self._data = {}
+
+    def _live(self, name):
+        entry = self._data.get(name)
+        if entry is not None and entry[1] is not None and entry[1] <= self._clock():
+            del self._data[name]
+            return None
+        return entry
+
+    def get(self, name):
+        entry = self._live(name)
+        return None if entry is None else entry[0]
+
+    def set(self, name, value, *, px=None, nx=False):
+        if nx and self._live(name) is not None:
+            return None
+        expires_at = None if px is None else self._clock() + px / 1000
+        self._data[name] = (value.encode() if isinstance(value, str) else value, expires_at)
+        return True
+
+    def eval(self, script, numkeys, *keys_and_args):
+        assert script == RELEASE_SCRIPT and numkeys == 1
+        name, token = keys_and_args
+        if self.get(name) != token.encode():
+            return 0
+        del self._data[name]
+        return 1
+
+
+RESPONSE = StoredResponse('fp', 201, b'{"success": true}')
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def store(request, clock):
+    if request.param == 'memory':
+        return InMemoryIdempotencyStore(clock=clock)
+    return RedisIdempotencyStore(FakeRedis(clock))
+
+
+class TestIdempotencyStores:
+    def test_put_and_get(self, store):
+        store.put('key', RESPONSE, 60)
+
+        assert store.get('key') == RESPONSE
+        assert store.get('missing') is None
+
+    def test_responses_expire(self, store, clock):
+        store.put('key', RESPONSE, 60)
+        clock.now = 60.0
+
+        assert store.get('key') is None
+
+    def test_lock_is_exclusive_until_released(self, store):
+        token = store.acquire('key', 30)
+        assert token is not None
+        assert store.acquire('key', 30) is None
+
+        store.release('key', token)
+
+        assert store.acquire('key', 30) is not None
+
+    def test_lock_expires(self, store, clock):
+        store.acquire('key', 30)
+        clock.now = 30.0
+
+        assert store.acquire('key', 30) is not None
+
+    def test_expired_owner_cannot_release_the_new_lock(self, store, clock):
+        stale = store.acquire('key', 30)
+        clock.now = 30.0
+        current = store.acquire('key', 30)
+
+        store.release('key', stale)
+
+        assert current not in (None, stale)
+        assert store.acquire('key', 30) is None
+
+
+class TestInMemoryIdempotencyStore:
+    def test_evicts_least_recently_used(self, clock):
+        store = InMemoryIdempotencyStore(max_entries=2, clock=clock)
+        store.put('a', RESPONSE, 60)
+        store.put('b', RESPONSE, 60)
+        store.get('a')
+
+        store.put('c', RESPONSE, 60)
+
+        assert store.get('b') is None
+        assert store.get('a') == RESPONSE
+        assert len(store) == 2
+
+    def test_sweeps_expired_entries_on_write(self, clock):
+        store = InMemoryIdempotencyStore(clock=clock)
+        store.put('old', RESPONSE, 1)
+        clock.now = 5.0
+
+        store.put('new', RESPONSE, 60)
+
+        assert len(store) == 1
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            InMemoryIdempotencyStore(max_entries=0)
@@ -0,0 +1,83 @@
+"""Unit tests for the HDR-style latency histogram."""
+
+import math
+import random
+
+import pytest
+
+from src.infrastructure.observability.latency_histogram import LatencyHistogram
+
+
+def exact_percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * percentile / 100)) - 1]
+
+
+class TestLatencyHistogram:
+    """Test suite for recording and querying latencies."""
+
+    def test_percentiles_stay_within_precision(self):
+        """Should report every percentile within 0.1% over six orders of magnitude."""
+        rng = random.Random(3)
+        values = [int(rng.lognormvariate(9, 2)) for _ in range(20_000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (1, 25, 50, 90, 99, 99.9, 100):
+            exact = exact_percentile(values, percentile)
+            assert exact <= histogram.percentile(percentile) <= exact * 1.001 + 1
+        assert histogram.count == len(values)
+        assert (histogram.min, histogram.max) == (min(values), max(values))
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_small_values_are_exact(self):
+        """Should keep values below 2 * 10**digits in buckets of their own."""
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in (0, 7, 199):
+            histogram.record(value)
+
+        assert [histogram.percentile(p) for p in (30, 60, 100)] == [0, 7, 199]
+
+    def test_counts_at_or_below_a_threshold(self):
+        """Should count samples under a latency, conservatively at the boundary."""
+        histogram = LatencyHistogram()
+        histogram.record_seconds(0.2)
+        histogram.record(499_000, count=2)
+        histogram.record(501_000)
+
+        assert histogram.count_at_or_below(500_000) == 3
+        assert histogram.count_at_or_below(100) == 0
+
+    def test_merge_adds_samples(self):
+        """Should combine histograms as if all samples were recorded in one."""
+        left, right, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for value in range(0, 100_000, 7):
+            (left if value % 2 else right).record(value)
+            both.record(value)
+
+        left.merge(right)
+        left.merge(LatencyHistogram())
+
+        assert left.summary() == both.summary()
+        with pytest.raises(ValueError, match='precision'):
+            left.merge(LatencyHistogram(significant_digits=2))
+
+    def test_summary_in_milliseconds(self):
+        """Should summarize in milliseconds, and report zeros when empty."""
+        histogram = LatencyHistogram()
+        assert histogram.summary(percentiles=(50,)) == {
+            'count': 0,
+            'min': 0.0,
+            'mean': 0.0,
+            'max': 0.0,
+            'p50': 0.0,
+        }
+        histogram.record_seconds(0.25)
+
+        assert histogram.summary(percentiles=(99.9,))['p99.9'] == 250.0
+
+    def test_rejects_invalid_precision(self):
+        """Should only accept 1 to 5 significant digits."""
+        with pytest.raises(ValueError, match='significant_digits'):
+            LatencyHistogram(significant_digits=0)
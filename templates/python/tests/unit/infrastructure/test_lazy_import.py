@@ -0,0 +1,51 @@
+"""Unit tests for deferred imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.infrastructure.lazy_import import lazy_import
+
+
+class TestLazyImport:
+    """Test suite for lazy_import."""
+
+    def test_returns_already_imported_module(self):
+        """Should reuse a module that is already loaded."""
+        assert lazy_import('json') is sys.modules['json']
+
+    def test_raises_for_missing_module(self):
+        """Should fail fast when the module is not installed."""
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import('definitely_not_installed_module')
+
+    def test_defers_execution_until_attribute_access(self, tmp_path, monkeypatch):
+        """Should execute the module body only on first attribute access."""
+        (tmp_path / 'lazy_probe.py').write_text(
+            'import builtins\nbuiltins.lazy_probe_executed = True\nVALUE = 42\n'
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_probe', raising=False)
+        import builtins
+
+        monkeypatch.setattr(builtins, 'lazy_probe_executed', False, raising=False)
+
+        module = lazy_import('lazy_probe')
+        assert builtins.lazy_probe_executed is False
+
+        assert module.VALUE == 42
+        assert builtins.lazy_probe_executed is True
+        monkeypatch.delitem(sys.modules, 'lazy_probe')
+
+    def test_domain_imports_no_infrastructure(self):
+        """Should import the domain without application, infrastructure or heavy deps."""
+        code = (
+            'import sys\n'
+            'import src.domain.entities.user, src.domain.value_objects.email\n'
+            'heavy = ("src.application", "src.infrastructure", "fastapi", "pydantic",\n'
+            '         "psycopg", "redis", "structlog", "opentelemetry", "numpy")\n'
+            'loaded = [m for m in sys.modules if m.startswith(heavy)]\n'
+            'assert not loaded, loaded\n'
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,134 @@
+"""Unit tests for the soak runner and its leak detection."""
+
+import itertools
+import tracemalloc
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.memory_soak import grows_monotonically, run_soak
+
+
+def new_user(index):
+    return User.create(
+        email=Email.create(f'soak{index}@example.com'), name='Soak', password_hash='hash'
+    )
+
+
+def lifecycle(index):
+    user = new_user(index)
+    user.verify_email()
+    user.change_name('Renamed')
+    user.clear_domain_events()
+
+
+class TestGrowsMonotonically:
+    """Test suite for the growth verdict on a series."""
+
+    def test_flags_steady_growth(self):
+        """Should flag a series that mostly goes up by enough in total."""
+        assert grows_monotonically([0, 10, 20, 20, 30, 40], min_growth=30, fraction=0.8)
+
+    def test_ignores_noise_plateaus_and_small_growth(self):
+        """Should not flag flat, noisy, too short or too small series."""
+        assert not grows_monotonically([5, 5, 5, 5], min_growth=0, fraction=0.8)
+        assert not grows_monotonically([0, 50, 10, 60, 20, 70], min_growth=10, fraction=0.8)
+        assert not grows_monotonically([0, 100], min_growth=10, fraction=0.8)
+        assert not grows_monotonically([0, 1, 2, 3], min_growth=10, fraction=0.8)
+
+
+class TestRunSoak:
+    """Test suite for soak runs over domain workloads."""
+
+    def test_clean_lifecycle_is_not_flagged(self):
+        """Should report create/mutate/clear cycles as stable."""
+        report = run_soak(
+            lifecycle, budget_seconds=1.0, sample_interval=0.05, min_growth_bytes=256 * 1024
+        )
+
+        assert not report.leak_suspected
+        assert report.cycles >= 1_000
+        assert report.traced_from_cycle is not None
+        assert report.to_dict()['leak_suspected'] is False
+
+    def test_uncleared_events_are_flagged_with_their_call_site(self):
+        """Should flag long-lived users whose events are never cleared, pointing at User."""
+        pool = [new_user(index) for index in range(10)]
+
+        def rename(index):
+            pool[index % 10].change_name('Renamed')
+
+        report = run_soak(
+            rename,
+            budget_seconds=1.0,
+            sample_interval=0.05,
+            trace_share=0.5,
+            min_growth_bytes=64 * 1024,
+        )
+
+        assert report.leak_suspected
+        assert report.traced_monotonic
+        assert report.bytes_per_cycle > 50
+        assert any('entities/user.py' in site.traceback[0] for site in report.top_sites[:3])
+
+    def test_rss_only_run_stops_at_the_cycle_cap(self):
+        """Should stop at max_cycles and judge growth on RSS samples without tracing."""
+        ticks = itertools.count(step=0.5)
+        rss = itertools.count(start=10 << 20, step=1 << 20)
+
+        report = run_soak(
+            lambda index: None,
+            budget_seconds=100,
+            max_cycles=5_000,
+            sample_interval=1.0,
+            trace_share=0,
+            clock=lambda: next(ticks),
+            rss=lambda: next(rss),
+        )
+
+        assert report.cycles == 5_000
+        assert report.traced_from_cycle is None
+        assert report.rss_monotonic and report.leak_suspected
+        assert report.top_sites == []
+        assert all(sample.traced_bytes is None for sample in report.samples)
+
+    def test_time_budget_ends_the_run(self):
+        """Should stop once the budget is spent, tracing the last part of it."""
+        ticks = itertools.count(step=1.0)
+
+        report = run_soak(
+            lambda index: None, budget_seconds=10, sample_interval=2.0, clock=lambda: next(ticks)
+        )
+
+        assert 0 < report.cycles <= 10_000
+        assert report.traced_from_cycle is not None
+        assert not report.leak_suspected
+
+    def test_slow_cycles_do_not_overshoot_the_budget(self):
+        """Should size batches from the cycle pace so the deadline is met within a cycle."""
+        now = [0.0]
+
+        def slow(index):
+            now[0] += 0.25
+
+        report = run_soak(
+            slow, budget_seconds=10, sample_interval=1.0, trace_share=0, clock=lambda: now[0]
+        )
+
+        assert report.elapsed <= 10.25
+        assert report.cycles <= 41
+        assert len(report.samples) >= 10
+
+    def test_rejects_invalid_settings(self):
+        """Should refuse an empty budget, a bad trace share and someone else's tracing."""
+        with pytest.raises(ValueError, match='budget_seconds'):
+            run_soak(lifecycle, budget_seconds=0)
+        with pytest.raises(ValueError, match='trace_share'):
+            run_soak(lifecycle, budget_seconds=1, trace_share=1.5)
+        tracemalloc.start()
+        try:
+            with pytest.raises(RuntimeError, match='already tracing'):
+                run_soak(lifecycle, budget_seconds=1)
+        finally:
+            tracemalloc.stop()
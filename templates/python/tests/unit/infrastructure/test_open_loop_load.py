@@ -0,0 +1,93 @@
+"""Unit tests for the open-loop load generator."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.observability.open_loop_load import (
+    TRANSPORT_ERROR,
+    arrival_offsets,
+    run_open_loop,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestArrivalOffsets:
+    """Test suite for the send schedule."""
+
+    async def test_constant_arrivals_are_evenly_spaced(self):
+        """Should schedule rate * duration sends at fixed intervals."""
+        assert list(arrival_offsets(4, 1)) == [0.0, 0.25, 0.5, 0.75]
+
+    async def test_poisson_arrivals_average_the_rate(self):
+        """Should draw exponential gaps whose mean matches the rate."""
+        offsets = list(arrival_offsets(1000, 10, 'poisson', seed=1))
+
+        assert len(offsets) == pytest.approx(10_000, rel=0.05)
+        assert offsets == sorted(offsets)
+        assert offsets == list(arrival_offsets(1000, 10, 'poisson', seed=1))
+
+    async def test_rejects_invalid_schedules(self):
+        """Should refuse non-positive rates and unknown processes."""
+        with pytest.raises(ValueError, match='rate'):
+            list(arrival_offsets(0, 1))
+        with pytest.raises(ValueError, match='arrivals'):
+            list(arrival_offsets(1, 1, 'bursty'))
+
+
+class TestRunOpenLoop:
+    """Test suite for sending on schedule and recording latencies."""
+
+    async def test_records_statuses_and_errors(self):
+        """Should count statuses and record exceptions as transport errors."""
+
+        async def send(index):
+            if index == 3:
+                raise ConnectionError('reset')
+            return 201 if index % 2 else 409
+
+        result = await run_open_loop(send, rate=200, duration=0.05)
+
+        assert result.statuses == {201: 4, 409: 5, TRANSPORT_ERROR: 1}
+        assert result.requests == result.response_time.count == 10
+        assert result.achieved_rate > 0
+
+    async def test_queueing_behind_a_stall_counts_as_latency(self):
+        """Should measure from the scheduled send, so waiting for a slot is not hidden."""
+
+        async def send(index):
+            await asyncio.sleep(0.2 if index == 0 else 0)
+            return 201
+
+        result = await run_open_loop(send, rate=100, duration=0.1, max_in_flight=1)
+
+        assert result.requests == 10
+        assert result.service_time.percentile(90) < 50_000
+        assert result.response_time.percentile(50) > 100_000
+        assert result.max_send_lag > 0.1
+
+    async def test_warmup_requests_are_not_recorded(self):
+        """Should send warm-up requests but leave them out of the result."""
+        sent = []
+
+        async def send(index):
+            sent.append(index)
+            return 201
+
+        result = await run_open_loop(send, rate=100, duration=0.1, warmup=0.05)
+
+        assert len(sent) == 10
+        assert result.requests == 5
+        assert result.duration == pytest.approx(0.05)
+
+    async def test_rejects_invalid_settings(self):
+        """Should refuse a warm-up as long as the run and an empty in-flight cap."""
+
+        async def send(index):
+            return 201
+
+        with pytest.raises(ValueError, match='warmup'):
+            await run_open_loop(send, rate=1, duration=1, warmup=1)
+        with pytest.raises(ValueError, match='max_in_flight'):
+            await run_open_loop(send, rate=1, duration=1, max_in_flight=0)
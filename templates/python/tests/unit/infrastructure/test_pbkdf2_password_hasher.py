@@ -0,0 +1,33 @@
+"""Unit tests for the PBKDF2 password hasher."""
+
+import pytest
+
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+
+def test_hash_and_verify():
+    hasher = Pbkdf2PasswordHasher(iterations=1_000)
+
+    encoded = hasher.hash('correct-horse-battery')
+
+    assert encoded.startswith('pbkdf2_sha256$1000$')
+    assert hasher.verify('correct-horse-battery', encoded)
+    assert not hasher.verify('wrong-password', encoded)
+    assert not hasher.verify('correct-horse-battery', 'garbage')
+
+
+def test_salts_differ():
+    hasher = Pbkdf2PasswordHasher(iterations=1_000)
+
+    assert hasher.hash('same-password') != hasher.hash('same-password')
+
+
+def test_iterations_from_environment(monkeypatch):
+    monkeypatch.setenv('PASSWORD_HASH_ITERATIONS', '2000')
+
+    assert Pbkdf2PasswordHasher().iterations == 2000
+
+
+def test_rejects_weak_work_factor():
+    with pytest.raises(ValueError):
+        Pbkdf2PasswordHasher(iterations=10)
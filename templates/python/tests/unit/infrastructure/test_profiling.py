@@ -0,0 +1,144 @@
+"""Unit tests for profiling mode and its report generator."""
+
+import sqlite3
+
+import pytest
+
+from src.application.use_cases.register_user_account import (
+    RegisterUserAccountCommand,
+    RegisterUserAccountHandler,
+)
+from src.domain.entities.user import User
+from src.domain.value_objects.email import Email
+from src.infrastructure.observability.profile_report import build_report, main, read_folded
+from src.infrastructure.observability.profiling import (
+    DomainProfiler,
+    profiler_from_env,
+)
+from src.infrastructure.persistence.in_memory_user_repository import InMemoryUserRepository
+from src.infrastructure.persistence.sql_user_repository import SqlUserRepository
+from src.infrastructure.security.pbkdf2_password_hasher import Pbkdf2PasswordHasher
+
+
+@pytest.fixture()
+def profiler():
+    profiler = DomainProfiler()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+
+
+def register(email: str) -> User:
+    return User.create(email=Email.create(email), name='Profiled', password_hash='hash')
+
+
+class TestDomainProfiler:
+    """Test suite for the stack-aggregating profiler."""
+
+    def test_collects_stacks_per_operation(self, profiler):
+        """Should aggregate call stacks rooted at the operation name."""
+        register('a@example.com').to_dict()
+
+        profile = profiler.profiles['user.create']
+        assert profile.calls == 1
+        assert profile.profiled_calls == 1
+        assert any(
+            stack[0] == 'user.create' and 'user.py:_validate' in stack for stack in profile.stacks
+        )
+        assert set(profiler.profiles) == {'email.create', 'user.create', 'user.serialize'}
+
+    def test_nested_hot_paths_belong_to_outer_operation(self, profiler):
+        """Should not profile User.from_persistence separately inside a repository call."""
+        connection = sqlite3.connect(':memory:')
+        repository = SqlUserRepository(connection)
+        repository.create_schema()
+        user = register('nested@example.com')
+        repository.save(user)
+
+        repository.find_by_id(user.id)
+
+        assert profiler.profiles['repository.find_by_id'].calls == 1
+        assert 'user.hydrate' not in profiler.profiles
+
+    def test_profiles_the_wired_registration_path(self, profiler):
+        """Should profile the use case with hashing in its stacks, and the in-memory adapter."""
+        repository = InMemoryUserRepository()
+        handler = RegisterUserAccountHandler(repository, Pbkdf2PasswordHasher(iterations=1_000))
+
+        handler.execute(
+            RegisterUserAccountCommand.create('wired@example.com', 'Wired', 'correct-horse')
+        )
+        repository.find_by_email(Email.create('wired@example.com'))
+
+        assert profiler.profiles['registration.execute'].calls == 1
+        assert profiler.profiles['repository.find_by_email'].calls == 1
+        assert 'password.hash' not in profiler.profiles
+        assert any(
+            'pbkdf2_password_hasher.py:hash' in stack
+            for stack in profiler.profiles['registration.execute'].stacks
+        )
+
+    def test_fast_calls_are_counted_but_not_kept(self):
+        """Should only keep stacks of calls above the slow threshold."""
+        profiler = DomainProfiler(slow_threshold_ms=60_000)
+        profiler.enable()
+        try:
+            Email.create('fast@example.com')
+        finally:
+            profiler.disable()
+
+        profile = profiler.profiles['email.create']
+        assert profile.calls == 1
+        assert profile.profiled_calls == 0
+        assert not profile.stacks
+
+    def test_disable_restores_original_functions(self):
+        """Should leave the domain untouched once disabled."""
+        original = User.__dict__['to_dict']
+        profiler = DomainProfiler()
+
+        profiler.enable()
+        profiler.disable()
+
+        assert User.__dict__['to_dict'] is original
+
+    def test_dump_and_report(self, profiler, tmp_path, capsys):
+        """Should write folded stacks and summarize them."""
+        register('dump@example.com')
+
+        written = profiler.dump(tmp_path)
+
+        assert tmp_path / 'summary.json' in written
+        stacks = read_folded(tmp_path / 'user.create.folded')
+        assert all(stack.startswith('user.create') for stack in stacks)
+        report = build_report(tmp_path, top=3)
+        assert '== user.create: 1 calls, 1 profiled' in report
+        assert main([str(tmp_path)]) == 0
+        assert 'heaviest stacks' in capsys.readouterr().out
+
+    def test_report_without_dump_fails(self, tmp_path):
+        """Should exit with an error when there is nothing to report."""
+        assert main([str(tmp_path)]) == 1
+
+
+class TestProfilerFromEnv:
+    """Test suite for environment configuration."""
+
+    def test_disabled_by_default(self):
+        """Should return None unless PROFILING_ENABLED is set."""
+        assert profiler_from_env({}) is None
+
+    def test_reads_threshold_and_directory(self):
+        """Should configure the profiler from the environment."""
+        profiler = profiler_from_env(
+            {
+                'PROFILING_ENABLED': 'true',
+                'PROFILING_SLOW_MS': '25',
+                'PROFILING_OUTPUT_DIR': '/tmp/profiles',
+            }
+        )
+
+        assert profiler is not None
+        assert profiler.slow_threshold == pytest.approx(0.025)
+        assert str(profiler.output_dir) == '/tmp/profiles'
+        assert profiler.is_enabled is False
@@ -0,0 +1,152 @@
+"""Unit tests for the token-bucket rate limiter adapters."""
+
+import hashlib
+
+import pytest
+
+from src.application.ports.rate_limiter import TokenBucketPolicy
+from src.infrastructure.rate_limiting.in_memory_rate_limiter import InMemoryRateLimiter
+from src.infrastructure.rate_limiting.redis_rate_limiter import (
+    TOKEN_BUCKET_SCRIPT,
+    RedisRateLimiter,
+)
+
+POLICY = TokenBucketPolicy(capacity=3, refill_per_second=1)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeScriptRedis:
+    """Local stand-in for Redis that runs TOKEN_BUCKET_SCRIPT's logic in Python."""
+
+    def __init__(self, clock):
+        self._clock = clock
+        self.hashes = {}
+        self.expires = {}
+        self.scripts = set()
+
+    def script_load(self, script):
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.scripts.add(sha)
+        return sha.encode()
+
+    def evalsha(self, sha, numkeys, key, capacity, rate, cost):
+        if sha not in self.scripts:
+            raise RuntimeError('NOSCRIPT No matching script. Please use EVAL.')
+        now = self._clock()
+        if key in self.expires and self.expires[key] <= now:
+            self.hashes.pop(key, None)
+        bucket = self.hashes.get(key)
+        if bucket is None:
+            tokens = capacity
+        else:
+            tokens = min(capacity, bucket['tokens'] + (now - bucket['ts']) * rate)
+        allowed = 0
+        if tokens >= cost:
+            tokens = min(capacity, tokens - cost)
+            allowed = 1
+        self.hashes[key] = {'tokens': tokens, 'ts': now}
+        self.expires[key] = now + (capacity - tokens) / rate + 0.001
+        return [allowed, str(tokens).encode()]
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def limiter(request, clock):
+    if request.param == 'memory':
+        return InMemoryRateLimiter(POLICY, clock=clock)
+    return RedisRateLimiter(FakeScriptRedis(clock), POLICY)
+
+
+class TestRateLimiters:
+    def test_allows_up_to_capacity(self, limiter):
+        decisions = [limiter.acquire('k') for _ in range(4)]
+
+        assert [decision.allowed for decision in decisions] == [True, True, True, False]
+        assert decisions[2].remaining == 0
+        assert decisions[3].retry_after == pytest.approx(1.0)
+
+    def test_refills_lazily(self, limiter, clock):
+        for _ in range(3):
+            limiter.acquire('k')
+        clock.now += 2
+
+        assert limiter.acquire('k', cost=2).allowed is True
+        assert limiter.acquire('k').allowed is False
+
+    def test_keys_are_independent(self, limiter):
+        for _ in range(3):
+            limiter.acquire('a')
+
+        assert limiter.acquire('b').allowed is True
+
+    def test_refund_returns_tokens_up_to_capacity(self, limiter):
+        limiter.acquire('k', cost=3)
+
+        limiter.refund('k', cost=2)
+        assert limiter.acquire('k', cost=2).allowed is True
+        limiter.refund('k', cost=10)
+
+        assert limiter.acquire('k').remaining == 2
+
+    def test_rejects_invalid_policy(self):
+        with pytest.raises(ValueError):
+            TokenBucketPolicy(capacity=0, refill_per_second=1)
+
+
+class TestInMemoryRateLimiter:
+    def test_evicts_refilled_buckets_and_reuses_slots(self, clock):
+        limiter = InMemoryRateLimiter(POLICY, sweep_interval=0, sweep_batch=4, clock=clock)
+        for key in ('a', 'b', 'c'):
+            limiter.acquire(key)
+        assert len(limiter) == 3
+
+        clock.now += POLICY.seconds_to_full
+        limiter.acquire('d')
+
+        assert len(limiter) == 1
+        assert limiter.acquire('a').remaining == 2
+
+    def test_eviction_keeps_partial_buckets(self, clock):
+        limiter = InMemoryRateLimiter(POLICY, sweep_interval=0, sweep_batch=4, clock=clock)
+        for _ in range(3):
+            limiter.acquire('a')
+        clock.now += 1
+        limiter.acquire('b')
+
+        assert len(limiter) == 2
+        assert limiter.acquire('a').remaining == 0
+
+
+class TestRedisRateLimiter:
+    def test_reloads_script_after_server_flush(self, clock):
+        client = FakeScriptRedis(clock)
+        limiter = RedisRateLimiter(client, POLICY)
+        limiter.acquire('k')
+
+        client.scripts.clear()
+
+        assert limiter.acquire('k').remaining == 1
+        assert 'ratelimit:k' in client.hashes
+
+    def test_propagates_other_errors(self, clock):
+        class BrokenRedis(FakeScriptRedis):
+            def evalsha(self, *args):
+                raise ConnectionError('down')
+
+        with pytest.raises(ConnectionError):
+            RedisRateLimiter(BrokenRedis(clock), POLICY).acquire('k')
+
+    def test_script_refills_from_server_time(self):
+        assert "redis.call('TIME')" in TOKEN_BUCKET_SCRIPT
+        assert 'PEXPIRE' in TOKEN_BUCKET_SCRIPT
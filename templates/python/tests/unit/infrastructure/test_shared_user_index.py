@@ -0,0 +1,112 @@
+"""Unit tests for the shared-memory user index."""
+
+import multiprocessing
+import uuid
+
+import pytest
+
+from src.domain.entities.user import User, UserRole
+from src.domain.value_objects.email import Email
+from src.infrastructure.cache.shared_user_index import (
+    SharedUserIndex,
+    SharedUserIndexPublisher,
+    UserIndexView,
+    encode_user_index,
+)
+
+
+def make_users(count):
+    return [
+        User.create(
+            email=Email.create(f'User{i}@Example.com'),
+            name=f'Usuario {i} ñ',
+            password_hash=f'hash{i}',
+            role=UserRole.ADMIN if i % 3 == 0 else UserRole.USER,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def prefix():
+    return f'test-user-index-{uuid.uuid4().hex[:12]}'
+
+
+@pytest.fixture()
+def publisher(prefix):
+    publisher = SharedUserIndexPublisher(prefix)
+    yield publisher
+    publisher.close()
+
+
+def _read_in_child(prefix, user_id, queue):
+    index = SharedUserIndex(prefix)
+    queue.put(index.get_by_id(user_id))
+    index.close()
+
+
+class TestUserIndexView:
+    def test_lookups_return_to_dict_records(self):
+        users = make_users(200)
+        view = UserIndexView(encode_user_index(users))
+
+        assert len(view) == 200
+        for user in users[::17]:
+            assert view.get_by_id(user.id) == user.to_dict()
+            assert view.get_by_email(user.email) == user.to_dict()
+            assert view.id_for_email(user.email.value.lower()) == user.id
+
+    def test_missing_keys(self):
+        view = UserIndexView(encode_user_index(make_users(5)))
+
+        assert view.get_by_id('missing') is None
+        assert view.get_by_email('missing@example.com') is None
+        assert view.id_for_email('missing@example.com') is None
+
+    def test_skips_duplicate_ids_and_emails(self):
+        users = make_users(3)
+
+        view = UserIndexView(encode_user_index(users + users[:1]))
+
+        assert len(view) == 3
+
+    def test_rejects_foreign_buffers(self):
+        with pytest.raises(ValueError):
+            UserIndexView(b'\0' * 64)
+
+
+class TestSharedUserIndex:
+    def test_reader_requires_a_publication(self, publisher, prefix):
+        with pytest.raises(LookupError):
+            SharedUserIndex(prefix)
+
+    def test_reader_in_another_process(self, publisher, prefix):
+        users = make_users(50)
+        publisher.publish(users)
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+
+        child = context.Process(target=_read_in_child, args=(prefix, users[42].id, queue))
+        child.start()
+        record = queue.get(timeout=10)
+        child.join(10)
+
+        assert record == users[42].to_dict()
+        assert child.exitcode == 0
+
+    def test_reader_follows_versioned_swap(self, publisher, prefix):
+        users = make_users(20)
+        publisher.publish(users[:10])
+        index = SharedUserIndex(prefix)
+        assert index.get_by_id(users[15].id) is None
+
+        generation = publisher.publish(users)
+
+        assert index.get_by_id(users[15].id) == users[15].to_dict()
+        assert index.generation == generation == 2
+        assert len(index) == 20
+        index.close()
+
+    def test_unknown_prefix(self):
+        with pytest.raises(FileNotFoundError):
+            SharedUserIndex(f'missing-{uuid.uuid4().hex}')
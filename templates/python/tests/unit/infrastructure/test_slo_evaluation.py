@@ -0,0 +1,114 @@
+"""Unit tests for evaluating the SLO file on load-test results."""
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.observability.open_loop_load import TRANSPORT_ERROR, LoadResult
+from src.infrastructure.observability.slo_evaluation import (
+    UnsupportedIndicatorError,
+    evaluate,
+    find_slo_file,
+    load_slo_file,
+    parse_target,
+)
+
+
+@pytest.fixture(scope='module')
+def document():
+    return load_slo_file(find_slo_file(Path(__file__).parent))
+
+
+def load_result(statuses, latencies_ms):
+    result = LoadResult(rate=10, duration=1, statuses=Counter(statuses))
+    for latency in latencies_ms:
+        result.response_time.record(latency * 1000)
+    return result
+
+
+def by_name(results):
+    return {result.name: result for result in results}
+
+
+class TestEvaluate:
+    """Test suite for SLOs and SLIs measured on a run."""
+
+    def test_healthy_run_meets_every_objective(self, document):
+        """Should pass the availability and p95 latency SLOs of slos.yaml."""
+        result = load_result({201: 990, 409: 10}, [120] * 960 + [700] * 40)
+
+        report = evaluate(document, result)
+        objectives = by_name(report.objectives)
+
+        assert report.passed
+        assert set(objectives) == {'api_availability', 'api_latency_p95'}
+        assert objectives['api_availability'].target == pytest.approx(0.999)
+        assert objectives['api_latency_p95'].good == 960
+        assert objectives['api_latency_p95'].threshold_ms == 500
+        assert by_name(report.indicators)['error_rate'].ratio == pytest.approx(0.99)
+
+    def test_server_errors_and_timeouts_break_availability(self, document):
+        """Should count 5xx responses and requests without a response as bad."""
+        result = load_result({201: 997, 503: 2, TRANSPORT_ERROR: 1}, [10] * 1000)
+
+        report = evaluate(document, result)
+        availability = by_name(report.objectives)['api_availability']
+
+        assert not report.passed
+        assert (availability.good, availability.total) == (997, 1000)
+        assert report.to_dict()['passed'] is False
+
+    def test_slow_tail_breaks_the_latency_objective(self, document):
+        """Should fail the p95 SLO when more than 5% of requests exceed 500 ms."""
+        report = evaluate(document, load_result({201: 100}, [100] * 90 + [800] * 10))
+
+        assert not by_name(report.objectives)['api_latency_p95'].passed
+        assert by_name(report.objectives)['api_availability'].passed
+
+    def test_an_empty_run_passes_nothing(self, document):
+        """Should not pass an objective without any request."""
+        assert not evaluate(document, load_result({}, [])).passed
+
+    def test_status_matchers(self):
+        """Should support the equality and regex matchers on status codes."""
+        result = load_result({201: 3, 409: 1}, [])
+        document = {
+            'service_level_indicators': {
+                name: {'good_events': f"http_requests{{status_code{selector}}}", 'target': 0.5}
+                for name, selector in {
+                    'created': "='201'",
+                    'not_created': "!='201'",
+                    'success': "=~'2..'",
+                }.items()
+            }
+        }
+
+        indicators = by_name(evaluate(document, result).indicators)
+
+        assert [indicators[name].good for name in ('created', 'not_created', 'success')] == [
+            3,
+            1,
+            3,
+        ]
+
+    def test_rejects_unsupported_selectors(self):
+        """Should refuse selectors it cannot evaluate from a load test."""
+        for selector in ('rate(http_requests[5m])', "process_cpu{mode='user'}"):
+            document = {'service_level_indicators': {'x': {'good_events': selector, 'target': 1}}}
+            with pytest.raises(UnsupportedIndicatorError):
+                evaluate(document, load_result({201: 1}, [1]))
+
+
+class TestSloFile:
+    """Test suite for locating and reading the SLO file."""
+
+    def test_parse_target(self):
+        """Should read percentages and plain ratios."""
+        assert parse_target('99.9%') == pytest.approx(0.999)
+        assert parse_target(0.95) == 0.95
+
+    def test_missing_file(self, tmp_path):
+        """Should say so when no parent directory has the file."""
+        with pytest.raises(FileNotFoundError):
+            find_slo_file(tmp_path, relative='missing/slos.yaml')
@@ -0,0 +1,116 @@
+"""Unit tests for memory-mapped user snapshots."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.entities.user import User, UserRole
+from src.domain.value_objects.email import Email
+from src.infrastructure.cache.user_snapshot import UserSnapshot, write_user_snapshot
+
+
+def make_users(count):
+    created = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    return [
+        User.from_persistence(
+            id=f'id-{i:04d}',
+            email=Email.create(f'User{i}@Example.com'),
+            name=f'Usuario {i} ñ',
+            password_hash=f'$2b$12$hash{i}',
+            role=UserRole.ADMIN if i % 3 == 0 else UserRole.USER,
+            email_verified=i % 2 == 0,
+            created_at=created,
+            updated_at=created,
+            version=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def snapshot_path(tmp_path):
+    return tmp_path / 'users.snapshot'
+
+
+class TestUserSnapshot:
+    def test_lookups_materialize_persisted_users(self, snapshot_path):
+        users = make_users(300)
+        assert write_user_snapshot(snapshot_path, reversed(users)) == 300
+
+        with UserSnapshot(snapshot_path) as snapshot:
+            assert len(snapshot) == 300
+            for user in users[::7]:
+                found = snapshot.find_by_id(user.id)
+                assert found is not None
+                assert found.to_dict() == user.to_dict()
+                assert found.password_hash == user.password_hash
+                assert found.version == user.version
+                assert not found.is_new()
+                assert found.get_domain_events() == []
+                by_email = snapshot.find_by_email(Email.create(user.email.value.upper()))
+                assert by_email is not None
+                assert by_email.id == user.id
+                assert snapshot.id_for_email(user.email.value.lower()) == user.id
+
+    def test_missing_keys(self, snapshot_path):
+        write_user_snapshot(snapshot_path, make_users(10))
+
+        with UserSnapshot(snapshot_path) as snapshot:
+            assert snapshot.find_by_id('id-9999') is None
+            assert snapshot.find_by_id('') is None
+            assert snapshot.find_by_email(Email.create('nobody@example.com')) is None
+            assert snapshot.id_for_email('user1@example.co') is None
+
+    def test_keys_sharing_long_prefixes(self, snapshot_path):
+        # Same 8-byte prefix everywhere: the search must fall back to full keys.
+        users = [
+            User.create(Email.create(f'samelocal{i}@example.com'), f'Name {i}', 'hash')
+            for i in (5, 50, 500, 51, 0)
+        ]
+        write_user_snapshot(snapshot_path, users)
+
+        with UserSnapshot(snapshot_path) as snapshot:
+            for user in users:
+                assert snapshot.id_for_email(user.email) == user.id
+            assert snapshot.id_for_email('samelocal52@example.com') is None
+
+    def test_duplicates_are_skipped(self, snapshot_path):
+        first, second = make_users(2)
+        clash = User.create(Email.create('USER0@example.com'), 'Clash', 'hash')
+
+        assert write_user_snapshot(snapshot_path, [first, second, clash, first]) == 2
+
+    def test_empty_snapshot(self, snapshot_path):
+        write_user_snapshot(snapshot_path, [])
+
+        with UserSnapshot(snapshot_path) as snapshot:
+            assert len(snapshot) == 0
+            assert snapshot.find_by_id('anything') is None
+
+    def test_rewrite_replaces_file(self, snapshot_path):
+        write_user_snapshot(snapshot_path, make_users(3))
+        write_user_snapshot(snapshot_path, make_users(5)[3:])
+
+        with UserSnapshot(snapshot_path) as snapshot:
+            assert len(snapshot) == 2
+            assert snapshot.find_by_id('id-0000') is None
+        assert [p.name for p in snapshot_path.parent.iterdir()] == ['users.snapshot']
+
+    def test_failed_write_leaves_no_partial_file(self, snapshot_path):
+        def broken():
+            yield from make_users(2)
+            raise RuntimeError('database went away')
+
+        with pytest.raises(RuntimeError):
+            write_user_snapshot(snapshot_path, broken())
+        assert list(snapshot_path.parent.iterdir()) == []
+
+    def test_rejects_foreign_and_truncated_files(self, snapshot_path):
+        snapshot_path.write_bytes(b'not a snapshot at all, clearly not one' * 2)
+        with pytest.raises(ValueError, match='Not a user snapshot'):
+            UserSnapshot(snapshot_path)
+
+        write_user_snapshot(snapshot_path, make_users(3))
+        snapshot_path.write_bytes(snapshot_path.read_bytes()[:-5])
+        with pytest.raises(ValueError, match='Truncated'):
+            UserSnapshot(snapshot_path)
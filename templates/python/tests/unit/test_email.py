@@ -269,11 +269,17 @@ class TestEmailValueObject:
         
         assert str(email) == email.value
 
+    def test_domain_is_lower_cased(self):
+        """Should expose the domain part in lower case."""
+        email = Email.create('User@Mail.Example.COM')
+
+        assert email.domain == 'mail.example.com'
+
     # Business rules
     def test_enforce_maximum_length_constraint(self):
         """Should enforce maximum length constraint."""
-        email_255 = 'a' * 240 + '@example.com'  # exactly 255
-        email_256 = 'a' * 241 + '@example.com'  # 256
+        email_255 = 'a' * 243 + '@example.com'  # exactly 255
+        email_256 = 'a' * 244 + '@example.com'  # 256
         
         Email.create(email_255)  # Should not raise
         
@@ -288,6 +294,22 @@ class TestEmailValueObject:
             with pytest.raises(ValueError, match=f'Email domain not allowed: {domain}'):
                 Email.create(f'user@{domain}')
 
+    def test_validation_errors_expose_reason(self):
+        """Should attach a stable reason code to validation errors."""
+        from src.domain.value_objects.email import InvalidEmailError
+
+        cases = {
+            '': 'empty',
+            'invalid': 'invalid_format',
+            'a' * 250 + '@example.com': 'too_long',
+            'user@tempmail.com': 'blocked_domain',
+        }
+
+        for raw, reason in cases.items():
+            with pytest.raises(InvalidEmailError) as error:
+                Email.create(raw)
+            assert error.value.reason == reason
+
     def test_allow_legitimate_domains(self):
         """Should allow legitimate domains."""
         legitimate_domains = [
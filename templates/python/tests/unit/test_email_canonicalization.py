@@ -0,0 +1,41 @@
+"""Unit tests for email canonicalization."""
+
+import pytest
+
+from src.domain.services.email_canonicalization import EmailCanonicalizer, ProviderRule
+from src.domain.value_objects.email import Email
+
+
+@pytest.fixture()
+def canonicalizer():
+    return EmailCanonicalizer()
+
+
+class TestEmailCanonicalizer:
+    """Test suite for per-provider alias rules."""
+
+    @pytest.mark.parametrize(
+        ('address', 'expected'),
+        [
+            ('John.Doe+promo@gmail.com', 'johndoe@gmail.com'),
+            ('j.o.h.n.doe@googlemail.com', 'johndoe@gmail.com'),
+            ('john.doe+news@outlook.com', 'john.doe@outlook.com'),
+            ('jane+x@me.com', 'jane@icloud.com'),
+            ('jane-shopping@yahoo.com', 'jane@yahoo.com'),
+            ('John.Doe+promo@Example.com', 'john.doe+promo@example.com'),
+        ],
+    )
+    def test_canonical_keys(self, canonicalizer, address, expected):
+        """Should apply the rule of the address's provider."""
+        assert canonicalizer.canonical_key(Email.create(address)) == expected
+
+    def test_custom_rules(self):
+        """Should accept rules for additional domains and a different default."""
+        canonicalizer = EmailCanonicalizer(
+            rules={'corp.io': ProviderRule(tag_separator='+', ignore_dots=True)},
+            default=ProviderRule(tag_separator='+'),
+        )
+
+        assert canonicalizer.canonicalize('a.b+c@corp.io') == 'ab@corp.io'
+        assert canonicalizer.canonicalize('a.b+c@other.org') == 'a.b@other.org'
+        assert canonicalizer.canonicalize('a.b+c@gmail.com') == 'a.b@gmail.com'
@@ -0,0 +1,144 @@
+"""Unit tests for declarative invariants."""
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.invariants import (
+    InvariantError,
+    Matches,
+    MaxLength,
+    NonEmpty,
+    NoneOf,
+    OneOf,
+    Rule,
+    Validated,
+    Violation,
+    compile_rules,
+)
+from src.domain.value_objects.email import Email, InvalidEmailError
+
+
+class Tag(Validated):
+    INVARIANTS = {
+        'label': (NonEmpty('Label required', strip=True), MaxLength('Label too long', limit=5)),
+        'color': (OneOf('Unknown color: {value}', values={'red', 'blue'}),),
+    }
+
+
+class TestCompileRules:
+    def test_check_raises_first_violation_in_declaration_order(self):
+        with pytest.raises(ValueError, match='^Label required$'):
+            Tag._validator.check('  ', 'green')
+        with pytest.raises(ValueError, match='^Label too long$'):
+            Tag._validator.check('abcdef', 'green')
+        with pytest.raises(ValueError, match='^Unknown color: green$'):
+            Tag._validator.check('ok', 'green')
+
+        Tag._validator.check('ok', 'red')
+
+    def test_violations_reports_every_field(self):
+        assert Tag._validator.violations('', 'green') == [
+            Violation('label', 'Label required', 'empty'),
+            Violation('color', 'Unknown color: green', 'not_allowed'),
+        ]
+        assert Tag._validator.violations('ok', 'blue') == []
+
+    def test_validate_many_tags_rows_with_their_index(self):
+        rows = [('ok', 'red'), ('toolong', 'red'), ('', 'pink')]
+
+        assert Tag.validate_many(rows) == [
+            Violation('label', 'Label too long', 'too_long', 1),
+            Violation('label', 'Label required', 'empty', 2),
+            Violation('color', 'Unknown color: pink', 'not_allowed', 2),
+        ]
+
+    def test_pattern_and_keyed_membership(self):
+        validator = compile_rules(
+            {
+                'code': (
+                    Matches('Bad code {value}', pattern=r'[A-Z]{2}-\d+$'),
+                    NoneOf('Prefix {key} retired', values=('XX',), key=lambda v: v[:2]),
+                ),
+            },
+        )
+
+        malformed = Violation('code', 'Bad code ab-1', 'invalid_format')
+        retired = Violation('code', 'Prefix XX retired', 'not_allowed')
+        assert validator.violations('ab-1') == [malformed]
+        assert validator.violations('XX-1') == [retired]
+        assert validator.violations_many([('AB-1',), ('XX-2',)]) == [
+            Violation('code', 'Prefix XX retired', 'not_allowed', 1),
+        ]
+
+    def test_custom_error_factory_is_inherited(self):
+        class Strict(Validated, error=InvalidEmailError):
+            INVARIANTS = {'value': (NonEmpty('Missing'),)}
+
+        class Stricter(Strict):
+            INVARIANTS = {'value': (MaxLength('Long', limit=1),)}
+
+        with pytest.raises(InvalidEmailError) as error:
+            Stricter._validator.check('ab')
+        assert error.value.reason == 'too_long'
+
+    def test_fields_without_rules_check_nothing(self):
+        validator = compile_rules({'free': (), 'label': (NonEmpty('Label required'),)})
+
+        validator.check('anything', 'ok')
+        assert validator.violations('', '') == [Violation('label', 'Label required', 'empty')]
+        assert validator.violations_many([('', 'ok'), ('x', '')]) == [
+            Violation('label', 'Label required', 'empty', 1)
+        ]
+        assert compile_rules({'free': ()}).violations_many([('',)]) == []
+
+    def test_class_without_rules(self):
+        class Free(Validated):
+            pass
+
+        Free._validator.check()
+        assert Free._validator.violations() == []
+        assert Free.validate_many([(), ()]) == []
+
+    def test_default_error_carries_the_reason(self):
+        with pytest.raises(InvariantError) as error:
+            Tag._validator.check('ok', 'green')
+
+        assert isinstance(error.value, ValueError)
+        assert error.value.reason == 'not_allowed'
+
+    def test_rules_must_render_a_condition(self):
+        with pytest.raises(TypeError, match='abstract'):
+            Rule('message', 'reason')
+
+
+class TestEntityInvariants:
+    @pytest.mark.parametrize(
+        ('raw', 'message', 'reason'),
+        [
+            ('', 'Email cannot be empty', 'empty'),
+            ('not-an-email', 'Invalid email format: not-an-email', 'invalid_format'),
+            (f'{"a" * 250}@example.com', 'Email too long', 'too_long'),
+            ('me@tempmail.com', 'Email domain not allowed: tempmail.com', 'blocked_domain'),
+        ],
+    )
+    def test_email_keeps_its_messages_and_reasons(self, raw, message, reason):
+        with pytest.raises(InvalidEmailError) as error:
+            Email.create(raw)
+
+        assert str(error.value) == message
+        assert error.value.reason == reason
+
+    def test_user_batch_validation(self):
+        assert User.validate_many([('Ada',), (' ',), ('x' * 256,)]) == [
+            Violation('name', 'User name cannot be empty', 'empty', 1),
+            Violation('name', 'User name too long', 'too_long', 2),
+        ]
+
+    def test_change_name_enforces_the_length_limit(self):
+        user = User.create(Email.create('ada@example.com'), 'Ada', 'hash')
+
+        with pytest.raises(ValueError, match='^Name cannot be empty$'):
+            user.change_name('')
+        with pytest.raises(ValueError, match='^User name too long$'):
+            user.change_name('x' * 256)
+        assert user.name == 'Ada'
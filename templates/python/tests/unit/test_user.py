@@ -9,7 +9,7 @@ Following TDD principles:
 import pytest
 from datetime import datetime
 
-from src.domain.entities.user import User, UserRole
+from src.domain.entities.user import User, UserNameChangedEvent, UserRole
 from src.domain.value_objects.email import Email
 
 
@@ -55,6 +55,8 @@ class TestUserEntity:
         events = user.get_domain_events()
         assert len(events) == 1
         assert events[0].__class__.__name__ == 'UserCreatedEvent'
+        assert events[0].occurred_at == user.created_at
+        assert events[0].name == 'Test User'
 
     def test_create_defaults_to_user_role(self):
         """
@@ -89,6 +91,22 @@ class TestUserEntity:
         # Assert
         assert user.email_verified is True
 
+    def test_verify_email_raises_email_verified_event(self):
+        """Should raise EmailVerified domain event."""
+        user = User.create(
+            email=Email.create('test@example.com'),
+            name='Test User',
+            password_hash='hashed_password_123',
+        )
+        user.clear_domain_events()
+
+        user.verify_email()
+
+        events = user.get_domain_events()
+        assert len(events) == 1
+        assert events[0].__class__.__name__ == 'EmailVerifiedEvent'
+        assert events[0].user_id == user.id
+
     def test_verify_email_throws_if_already_verified(self):
         """
         Raise ValueError when attempting to verify an already-verified email.
@@ -121,6 +139,9 @@ class TestUserEntity:
 
         # Assert
         assert user.name == 'New Name'
+        events = user.get_domain_events()
+        name_changes = [e for e in events if isinstance(e, UserNameChangedEvent)]
+        assert [(e.user_id, e.name) for e in name_changes] == [(user.id, 'New Name')]
 
     def test_change_name_throws_if_empty(self):
         """Should throw if name is empty."""
@@ -564,3 +585,75 @@ class TestUserEntity:
         
         user.change_name('Name 3')
         assert user.name == 'Name 3'
+
+    def test_new_user_is_new_and_clean(self):
+        """Should start unpersisted and without pending changes."""
+        user = User.create(
+            email=Email.create('test@example.com'),
+            name='Test User',
+            password_hash='hash',
+        )
+
+        assert user.is_new() is True
+        assert user.version == 0
+        assert user.is_dirty() is False
+
+    def test_from_persistence_is_not_new(self):
+        """Should default reconstituted users to version 1."""
+        user = User.from_persistence(
+            id='test-id',
+            email=Email.create('test@example.com'),
+            name='Persisted User',
+            password_hash='hash',
+            role=UserRole.USER,
+            email_verified=False,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+
+        assert user.is_new() is False
+        assert user.version == 1
+        assert user.dirty_fields == frozenset()
+
+    def test_mutators_record_dirty_fields(self):
+        """Should track each changed field together with updated_at."""
+        user = User.create(
+            email=Email.create('test@example.com'),
+            name='Test User',
+            password_hash='hash',
+        )
+
+        user.change_name('New Name')
+        user.verify_email()
+        user.change_password('new_hash')
+
+        assert user.dirty_fields == frozenset(
+            {'name', 'email_verified', 'password_hash', 'updated_at'}
+        )
+
+    def test_mark_persisted_clears_dirty_fields(self):
+        """Should clear pending changes and store the new version."""
+        user = User.create(
+            email=Email.create('test@example.com'),
+            name='Test User',
+            password_hash='hash',
+        )
+        user.change_name('New Name')
+
+        user.mark_persisted(3)
+
+        assert user.is_dirty() is False
+        assert user.version == 3
+
+    def test_failed_mutation_does_not_mark_dirty(self):
+        """Should not track a change rejected by an invariant."""
+        user = User.create(
+            email=Email.create('test@example.com'),
+            name='Test User',
+            password_hash='hash',
+        )
+
+        with pytest.raises(ValueError):
+            user.change_name('')
+
+        assert user.is_dirty() is False